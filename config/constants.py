@@ -257,6 +257,10 @@ ENV_POLYGON_KEY = "POLYGON_API_KEY"
 ENV_TWELVE_DATA_KEY = "TWELVE_DATA_API_KEY"
 ENV_YFINANCE_KEY = "YFINANCE_API_KEY"  # For future use
 
+# Shared rate limit state ("memory", "sqlite" or "file") and its location
+ENV_RATE_LIMIT_BACKEND = "FINANCIAL_ANALYSIS_RATE_LIMIT_BACKEND"
+ENV_RATE_LIMIT_STATE_PATH = "FINANCIAL_ANALYSIS_RATE_LIMIT_STATE"
+
 # ============================================================================
 # STATISTICAL CONSTANTS
 # ============================================================================
@@ -31,6 +31,7 @@ from .constants import (
     
     # API key environment variables
     ENV_ALPHA_VANTAGE_KEY, ENV_FMP_KEY, ENV_POLYGON_KEY, ENV_TWELVE_DATA_KEY,
+    ENV_RATE_LIMIT_BACKEND, ENV_RATE_LIMIT_STATE_PATH,
     
     # Default directories
     DEFAULT_EXPORT_DIR, DEFAULT_DATA_DIR, DEFAULT_CACHE_DIR, DEFAULT_LOG_DIR,
@@ -80,6 +81,10 @@ class ApiConfig:
     queue_timeout: float = 60.0
     min_request_spacing: float = 0.5  # Minimum seconds between requests
     
+    # Shared token buckets: "memory" (per process), "sqlite" or "file" (shared by processes on this host)
+    rate_limit_backend: str = field(default_factory=lambda: os.getenv(ENV_RATE_LIMIT_BACKEND, "memory"))
+    rate_limit_state_path: Optional[str] = field(default_factory=lambda: os.getenv(ENV_RATE_LIMIT_STATE_PATH))
+    
     # Adaptive rate limiting
     adaptive_rate_limiting: bool = True
     rate_limit_header_respect: bool = True
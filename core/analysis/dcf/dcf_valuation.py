@@ -11,7 +11,7 @@ Key Features
 - Multi-stage growth modeling (years 1-5, 5-10, terminal)
 - Automated historical growth rate calculation
 - Terminal value calculation using Gordon Growth Model
-- Comprehensive sensitivity analysis with market price comparison
+- Comprehensive sensitivity analysis with market price comparison (vectorized grid evaluation)
 - Configurable assumptions with intelligent defaults
 
 Classes
@@ -74,16 +74,76 @@ Notes
 import numpy as np
 import pandas as pd
 import logging
-from functools import lru_cache
 from scipy import stats
 from typing import Dict, Any, Optional, List, Union, Tuple
 from config import get_dcf_config
+from utils.memoization import content_memoized
+from core.analysis.monte_carlo import MonteCarloEngine
 
 # Import var_input_data system for unified data access
 from ...data_processing.var_input_data import get_var_input_data, VariableMetadata
 
 logger = logging.getLogger(__name__)
 
+# Default spread of each sampled assumption around its base value in Monte Carlo mode
+DEFAULT_MONTE_CARLO_DISTRIBUTIONS = {
+    'discount_rate': {'distribution': 'normal', 'std': 0.01},
+    'growth_rate_yr1_5': {'distribution': 'normal', 'std': 0.03},
+    'growth_rate_yr5_10': {'distribution': 'normal', 'std': 0.02},
+    'terminal_growth_rate': {'distribution': 'normal', 'std': 0.005},
+}
+MONTE_CARLO_PERCENTILES = (0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)
+# Sampled terminal growth is kept at least this far below the sampled discount rate
+MIN_DISCOUNT_TERMINAL_SPREAD = 0.005
+
+
+def _sample_assumption(
+    rng: np.random.Generator, spec: Union[float, Dict[str, Any]], base: float, n_paths: int
+) -> np.ndarray:
+    """
+    Draw n_paths values of one DCF assumption
+
+    Args:
+        rng: Random generator
+        spec: Fixed value, or dict with 'distribution' ('normal', 'uniform',
+            'triangular', 'fixed') and its parameters. Missing 'mean'/'mode' default
+            to the base assumption; optional 'min'/'max' clip the draws.
+        base: Base-case value of the assumption
+        n_paths: Number of draws
+
+    Returns:
+        np.ndarray: Draws of shape (n_paths,)
+    """
+    if not isinstance(spec, dict):
+        return np.full(n_paths, float(spec))
+
+    distribution = spec.get('distribution', 'normal')
+    if distribution == 'normal':
+        draws = rng.normal(spec.get('mean', base), spec.get('std', 0.0), n_paths)
+    elif distribution == 'uniform':
+        draws = rng.uniform(spec['low'], spec['high'], n_paths)
+    elif distribution == 'triangular':
+        draws = rng.triangular(spec['low'], spec.get('mode', base), spec['high'], n_paths)
+    elif distribution == 'fixed':
+        draws = np.full(n_paths, float(spec.get('value', base)))
+    else:
+        raise ValueError(f"Unknown distribution '{distribution}'")
+
+    if 'min' in spec or 'max' in spec:
+        draws = np.clip(draws, spec.get('min', -np.inf), spec.get('max', np.inf))
+    return draws
+
+
+def _monte_carlo_bytes_per_path(projection_years: int) -> int:
+    """
+    Peak memory per path of the Monte Carlo DCF sampler
+
+    Besides the sampled assumptions, each path holds a few float64 rows of
+    projection_years values: projected FCF, discount factors and the growth
+    terms they are built from.
+    """
+    return np.dtype(float).itemsize * (3 * projection_years + 10)
+
 
 class DCFValuator:
     """
@@ -113,6 +173,7 @@ class DCFValuator:
             'terminal_method': dcf_config.default_terminal_method,
             'fcf_type': dcf_config.default_fcf_type,
         }
+        self.monte_carlo = MonteCarloEngine()
 
     def calculate_dcf_projections(
         self, assumptions: Optional[Dict[str, Any]] = None
@@ -203,19 +264,7 @@ class DCFValuator:
 
         try:
             # Get FCF data using var_input_data system with fallback hierarchy
-            fcf_type = assumptions.get('fcf_type', 'FCFE')
-            fcf_values = self._get_fcf_data_from_var_system(fcf_type)
-
-            # If primary FCF type not available, try fallback hierarchy
-            if not fcf_values:
-                for fallback_type in ['FCFF', 'levered_fcf', 'free_cash_flow']:
-                    if fallback_type != fcf_type:  # Don't retry the same type
-                        fallback_values = self._get_fcf_data_from_var_system(fallback_type)
-                        if fallback_values:
-                            fcf_type = fallback_type
-                            fcf_values = fallback_values
-                            logger.info(f"Primary FCF type not available, using {fcf_type} as fallback")
-                            break
+            fcf_type, fcf_values = self._resolve_fcf_data(assumptions.get('fcf_type', 'FCFE'))
 
             if not fcf_values:
                 logger.error(f"No FCF data available for DCF calculation from var_input_data or financial_calculator")
@@ -320,29 +369,19 @@ class DCFValuator:
                 )
 
             # Calculate per-share values - require valid shares outstanding
-            shares_outstanding = market_data.get('shares_outstanding', 0)
-
-            # Calculate shares outstanding from market cap if not directly available
-            if shares_outstanding <= 0:
-                current_price = market_data.get('current_price', 0)
-                market_cap = market_data.get('market_cap', 0)
+            shares_outstanding = self._resolve_shares_outstanding(market_data)
 
-                if current_price > 0 and market_cap > 0:
-                    shares_outstanding = market_cap / current_price
-                    logger.info(
-                        f"Calculated shares outstanding from market data: {shares_outstanding/1000000:.1f}M shares"
-                    )
-                else:
-                    # No fallback - DCF calculation cannot proceed without shares outstanding
-                    logger.error(
-                        "Cannot determine shares outstanding: no direct data or market cap/price available"
-                    )
-                    return {
-                        'error': 'shares_outstanding_unavailable',
-                        'error_message': 'Shares outstanding cannot be determined. Please ensure ticker symbol is correct and market data is available.',
-                        'fcf_type': fcf_type,
-                        'market_data': market_data,
-                    }
+            if shares_outstanding is None:
+                # No fallback - DCF calculation cannot proceed without shares outstanding
+                logger.error(
+                    "Cannot determine shares outstanding: no direct data or market cap/price available"
+                )
+                return {
+                    'error': 'shares_outstanding_unavailable',
+                    'error_message': 'Shares outstanding cannot be determined. Please ensure ticker symbol is correct and market data is available.',
+                    'fcf_type': fcf_type,
+                    'market_data': market_data,
+                }
 
             # Validate shares outstanding is reasonable
             if shares_outstanding <= 0:
@@ -456,8 +495,8 @@ class DCFValuator:
             logger.error(f"Error in DCF calculation: {e}")
             return {}
 
-    @lru_cache(maxsize=128)
-    def _calculate_historical_growth_rates(self, fcf_values: tuple) -> Dict[str, float]:
+    @content_memoized(maxsize=128)
+    def _calculate_historical_growth_rates(self, fcf_values: Tuple[float, ...]) -> Dict[str, float]:
         """
         Calculate historical growth rates from FCF data
 
@@ -808,6 +847,7 @@ class DCFValuator:
         discount_rates: List[float],
         growth_rates: List[float],
         base_assumptions: Optional[Dict[str, Any]] = None,
+        vectorized: bool = True,
     ) -> Dict[str, Any]:
         """
         Perform comprehensive sensitivity analysis on DCF valuation.
@@ -833,6 +873,11 @@ class DCFValuator:
             the instance's default assumptions. Only discount_rate and
             growth_rate_yr1_5 are varied; other assumptions remain constant.
 
+        vectorized : bool, default True
+            If True, historical FCF, net debt and share count are resolved once and
+            the whole grid is evaluated as NumPy arrays. If False, the full
+            calculate_dcf_projections() pipeline is run once per grid cell.
+
         Returns
         -------
         dict
@@ -876,6 +921,7 @@ class DCFValuator:
         - If market price is unavailable, upside_downside values will be 0
         - Growth rates are applied to years 1-5; years 5-10 use separate assumption
         - Terminal growth rate and other parameters remain constant during analysis
+        - The vectorized mode does not write per-cell results to var_input_data
         """
         if base_assumptions is None:
             base_assumptions = self.default_assumptions.copy()
@@ -892,6 +938,21 @@ class DCFValuator:
             'current_price': current_price,
         }
 
+        if vectorized:
+            valuations = self._vectorized_sensitivity_grid(
+                discount_rates, growth_rates, base_assumptions, market_data
+            )
+            if current_price > 0:
+                upside = np.where(
+                    valuations > 0, (valuations - current_price) / current_price, 0.0
+                )
+            else:
+                upside = np.zeros_like(valuations)
+
+            results['valuations'] = valuations.tolist()
+            results['upside_downside'] = upside.tolist()
+            return results
+
         for discount_rate in discount_rates:
             valuation_row = []
             upside_row = []
@@ -919,6 +980,276 @@ class DCFValuator:
 
         return results
     
+    def _vectorized_sensitivity_grid(
+        self,
+        discount_rates: List[float],
+        growth_rates: List[float],
+        base_assumptions: Dict[str, Any],
+        market_data: Dict[str, Any],
+    ) -> np.ndarray:
+        """
+        Evaluate value per share over a (discount rate x growth rate) grid in one pass
+
+        Mirrors calculate_dcf_projections() cell by cell. Without FCF data or shares
+        outstanding every cell is 0. Where the discount rate equals the terminal
+        growth rate only the terminal value is zeroed, as in _calculate_terminal_value,
+        so the cell is the present value of the projected FCF alone.
+
+        Args:
+            discount_rates: Discount rates (rows of the grid)
+            growth_rates: Years 1-5 growth rates (columns of the grid)
+            base_assumptions: Assumptions held constant across the grid
+            market_data: Market data from _get_market_data()
+
+        Returns:
+            np.ndarray: Value per share matrix of shape (len(discount_rates), len(growth_rates))
+        """
+        rates = np.asarray(discount_rates, dtype=float)
+        growth = np.asarray(growth_rates, dtype=float)
+        valuations = np.zeros((rates.size, growth.size))
+
+        try:
+            fcf_type, fcf_values = self._resolve_fcf_data(base_assumptions.get('fcf_type', 'FCFE'))
+            if not fcf_values:
+                logger.error("No FCF data available for sensitivity analysis")
+                return valuations
+
+            shares_outstanding = self._resolve_shares_outstanding(market_data)
+            if shares_outstanding is None or shares_outstanding <= 0:
+                logger.error("Cannot determine shares outstanding for sensitivity analysis")
+                return valuations
+
+            projection_years = int(base_assumptions['projection_years'])
+            growth_yr5_10 = base_assumptions.get('growth_rate_yr5_10', 0.03)
+            terminal_growth = base_assumptions.get('terminal_growth_rate')
+            base_fcf = fcf_values[-1]
+
+            # Projected FCF for every growth rate: shape (growth, years)
+            years = np.arange(1, projection_years + 1)
+            projected_fcf = (
+                base_fcf
+                * (1 + growth[:, None]) ** np.minimum(years, 5)
+                * (1 + growth_yr5_10) ** np.maximum(years - 5, 0)
+            )
+
+            # Discount factors for every rate: shape (years, rates)
+            discount_factors = (1 + rates[None, :]) ** -years[:, None]
+            sum_pv_fcf = (projected_fcf @ discount_factors).T
+
+            # Gordon growth terminal value; zero where undefined, as in _calculate_terminal_value
+            if terminal_growth is None:
+                pv_terminal = np.zeros_like(sum_pv_fcf)
+            else:
+                denominator = rates - terminal_growth
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    terminal_value = (
+                        projected_fcf[None, :, -1]
+                        * (1 + terminal_growth)
+                        / denominator[:, None]
+                    )
+                terminal_value = np.where(denominator[:, None] == 0, 0.0, terminal_value)
+                pv_terminal = terminal_value * discount_factors[-1][:, None]
+
+            equity_value = sum_pv_fcf + pv_terminal
+            if fcf_type != 'FCFE':
+                equity_value = equity_value - self._get_net_debt()
+
+            # Equity value is in millions; TASE per-share values are in Agorot
+            scale = 1000000 * 100 if getattr(self.financial_calculator, 'is_tase_stock', False) else 1000000
+            valuations = equity_value * scale / shares_outstanding
+
+        except Exception as e:
+            logger.error(f"Error in vectorized sensitivity analysis: {e}")
+
+        return valuations
+
+    def monte_carlo_valuation(
+        self,
+        n_paths: int = 100_000,
+        distributions: Optional[Dict[str, Any]] = None,
+        base_assumptions: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Probabilistic DCF: value per share distribution over sampled assumptions.
+
+        discount_rate, growth_rate_yr1_5, growth_rate_yr5_10 and terminal_growth_rate
+        are drawn per path from ``distributions`` (defaults: normal around the base
+        assumptions, see DEFAULT_MONTE_CARLO_DISTRIBUTIONS). FCF for every path is
+        projected as one (paths x years) array using the same growth, Gordon growth
+        terminal value and discounting rules as calculate_dcf_projections().
+
+        Parameters
+        ----------
+        n_paths : int, default 100_000
+            Number of simulated paths
+        distributions : dict, optional
+            Per-assumption overrides of DEFAULT_MONTE_CARLO_DISTRIBUTIONS; a plain
+            number fixes that assumption. See _sample_assumption() for the format.
+        base_assumptions : dict, optional
+            Base-case assumptions; defaults to the instance's default assumptions
+        seed : int, optional
+            Reseed the valuator's Monte Carlo engine for a reproducible run
+
+        Returns
+        -------
+        dict
+            - value_per_share : np.ndarray of shape (n_paths,)
+            - mean, std : float
+            - percentiles : dict of '5%'...'95%' to value per share
+            - probability_above_price : float or None, share of paths above current price
+            - clipped_terminal_paths : int, paths whose terminal growth was capped
+              MIN_DISCOUNT_TERMINAL_SPREAD below the discount rate (None for
+              chunked runs)
+            - fcf_type, n_paths, distributions, current_price
+            Returns a dict with an 'error' key when FCF data or shares outstanding
+            are unavailable.
+
+        Notes
+        -----
+        - Results are not written to var_input_data
+        - Paths are simulated with the shared MonteCarloEngine, so large runs
+          stream in chunks; the full sample array is returned only for runs
+          that fit the engine's memory limit
+        """
+        if base_assumptions is None:
+            base_assumptions = self.default_assumptions.copy()
+        specs = {**DEFAULT_MONTE_CARLO_DISTRIBUTIONS, **(distributions or {})}
+
+        fcf_type, fcf_values = self._resolve_fcf_data(base_assumptions.get('fcf_type', 'FCFE'))
+        if not fcf_values:
+            logger.error("No FCF data available for Monte Carlo DCF")
+            return {'error': 'fcf_data_unavailable', 'fcf_type': fcf_type}
+
+        market_data = self._get_market_data()
+        shares_outstanding = self._resolve_shares_outstanding(market_data)
+        if shares_outstanding is None or shares_outstanding <= 0:
+            logger.error("Cannot determine shares outstanding for Monte Carlo DCF")
+            return {'error': 'shares_outstanding_unavailable', 'fcf_type': fcf_type}
+
+        historical_growth = self._calculate_historical_growth_rates(tuple(fcf_values))
+        base = {
+            'discount_rate': base_assumptions['discount_rate'],
+            'growth_rate_yr1_5': base_assumptions.get(
+                'growth_rate_yr1_5', historical_growth.get('projection_growth', 0.05)
+            ),
+            'growth_rate_yr5_10': base_assumptions.get('growth_rate_yr5_10', 0.03),
+            'terminal_growth_rate': base_assumptions['terminal_growth_rate'],
+        }
+
+        years = np.arange(1, int(base_assumptions['projection_years']) + 1)
+        base_fcf = fcf_values[-1]
+        net_debt = self._get_net_debt() if fcf_type != 'FCFE' else 0.0
+        # Equity value is in millions; TASE per-share values are in Agorot
+        scale = 1000000 * 100 if getattr(self.financial_calculator, 'is_tase_stock', False) else 1000000
+        # Set by the single full-size draw of an in-memory run; chunked runs leave it None
+        clipped_paths = [None]
+
+        def value_per_share_sampler(rng: np.random.Generator, n: int) -> np.ndarray:
+            draws = {name: _sample_assumption(rng, specs[name], base[name], n) for name in base}
+            rates = draws['discount_rate']
+            terminal_growth = draws['terminal_growth_rate']
+            ceiling = rates - MIN_DISCOUNT_TERMINAL_SPREAD
+            if n == n_paths:
+                clipped_paths[0] = int(np.count_nonzero(terminal_growth > ceiling))
+            terminal_growth = np.minimum(terminal_growth, ceiling)
+
+            # (paths, years) projected FCF and discount factors
+            projected_fcf = (
+                base_fcf
+                * (1 + draws['growth_rate_yr1_5'][:, None]) ** np.minimum(years, 5)
+                * (1 + draws['growth_rate_yr5_10'][:, None]) ** np.maximum(years - 5, 0)
+            )
+            discount_factors = (1 + rates[:, None]) ** -years
+            sum_pv_fcf = np.einsum('ij,ij->i', projected_fcf, discount_factors)
+
+            terminal_value = projected_fcf[:, -1] * (1 + terminal_growth) / (rates - terminal_growth)
+            equity_value = sum_pv_fcf + terminal_value * discount_factors[:, -1] - net_debt
+            return equity_value * scale / shares_outstanding
+
+        if seed is not None:
+            self.monte_carlo.reseed(seed)
+        summary = self.monte_carlo.simulate(
+            value_per_share_sampler,
+            n_paths,
+            quantiles=MONTE_CARLO_PERCENTILES,
+            keep_samples=True,
+            bytes_per_path=_monte_carlo_bytes_per_path(len(years)),
+        )
+
+        current_price = market_data.get('current_price', 0)
+        samples = summary.samples
+        probability_above_price = None
+        if current_price and current_price > 0 and samples is not None:
+            probability_above_price = float(np.mean(samples > current_price))
+
+        return {
+            'fcf_type': fcf_type,
+            'n_paths': n_paths,
+            'value_per_share': samples,
+            'mean': float(summary.mean),
+            'std': float(summary.std),
+            'percentiles': {
+                f'{level:.0%}': float(summary.quantile(level)) for level in MONTE_CARLO_PERCENTILES
+            },
+            'probability_above_price': probability_above_price,
+            'current_price': current_price,
+            'clipped_terminal_paths': clipped_paths[0],
+            'distributions': specs,
+        }
+
+    def _resolve_fcf_data(self, fcf_type: str) -> Tuple[str, List[float]]:
+        """
+        Get FCF data for the requested type, walking the fallback hierarchy if needed
+
+        Args:
+            fcf_type: Preferred FCF type ('FCFE', 'FCFF', 'LFCF', ...)
+
+        Returns:
+            tuple: (FCF type actually used, list of FCF values or empty list)
+        """
+        fcf_values = self._get_fcf_data_from_var_system(fcf_type)
+
+        # If primary FCF type not available, try fallback hierarchy
+        if not fcf_values:
+            for fallback_type in ['FCFF', 'levered_fcf', 'free_cash_flow']:
+                if fallback_type != fcf_type:  # Don't retry the same type
+                    fallback_values = self._get_fcf_data_from_var_system(fallback_type)
+                    if fallback_values:
+                        fcf_type = fallback_type
+                        fcf_values = fallback_values
+                        logger.info(f"Primary FCF type not available, using {fcf_type} as fallback")
+                        break
+
+        return fcf_type, fcf_values
+
+    def _resolve_shares_outstanding(self, market_data: Dict[str, Any]) -> Optional[float]:
+        """
+        Determine shares outstanding, deriving it from market cap and price if needed
+
+        Args:
+            market_data: Market data from _get_market_data()
+
+        Returns:
+            float or None: Shares outstanding, or None if it cannot be determined
+        """
+        shares_outstanding = market_data.get('shares_outstanding', 0)
+
+        # Calculate shares outstanding from market cap if not directly available
+        if shares_outstanding <= 0:
+            current_price = market_data.get('current_price', 0)
+            market_cap = market_data.get('market_cap', 0)
+
+            if current_price > 0 and market_cap > 0:
+                shares_outstanding = market_cap / current_price
+                logger.info(
+                    f"Calculated shares outstanding from market data: {shares_outstanding/1000000:.1f}M shares"
+                )
+            else:
+                return None
+
+        return shares_outstanding
+
     def _get_fcf_data_from_var_system(self, fcf_type: str) -> List[float]:
         """
         Get FCF data from var_input_data system with fallback to financial_calculator
@@ -213,7 +213,6 @@ import numpy as np
 from openpyxl import load_workbook
 import logging
 from datetime import datetime
-from functools import lru_cache
 from scipy import stats
 import yfinance as yf
 import re
@@ -235,6 +234,8 @@ from utils.error_handler import (
     EnhancedLogger,
     with_error_handling,
 )
+from utils.memoization import content_memoized
+from utils.excel_processor import build_typed_dataframe, is_fy_header_row, stream_statement_rows
 import functools
 import time
 import requests
@@ -432,13 +433,146 @@ def handle_financial_nan_series(
     return filled_series
 
 
+def _coerce_metric_cell(value: Any) -> Tuple[float, bool]:
+    """
+    Convert a statement cell to float the way unvalidated metric extraction does
+
+    Args:
+        value: Raw cell value
+
+    Returns:
+        tuple: (numeric value, whether the cell was empty)
+    """
+    try:
+        if pd.isna(value) or value == '':
+            return 0.0, True
+    except (TypeError, ValueError):
+        pass
+
+    if isinstance(value, (int, float, np.number)):
+        return float(value), False
+
+    try:
+        if isinstance(value, str):
+            value = value.replace(',', '').replace('(', '-').replace(')', '')
+        numeric_val = pd.to_numeric(value, errors='coerce')
+        return (float(numeric_val) if pd.notna(numeric_val) else 0.0), False
+    except (ValueError, TypeError):
+        return 0.0, False
+
+
+class MetricRowIndex:
+    """
+    Row-label index over a row-oriented (Excel format) financial statement
+
+    Built once per DataFrame. Labels are taken from the first non-null cell of the
+    first three columns and normalized to lower case, mapping to row positions. The
+    data columns (4th onward) are converted into a float matrix on first use, so
+    unvalidated extraction is a dictionary lookup plus an array slice while validated
+    extraction never pays for it. Row lookups are memoized per metric name for the
+    lifetime of the index.
+    """
+
+    LABEL_COLUMNS = 3
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self.raw_values = df.to_numpy(dtype=object)
+        self.labels: List[str] = []
+        self.label_rows: List[int] = []
+        self.exact: Dict[str, int] = {}
+
+        label_width = min(self.LABEL_COLUMNS, self.raw_values.shape[1])
+        for pos in range(self.raw_values.shape[0]):
+            metric_text = None
+            for col_idx in range(label_width):
+                cell = self.raw_values[pos, col_idx]
+                if pd.notna(cell):
+                    metric_text = str(cell).strip()
+                    break
+            if metric_text:
+                self.labels.append(metric_text)
+                self.label_rows.append(pos)
+                self.exact.setdefault(metric_text.lower(), pos)
+
+        self._lowered = [label.lower() for label in self.labels]
+
+        self._numeric_values: Optional[np.ndarray] = None
+        self._empty_mask: Optional[np.ndarray] = None
+        self._lookups: Dict[str, Tuple[Optional[int], float]] = {}
+
+    def _coerce_data_columns(self) -> None:
+        """Convert every data cell once with _coerce_metric_cell"""
+        data = self.raw_values[:, self.LABEL_COLUMNS:]
+        numeric_values = np.zeros(data.shape, dtype=np.float64)
+        empty_mask = np.zeros(data.shape, dtype=bool)
+        for (row, col), cell in np.ndenumerate(data):
+            numeric_values[row, col], empty_mask[row, col] = _coerce_metric_cell(cell)
+        self._numeric_values, self._empty_mask = numeric_values, empty_mask
+
+    @property
+    def numeric_values(self) -> np.ndarray:
+        """Data columns as floats (empty and unparseable cells are 0.0)"""
+        if self._numeric_values is None:
+            self._coerce_data_columns()
+        return self._numeric_values
+
+    @property
+    def empty_mask(self) -> np.ndarray:
+        """True where a data cell is empty"""
+        if self._empty_mask is None:
+            self._coerce_data_columns()
+        return self._empty_mask
+
+    def find(self, metric_name: str) -> Tuple[Optional[int], float]:
+        """
+        Resolve a metric name to a row position
+
+        An exact (case-insensitive) label match wins; otherwise the label containing the
+        metric name with the highest len(metric_name) / len(label) score is used, earliest
+        row first on ties.
+
+        Args:
+            metric_name: Metric name to look up
+
+        Returns:
+            tuple: (row position or None, match score; 1.0 for exact matches)
+        """
+        cached = self._lookups.get(metric_name)
+        if cached is not None:
+            return cached
+
+        target = metric_name.lower()
+        pos = self.exact.get(target)
+        result = (pos, 1.0)
+        if pos is None:
+            best_score = 0
+            best_pos = None
+            for label, lowered, row in zip(self.labels, self._lowered, self.label_rows):
+                if target in lowered:
+                    match_score = len(metric_name) / len(label)
+                    if match_score > best_score:
+                        best_score = match_score
+                        best_pos = row
+            result = (best_pos, best_score)
+
+        self._lookups[metric_name] = result
+        return result
+
+
 class FinancialCalculator:
     """
     Core financial calculations for FCF analysis and DCF valuation
     """
 
+    # Upper bound on statement indexes kept alive for ad-hoc DataFrames
+    MAX_METRIC_INDEXES = 64
+
     def __init__(
-        self, company_folder: Optional[str], enhanced_data_manager: Optional[Any] = None
+        self,
+        company_folder: Optional[str],
+        enhanced_data_manager: Optional[Any] = None,
+        streaming_excel: bool = False,
     ) -> None:
         """
         Initialize financial calculator with company folder path
@@ -446,8 +580,11 @@ class FinancialCalculator:
         Args:
             company_folder (str): Path to company folder containing FY and LTM subfolders
             enhanced_data_manager (EnhancedDataManager, optional): Enhanced data manager for multi-source data access
+            streaming_excel (bool): Load statements through the read-only streaming parser
+                (cached cell values, rows from the FY header onward, typed columns)
         """
         self.company_folder = company_folder
+        self.streaming_excel = streaming_excel
         self.company_name = (
             os.path.basename(company_folder) if company_folder else get_unknown_company_name()
         )
@@ -488,6 +625,9 @@ class FinancialCalculator:
         self.metrics = {}
         self.metrics_calculated = False
 
+        # Row-label indexes for loaded statements, keyed by id() of the DataFrame
+        self._metric_indexes: Dict[int, MetricRowIndex] = {}
+
         # Financial data scale factor - Excel data is typically in millions
         # Keep FCF results in millions to match DCF module expectations
         self.financial_scale_factor = 1
@@ -563,6 +703,12 @@ class FinancialCalculator:
             self.metrics = {}
             self.metrics_calculated = False
 
+            # Index every statement once so metric extraction avoids row scans
+            self._metric_indexes = {}
+            for df in self.financial_data.values():
+                if isinstance(df, pd.DataFrame) and not df.empty:
+                    self._get_metric_index(df)
+
         except (FileNotFoundError, PermissionError) as e:
             logger.error(
                 f"File access error loading financial statements: {e}",
@@ -592,23 +738,29 @@ class FinancialCalculator:
             pd.DataFrame: Financial data with dynamically discovered FY columns
         """
         try:
-            wb = load_workbook(filename=file_path)
-            sheet = wb.active
-
-            # Convert to list of lists, then to DataFrame
-            data = []
-            for row in sheet.iter_rows(values_only=True):
-                data.append(row)
-
-            # Find the header row (contains 'FY-N', 'FY', etc.)
-            header_row_idx = None
-            for i, row in enumerate(data):
-                if row and any('FY-' in str(cell) or 'FY' == str(cell) for cell in row if cell):
-                    header_row_idx = i
-                    break
+            if self.streaming_excel:
+                # Read-only streaming parse: only rows from the FY header onward are kept
+                headers, data_rows = stream_statement_rows(file_path)
+            else:
+                wb = load_workbook(filename=file_path)
+                sheet = wb.active
+
+                # Convert to list of lists, then to DataFrame
+                data = []
+                for row in sheet.iter_rows(values_only=True):
+                    data.append(row)
+
+                # Find the header row (contains 'FY-N', 'FY', etc.)
+                headers = None
+                for i, row in enumerate(data):
+                    if is_fy_header_row(row):
+                        headers = row
+                        data_rows = data[i + 1:]
+                        break
+                else:
+                    data_rows = data
 
-            if header_row_idx is not None:
-                headers = data[header_row_idx]
+            if headers is not None:
                 
                 # Dynamic FY column discovery and analysis
                 fy_columns = []
@@ -665,8 +817,10 @@ class FinancialCalculator:
                         context={'file_path': file_path}
                     )
 
-                data_rows = data[header_row_idx + 1:]
-                df = pd.DataFrame(data_rows, columns=headers)
+                if self.streaming_excel:
+                    df = build_typed_dataframe(data_rows, headers)
+                else:
+                    df = pd.DataFrame(data_rows, columns=headers)
                 
                 # Store FY column metadata on the DataFrame for future reference
                 if hasattr(df, 'attrs'):
@@ -676,10 +830,10 @@ class FinancialCalculator:
             else:
                 logger.warning(f"No FY header row found in {os.path.basename(file_path)}, using fallback method")
                 # Fallback to old method
-                if len(data) > 1:
-                    df = pd.DataFrame(data[1:], columns=data[0])
+                if len(data_rows) > 1:
+                    df = pd.DataFrame(data_rows[1:], columns=data_rows[0])
                 else:
-                    df = pd.DataFrame(data)
+                    df = pd.DataFrame(data_rows)
 
             return df
 
@@ -2448,45 +2602,18 @@ class FinancialCalculator:
             # Fall back to Excel format search (metrics in rows)
             logger.debug(f"Searching for '{metric_name}' in row format (Excel format)")
 
-            # Find row containing the metric with enhanced search
-            metric_row = None
-            available_metrics = []
-            best_match_score = 0
-            best_match_row = None
-
-            for idx, row in df.iterrows():
-                # Check multiple columns for metric names (more flexible matching)
-                metric_text = None
-                for col_idx in [0, 1, 2]:  # Check first 3 columns
-                    if len(row) > col_idx and pd.notna(row.iloc[col_idx]):
-                        metric_text = str(row.iloc[col_idx]).strip()
-                        break
-
-                if metric_text:
-                    available_metrics.append(metric_text)
-
-                    # Exact match (best case)
-                    if metric_name.lower() == metric_text.lower():
-                        metric_row = row
-                        logger.debug(f"Exact match found for '{metric_name}' at row {idx}")
-                        break
+            # Find row containing the metric via the statement's label index
+            index = self._get_metric_index(df)
+            available_metrics = index.labels
+            row_pos, match_score = index.find(metric_name)
 
-                    # Partial match with scoring
-                    if metric_name.lower() in metric_text.lower():
-                        # Calculate match score based on how much of the target is in the text
-                        match_score = len(metric_name) / len(metric_text)
-                        if match_score > best_match_score:
-                            best_match_score = match_score
-                            best_match_row = row
-
-            # Use best match if no exact match found
-            if metric_row is None and best_match_row is not None:
-                metric_row = best_match_row
-                logger.info(
-                    f"Using best match for '{metric_name}' with score {best_match_score:.2f}"
-                )
+            if row_pos is not None:
+                if metric_name.lower() in index.exact:
+                    logger.debug(f"Exact match found for '{metric_name}' at row {df.index[row_pos]}")
+                else:
+                    logger.info(f"Using best match for '{metric_name}' with score {match_score:.2f}")
 
-            if metric_row is None:
+            if row_pos is None:
                 error_msg = f"Metric '{metric_name}' not found in financial data"
                 logger.warning(error_msg)
 
@@ -2515,42 +2642,33 @@ class FinancialCalculator:
             empty_count = 0
             invalid_count = 0
 
-            # Skip the first 3 columns which contain metadata
-            for col_idx, val in enumerate(metric_row.iloc[3:], start=3):
-                context = f"{metric_name}.Column{col_idx}"
+            if self.validation_enabled:
+                # Skip the first 3 columns which contain metadata
+                for col_idx, val in enumerate(index.raw_values[row_pos, 3:], start=3):
+                    context = f"{metric_name}.Column{col_idx}"
 
-                if pd.isna(val) or val == '':
-                    empty_count += 1
-                    if self.validation_enabled:
+                    if pd.isna(val) or val == '':
+                        empty_count += 1
                         validated_val, is_valid = self.data_validator.validate_cell_value(
                             val, float, True, context
                         )
                         values.append(validated_val)
                     else:
-                        values.append(0)
-                else:
-                    try:
-                        # Enhanced numeric conversion with modern pandas error handling
-                        if self.validation_enabled:
+                        try:
                             validated_val, is_valid = self.data_validator.validate_cell_value(
                                 val, float, True, context
                             )
                             values.append(validated_val)
                             if not is_valid:
                                 invalid_count += 1
-                        else:
-                            # Use pandas to_numeric for robust conversion with error handling
-                            if isinstance(val, str):
-                                clean_val = val.replace(',', '').replace('(', '-').replace(')', '')
-                                numeric_val = pd.to_numeric(clean_val, errors='coerce')
-                            else:
-                                numeric_val = pd.to_numeric(val, errors='coerce')
-
-                            values.append(numeric_val if pd.notna(numeric_val) else 0.0)
-                    except (ValueError, TypeError) as e:
-                        invalid_count += 1
-                        logger.warning(f"Invalid value in {context}: {val} -> {e}")
-                        values.append(0)
+                        except (ValueError, TypeError) as e:
+                            invalid_count += 1
+                            logger.warning(f"Invalid value in {context}: {val} -> {e}")
+                            values.append(0)
+            else:
+                # Precomputed numeric row from the statement index
+                values = index.numeric_values[row_pos].tolist()
+                empty_count = int(index.empty_mask[row_pos].sum())
 
             # Log data quality information
             if empty_count > 0:
@@ -2588,9 +2706,31 @@ class FinancialCalculator:
                 self.data_validator.report.add_error(error_msg, "Metric extraction function")
             return []
 
-    @lru_cache(maxsize=256)
+    def _get_metric_index(self, df: pd.DataFrame) -> MetricRowIndex:
+        """
+        Get (building on first use) the row-label index for a statement DataFrame
+
+        Args:
+            df (pd.DataFrame): Row-oriented financial statement
+
+        Returns:
+            MetricRowIndex: Index for the DataFrame
+        """
+        if not hasattr(self, '_metric_indexes'):
+            self._metric_indexes = {}
+
+        indexes = self._metric_indexes
+        index = indexes.get(id(df))
+        if index is None or index.df is not df:
+            if len(indexes) >= self.MAX_METRIC_INDEXES:
+                indexes.clear()
+            index = MetricRowIndex(df)
+            indexes[id(df)] = index
+        return index
+
+    @content_memoized(maxsize=256)
     def calculate_growth_rates(
-        self, values: tuple, periods: tuple = (1, 3, 5, 10)
+        self, values: Union[tuple, list, np.ndarray], periods: tuple = (1, 3, 5, 10)
     ) -> Dict[str, float]:
         """
         Calculate annualized growth rates for different periods
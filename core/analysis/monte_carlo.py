@@ -0,0 +1,285 @@
+"""
+Monte Carlo Simulation Engine
+=============================
+
+Shared, reproducible Monte Carlo engine for valuation distributions. Used by the
+P/B historical analysis and fair value calculators and by DCF scenario analysis.
+
+Key Features:
+- Seeded ``numpy.random.Generator`` draws, reproducible across runs
+- Many series (e.g. tickers) simulated together as one (series x paths) array
+- All confidence interval and VaR quantiles computed in a single call
+- Chunked streaming for 10^6+ paths within a memory limit
+
+Classes:
+--------
+MonteCarloSummary
+    Per-series mean, standard deviation and quantiles of a simulation
+
+MonteCarloEngine
+    Runs a sampler function in memory or in memory-capped chunks
+
+Usage Example:
+--------------
+>>> engine = MonteCarloEngine(seed=42)
+>>> summary = engine.simulate(normal_sampler([1.2, 2.5], [0.3, 0.4]), n_paths=100_000)
+>>> summary.confidence_interval(0.95)       # arrays of shape (2,)
+>>> summary.value_at_risk(0.05)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+# sampler(rng, n_paths) -> array of shape (..., n_paths)
+Sampler = Callable[[np.random.Generator, int], np.ndarray]
+
+DEFAULT_CONFIDENCE_LEVELS = (0.90, 0.95, 0.99)
+DEFAULT_VAR_LEVELS = (0.05, 0.01, 0.001)
+DEFAULT_MEMORY_LIMIT_BYTES = 64 * 1024 * 1024
+DEFAULT_HISTOGRAM_BINS = 8192
+
+# Samplers typically hold a few temporaries the size of their output
+_SAMPLER_WORKSPACE_FACTOR = 4
+
+
+def quantile_levels(confidence_levels: Sequence[float] = DEFAULT_CONFIDENCE_LEVELS,
+                    var_levels: Sequence[float] = DEFAULT_VAR_LEVELS) -> Tuple[float, ...]:
+    """Sorted, de-duplicated quantiles needed for the given CI and VaR levels"""
+    levels = {0.5}
+    for level in confidence_levels:
+        alpha = 1.0 - level
+        levels.update((round(alpha / 2, 10), round(1.0 - alpha / 2, 10)))
+    levels.update(round(q, 10) for q in var_levels)
+    return tuple(sorted(levels))
+
+
+@dataclass
+class MonteCarloSummary:
+    """
+    Summary statistics of a Monte Carlo run.
+
+    Arrays have the sampler's leading (series) shape; a 1-D sampler gives
+    scalar (0-d) arrays. ``quantiles`` is indexed by position in
+    ``quantile_levels`` first.
+    """
+
+    n_paths: int
+    mean: np.ndarray
+    std: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    quantile_levels: Tuple[float, ...]
+    quantiles: np.ndarray
+    chunked: bool = False
+    samples: Optional[np.ndarray] = None
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Simulated value at quantile q (must be one of quantile_levels)"""
+        for index, level in enumerate(self.quantile_levels):
+            if np.isclose(level, q):
+                return self.quantiles[index]
+        raise KeyError(f"Quantile {q} was not computed; available: {self.quantile_levels}")
+
+    def confidence_interval(self, level: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Central interval containing the given share of simulated values"""
+        alpha = 1.0 - level
+        return self.quantile(alpha / 2), self.quantile(1.0 - alpha / 2)
+
+    def value_at_risk(self, level: float) -> np.ndarray:
+        """Simulated value at the lower tail probability ``level``"""
+        return self.quantile(level)
+
+
+def normal_sampler(mean: ArrayLike, std: ArrayLike, minimum: Optional[float] = None) -> Sampler:
+    """
+    Sampler drawing normal values for one or many series.
+
+    Args:
+        mean: Mean per series (scalar or 1-D)
+        std: Standard deviation per series (scalar or 1-D)
+        minimum: Optional floor applied to every draw
+    """
+    mean = np.asarray(mean, dtype=float)
+    std = np.asarray(std, dtype=float)
+
+    def sample(rng: np.random.Generator, n_paths: int) -> np.ndarray:
+        shape = np.broadcast(mean, std).shape + (n_paths,)
+        draws = rng.standard_normal(shape)
+        draws *= std[..., None]
+        draws += mean[..., None]
+        if minimum is not None:
+            np.maximum(draws, minimum, out=draws)
+        return draws
+
+    return sample
+
+
+def bootstrap_sampler(values: ArrayLike, noise_std: float = 0.0,
+                      minimum: Optional[float] = None) -> Sampler:
+    """
+    Sampler resampling observed values with replacement, plus optional normal noise.
+
+    Args:
+        values: Observations, 1-D for one series or 2-D (series x observations)
+        noise_std: Standard deviation of normal noise added to each draw
+        minimum: Optional floor applied to every draw
+    """
+    values = np.asarray(values, dtype=float)
+
+    def sample(rng: np.random.Generator, n_paths: int) -> np.ndarray:
+        indices = rng.integers(0, values.shape[-1], size=values.shape[:-1] + (n_paths,))
+        draws = np.take_along_axis(values, indices, axis=-1)
+        if noise_std > 0:
+            draws += rng.normal(0.0, noise_std, draws.shape)
+        if minimum is not None:
+            np.maximum(draws, minimum, out=draws)
+        return draws
+
+    return sample
+
+
+class MonteCarloEngine:
+    """
+    Reproducible Monte Carlo runner for vectorized samplers.
+
+    Successive ``simulate`` calls on one engine draw from a single seeded
+    generator, so a fixed seed reproduces the whole sequence of runs. Runs whose
+    samples would exceed ``memory_limit_bytes`` are streamed in chunks: moments
+    are merged across chunks and quantiles are read from a fine histogram built
+    in a second pass that regenerates each chunk from its own seed.
+    """
+
+    def __init__(self, seed: Optional[int] = None,
+                 memory_limit_bytes: int = DEFAULT_MEMORY_LIMIT_BYTES,
+                 histogram_bins: int = DEFAULT_HISTOGRAM_BINS) -> None:
+        self.seed = seed
+        self.memory_limit_bytes = memory_limit_bytes
+        self.histogram_bins = histogram_bins
+        self.rng = np.random.default_rng(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """Restart the draw sequence from ``seed`` (defaults to the engine seed)"""
+        self.rng = np.random.default_rng(self.seed if seed is None else seed)
+
+    def simulate(self, sampler: Sampler, n_paths: int,
+                 quantiles: Optional[Sequence[float]] = None,
+                 chunk_size: Optional[int] = None,
+                 keep_samples: bool = False,
+                 bytes_per_path: Optional[int] = None) -> MonteCarloSummary:
+        """
+        Run ``n_paths`` draws of ``sampler`` and summarize them per series.
+
+        Args:
+            sampler: Function ``(rng, n) -> array of shape (..., n)``
+            n_paths: Number of simulated paths per series
+            quantiles: Quantile levels to report (defaults to the CI and VaR levels)
+            chunk_size: Paths per chunk; derived from the memory limit when omitted
+            keep_samples: Return the raw samples (in-memory runs only)
+            bytes_per_path: Peak memory the sampler needs per path, across all series;
+                defaults to a few temporaries the size of the sampler's output. Used to
+                derive ``chunk_size`` for samplers with larger intermediates.
+
+        Returns:
+            MonteCarloSummary: Per-series statistics
+        """
+        if n_paths < 1:
+            raise ValueError("n_paths must be positive")
+        levels = tuple(sorted(quantiles)) if quantiles is not None else quantile_levels()
+
+        probe = np.asarray(sampler(np.random.default_rng(0), 1))
+        series_shape = probe.shape[:-1]
+        series_count = int(np.prod(series_shape, dtype=np.int64))
+
+        if chunk_size is None:
+            if bytes_per_path is None:
+                bytes_per_path = series_count * probe.itemsize * _SAMPLER_WORKSPACE_FACTOR
+            chunk_size = max(1, self.memory_limit_bytes // max(bytes_per_path, 1))
+
+        if n_paths <= chunk_size:
+            samples = np.asarray(sampler(self.rng, n_paths), dtype=float)
+            return MonteCarloSummary(
+                n_paths=n_paths,
+                mean=samples.mean(axis=-1),
+                std=samples.std(axis=-1),
+                minimum=samples.min(axis=-1),
+                maximum=samples.max(axis=-1),
+                quantile_levels=levels,
+                quantiles=np.quantile(samples, levels, axis=-1),
+                samples=samples if keep_samples else None,
+            )
+
+        if keep_samples:
+            logger.warning("keep_samples ignored for chunked Monte Carlo run of %d paths", n_paths)
+        return self._simulate_chunked(sampler, n_paths, levels, chunk_size, series_shape)
+
+    def _simulate_chunked(self, sampler: Sampler, n_paths: int, levels: Tuple[float, ...],
+                          chunk_size: int, series_shape: Tuple[int, ...]) -> MonteCarloSummary:
+        """Two-pass streaming run: merged moments, then histogram quantiles"""
+        chunk_lengths = [chunk_size] * (n_paths // chunk_size)
+        if n_paths % chunk_size:
+            chunk_lengths.append(n_paths % chunk_size)
+        chunk_seeds = np.random.SeedSequence(self.rng.integers(2**63)).spawn(len(chunk_lengths))
+
+        def chunks():
+            for seed, length in zip(chunk_seeds, chunk_lengths):
+                yield np.asarray(sampler(np.random.default_rng(seed), length), dtype=float)
+
+        # Pass 1: count, mean, M2 (Chan et al. merge), min and max
+        count = 0
+        mean = np.zeros(series_shape)
+        m2 = np.zeros(series_shape)
+        minimum = np.full(series_shape, np.inf)
+        maximum = np.full(series_shape, -np.inf)
+        for chunk in chunks():
+            length = chunk.shape[-1]
+            chunk_mean = chunk.mean(axis=-1)
+            chunk_m2 = ((chunk - chunk_mean[..., None]) ** 2).sum(axis=-1)
+            delta = chunk_mean - mean
+            total = count + length
+            mean = mean + delta * (length / total)
+            m2 = m2 + chunk_m2 + delta ** 2 * (count * length / total)
+            count = total
+            np.minimum(minimum, chunk.min(axis=-1), out=minimum)
+            np.maximum(maximum, chunk.max(axis=-1), out=maximum)
+
+        # Pass 2: per-series histogram over [minimum, maximum]
+        bins = self.histogram_bins
+        flat_min = minimum.reshape(-1)
+        width = (maximum.reshape(-1) - flat_min) / bins
+        safe_width = np.where(width > 0, width, 1.0)
+        row_offsets = (np.arange(flat_min.size) * bins)[:, None]
+        counts = np.zeros(flat_min.size * bins, dtype=np.int64)
+        for chunk in chunks():
+            flat = chunk.reshape(flat_min.size, -1)
+            bin_index = ((flat - flat_min[:, None]) / safe_width[:, None]).astype(np.int64)
+            np.clip(bin_index, 0, bins - 1, out=bin_index)
+            counts += np.bincount((bin_index + row_offsets).ravel(), minlength=counts.size)
+
+        cumulative = np.cumsum(counts.reshape(flat_min.size, bins), axis=-1)
+        quantile_values = np.empty((len(levels), flat_min.size))
+        for position, q in enumerate(levels):
+            rank = q * count
+            bin_hit = np.argmax(cumulative >= max(rank, 1e-12), axis=-1)
+            rows = np.arange(flat_min.size)
+            below = np.where(bin_hit > 0, cumulative[rows, np.maximum(bin_hit - 1, 0)], 0)
+            in_bin = cumulative[rows, bin_hit] - below
+            fraction = np.clip((rank - below) / np.maximum(in_bin, 1), 0.0, 1.0)
+            quantile_values[position] = flat_min + (bin_hit + fraction) * width
+
+        return MonteCarloSummary(
+            n_paths=n_paths,
+            mean=mean,
+            std=np.sqrt(m2 / count),
+            minimum=minimum,
+            maximum=maximum,
+            quantile_levels=levels,
+            quantiles=quantile_values.reshape((len(levels),) + series_shape),
+            chunked=True,
+        )
@@ -60,6 +60,12 @@ except ImportError:
 
 from core.data_sources.interfaces.data_sources import DataSourceResponse, DataSourceType, DataQualityMetrics
 from core.analysis.pb.pb_historical_analysis import PBHistoricalAnalysisResult, PBHistoricalQualityMetrics, PBStatisticalSummary
+from core.analysis.monte_carlo import (
+    DEFAULT_CONFIDENCE_LEVELS,
+    DEFAULT_VAR_LEVELS,
+    MonteCarloEngine,
+    normal_sampler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -135,16 +141,19 @@ class PBFairValueCalculator:
     with weighted calculations, scenario analysis, and quality-adjusted confidence levels.
     """
     
-    def __init__(self, decay_factor: float = 0.85, min_data_points: int = 12) -> None:
+    def __init__(self, decay_factor: float = 0.85, min_data_points: int = 12,
+                 monte_carlo: Optional[MonteCarloEngine] = None) -> None:
         """Initialize the fair value calculator with weighting parameters.
         
         Args:
             decay_factor: Exponential decay factor for time weighting (0-1)
             min_data_points: Minimum historical data points required for calculation
+            monte_carlo: Shared Monte Carlo engine for fair value distributions
         """
         self.decay_factor = decay_factor
         self.min_data_points = min_data_points
         self.confidence_threshold = 0.7  # Minimum quality for strong signals
+        self.monte_carlo = monte_carlo or MonteCarloEngine()
         
         logger.info("P/B Fair Value Calculator initialized")
     
@@ -227,6 +236,71 @@ class PBFairValueCalculator:
                 error_message=f"Calculation error: {str(e)}"
             )
     
+    def simulate_fair_value_distribution(self, historical_analyses: Dict[str, PBHistoricalAnalysisResult],
+                                         book_values: Dict[str, float],
+                                         n_paths: int = 100_000) -> Dict[str, Dict[str, Any]]:
+        """
+        Simulate fair value distributions for many tickers in one batched run.
+
+        Each ticker's P/B multiple is drawn from a normal distribution around its
+        quality-weighted mean (median as fallback) with its historical standard
+        deviation widened for lower data quality, floored at 0.01, and scaled by
+        the ticker's book value per share.
+
+        Args:
+            historical_analyses: Historical P/B analysis results by ticker
+            book_values: Current book value per share by ticker
+            n_paths: Simulated paths per ticker
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per ticker 'mean', 'std', 'confidence_intervals'
+            and 'value_at_risk' of the fair value per share. Tickers without a
+            usable analysis or book value are omitted.
+        """
+        tickers, means, stds = [], [], []
+        for ticker, analysis in historical_analyses.items():
+            book_value = book_values.get(ticker)
+            statistics = analysis.statistics if analysis else None
+            if not book_value or book_value <= 0 or statistics is None:
+                continue
+            center = statistics.quality_weighted_mean or statistics.median_pb
+            if center <= 0:
+                continue
+            quality = analysis.quality_metrics.overall_score if analysis.quality_metrics else 0.5
+            tickers.append(ticker)
+            means.append(center)
+            stds.append(statistics.std_pb * (1.0 + (1.0 - quality) * 0.5))
+
+        if not tickers:
+            return {}
+
+        scale = np.array([book_values[ticker] for ticker in tickers])
+        pb_sampler = normal_sampler(means, stds, minimum=0.01)
+
+        def fair_value_sampler(rng: np.random.Generator, n: int) -> np.ndarray:
+            draws = pb_sampler(rng, n)
+            draws *= scale[:, None]
+            return draws
+
+        summary = self.monte_carlo.simulate(fair_value_sampler, n_paths)
+
+        distributions = {}
+        for index, ticker in enumerate(tickers):
+            distributions[ticker] = {
+                'mean': float(summary.mean[index]),
+                'std': float(summary.std[index]),
+                'confidence_intervals': {
+                    f'{level:.0%}': tuple(float(bound[index]) for bound in summary.confidence_interval(level))
+                    for level in DEFAULT_CONFIDENCE_LEVELS
+                },
+                'value_at_risk': {
+                    f'{level:.1%}': float(summary.value_at_risk(level)[index])
+                    for level in DEFAULT_VAR_LEVELS
+                },
+                'n_paths': n_paths,
+            }
+        return distributions
+
     def _validate_inputs(self, historical_analysis: PBHistoricalAnalysisResult, 
                         current_book_value: float) -> Dict[str, Any]:
         """Validate inputs for fair value calculation"""
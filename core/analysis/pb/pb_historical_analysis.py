@@ -45,14 +45,67 @@ from statistics import median, stdev
 import warnings
 from scipy import stats
 from scipy.stats import norm, t, jarque_bera
-import random
 
 from core.data_sources.interfaces.data_sources import DataSourceResponse, DataSourceType, DataQualityMetrics
 from core.analysis.pb.pb_calculation_engine import PBCalculationEngine, PBDataPoint, PBCalculationResult
+from core.analysis.monte_carlo import (
+    DEFAULT_CONFIDENCE_LEVELS,
+    DEFAULT_VAR_LEVELS,
+    MonteCarloEngine,
+    bootstrap_sampler,
+    normal_sampler,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _build_pb_frame(pb_data: List[PBDataPoint]) -> pd.DataFrame:
+    """
+    Convert P/B data points into a date-indexed frame sorted by date.
+
+    Dates are parsed once for the whole series; missing or unparseable dates
+    become NaT and sort last. Missing ratios and quality scores become NaN.
+    """
+    dates = pd.to_datetime([dp.date or None for dp in pb_data], errors='coerce', format='mixed')
+    frame = pd.DataFrame(
+        {
+            'pb_ratio': np.array(
+                [np.nan if dp.pb_ratio is None else dp.pb_ratio for dp in pb_data], dtype=float
+            ),
+            'data_quality': np.array(
+                [np.nan if dp.data_quality is None else dp.data_quality for dp in pb_data], dtype=float
+            ),
+        },
+        index=pd.DatetimeIndex(dates, name='date'),
+    )
+    return frame.sort_index(kind='stable', na_position='last')
+
+
+def _autocorrelation_function(values: Union[List[float], np.ndarray], max_lag: int) -> np.ndarray:
+    """
+    Autocorrelation for lags 0..max_lag computed with a single FFT.
+
+    Each lag is the mean cross-product of the overlapping points divided by the
+    population variance, matching the per-lag definition used by the engine.
+    """
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    max_lag = min(max_lag, n - 1)
+    if max_lag < 0:
+        return np.zeros(0)
+
+    centered = x - x.mean()
+    nfft = 1 << (2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(centered, nfft)
+    autocovariance = np.fft.irfft(spectrum * np.conj(spectrum), nfft)[:max_lag + 1]
+    autocovariance /= np.arange(n, n - max_lag - 1, -1)
+
+    variance = autocovariance[0]
+    if variance <= 0:
+        return np.zeros(max_lag + 1)
+    return autocovariance / variance
+
+
 @dataclass
 class PBHistoricalQualityMetrics(DataQualityMetrics):
     """
@@ -219,11 +272,20 @@ class PBHistoricalAnalysisEngine:
     framework to provide in-depth historical P/B analysis.
     """
     
-    def __init__(self):
-        """Initialize the historical P/B analysis engine"""
+    def __init__(self, seed: Optional[int] = None, monte_carlo_paths: Optional[int] = None):
+        """
+        Initialize the historical P/B analysis engine
+
+        Args:
+            seed: Seed for reproducible Monte Carlo draws
+            monte_carlo_paths: Fixed number of simulated paths; by default scales
+                with the number of data points (1,000-10,000)
+        """
         self.pb_engine = PBCalculationEngine()
         self.min_data_points = 12  # Minimum data points for meaningful analysis
         self.confidence_level = 0.95
+        self.monte_carlo = MonteCarloEngine(seed=seed)
+        self.monte_carlo_paths = monte_carlo_paths
         
         logger.info("P/B Historical Analysis Engine initialized")
     
@@ -328,17 +390,20 @@ class PBHistoricalAnalysisEngine:
             
             result.historical_data = historical_pb_data
             result.data_points_count = len(historical_pb_data)
-            
+
+            # Parse dates and sort once; every calculation below shares this frame
+            pb_frame = _build_pb_frame(historical_pb_data)
+
             # Calculate P/B-specific quality metrics
-            quality_metrics = self._calculate_pb_quality_metrics(historical_pb_data, response)
+            quality_metrics = self._calculate_pb_quality_metrics(historical_pb_data, response, pb_frame)
             result.quality_metrics = quality_metrics
-            
+
             # Perform statistical analysis
-            statistics = self._calculate_statistical_summary(historical_pb_data, quality_metrics)
+            statistics = self._calculate_statistical_summary(historical_pb_data, quality_metrics, pb_frame)
             result.statistics = statistics
-            
+
             # Perform trend analysis
-            trend_analysis = self._analyze_trends(historical_pb_data)
+            trend_analysis = self._analyze_trends(historical_pb_data, pb_frame)
             result.trend_analysis = trend_analysis
             
             # Calculate current position and valuation signals
@@ -362,15 +427,19 @@ class PBHistoricalAnalysisEngine:
                 error_message=f"Analysis error: {str(e)}"
             )
     
-    def _calculate_pb_quality_metrics(self, pb_data: List[PBDataPoint], 
-                                    response: DataSourceResponse) -> PBHistoricalQualityMetrics:
+    def _calculate_pb_quality_metrics(self, pb_data: List[PBDataPoint],
+                                    response: DataSourceResponse,
+                                    pb_frame: Optional[pd.DataFrame] = None) -> PBHistoricalQualityMetrics:
         """Calculate P/B-specific quality metrics for historical data"""
         try:
             metrics = PBHistoricalQualityMetrics()
-            
+
             if not pb_data:
                 return metrics
-            
+
+            if pb_frame is None:
+                pb_frame = _build_pb_frame(pb_data)
+
             # Basic quality metrics from base response
             if response.quality_metrics:
                 metrics.completeness = response.quality_metrics.completeness
@@ -397,13 +466,13 @@ class PBHistoricalAnalysisEngine:
             metrics.balance_sheet_quality = len(valid_bvps) / len(pb_data)
             
             # Temporal consistency check
-            metrics.temporal_consistency = self._assess_temporal_consistency(pb_data)
-            
+            metrics.temporal_consistency = self._assess_temporal_consistency(pb_data, pb_frame)
+
             # Outlier detection
             metrics.outlier_detection_score = self._calculate_outlier_score(pb_data)
-            
+
             # Data gap penalty
-            metrics.data_gap_penalty = self._calculate_data_gap_penalty(pb_data)
+            metrics.data_gap_penalty = self._calculate_data_gap_penalty(pb_data, pb_frame)
             
             # Calculate confidence interval width
             if len(valid_pb_points) > 1:
@@ -423,28 +492,31 @@ class PBHistoricalAnalysisEngine:
             logger.error(f"Error calculating P/B quality metrics: {e}")
             return PBHistoricalQualityMetrics()
     
-    def _assess_temporal_consistency(self, pb_data: List[PBDataPoint]) -> float:
+    def _assess_temporal_consistency(self, pb_data: List[PBDataPoint],
+                                     pb_frame: Optional[pd.DataFrame] = None) -> float:
         """Assess temporal consistency of P/B data"""
         try:
             if len(pb_data) < 2:
                 return 0.0
-            
+
+            if pb_frame is None:
+                pb_frame = _build_pb_frame(pb_data)
+
             # Check for reasonable temporal ordering and values
-            dates = [pd.to_datetime(dp.date) for dp in pb_data if dp.date]
-            dates.sort()
-            
+            dates = pb_frame.index.dropna()
+
             if len(dates) != len(pb_data):
                 return 0.5  # Some missing dates
-            
+
             # Check for reasonable time intervals
-            intervals = [(dates[i+1] - dates[i]).days for i in range(len(dates)-1)]
-            
+            intervals = (dates[1:] - dates[:-1]).days.to_numpy()
+
             # For quarterly data, expect ~90 day intervals
             expected_interval = 90
-            reasonable_intervals = [abs(interval - expected_interval) < 45 for interval in intervals]
-            
-            consistency_score = sum(reasonable_intervals) / len(reasonable_intervals)
-            
+            reasonable_intervals = np.abs(intervals - expected_interval) < 45
+
+            consistency_score = float(reasonable_intervals.mean())
+
             return consistency_score
             
         except Exception as e:
@@ -487,16 +559,21 @@ class PBHistoricalAnalysisEngine:
             logger.debug(f"Error calculating outlier score: {e}")
             return 0.5
     
-    def _calculate_data_gap_penalty(self, pb_data: List[PBDataPoint]) -> float:
+    def _calculate_data_gap_penalty(self, pb_data: List[PBDataPoint],
+                                    pb_frame: Optional[pd.DataFrame] = None) -> float:
         """Calculate penalty for data gaps in the time series"""
         try:
             if len(pb_data) < 2:
                 return 0.5
-            
-            # Sort by date
-            sorted_data = sorted(pb_data, key=lambda x: pd.to_datetime(x.date))
-            dates = [pd.to_datetime(dp.date) for dp in sorted_data]
-            
+
+            if pb_frame is None:
+                pb_frame = _build_pb_frame(pb_data)
+
+            # Frame is already sorted by date
+            dates = pb_frame.index.dropna()
+            if len(dates) < 2:
+                return 0.1
+
             # Estimate data completeness based on quarterly reporting assumption
             # Financial statements are typically reported quarterly (every ~90 days)
             total_period = (dates[-1] - dates[0]).days
@@ -518,16 +595,21 @@ class PBHistoricalAnalysisEngine:
             logger.debug(f"Error calculating data gap penalty: {e}")
             return 0.1
     
-    def _calculate_statistical_summary(self, pb_data: List[PBDataPoint], 
-                                     quality_metrics: PBHistoricalQualityMetrics) -> PBStatisticalSummary:
+    def _calculate_statistical_summary(self, pb_data: List[PBDataPoint],
+                                     quality_metrics: PBHistoricalQualityMetrics,
+                                     pb_frame: Optional[pd.DataFrame] = None) -> PBStatisticalSummary:
         """Calculate comprehensive statistical summary of P/B data"""
         try:
             summary = PBStatisticalSummary()
-            
-            # Extract valid P/B ratios
-            valid_ratios = [dp.pb_ratio for dp in pb_data if dp.pb_ratio and dp.pb_ratio > 0]
-            
-            if not valid_ratios:
+
+            if pb_frame is None:
+                pb_frame = _build_pb_frame(pb_data)
+
+            # Extract valid P/B ratios in date order
+            valid_rows = pb_frame[pb_frame['pb_ratio'] > 0]
+            valid_ratios = valid_rows['pb_ratio'].to_numpy()
+
+            if len(valid_ratios) == 0:
                 return summary
             
             # Basic statistics
@@ -545,19 +627,21 @@ class PBHistoricalAnalysisEngine:
             
             # Rolling statistics (12-month windows)
             if len(valid_ratios) >= 4:  # At least 4 quarters
-                summary.rolling_mean_12m = self._calculate_rolling_stats(pb_data, 'mean', 4)
-                summary.rolling_median_12m = self._calculate_rolling_stats(pb_data, 'median', 4)
-                summary.rolling_std_12m = self._calculate_rolling_stats(pb_data, 'std', 4)
-            
-            # Quality-weighted statistics
-            quality_weights = [dp.data_quality or quality_metrics.overall_score for dp in pb_data 
-                             if dp.pb_ratio and dp.pb_ratio > 0]
-            
-            if len(quality_weights) == len(valid_ratios) and sum(quality_weights) > 0:
+                summary.rolling_mean_12m = self._calculate_rolling_stats(pb_data, 'mean', 4, pb_frame)
+                summary.rolling_median_12m = self._calculate_rolling_stats(pb_data, 'median', 4, pb_frame)
+                summary.rolling_std_12m = self._calculate_rolling_stats(pb_data, 'std', 4, pb_frame)
+
+            # Quality-weighted statistics (missing or zero quality falls back to the overall score)
+            quality = valid_rows['data_quality'].to_numpy()
+            quality_weights = np.where(
+                np.isnan(quality) | (quality == 0), quality_metrics.overall_score, quality
+            )
+
+            if len(quality_weights) == len(valid_ratios) and quality_weights.sum() > 0:
                 summary.quality_weighted_mean = np.average(valid_ratios, weights=quality_weights)
                 # Quality-weighted standard deviation approximation
                 summary.quality_weighted_std = np.sqrt(
-                    np.average((np.array(valid_ratios) - summary.quality_weighted_mean)**2, 
+                    np.average((valid_ratios - summary.quality_weighted_mean)**2,
                               weights=quality_weights)
                 )
             else:
@@ -593,64 +677,42 @@ class PBHistoricalAnalysisEngine:
             logger.error(f"Error calculating statistical summary: {e}")
             return PBStatisticalSummary()
     
-    def _calculate_rolling_stats(self, pb_data: List[PBDataPoint], 
-                               stat_type: str, window: int) -> List[float]:
+    def _calculate_rolling_stats(self, pb_data: List[PBDataPoint],
+                               stat_type: str, window: int,
+                               pb_frame: Optional[pd.DataFrame] = None) -> List[float]:
         """Calculate rolling statistics for P/B data"""
         try:
-            # Sort by date
-            sorted_data = sorted(pb_data, key=lambda x: pd.to_datetime(x.date))
-            valid_ratios = [dp.pb_ratio for dp in sorted_data if dp.pb_ratio and dp.pb_ratio > 0]
-            
+            if pb_frame is None:
+                pb_frame = _build_pb_frame(pb_data)
+            valid_ratios = pb_frame.loc[pb_frame['pb_ratio'] > 0, 'pb_ratio'].to_numpy()
+
             if len(valid_ratios) < window:
                 return []
-            
-            rolling_stats = []
-            
-            for i in range(window - 1, len(valid_ratios)):
-                window_data = valid_ratios[i - window + 1:i + 1]
-                
-                if stat_type == 'mean':
-                    stat_value = np.mean(window_data)
-                elif stat_type == 'median':
-                    stat_value = np.median(window_data)
-                elif stat_type == 'std':
-                    stat_value = np.std(window_data)
-                else:
-                    stat_value = np.mean(window_data)
-                
-                rolling_stats.append(stat_value)
-            
-            return rolling_stats
-            
+
+            # One (n - window + 1, window) view over the series; no copies per window
+            windows = np.lib.stride_tricks.sliding_window_view(valid_ratios, window)
+
+            if stat_type == 'median':
+                rolling_stats = np.median(windows, axis=1)
+            elif stat_type == 'std':
+                rolling_stats = windows.std(axis=1)
+            else:
+                rolling_stats = windows.mean(axis=1)
+
+            return rolling_stats.tolist()
+
         except Exception as e:
             logger.debug(f"Error calculating rolling {stat_type}: {e}")
             return []
-    
+
     def _calculate_autocorrelation(self, values: List[float], lag: int) -> float:
         """Calculate autocorrelation at specified lag"""
         try:
             if len(values) <= lag:
                 return 0.0
-            
-            # Simple autocorrelation calculation
-            n = len(values)
-            mean_val = np.mean(values)
-            
-            # Calculate autocovariance
-            autocovariance = np.mean([
-                (values[i] - mean_val) * (values[i - lag] - mean_val)
-                for i in range(lag, n)
-            ])
-            
-            # Calculate variance
-            variance = np.var(values)
-            
-            if variance == 0:
-                return 0.0
-            
-            autocorr = autocovariance / variance
-            return autocorr
-            
+
+            return float(_autocorrelation_function(values, lag)[lag])
+
         except Exception as e:
             logger.debug(f"Error calculating autocorrelation: {e}")
             return 0.0
@@ -769,7 +831,7 @@ class PBHistoricalAnalysisEngine:
                                   quality_metrics: PBHistoricalQualityMetrics) -> PBStatisticalSummary:
         """Run Monte Carlo simulation for fair value distribution analysis"""
         try:
-            n_simulations = min(10000, max(1000, len(valid_ratios) * 100))  # Scale with data size
+            n_simulations = self.monte_carlo_paths or min(10000, max(1000, len(valid_ratios) * 100))
             
             # Estimate distribution parameters
             sample_mean = np.mean(valid_ratios)
@@ -780,41 +842,28 @@ class PBHistoricalAnalysisEngine:
             quality_adjustment = 1.0 + (1.0 - quality_metrics.overall_score) * 0.5
             adjusted_std = sample_std * quality_adjustment
             
-            # Generate Monte Carlo samples
+            # Normal draws, or bootstrap resampling with quality-based noise for
+            # non-normal data; no negative P/B ratios either way
             if summary.is_normal_distribution:
-                # Use normal distribution
-                mc_samples = np.random.normal(sample_mean, adjusted_std, n_simulations)
+                sampler = normal_sampler(sample_mean, adjusted_std, minimum=0.01)
             else:
-                # Use bootstrap resampling for non-normal data
-                mc_samples = np.random.choice(valid_ratios, size=n_simulations, replace=True)
-                # Add some noise based on quality
-                noise = np.random.normal(0, adjusted_std * 0.1, n_simulations)
-                mc_samples = mc_samples + noise
+                sampler = bootstrap_sampler(valid_ratios, noise_std=adjusted_std * 0.1, minimum=0.01)
             
-            # Ensure no negative P/B ratios
-            mc_samples = np.maximum(mc_samples, 0.01)
+            mc = self.monte_carlo.simulate(sampler, n_simulations)
             
             # Calculate Monte Carlo statistics
-            summary.monte_carlo_mean = np.mean(mc_samples)
-            summary.monte_carlo_std = np.std(mc_samples)
-            
-            # Calculate confidence intervals from Monte Carlo
-            confidence_levels = [0.90, 0.95, 0.99]
-            for conf_level in confidence_levels:
-                alpha = 1 - conf_level
-                lower_percentile = (alpha / 2) * 100
-                upper_percentile = (1 - alpha / 2) * 100
-                
-                lower_bound = np.percentile(mc_samples, lower_percentile)
-                upper_bound = np.percentile(mc_samples, upper_percentile)
-                
-                summary.monte_carlo_confidence_intervals[f'{conf_level:.0%}'] = (lower_bound, upper_bound)
+            summary.monte_carlo_mean = float(mc.mean)
+            summary.monte_carlo_std = float(mc.std)
+            
+            # Confidence intervals and Value at Risk from one quantile pass
+            for conf_level in DEFAULT_CONFIDENCE_LEVELS:
+                lower_bound, upper_bound = mc.confidence_interval(conf_level)
+                summary.monte_carlo_confidence_intervals[f'{conf_level:.0%}'] = (
+                    float(lower_bound), float(upper_bound)
+                )
             
-            # Calculate Value at Risk (VaR) - probability of extreme low values
-            var_levels = [0.05, 0.01, 0.001]  # 5%, 1%, 0.1% VaR
-            for var_level in var_levels:
-                var_value = np.percentile(mc_samples, var_level * 100)
-                summary.monte_carlo_value_at_risk[f'{var_level:.1%}'] = var_value
+            for var_level in DEFAULT_VAR_LEVELS:
+                summary.monte_carlo_value_at_risk[f'{var_level:.1%}'] = float(mc.value_at_risk(var_level))
             
             logger.debug(f"Monte Carlo simulation completed with {n_simulations} samples")
             return summary
@@ -833,8 +882,8 @@ class PBHistoricalAnalysisEngine:
             mean_pb = np.mean(valid_ratios)
             
             # Calculate downside deviation (volatility of negative deviations from mean)
-            downside_deviations = [min(0, ratio - mean_pb) for ratio in valid_ratios]
-            summary.downside_deviation = np.sqrt(np.mean([d**2 for d in downside_deviations]))
+            downside_deviations = np.minimum(0.0, np.asarray(valid_ratios, dtype=float) - mean_pb)
+            summary.downside_deviation = np.sqrt(np.mean(downside_deviations ** 2))
             
             # Risk-adjusted return (Sharpe-like ratio for P/B)
             # Higher P/B with lower volatility is better for growth stocks
@@ -852,25 +901,28 @@ class PBHistoricalAnalysisEngine:
             logger.error(f"Error calculating risk-adjusted metrics: {e}")
             return summary
     
-    def _analyze_trends(self, pb_data: List[PBDataPoint]) -> PBTrendAnalysis:
+    def _analyze_trends(self, pb_data: List[PBDataPoint],
+                        pb_frame: Optional[pd.DataFrame] = None) -> PBTrendAnalysis:
         """Analyze trends in historical P/B data"""
         try:
             trend = PBTrendAnalysis()
-            
-            # Extract valid data
-            valid_data = [(pd.to_datetime(dp.date), dp.pb_ratio) 
-                         for dp in pb_data if dp.pb_ratio and dp.pb_ratio > 0]
-            
-            if len(valid_data) < 3:
+
+            if pb_frame is None:
+                pb_frame = _build_pb_frame(pb_data)
+
+            # Extract valid, dated data (frame is already sorted by date)
+            valid_series = pb_frame.loc[pb_frame['pb_ratio'] > 0, 'pb_ratio']
+            valid_series = valid_series[valid_series.index.notna()]
+
+            if len(valid_series) < 3:
                 return trend
-            
-            # Sort by date
-            valid_data.sort(key=lambda x: x[0])
-            dates, ratios = zip(*valid_data)
-            
+
+            dates = valid_series.index
+            ratios = valid_series.to_numpy()
+
             # Convert dates to numeric values for regression
-            date_nums = [(d - dates[0]).days for d in dates]
-            
+            date_nums = (dates - dates[0]).days.to_numpy()
+
             # Linear regression for trend
             if len(date_nums) > 1:
                 slope, intercept, r_value, p_value, std_err = self._simple_linear_regression(date_nums, ratios)
@@ -894,8 +946,7 @@ class PBHistoricalAnalysisEngine:
             
             # Mean reversion analysis
             mean_pb = np.mean(ratios)
-            deviations = [abs(ratio - mean_pb) for ratio in ratios]
-            avg_deviation = np.mean(deviations)
+            avg_deviation = np.mean(np.abs(ratios - mean_pb))
             
             # Mean reversion score (higher = more mean reverting)
             if trend.volatility > 0:
@@ -919,12 +970,14 @@ class PBHistoricalAnalysisEngine:
     def _simple_linear_regression(self, x: List[float], y: List[float]) -> Tuple[float, float, float, float, float]:
         """Simple linear regression implementation"""
         try:
+            x = np.asarray(x, dtype=float)
+            y = np.asarray(y, dtype=float)
             n = len(x)
-            sum_x = sum(x)
-            sum_y = sum(y)
-            sum_xy = sum(x[i] * y[i] for i in range(n))
-            sum_x2 = sum(xi ** 2 for xi in x)
-            sum_y2 = sum(yi ** 2 for yi in y)
+            sum_x = x.sum()
+            sum_y = y.sum()
+            sum_xy = x @ y
+            sum_x2 = x @ x
+            sum_y2 = y @ y
             
             # Calculate slope and intercept
             denominator = n * sum_x2 - sum_x ** 2
@@ -960,27 +1013,21 @@ class PBHistoricalAnalysisEngine:
                 return {'cycle_count': 0, 'avg_duration': 0.0, 'current_position': 'unknown'}
             
             # Find local peaks and troughs
-            peaks = []
-            troughs = []
-            
-            for i in range(1, len(ratios) - 1):
-                if ratios[i] > ratios[i-1] and ratios[i] > ratios[i+1]:
-                    peaks.append(i)
-                elif ratios[i] < ratios[i-1] and ratios[i] < ratios[i+1]:
-                    troughs.append(i)
-            
+            values = np.asarray(ratios, dtype=float)
+            previous, current, following = values[:-2], values[1:-1], values[2:]
+            peaks = np.flatnonzero((current > previous) & (current > following)) + 1
+            troughs = np.flatnonzero((current < previous) & (current < following)) + 1
+
             # Count cycles (peak to peak or trough to trough)
             cycle_count = max(len(peaks) - 1, len(troughs) - 1, 0)
-            
+
             # Calculate average cycle duration
             avg_duration = 0.0
             if cycle_count > 0:
                 if len(peaks) > 1:
-                    peak_durations = [peaks[i+1] - peaks[i] for i in range(len(peaks)-1)]
-                    avg_duration = np.mean(peak_durations) * 3  # Convert to months (assuming quarterly data)
+                    avg_duration = np.diff(peaks).mean() * 3  # Convert to months (assuming quarterly data)
                 elif len(troughs) > 1:
-                    trough_durations = [troughs[i+1] - troughs[i] for i in range(len(troughs)-1)]
-                    avg_duration = np.mean(trough_durations) * 3
+                    avg_duration = np.diff(troughs).mean() * 3
             
             # Determine current position
             current_position = 'unknown'
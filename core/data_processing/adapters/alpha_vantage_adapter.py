@@ -429,10 +429,6 @@ class AlphaVantageAdapter(BaseApiAdapter):
                 
                 if function_data:
                     category_data[function_key] = function_data
-                
-                # Be respectful of rate limits - add delay between requests
-                if len(functions) > 1:
-                    time.sleep(self.rate_limit_delay)
             
             if not category_data:
                 result['warnings'].append(f"No data retrieved from Alpha Vantage for category {category.value}")
@@ -38,6 +38,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+from ..rate_limiting.rate_limit_service import RateLimit, get_rate_limit_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -251,13 +253,21 @@ class BaseApiAdapter(ABC):
         }
     
     def enforce_rate_limit(self) -> None:
-        """Enforce rate limiting by waiting if necessary"""
-        current_time = time.time()
-        time_since_last_request = current_time - self._stats['last_request_time']
+        """
+        Take a request token from the shared rate limit service, waiting if necessary.
+        
+        The provider's configured quota applies; providers without one are
+        spaced by this adapter's rate_limit_delay.
+        """
+        service = get_rate_limit_service()
+        provider = self.get_source_type()
+        if self.rate_limit_delay > 0:
+            service.configure(provider, [RateLimit(1, self.rate_limit_delay)], override=False)
         
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            time.sleep(sleep_time)
+        acquired, _ = service.try_acquire(provider)
+        if not acquired:
+            self._stats['rate_limit_hits'] += 1
+            service.acquire(provider)
         
         self._stats['last_request_time'] = time.time()
     
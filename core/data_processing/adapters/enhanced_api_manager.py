@@ -43,6 +43,7 @@ from .base_adapter import (
     BaseApiAdapter, DataCategory, ExtractionResult,
     DataQualityMetrics, ApiCapabilities
 )
+from ..rate_limiting.rate_limit_service import RateLimit, get_rate_limit_service, window_limits
 
 # Import enhanced logging
 try:
@@ -72,6 +73,15 @@ class RateLimitConfig:
     burst_allowance: int = 5
     cooldown_minutes: int = 15
     
+    def to_limits(self) -> Tuple[RateLimit, ...]:
+        """Token buckets enforcing these quotas"""
+        return window_limits(
+            per_minute=self.requests_per_minute,
+            per_hour=self.requests_per_hour,
+            per_day=self.requests_per_day,
+            burst=self.burst_allowance
+        )
+    
     
 @dataclass 
 class ProviderHealthMetrics:
@@ -142,73 +152,6 @@ class CircuitBreaker:
             self.state = 'open'
 
 
-class RateLimiter:
-    """Advanced rate limiter with burst handling"""
-    
-    def __init__(self, config: RateLimitConfig):
-        self.config = config
-        self.request_times = deque()
-        self.burst_used = 0
-        self.last_reset = time.time()
-        self.lock = RLock()
-    
-    def can_make_request(self) -> bool:
-        """Check if a request can be made without violating rate limits"""
-        with self.lock:
-            current_time = time.time()
-            self._cleanup_old_requests(current_time)
-            
-            # Check per-minute limit
-            minute_requests = sum(1 for t in self.request_times 
-                                if current_time - t <= 60)
-            
-            if minute_requests < self.config.requests_per_minute:
-                return True
-            
-            # Check burst allowance
-            if self.burst_used < self.config.burst_allowance:
-                return True
-                
-            return False
-    
-    def wait_time_until_next_request(self) -> float:
-        """Get the time to wait before the next request can be made"""
-        with self.lock:
-            current_time = time.time()
-            self._cleanup_old_requests(current_time)
-            
-            if len(self.request_times) == 0:
-                return 0
-            
-            # Calculate wait time based on rate limit
-            oldest_request = min(self.request_times)
-            wait_time = 60 - (current_time - oldest_request)
-            return max(0, wait_time / self.config.requests_per_minute)
-    
-    def record_request(self):
-        """Record a new request"""
-        with self.lock:
-            current_time = time.time()
-            self.request_times.append(current_time)
-            
-            minute_requests = sum(1 for t in self.request_times 
-                                if current_time - t <= 60)
-            
-            if minute_requests > self.config.requests_per_minute:
-                self.burst_used += 1
-    
-    def _cleanup_old_requests(self, current_time: float):
-        """Remove old request timestamps"""
-        cutoff_time = current_time - 3600  # Keep 1 hour of history
-        while self.request_times and self.request_times[0] < cutoff_time:
-            self.request_times.popleft()
-        
-        # Reset burst counter if cooldown period has passed
-        if current_time - self.last_reset > (self.config.cooldown_minutes * 60):
-            self.burst_used = 0
-            self.last_reset = current_time
-
-
 class EnhancedApiManager(MultiApiManager):
     """
     Enhanced Multi-API Manager with advanced fallback, monitoring, and rate limiting.
@@ -251,7 +194,7 @@ class EnhancedApiManager(MultiApiManager):
         super().__init__(**kwargs)
         
         # Enhanced monitoring and control
-        self.rate_limiters: Dict[DataSourceType, RateLimiter] = {}
+        self.rate_limit_service = get_rate_limit_service()
         self.circuit_breakers: Dict[DataSourceType, CircuitBreaker] = {}
         self.health_metrics: Dict[DataSourceType, ProviderHealthMetrics] = {}
         
@@ -271,10 +214,10 @@ class EnhancedApiManager(MultiApiManager):
     def _initialize_enhanced_monitoring(self):
         """Initialize rate limiters, circuit breakers, and health monitoring"""
         for source_type in self.adapters.keys():
-            # Initialize rate limiter
+            # Fill in quotas for providers the shared rate limit service does not know
             if source_type in self.DEFAULT_RATE_LIMITS:
-                self.rate_limiters[source_type] = RateLimiter(
-                    self.DEFAULT_RATE_LIMITS[source_type]
+                self.rate_limit_service.configure(
+                    source_type, self.DEFAULT_RATE_LIMITS[source_type].to_limits(), override=False
                 )
             
             # Initialize circuit breaker
@@ -419,7 +362,7 @@ class EnhancedApiManager(MultiApiManager):
                     result.warnings.append(f"Circuit breaker open for {source_type.value}")
                     continue
                 
-                # Check rate limits
+                # Check rate limits (the adapter takes the token for each API call)
                 if not self._can_make_request(source_type):
                     wait_time = self._get_wait_time(source_type)
                     result.warnings.append(
@@ -509,9 +452,6 @@ class EnhancedApiManager(MultiApiManager):
         start_time = time.time()
         
         try:
-            # Record rate limit usage
-            self._record_request(source_type)
-            
             # Execute with circuit breaker
             adapter = self.adapters[source_type]
             circuit_breaker = self.circuit_breakers[source_type]
@@ -612,19 +552,12 @@ class EnhancedApiManager(MultiApiManager):
         return circuit_breaker and circuit_breaker.state == 'open'
     
     def _can_make_request(self, source_type: DataSourceType) -> bool:
-        """Check if a request can be made to a source"""
-        rate_limiter = self.rate_limiters.get(source_type)
-        return not rate_limiter or rate_limiter.can_make_request()
+        """Check if a request can be made to a source without taking a token"""
+        return self.rate_limit_service.wait_time(source_type) == 0
     
     def _get_wait_time(self, source_type: DataSourceType) -> float:
         """Get wait time before next request can be made"""
-        rate_limiter = self.rate_limiters.get(source_type)
-        return rate_limiter.wait_time_until_next_request() if rate_limiter else 0
-    
-    def _record_request(self, source_type: DataSourceType):
-        """Record a request for rate limiting"""
-        if source_type in self.rate_limiters:
-            self.rate_limiters[source_type].record_request()
+        return self.rate_limit_service.wait_time(source_type)
     
     def _record_success(self, source_type: DataSourceType, response_time: float):
         """Record successful API call"""
@@ -719,15 +652,13 @@ class EnhancedApiManager(MultiApiManager):
     def _get_rate_limit_status(self) -> Dict[str, Dict[str, Any]]:
         """Get current rate limit status for all providers"""
         status = {}
-        for source_type, limiter in self.rate_limiters.items():
-            with limiter.lock:
-                status[source_type.value] = {
-                    "requests_last_minute": len([t for t in limiter.request_times 
-                                               if time.time() - t <= 60]),
-                    "burst_used": limiter.burst_used,
-                    "can_make_request": limiter.can_make_request(),
-                    "wait_time_seconds": limiter.wait_time_until_next_request()
-                }
+        for source_type in self.adapters:
+            provider_status = self.rate_limit_service.get_status(source_type)
+            status[source_type.value] = {
+                "buckets": provider_status['buckets'],
+                "can_make_request": provider_status['wait_time_seconds'] == 0,
+                "wait_time_seconds": provider_status['wait_time_seconds']
+            }
         return status
     
     def _calculate_performance_metrics(self, result: EnhancedApiResult) -> Dict[str, Any]:
@@ -24,6 +24,9 @@ Key Features:
 - **Unit Conversion**: Handles different unit scales (thousands, millions, billions)
 - **Error Recovery**: Robust error handling with detailed logging
 - **Memory Efficient**: Processes data in chunks for large historical datasets
+- **Single-Pass Parsing**: Each workbook is streamed once (read-only) and the parsed
+  sheet is shared by header detection, quality scoring and variable extraction; an
+  optional on-disk cache keyed on file mtime and size skips parsing unchanged files
 
 Usage Example:
 --------------
@@ -43,17 +46,24 @@ Usage Example:
 >>> print(f"AAPL 2023 Revenue: ${revenue}M")
 """
 
+import hashlib
 import logging
 import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 
+from utils.alias_matcher import AliasMatcher, normalize_label
+from utils.excel_processor import is_fy_header_row
+
 # Import project dependencies
 from ..var_input_data import (
     get_var_input_data,
@@ -72,6 +82,39 @@ from ..financial_variable_registry import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Registry categories holding the variables of each statement type
+_SHEET_CATEGORIES = {
+    'income': [VariableCategory.INCOME_STATEMENT],
+    'balance': [VariableCategory.BALANCE_SHEET],
+    'cashflow': [VariableCategory.CASH_FLOW]
+}
+
+# Common Excel label variations not covered by registry aliases
+_EXCEL_LABEL_MAPPINGS = {
+    'revenue': ['revenue', 'total revenue', 'net sales', 'sales', 'net revenue'],
+    'cost_of_revenue': ['cost of revenues', 'cost of sales', 'cogs', 'cost of goods sold'],
+    'gross_profit': ['gross profit', 'gross income'],
+    'operating_income': ['operating income', 'operating profit', 'ebit'],
+    'net_income': ['net income', 'net earnings', 'profit', 'bottom line'],
+    'rd_expenses': ['r&d expenses', 'research and development', 'rd expense'],
+    'sga_expenses': ['selling and marketing expense', 'general & admin expenses', 'sga', 'sg&a'],
+    'operating_expenses': ['operating expenses', 'total operating expenses'],
+    'interest_expense': ['net interest expenses', 'interest expense'],
+    'ebt': ['ebt, incl. unusual items', 'earnings before tax', 'pre-tax income'],
+}
+
+
+def _invert_label_mappings(mappings: Dict[str, List[str]]) -> Dict[str, str]:
+    """Normalized label variation -> variable name (first mapping wins)"""
+    inverted = {}
+    for var_name, variations in mappings.items():
+        for variation in variations:
+            inverted.setdefault(normalize_label(variation), var_name)
+    return inverted
+
+
+_EXCEL_LABEL_VARIATIONS = _invert_label_mappings(_EXCEL_LABEL_MAPPINGS)
+
 
 @dataclass
 class ExcelFileInfo:
@@ -102,6 +145,7 @@ class VariableExtractionResult:
     quality_score: float
     missing_periods: List[str]
     conversion_applied: Optional[str]  # Unit conversion that was applied
+    row_index: Optional[int] = None    # Worksheet row the values were read from
     
     def __post_init__(self):
         """Calculate overall quality score based on data completeness"""
@@ -119,6 +163,275 @@ class VariableExtractionResult:
             self.quality_score = base_score * 0.7 + completeness * 0.3
 
 
+# Cell kinds of the compact parsed-sheet encoding
+_CELL_EMPTY, _CELL_FLOAT, _CELL_INT, _CELL_BOOL, _CELL_TEXT, _CELL_DATETIME = range(6)
+
+
+@dataclass
+class ParsedSheet:
+    """
+    Cell values of a statement workbook's active sheet, parsed once per file.
+
+    ``rows`` holds every worksheet row as a tuple of cell values and
+    ``header_row`` the index of the FY header row (None if there is none).
+    The sheet round-trips through ``to_arrays``/``from_arrays`` as a few
+    numpy arrays for the on-disk parse cache.
+    """
+    file_path: str
+    rows: List[Tuple]
+    header_row: Optional[int]
+
+    @classmethod
+    def from_file(cls, file_path: str) -> 'ParsedSheet':
+        """Stream the active sheet in read-only mode and locate the FY header row"""
+        workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+        try:
+            rows = list(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+
+        header_row = next((i for i, row in enumerate(rows) if is_fy_header_row(row)), None)
+        return cls(file_path=file_path, rows=rows, header_row=header_row)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Encode the cells as a kind grid, a float grid and the text cells in row-major order"""
+        width = max((len(row) for row in self.rows), default=0)
+        kinds = np.zeros((len(self.rows), width), dtype=np.uint8)
+        numbers = np.full((len(self.rows), width), np.nan)
+        texts = []
+
+        for row_idx, row in enumerate(self.rows):
+            for col_idx, value in enumerate(row):
+                if value is None:
+                    continue
+                if isinstance(value, bool):
+                    kinds[row_idx, col_idx] = _CELL_BOOL
+                    numbers[row_idx, col_idx] = float(value)
+                elif isinstance(value, int):
+                    kinds[row_idx, col_idx] = _CELL_INT
+                    numbers[row_idx, col_idx] = value
+                elif isinstance(value, float):
+                    kinds[row_idx, col_idx] = _CELL_FLOAT
+                    numbers[row_idx, col_idx] = value
+                elif isinstance(value, datetime):
+                    kinds[row_idx, col_idx] = _CELL_DATETIME
+                    texts.append(value.isoformat())
+                else:
+                    kinds[row_idx, col_idx] = _CELL_TEXT
+                    texts.append(str(value))
+
+        return {
+            'kinds': kinds,
+            'numbers': numbers,
+            'texts': np.array(texts, dtype=str),
+            'row_lengths': np.array([len(row) for row in self.rows], dtype=np.int32),
+            'header_row': np.array(-1 if self.header_row is None else self.header_row),
+        }
+
+    @classmethod
+    def from_arrays(cls, file_path: str, arrays: Dict[str, np.ndarray]) -> 'ParsedSheet':
+        """Rebuild a parsed sheet from the arrays produced by ``to_arrays``"""
+        kinds = arrays['kinds']
+        numbers = arrays['numbers']
+        grid = np.full(kinds.shape, None, dtype=object)
+
+        float_cells = kinds == _CELL_FLOAT
+        grid[float_cells] = numbers[float_cells].tolist()
+        int_cells = kinds == _CELL_INT
+        grid[int_cells] = numbers[int_cells].astype(np.int64).tolist()
+        bool_cells = kinds == _CELL_BOOL
+        grid[bool_cells] = (numbers[bool_cells] != 0).tolist()
+
+        text_cells = (kinds == _CELL_TEXT) | (kinds == _CELL_DATETIME)
+        grid[text_cells] = [
+            datetime.fromisoformat(text) if kind == _CELL_DATETIME else text
+            for text, kind in zip(arrays['texts'].tolist(), kinds[text_cells].tolist())
+        ]
+
+        rows = [tuple(grid[i, :length]) for i, length in enumerate(arrays['row_lengths'].tolist())]
+        header_row = int(arrays['header_row'])
+        return cls(file_path=file_path, rows=rows, header_row=None if header_row < 0 else header_row)
+
+
+class ParsedSheetCache:
+    """
+    On-disk cache of parsed sheets keyed on source path, mtime and size.
+
+    Each source file maps to one ``.npz`` entry holding the arrays of
+    ``ParsedSheet.to_arrays`` plus the mtime/size it was parsed from; an entry
+    whose recorded mtime or size no longer matches the file is ignored and
+    overwritten on the next store.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, file_path: str) -> Path:
+        digest = hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=16)
+        return self.cache_dir / f"{digest.hexdigest()}.npz"
+
+    def load(self, file_path: str, source_key: Tuple[int, int]) -> Optional[ParsedSheet]:
+        """Return the cached sheet if it was parsed from a file with this (mtime_ns, size)"""
+        entry_path = self._entry_path(file_path)
+        if not entry_path.exists():
+            return None
+
+        try:
+            with np.load(entry_path, allow_pickle=False) as entry:
+                if (int(entry['source_mtime_ns']), int(entry['source_size'])) != source_key:
+                    return None
+                return ParsedSheet.from_arrays(file_path, entry)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {entry_path}: {str(e)}")
+            return None
+
+    def store(self, sheet: ParsedSheet, source_key: Tuple[int, int]) -> None:
+        """Write the sheet atomically, replacing any previous entry for the file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                np.savez(
+                    handle,
+                    source_mtime_ns=np.array(source_key[0], dtype=np.int64),
+                    source_size=np.array(source_key[1], dtype=np.int64),
+                    **sheet.to_arrays()
+                )
+            os.replace(tmp_path, self._entry_path(sheet.file_path))
+        except Exception as e:
+            logger.warning(f"Failed to write parse cache entry for {sheet.file_path}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+# States of a (variable, period) cell in FileExtraction.cell_state
+_VALUE_ABSENT, _VALUE_NUMERIC, _VALUE_MISSING, _VALUE_OBJECT = range(4)
+
+
+@dataclass
+class FileExtraction:
+    """
+    Compact, picklable form of the variables extracted from one statement file.
+
+    Values are held as a (variables x periods) float array with a matching
+    state array, plus plain label lists, so worker processes can ship results
+    back cheaply. Non-numeric values that survive unit conversion are kept in
+    ``object_values`` as (variable index, period index, value) entries.
+    """
+    file_path: str
+    sheet_type: str
+    period_type: str
+    available_periods: List[str]
+    data_quality_score: float
+    variable_names: List[str]
+    excel_labels: List[str]
+    conversions: List[Optional[str]]
+    periods: List[str]
+    values: np.ndarray
+    cell_state: np.ndarray
+    quality_scores: np.ndarray
+    validation_passed: np.ndarray
+    row_indices: np.ndarray
+    object_values: List[Tuple[int, int, Any]]
+
+    @classmethod
+    def from_results(
+        cls,
+        file_info: ExcelFileInfo,
+        extraction_results: List[VariableExtractionResult]
+    ) -> 'FileExtraction':
+        """Pack extraction results for one file into arrays"""
+        periods = list(file_info.available_periods)
+        period_index = {period: i for i, period in enumerate(periods)}
+        shape = (len(extraction_results), len(periods))
+        values = np.full(shape, np.nan)
+        cell_state = np.full(shape, _VALUE_ABSENT, dtype=np.int8)
+        object_values = []
+
+        for var_idx, result in enumerate(extraction_results):
+            for period, value in result.values.items():
+                col = period_index[period]
+                if isinstance(value, float):
+                    values[var_idx, col] = value
+                    cell_state[var_idx, col] = _VALUE_NUMERIC
+                else:
+                    cell_state[var_idx, col] = _VALUE_OBJECT
+                    object_values.append((var_idx, col, value))
+            for period in result.missing_periods:
+                cell_state[var_idx, period_index[period]] = _VALUE_MISSING
+
+        return cls(
+            file_path=file_info.file_path,
+            sheet_type=file_info.sheet_type,
+            period_type=file_info.period_type,
+            available_periods=periods,
+            data_quality_score=file_info.data_quality_score,
+            variable_names=[result.variable_name for result in extraction_results],
+            excel_labels=[result.excel_column_name for result in extraction_results],
+            conversions=[result.conversion_applied for result in extraction_results],
+            periods=periods,
+            values=values,
+            cell_state=cell_state,
+            quality_scores=np.array([r.metadata.quality_score for r in extraction_results], dtype=float),
+            validation_passed=np.array([r.metadata.validation_passed for r in extraction_results], dtype=bool),
+            row_indices=np.array(
+                [-1 if r.row_index is None else r.row_index for r in extraction_results], dtype=np.int32
+            ),
+            object_values=object_values
+        )
+
+    def to_results(self, symbol: str) -> List[VariableExtractionResult]:
+        """Rebuild VariableExtractionResult objects, with fresh metadata timestamps"""
+        objects = {(var_idx, col): value for var_idx, col, value in self.object_values}
+        timestamp = datetime.now()
+        results = []
+
+        for var_idx, variable_name in enumerate(self.variable_names):
+            row_index = int(self.row_indices[var_idx])
+            values = {}
+            missing_periods = []
+            for col, period in enumerate(self.periods):
+                state = self.cell_state[var_idx, col]
+                if state == _VALUE_NUMERIC:
+                    values[period] = float(self.values[var_idx, col])
+                elif state == _VALUE_OBJECT:
+                    values[period] = objects[(var_idx, col)]
+                elif state == _VALUE_MISSING:
+                    missing_periods.append(period)
+
+            metadata = VariableMetadata(
+                source="excel",
+                timestamp=timestamp,
+                quality_score=float(self.quality_scores[var_idx]),
+                validation_passed=bool(self.validation_passed[var_idx]),
+                period=self.period_type,
+                lineage_id=f"{symbol}_{self.sheet_type}_{row_index}"
+            )
+            results.append(VariableExtractionResult(
+                variable_name=variable_name,
+                excel_column_name=self.excel_labels[var_idx],
+                values=values,
+                metadata=metadata,
+                quality_score=metadata.quality_score,
+                missing_periods=missing_periods,
+                conversion_applied=self.conversions[var_idx],
+                row_index=row_index if row_index >= 0 else None
+            ))
+
+        return results
+
+
+@dataclass
+class CompanyExtraction:
+    """Everything extracted from one company folder, ready to store in the parent process"""
+    symbol: str
+    company_data_path: str
+    files: List[FileExtraction]
+    errors: List[str]
+    stats: Dict[str, int]
+    files_failed: int = 0
+
+
 class ExcelDataAdapter:
     """
     Excel Data Source Adapter for extracting financial variables.
@@ -127,10 +440,17 @@ class ExcelDataAdapter:
     into the VarInputData system with proper validation and quality scoring.
     """
     
-    def __init__(self):
-        """Initialize the Excel adapter with required registries"""
+    def __init__(self, parse_cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the Excel adapter with required registries
+
+        Args:
+            parse_cache_dir: Optional directory for the on-disk parsed-sheet cache.
+                When set, files whose mtime and size are unchanged are not re-parsed.
+        """
         self.var_data = get_var_input_data()
         self.variable_registry = get_registry()
+        self._parse_cache = ParsedSheetCache(parse_cache_dir) if parse_cache_dir else None
         
         # Initialize statistics
         self._stats = {
@@ -138,7 +458,9 @@ class ExcelDataAdapter:
             'variables_extracted': 0,
             'data_points_loaded': 0,
             'validation_failures': 0,
-            'conversion_applied': 0
+            'conversion_applied': 0,
+            'sheets_parsed': 0,
+            'parse_cache_hits': 0
         }
         
         # Standard file name patterns for different statement types
@@ -251,41 +573,172 @@ class ExcelDataAdapter:
         logger.info(f"Loading single file for {symbol}: {file_path}")
         
         try:
-            # Analyze the file structure first
-            file_info = self._analyze_excel_file(file_path, symbol, sheet_type, period_type)
-            
-            # Extract variables from the file
-            extraction_results = self._extract_variables_from_file(file_info, validate_data)
-            
-            # Store data in VarInputData
-            storage_results = self._store_extracted_data(extraction_results)
-            
-            # Compile results
-            results = {
-                'symbol': symbol,
-                'file_path': file_path,
-                'sheet_type': sheet_type,
-                'period_type': period_type,
-                'variables_extracted': len(extraction_results),
-                'data_points_stored': storage_results['stored_count'],
-                'periods_covered': file_info.available_periods,
-                'quality_score': file_info.data_quality_score,
-                'errors': storage_results.get('errors', [])
-            }
-            
-            logger.info(f"Successfully loaded {results['variables_extracted']} variables from {file_path}")
-            return results
+            file_info, extraction_results = self._extract_file(
+                symbol, file_path, sheet_type, period_type, validate_data
+            )
+            return self._store_file_results(symbol, file_info, extraction_results)
             
         except Exception as e:
-            error_msg = f"Failed to load file {file_path}: {str(e)}"
-            logger.error(error_msg)
-            return {
-                'symbol': symbol,
-                'file_path': file_path,
-                'errors': [error_msg],
-                'variables_extracted': 0,
-                'data_points_stored': 0
+            return self._file_error_result(symbol, file_path, e)
+    
+    def extract_company_data(
+        self,
+        symbol: str,
+        company_data_path: str,
+        load_fy: bool = True,
+        load_ltm: bool = True,
+        validate_data: bool = True
+    ) -> CompanyExtraction:
+        """
+        Parse and extract a company folder without storing anything.
+        
+        This is the unit of work of load_companies_data and runs in worker
+        processes; errors are recorded per file rather than raised.
+        
+        Args:
+            symbol: Stock symbol
+            company_data_path: Path to company data folder
+            load_fy: Whether to extract FY (full year) data
+            load_ltm: Whether to extract LTM (last twelve months) data
+            validate_data: Whether to validate data using registry definitions
+            
+        Returns:
+            CompanyExtraction with compact per-file results
+        """
+        symbol = symbol.upper().strip()
+        stats_before = dict(self._stats)
+        extraction = CompanyExtraction(
+            symbol=symbol, company_data_path=company_data_path, files=[], errors=[], stats={}
+        )
+        
+        period_types = [period for period, wanted in (("FY", load_fy), ("LTM", load_ltm)) if wanted]
+        for period_type in period_types:
+            folder_path = os.path.join(company_data_path, period_type)
+            if not os.path.exists(folder_path):
+                logger.warning(f"{period_type} folder not found: {folder_path}")
+                continue
+            
+            try:
+                for file_path, sheet_type in self._iter_statement_files(folder_path):
+                    try:
+                        file_info, extraction_results = self._extract_file(
+                            symbol, file_path, sheet_type, period_type, validate_data
+                        )
+                        extraction.files.append(FileExtraction.from_results(file_info, extraction_results))
+                    except Exception as e:
+                        extraction.files_failed += 1
+                        extraction.errors.extend(self._file_error_result(symbol, file_path, e)['errors'])
+            except Exception as e:
+                error_msg = f"Error processing folder {folder_path}: {str(e)}"
+                logger.error(error_msg)
+                extraction.errors.append(error_msg)
+        
+        extraction.stats = {
+            key: self._stats[key] - stats_before.get(key, 0)
+            for key in ('validation_failures', 'conversion_applied', 'sheets_parsed', 'parse_cache_hits')
+        }
+        return extraction
+    
+    def load_companies_data(
+        self,
+        companies: Union[Dict[str, str], List[str]],
+        load_fy: bool = True,
+        load_ltm: bool = True,
+        validate_data: bool = True,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load many company folders, parsing and extracting them in a process pool.
+        
+        Worker processes return CompanyExtraction objects (NumPy arrays and
+        label lists); values are stored into VarInputData here in the parent.
+        A failing folder only produces errors in its own result.
+        
+        Args:
+            companies: {symbol: company_data_path}, or folder paths whose
+                base name is the symbol
+            load_fy: Whether to load FY (full year) data
+            load_ltm: Whether to load LTM (last twelve months) data
+            validate_data: Whether to validate data using registry definitions
+            max_workers: Worker processes (default: CPU count); 1 runs in-process
+            progress_callback: Called as callback(completed, total, symbol, result)
+                after each company is stored
+            
+        Returns:
+            Dictionary of symbol -> load_company_data-style results
+        """
+        if not isinstance(companies, dict):
+            companies = {
+                os.path.basename(os.path.normpath(path)): path for path in companies
             }
+        companies = {symbol.upper().strip(): path for symbol, path in companies.items()}
+        
+        total = len(companies)
+        all_results: Dict[str, Dict[str, Any]] = {}
+        if total == 0:
+            return all_results
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, total))
+        
+        logger.info(f"Starting batch load of {total} companies with {max_workers} worker(s)")
+        
+        def store(symbol: str, extraction: Optional[CompanyExtraction], error: Optional[Exception]) -> None:
+            if error is not None:
+                error_msg = f"Failed to load data for {symbol}: {str(error)}"
+                logger.error(error_msg)
+                results = self._empty_company_results(symbol)
+                results['errors'].append(error_msg)
+            else:
+                results = self._store_company_extraction(extraction)
+            
+            all_results[symbol] = results
+            if progress_callback:
+                try:
+                    progress_callback(len(all_results), total, symbol, results)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed for {symbol}: {str(e)}")
+        
+        if max_workers == 1:
+            for symbol, path in companies.items():
+                try:
+                    extraction = self.extract_company_data(symbol, path, load_fy, load_ltm, validate_data)
+                    store(symbol, extraction, None)
+                except Exception as e:
+                    store(symbol, None, e)
+            return all_results
+        
+        parse_cache_dir = str(self._parse_cache.cache_dir) if self._parse_cache else None
+        variable_defs = [
+            self.variable_registry.get_variable_definition(name)
+            for name in self.variable_registry.list_all_variables()
+        ]
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_extraction_worker,
+            initargs=(variable_defs, parse_cache_dir)
+        ) as executor:
+            future_to_symbol = {
+                executor.submit(
+                    _extract_company_worker, symbol, path, load_fy, load_ltm, validate_data
+                ): symbol
+                for symbol, path in companies.items()
+            }
+            
+            for future in as_completed(future_to_symbol):
+                symbol = future_to_symbol[future]
+                try:
+                    extraction = future.result()
+                except Exception as e:
+                    store(symbol, None, e)
+                else:
+                    store(symbol, extraction, None)
+        
+        logger.info(f"Completed batch load of {total} companies")
+        return all_results
     
     def get_adapter_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about the adapter's operations"""
@@ -302,6 +755,134 @@ class ExcelDataAdapter:
     
     # Private helper methods
     
+    def _extract_file(
+        self,
+        symbol: str,
+        file_path: str,
+        sheet_type: str,
+        period_type: str,
+        validate_data: bool
+    ) -> Tuple[ExcelFileInfo, List[VariableExtractionResult]]:
+        """Parse, analyze and extract one statement file"""
+        # Parse the workbook once; analysis and extraction share the parsed sheet
+        parsed_sheet = self._get_parsed_sheet(file_path)
+        
+        # Analyze the file structure first
+        file_info = self._analyze_excel_file(
+            file_path, symbol, sheet_type, period_type, parsed_sheet
+        )
+        
+        # Extract variables from the file
+        extraction_results = self._extract_variables_from_file(
+            file_info, validate_data, parsed_sheet
+        )
+        
+        return file_info, extraction_results
+    
+    def _store_file_results(
+        self,
+        symbol: str,
+        file_info: ExcelFileInfo,
+        extraction_results: List[VariableExtractionResult],
+        emit_event: bool = True
+    ) -> Dict[str, Any]:
+        """Store one file's extraction results and summarize them"""
+        # Store data in VarInputData
+        storage_results = self._store_extracted_data(extraction_results, emit_event)
+        
+        # Compile results
+        results = {
+            'symbol': symbol,
+            'file_path': file_info.file_path,
+            'sheet_type': file_info.sheet_type,
+            'period_type': file_info.period_type,
+            'variables_extracted': len(extraction_results),
+            'data_points_stored': storage_results['stored_count'],
+            'periods_covered': file_info.available_periods,
+            'quality_score': file_info.data_quality_score,
+            'errors': storage_results.get('errors', [])
+        }
+        
+        logger.info(f"Successfully loaded {results['variables_extracted']} variables from {file_info.file_path}")
+        return results
+    
+    def _file_error_result(self, symbol: str, file_path: str, error: Exception) -> Dict[str, Any]:
+        """Per-file result recording a load failure"""
+        error_msg = f"Failed to load file {file_path}: {str(error)}"
+        logger.error(error_msg)
+        return {
+            'symbol': symbol,
+            'file_path': file_path,
+            'errors': [error_msg],
+            'variables_extracted': 0,
+            'data_points_stored': 0
+        }
+    
+    def _empty_company_results(self, symbol: str) -> Dict[str, Any]:
+        """Initial load_company_data results dictionary"""
+        return {
+            'symbol': symbol,
+            'files_processed': 0,
+            'variables_loaded': 0,
+            'data_points_loaded': 0,
+            'errors': [],
+            'quality_scores': {},
+            'period_coverage': {},
+            'file_details': []
+        }
+    
+    def _store_company_extraction(self, extraction: CompanyExtraction) -> Dict[str, Any]:
+        """Store a worker's CompanyExtraction in VarInputData"""
+        results = self._empty_company_results(extraction.symbol)
+        
+        for file_extraction in extraction.files:
+            file_info = ExcelFileInfo(
+                file_path=file_extraction.file_path,
+                sheet_type=file_extraction.sheet_type,
+                period_type=file_extraction.period_type,
+                company_symbol=extraction.symbol,
+                available_periods=file_extraction.available_periods,
+                header_row=-1,
+                data_quality_score=file_extraction.data_quality_score
+            )
+            file_results = self._store_file_results(
+                extraction.symbol, file_info, file_extraction.to_results(extraction.symbol),
+                emit_event=False
+            )
+            results['file_details'].append(file_results)
+            results['files_processed'] += 1
+            results['variables_loaded'] += file_results['variables_extracted']
+            results['data_points_loaded'] += file_results['data_points_stored']
+            results['errors'].extend(file_results['errors'])
+        
+        # Failed files still count as processed, as in load_company_data
+        results['files_processed'] += extraction.files_failed
+        results['errors'].extend(extraction.errors)
+        
+        # One change event for the whole company rather than one per data point
+        if results['data_points_loaded']:
+            self.var_data.emit_bulk_update(results['data_points_loaded'], source="excel")
+        
+        for key, count in extraction.stats.items():
+            self._stats[key] += count
+        self._stats['files_processed'] += results['files_processed']
+        self._stats['variables_extracted'] += results['variables_loaded']
+        self._stats['data_points_loaded'] += results['data_points_loaded']
+        
+        return results
+    
+    def _iter_statement_files(self, folder_path: str):
+        """Yield (file_path, sheet_type) for each statement workbook in a folder"""
+        for file_name in os.listdir(folder_path):
+            if not file_name.endswith(('.xlsx', '.xls')):
+                continue
+            
+            sheet_type = self._determine_sheet_type(file_name)
+            if sheet_type:
+                yield os.path.join(folder_path, file_name), sheet_type
+            else:
+                logger.warning(f"Could not determine sheet type for file: {file_name}")
+    
     def _process_folder(
         self,
         symbol: str,
@@ -320,28 +901,19 @@ class ExcelDataAdapter:
         }
         
         try:
-            for file_name in os.listdir(folder_path):
-                if not file_name.endswith(('.xlsx', '.xls')):
-                    continue
-                    
-                file_path = os.path.join(folder_path, file_name)
-                sheet_type = self._determine_sheet_type(file_name)
+            for file_path, sheet_type in self._iter_statement_files(folder_path):
+                file_results = self.load_single_file(
+                    symbol, file_path, sheet_type, period_type, validate_data
+                )
                 
-                if sheet_type:
-                    file_results = self.load_single_file(
-                        symbol, file_path, sheet_type, period_type, validate_data
-                    )
-                    
-                    # Merge file results
-                    results['files_processed'] += 1
-                    results['variables_loaded'] += file_results.get('variables_extracted', 0)
-                    results['data_points_loaded'] += file_results.get('data_points_stored', 0)
-                    results['file_details'].append(file_results)
-                    
-                    if file_results.get('errors'):
-                        results['errors'].extend(file_results['errors'])
-                else:
-                    logger.warning(f"Could not determine sheet type for file: {file_name}")
+                # Merge file results
+                results['files_processed'] += 1
+                results['variables_loaded'] += file_results.get('variables_extracted', 0)
+                results['data_points_loaded'] += file_results.get('data_points_stored', 0)
+                results['file_details'].append(file_results)
+                
+                if file_results.get('errors'):
+                    results['errors'].extend(file_results['errors'])
                     
         except Exception as e:
             error_msg = f"Error processing folder {folder_path}: {str(e)}"
@@ -350,6 +922,25 @@ class ExcelDataAdapter:
         
         return results
     
+    def _get_parsed_sheet(self, file_path: str) -> ParsedSheet:
+        """Parse a workbook, or reuse its on-disk cache entry if the file is unchanged"""
+        if self._parse_cache is not None:
+            stat = os.stat(file_path)
+            source_key = (stat.st_mtime_ns, stat.st_size)
+            parsed_sheet = self._parse_cache.load(file_path, source_key)
+            if parsed_sheet is not None:
+                self._stats['parse_cache_hits'] += 1
+                logger.debug(f"Parse cache hit for {file_path}")
+                return parsed_sheet
+        
+        parsed_sheet = ParsedSheet.from_file(file_path)
+        self._stats['sheets_parsed'] += 1
+        
+        if self._parse_cache is not None:
+            self._parse_cache.store(parsed_sheet, source_key)
+        
+        return parsed_sheet
+    
     def _determine_sheet_type(self, file_name: str) -> Optional[str]:
         """Determine the type of financial statement from file name"""
         file_name_lower = file_name.lower()
@@ -366,7 +957,8 @@ class ExcelDataAdapter:
         file_path: str,
         symbol: str,
         sheet_type: str,
-        period_type: str
+        period_type: str,
+        parsed_sheet: Optional[ParsedSheet] = None
     ) -> ExcelFileInfo:
         """
         Analyze Excel file structure and discover available periods.
@@ -374,20 +966,13 @@ class ExcelDataAdapter:
         This method replicates and extends the logic from FinancialCalculator._load_excel_data()
         """
         try:
-            wb = load_workbook(filename=file_path)
-            sheet = wb.active
+            if parsed_sheet is None:
+                parsed_sheet = self._get_parsed_sheet(file_path)
             
-            # Convert to list of lists for processing
-            data = []
-            for row in sheet.iter_rows(values_only=True):
-                data.append(row)
+            data = parsed_sheet.rows
             
-            # Find the header row (contains 'FY-N', 'FY', etc.)
-            header_row_idx = None
-            for i, row in enumerate(data):
-                if row and any('FY-' in str(cell) or 'FY' == str(cell) for cell in row if cell):
-                    header_row_idx = i
-                    break
+            # Header row (contains 'FY-N', 'FY', etc.) is located during parsing
+            header_row_idx = parsed_sheet.header_row
             
             if header_row_idx is None:
                 raise ValueError(f"Could not find header row with FY columns in {file_path}")
@@ -498,24 +1083,22 @@ class ExcelDataAdapter:
     def _extract_variables_from_file(
         self,
         file_info: ExcelFileInfo,
-        validate_data: bool
+        validate_data: bool,
+        parsed_sheet: Optional[ParsedSheet] = None
     ) -> List[VariableExtractionResult]:
         """Extract financial variables from the Excel file using registry aliases"""
         extraction_results = []
         
         try:
-            # Load the Excel data using openpyxl (same as FinancialCalculator)
-            wb = load_workbook(filename=file_info.file_path)
-            sheet = wb.active
+            if parsed_sheet is None:
+                parsed_sheet = self._get_parsed_sheet(file_info.file_path)
             
-            data = []
-            for row in sheet.iter_rows(values_only=True):
-                data.append(row)
+            data = parsed_sheet.rows
             
             headers = data[file_info.header_row]
             
-            # Get all variables from registry that might be in this sheet type
-            relevant_variables = self._get_relevant_variables_for_sheet(file_info.sheet_type)
+            # Compiled once per registry state; resolves each row label in O(1)
+            matcher = self.variable_registry.get_alias_matcher()
             
             # Find FY column indices for period mapping
             period_column_map = {}  # period_name -> column_index
@@ -544,7 +1127,7 @@ class ExcelDataAdapter:
                 
                 # Try to match this row to a variable in the registry
                 matched_variable = self._match_row_to_variable(
-                    row_label, relevant_variables, file_info.sheet_type
+                    row_label, file_info.sheet_type, matcher
                 )
                 
                 if matched_variable:
@@ -593,7 +1176,8 @@ class ExcelDataAdapter:
                             metadata=metadata,
                             quality_score=metadata.quality_score,
                             missing_periods=missing_periods,
-                            conversion_applied=conversion_info
+                            conversion_applied=conversion_info,
+                            row_index=row_idx
                         )
                         
                         extraction_results.append(result)
@@ -606,101 +1190,43 @@ class ExcelDataAdapter:
             logger.error(f"Failed to extract variables from {file_info.file_path}: {str(e)}")
             raise
     
-    def _get_relevant_variables_for_sheet(self, sheet_type: str) -> List:
-        """Get variables from registry that are relevant for this sheet type"""
-        category_mapping = {
-            'income': [VariableCategory.INCOME_STATEMENT],
-            'balance': [VariableCategory.BALANCE_SHEET],
-            'cashflow': [VariableCategory.CASH_FLOW]
-        }
-        
-        relevant_categories = category_mapping.get(sheet_type, [])
-        all_variables = self.variable_registry.list_all_variables()
-        
-        relevant_variables = []
-        for var_name in all_variables:
-            var_def = self.variable_registry.get_variable_definition(var_name)
-            if var_def and var_def.category in relevant_categories:
-                relevant_variables.append(var_def)
-        
-        return relevant_variables
-    
     def _match_row_to_variable(
         self,
         row_label: str,
-        relevant_variables: List,
-        sheet_type: str
+        sheet_type: str,
+        matcher: Optional[AliasMatcher] = None
     ):
-        """Match an Excel row label to a variable definition using aliases"""
-        row_label_clean = row_label.lower().strip()
-        
-        # Try exact name match first
-        for var_def in relevant_variables:
-            if var_def.name.lower() == row_label_clean:
-                return var_def
-        
-        # Try alias matching
-        for var_def in relevant_variables:
-            if hasattr(var_def, 'aliases') and var_def.aliases:
-                # Check excel-specific aliases
-                if 'excel' in var_def.aliases:
-                    excel_aliases = var_def.aliases['excel']
-                    if isinstance(excel_aliases, str):
-                        excel_aliases = [excel_aliases]
-                    
-                    for alias in excel_aliases:
-                        if alias and alias.lower().strip() == row_label_clean:
-                            return var_def
-                
-                # Check generic aliases
-                for alias_source, aliases in var_def.aliases.items():
-                    if isinstance(aliases, str):
-                        aliases = [aliases]
-                    elif aliases is None:
-                        continue
-                    
-                    for alias in aliases:
-                        if alias and alias.lower().strip() == row_label_clean:
-                            return var_def
-        
-        # Try common Excel variations and mapping
-        excel_mappings = {
-            'revenue': ['revenue', 'total revenue', 'net sales', 'sales', 'net revenue'],
-            'cost_of_revenue': ['cost of revenues', 'cost of sales', 'cogs', 'cost of goods sold'],
-            'gross_profit': ['gross profit', 'gross income'],
-            'operating_income': ['operating income', 'operating profit', 'ebit'],
-            'net_income': ['net income', 'net earnings', 'profit', 'bottom line'],
-            'rd_expenses': ['r&d expenses', 'research and development', 'rd expense'],
-            'sga_expenses': ['selling and marketing expense', 'general & admin expenses', 'sga', 'sg&a'],
-            'operating_expenses': ['operating expenses', 'total operating expenses'],
-            'interest_expense': ['net interest expenses', 'interest expense'],
-            'ebt': ['ebt, incl. unusual items', 'earnings before tax', 'pre-tax income'],
-        }
+        """
+        Match an Excel row label to a variable definition.
         
-        for var_name, variations in excel_mappings.items():
-            for variation in variations:
-                if variation == row_label_clean:
-                    # Find the variable in registry
-                    for var_def in relevant_variables:
-                        if var_def.name == var_name:
-                            logger.debug(f"Excel mapping match: '{row_label}' -> '{var_name}'")
-                            return var_def
-        
-        # Try partial matching for common variations
-        for var_def in relevant_variables:
-            var_name_clean = var_def.name.lower().replace('_', ' ')
-            row_label_words = set(row_label_clean.replace('_', ' ').replace('&', ' ').split())
-            var_name_words = set(var_name_clean.split())
-            
-            # If most words match, consider it a match
-            common_words = row_label_words & var_name_words
-            if len(common_words) >= min(2, max(1, len(var_name_words) * 0.6)):
-                logger.debug(f"Partial match: '{row_label}' -> '{var_def.name}'")
-                return var_def
-        
-        # Log unmatched variables for debugging
-        logger.debug(f"No match found for Excel variable: '{row_label}'")
-        return None
+        Tries, in order: exact variable name or alias (Excel aliases first), the
+        common Excel label variations, then the best partial word match. All
+        lookups go through the registry's compiled AliasMatcher.
+        """
+        if matcher is None:
+            matcher = self.variable_registry.get_alias_matcher()
+        categories = _SHEET_CATEGORIES.get(sheet_type, [])
+        
+        var_name = matcher.match_exact(row_label, categories, source='excel')
+        
+        if var_name is None:
+            mapped_name = _EXCEL_LABEL_VARIATIONS.get(normalize_label(row_label))
+            mapped_def = self.variable_registry.get_variable_definition(mapped_name) if mapped_name else None
+            if mapped_def and mapped_def.category in categories:
+                logger.debug(f"Excel mapping match: '{row_label}' -> '{mapped_name}'")
+                return mapped_def
+            
+            candidates = matcher.partial_candidates(row_label, categories)
+            if candidates:
+                var_name = candidates[0]
+                logger.debug(f"Partial match: '{row_label}' -> '{var_name}'")
+        
+        if var_name is None:
+            # Log unmatched variables for debugging
+            logger.debug(f"No match found for Excel variable: '{row_label}'")
+            return None
+        
+        return self.variable_registry.get_variable_definition(var_name)
     
     def _convert_units(self, value: Any, variable_def) -> Tuple[Any, Optional[str]]:
         """Convert units based on variable definition and value magnitude"""
@@ -785,9 +1311,15 @@ class ExcelDataAdapter:
     
     def _store_extracted_data(
         self,
-        extraction_results: List[VariableExtractionResult]
+        extraction_results: List[VariableExtractionResult],
+        emit_event: bool = True
     ) -> Dict[str, Any]:
-        """Store extracted data in VarInputData system"""
+        """
+        Store extracted data in VarInputData system
+        
+        Values are written without per-value change events; a single BULK_UPDATE
+        is emitted for the batch unless emit_event is False.
+        """
         storage_results = {
             'stored_count': 0,
             'failed_count': 0,
@@ -806,7 +1338,7 @@ class ExcelDataAdapter:
                         source=result.metadata.source,
                         metadata=result.metadata,
                         validate=False,  # Already validated in extraction
-                        emit_event=True
+                        emit_event=False
                     )
                     
                     if success:
@@ -821,6 +1353,9 @@ class ExcelDataAdapter:
             logger.info(f"Stored {storage_results['stored_count']} data points, "
                        f"failed: {storage_results['failed_count']}")
             
+            if emit_event and storage_results['stored_count']:
+                self.var_data.emit_bulk_update(storage_results['stored_count'], source="excel")
+            
         except Exception as e:
             error_msg = f"Failed to store extracted data: {str(e)}"
             logger.error(error_msg)
@@ -841,6 +1376,34 @@ class ExcelDataAdapter:
             main_results['file_details'].extend(new_results['file_details'])
 
 
+# Worker-process entry points for ExcelDataAdapter.load_companies_data
+
+_worker_adapter: Optional['ExcelDataAdapter'] = None
+
+
+def _init_extraction_worker(variable_defs: List, parse_cache_dir: Optional[str]) -> None:
+    """Make sure the worker's registry has the parent's variables and build its adapter"""
+    global _worker_adapter
+    registry = get_registry()
+    for var_def in variable_defs:
+        if registry.get_variable_definition(var_def.name) is None:
+            registry.register_variable(var_def)
+    _worker_adapter = ExcelDataAdapter(parse_cache_dir=parse_cache_dir)
+
+
+def _extract_company_worker(
+    symbol: str,
+    company_data_path: str,
+    load_fy: bool,
+    load_ltm: bool,
+    validate_data: bool
+) -> CompanyExtraction:
+    """Extract one company folder in a worker process"""
+    return _worker_adapter.extract_company_data(
+        symbol, company_data_path, load_fy, load_ltm, validate_data
+    )
+
+
 # Convenience functions for common operations
 
 def load_company_excel_data(
@@ -863,6 +1426,24 @@ def load_company_excel_data(
     return adapter.load_company_data(symbol, company_data_path, **kwargs)
 
 
+def load_companies_excel_data(
+    companies: Union[Dict[str, str], List[str]],
+    **kwargs
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Convenience function to load Excel data for many companies in parallel.
+    
+    Args:
+        companies: {symbol: company_data_path}, or folder paths named by symbol
+        **kwargs: Additional arguments for ExcelDataAdapter.load_companies_data()
+        
+    Returns:
+        Dictionary of symbol -> loading results
+    """
+    adapter = ExcelDataAdapter()
+    return adapter.load_companies_data(companies, **kwargs)
+
+
 def get_excel_adapter_stats() -> Dict[str, Any]:
     """
     Convenience function to get Excel adapter statistics.
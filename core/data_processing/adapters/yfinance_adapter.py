@@ -48,6 +48,7 @@ import yfinance as yf
 from requests.exceptions import RequestException, Timeout
 
 # Import project dependencies
+from ..rate_limiting.rate_limit_service import RateLimit, get_rate_limit_service
 from ..var_input_data import (
     get_var_input_data,
     VarInputData,
@@ -62,10 +63,18 @@ from ..financial_variable_registry import (
     Units
 )
 from ..converters.yfinance_converter import YfinanceConverter
+from utils.alias_matcher import AliasMatcher
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Registry categories holding the variables of each statement type
+_STATEMENT_CATEGORIES = {
+    'income': [VariableCategory.INCOME_STATEMENT],
+    'balance': [VariableCategory.BALANCE_SHEET],
+    'cashflow': [VariableCategory.CASH_FLOW]
+}
+
 
 @dataclass
 class YFinanceExtractionResult:
@@ -117,7 +126,8 @@ class YFinanceAdapter:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries in seconds
-            rate_limit_delay: Delay between requests to avoid rate limiting
+            rate_limit_delay: Minimum spacing between requests when the shared
+                rate limit service has no yfinance quota configured
         """
         self.timeout = timeout
         self.max_retries = max_retries
@@ -137,7 +147,8 @@ class YFinanceAdapter:
             'variables_extracted': 0,
             'data_points_stored': 0,
             'cache_hits': 0,
-            'retry_attempts': 0
+            'retry_attempts': 0,
+            'rate_limit_hits': 0
         }
         
         # Data mapping configuration
@@ -298,7 +309,7 @@ class YFinanceAdapter:
             
             # Check market data availability
             try:
-                info = ticker.info
+                info = self._safe_api_call(ticker, 'info')
                 if info and len(info) > 5:  # Basic threshold for valid info
                     availability['market_data_available'] = True
                     availability['info_fields'] = list(info.keys())
@@ -308,7 +319,6 @@ class YFinanceAdapter:
             # Check financial statements availability
             for stmt_name, method_name in self._statement_methods.items():
                 try:
-                    time.sleep(self.rate_limit_delay)  # Rate limiting
                     data = self._safe_api_call(ticker, method_name)
                     if data is not None and not data.empty:
                         availability['statements_available'][stmt_name] = {
@@ -358,6 +368,7 @@ class YFinanceAdapter:
         try:
             ticker = yf.Ticker(symbol)
             # Test that ticker is valid by checking if info is accessible
+            self._enforce_rate_limit()
             _ = ticker.info.get('symbol')  # Light test
             return ticker
         except Exception as e:
@@ -493,6 +504,9 @@ class YFinanceAdapter:
             # Get relevant variables for this statement type
             relevant_variables = self._get_relevant_variables_for_statement(statement_type)
             
+            # Fuzzy-match every statement row once, not once per (variable, period)
+            matched_rows = self._match_statement_rows(data, statement_type)
+            
             # Process each period (column) in the data
             periods = list(data.columns)
             result['periods_covered'] = [str(p) for p in periods]
@@ -507,7 +521,7 @@ class YFinanceAdapter:
                         continue
                     
                     # Check if variable has data for this period
-                    value = self._extract_variable_from_dataframe(data, var_def, period)
+                    value = self._extract_variable_from_dataframe(data, var_def, period, matched_rows)
                     if value is None:
                         continue
                     
@@ -558,13 +572,7 @@ class YFinanceAdapter:
     
     def _get_relevant_variables_for_statement(self, statement_type: str) -> List[str]:
         """Get variables relevant for a specific statement type from registry"""
-        category_mapping = {
-            'income': [VariableCategory.INCOME_STATEMENT],
-            'balance': [VariableCategory.BALANCE_SHEET],
-            'cashflow': [VariableCategory.CASH_FLOW]
-        }
-        
-        relevant_categories = category_mapping.get(statement_type, [])
+        relevant_categories = _STATEMENT_CATEGORIES.get(statement_type, [])
         all_variables = self.variable_registry.list_all_variables()
         
         relevant_variables = []
@@ -575,11 +583,35 @@ class YFinanceAdapter:
         
         return relevant_variables
     
+    def _match_statement_rows(
+        self,
+        data: pd.DataFrame,
+        statement_type: Optional[str] = None,
+        matcher: Optional[AliasMatcher] = None
+    ) -> Dict[str, Any]:
+        """
+        Map variable names to the first statement row whose label fuzzy-matches them.
+        
+        Uses the registry's compiled AliasMatcher token index, so each row label
+        is resolved once instead of being compared against every variable.
+        """
+        if matcher is None:
+            matcher = self.variable_registry.get_alias_matcher()
+        categories = _STATEMENT_CATEGORIES.get(statement_type) if statement_type else None
+        
+        matched_rows = {}
+        for index_name in data.index:
+            for var_name in matcher.partial_candidates(str(index_name), categories):
+                matched_rows.setdefault(var_name, index_name)
+        
+        return matched_rows
+    
     def _extract_variable_from_dataframe(
         self,
         data: pd.DataFrame,
         var_def: Any,
-        period: Any
+        period: Any,
+        matched_rows: Optional[Dict[str, Any]] = None
     ) -> Optional[float]:
         """Extract a specific variable from yfinance DataFrame using registry aliases"""
         # Try direct field mapping from converter
@@ -601,29 +633,15 @@ class YFinanceAdapter:
                         return self._normalize_numeric_value(value)
         
         # Try fuzzy matching with common variations
-        for index_name in data.index:
-            if self._is_field_match(str(index_name), var_def.name):
-                value = data.loc[index_name, period]
-                return self._normalize_numeric_value(value)
+        if matched_rows is None:
+            matched_rows = self._match_statement_rows(data)
+        index_name = matched_rows.get(var_def.name)
+        if index_name is not None:
+            value = data.loc[index_name, period]
+            return self._normalize_numeric_value(value)
         
         return None
     
-    def _is_field_match(self, yf_field: str, var_name: str) -> bool:
-        """Check if yfinance field name matches variable name with fuzzy matching"""
-        yf_normalized = yf_field.lower().replace(' ', '_').replace('-', '_')
-        var_normalized = var_name.lower().replace('_', ' ')
-        
-        # Direct match
-        if yf_normalized == var_name.lower():
-            return True
-        
-        # Word matching (at least 2 common words)
-        yf_words = set(yf_normalized.replace('_', ' ').split())
-        var_words = set(var_normalized.split())
-        common_words = yf_words & var_words
-        
-        return len(common_words) >= min(2, max(1, len(var_words) * 0.6))
-    
     def _normalize_numeric_value(self, value: Any) -> Optional[float]:
         """Normalize value to float with pandas NaN handling"""
         if value is None or pd.isna(value):
@@ -637,10 +655,22 @@ class YFinanceAdapter:
         except (ValueError, TypeError):
             return None
     
+    def _enforce_rate_limit(self) -> None:
+        """Take a yfinance request token from the shared rate limit service, waiting if necessary"""
+        service = get_rate_limit_service()
+        if self.rate_limit_delay > 0:
+            service.configure('yfinance', [RateLimit(1, self.rate_limit_delay)], override=False)
+        
+        acquired, _ = service.try_acquire('yfinance')
+        if not acquired:
+            self._stats['rate_limit_hits'] += 1
+            service.acquire('yfinance')
+    
     def _safe_api_call(self, ticker: yf.Ticker, method: str) -> Any:
         """Make yfinance API call with retry logic and error handling"""
         for attempt in range(self.max_retries + 1):
             try:
+                self._enforce_rate_limit()
                 self._stats['api_calls_made'] += 1
                 
                 if method == 'info':
@@ -654,8 +684,6 @@ class YFinanceAdapter:
                 else:
                     raise ValueError(f"Unknown method: {method}")
                 
-                # Rate limiting
-                time.sleep(self.rate_limit_delay)
                 return result
                 
             except (RequestException, Timeout) as e:
@@ -7,6 +7,8 @@ to optimize performance and reduce API costs while respecting rate limits.
 
 Features:
 - Request batching with configurable windows
+- Event-driven scheduling: per-(provider, endpoint) queues with a timer heap
+  for batch-window deadlines and rate-limit deferrals (no polling)
 - Connection pooling with keepalive
 - Rate limiting and throttling
 - Retry logic with exponential backoff
@@ -28,12 +30,14 @@ Usage Example:
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import threading
 import time
 import json
 import hashlib
-from collections import defaultdict, deque
+from collections import deque
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -44,6 +48,10 @@ from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 from urllib3 import PoolManager
 
+from .rate_limiting.rate_limit_service import (
+    RateLimit, RateLimitService, get_rate_limit_service, window_limits
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -94,6 +102,15 @@ class RateLimitConfig:
     calls_per_day: int = 10000           # API calls per day
     burst_allowance: int = 10            # Burst capacity above average
     
+    def to_limits(self) -> Tuple[RateLimit, ...]:
+        """Token buckets enforcing these quotas"""
+        return window_limits(
+            per_minute=self.calls_per_minute,
+            per_hour=self.calls_per_hour,
+            per_day=self.calls_per_day,
+            burst=self.burst_allowance
+        )
+    
     
 @dataclass
 class CircuitBreakerConfig:
@@ -143,6 +160,13 @@ class ApiRequest:
         return (datetime.now() - self.submitted_time).total_seconds() > max_age_seconds
 
 
+@dataclass
+class _RequestQueue:
+    """Pending batch-compatible requests for one (provider, endpoint)"""
+    requests: List[ApiRequest] = field(default_factory=list)
+    deadline: Optional[float] = None  # time.monotonic() at which the batch window closes
+
+
 @dataclass
 class BatchedRequestGroup:
     """Group of requests that can be processed together"""
@@ -182,115 +206,6 @@ class BatchedRequestGroup:
         return batch_params
 
 
-class RateLimiter:
-    """Multi-level rate limiter with burst handling"""
-    
-    def __init__(self, config: RateLimitConfig):
-        self.config = config
-        self._call_times: Dict[str, deque] = {
-            'minute': deque(),
-            'hour': deque(), 
-            'day': deque()
-        }
-        self._burst_tokens = config.burst_allowance
-        self._last_refill = time.time()
-        self._lock = threading.RLock()
-    
-    def can_make_request(self) -> bool:
-        """Check if a request can be made without violating rate limits"""
-        with self._lock:
-            current_time = time.time()
-            
-            # Refill burst tokens
-            self._refill_burst_tokens(current_time)
-            
-            # Clean old call records
-            self._cleanup_old_calls(current_time)
-            
-            # Check limits
-            minute_calls = len(self._call_times['minute'])
-            hour_calls = len(self._call_times['hour'])
-            day_calls = len(self._call_times['day'])
-            
-            # Use burst tokens if available
-            if self._burst_tokens > 0:
-                return True
-            
-            # Check standard limits
-            return (minute_calls < self.config.calls_per_minute and
-                    hour_calls < self.config.calls_per_hour and
-                    day_calls < self.config.calls_per_day)
-    
-    def record_request(self) -> None:
-        """Record that a request was made"""
-        with self._lock:
-            current_time = time.time()
-            
-            # Use burst token if available
-            if self._burst_tokens > 0:
-                self._burst_tokens -= 1
-            
-            # Record call time
-            self._call_times['minute'].append(current_time)
-            self._call_times['hour'].append(current_time)
-            self._call_times['day'].append(current_time)
-    
-    def wait_time(self) -> float:
-        """Get time to wait before next request"""
-        if self.can_make_request():
-            return 0.0
-        
-        with self._lock:
-            # Calculate wait time based on most restrictive limit
-            wait_times = []
-            
-            if len(self._call_times['minute']) >= self.config.calls_per_minute:
-                oldest_minute = self._call_times['minute'][0]
-                wait_times.append(60.0 - (time.time() - oldest_minute))
-            
-            if len(self._call_times['hour']) >= self.config.calls_per_hour:
-                oldest_hour = self._call_times['hour'][0]
-                wait_times.append(3600.0 - (time.time() - oldest_hour))
-            
-            if len(self._call_times['day']) >= self.config.calls_per_day:
-                oldest_day = self._call_times['day'][0]
-                wait_times.append(86400.0 - (time.time() - oldest_day))
-            
-            return max(wait_times) if wait_times else 0.0
-    
-    def _refill_burst_tokens(self, current_time: float) -> None:
-        """Refill burst tokens based on time elapsed"""
-        time_elapsed = current_time - self._last_refill
-        
-        # Refill 1 token per 60/calls_per_minute seconds
-        refill_rate = 60.0 / self.config.calls_per_minute
-        tokens_to_add = int(time_elapsed / refill_rate)
-        
-        if tokens_to_add > 0:
-            self._burst_tokens = min(
-                self.config.burst_allowance,
-                self._burst_tokens + tokens_to_add
-            )
-            self._last_refill = current_time
-    
-    def _cleanup_old_calls(self, current_time: float) -> None:
-        """Remove old call records that are outside the time windows"""
-        # Remove calls older than 1 minute
-        while (self._call_times['minute'] and
-               current_time - self._call_times['minute'][0] > 60):
-            self._call_times['minute'].popleft()
-        
-        # Remove calls older than 1 hour
-        while (self._call_times['hour'] and
-               current_time - self._call_times['hour'][0] > 3600):
-            self._call_times['hour'].popleft()
-        
-        # Remove calls older than 1 day
-        while (self._call_times['day'] and
-               current_time - self._call_times['day'][0] > 86400):
-            self._call_times['day'].popleft()
-
-
 class CircuitBreaker:
     """Circuit breaker to protect against failing services"""
     
@@ -353,6 +268,11 @@ class ApiBatchManager:
     This manager intelligently batches compatible API requests, manages
     connection pools, enforces rate limits, and provides circuit breaker
     protection for external API services.
+    
+    A single scheduler thread sleeps until the next event: a submission, a
+    batch-window deadline, a rate-limit deferral expiring or a worker slot
+    freeing up. Rate-limited batches are re-queued for the time their tokens
+    become available instead of blocking a worker thread.
     """
     
     def __init__(
@@ -360,7 +280,8 @@ class ApiBatchManager:
         batch_config: Optional[BatchConfig] = None,
         connection_config: Optional[ConnectionConfig] = None,
         rate_limit_config: Optional[Dict[str, RateLimitConfig]] = None,
-        circuit_breaker_config: Optional[Dict[str, CircuitBreakerConfig]] = None
+        circuit_breaker_config: Optional[Dict[str, CircuitBreakerConfig]] = None,
+        rate_limit_service: Optional[RateLimitService] = None
     ):
         """
         Initialize the API batch manager.
@@ -370,25 +291,31 @@ class ApiBatchManager:
             connection_config: Configuration for connection pooling
             rate_limit_config: Rate limit configs per API provider
             circuit_breaker_config: Circuit breaker configs per API provider
+            rate_limit_service: Shared token-bucket service (default: process-wide service)
         """
         self.batch_config = batch_config or BatchConfig()
         self.connection_config = connection_config or ConnectionConfig()
         
-        # Per-provider configurations
-        self.rate_limiters = {}
+        # Per-provider configurations; quotas are enforced by the shared service
+        self.rate_limit_service = rate_limit_service or get_rate_limit_service()
         self.circuit_breakers = {}
         
         if rate_limit_config:
             for provider, config in rate_limit_config.items():
-                self.rate_limiters[provider] = RateLimiter(config)
+                self.rate_limit_service.configure(provider, config.to_limits())
+        self._rate_limited_providers: Set[str] = set(rate_limit_config or ())
         
         if circuit_breaker_config:
             for provider, config in circuit_breaker_config.items():
                 self.circuit_breakers[provider] = CircuitBreaker(config)
         
         # Request management
-        self._pending_requests: Dict[str, ApiRequest] = {}
+        self._queues: Dict[Tuple[str, str], _RequestQueue] = {}
         self._batch_groups: Dict[str, BatchedRequestGroup] = {}
+        self._ready_batches: deque = deque()  # Batches waiting for a worker slot
+        self._active_batches = 0
+        self._timers: List[Tuple[float, int, Any]] = []  # Heap of (due, seq, queue key or batch)
+        self._sequence = itertools.count()
         self._request_futures: Dict[str, Future] = {}
         self._request_cache: Dict[str, Tuple[Any, datetime]] = {}
         
@@ -401,6 +328,7 @@ class ApiBatchManager:
         self._batch_processor_thread = None
         self._running = False
         self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
         
         # Statistics
         self._stats = {
@@ -427,7 +355,7 @@ class ApiBatchManager:
         
         # Start batch processor thread
         self._batch_processor_thread = threading.Thread(
-            target=self._batch_processor_loop,
+            target=self._scheduler_loop,
             name="ApiBatchProcessor",
             daemon=True
         )
@@ -440,14 +368,16 @@ class ApiBatchManager:
         if not self._running:
             return
         
-        self._running = False
+        with self._lock:
+            self._running = False
+            self._wakeup.notify_all()
         
         # Wait for processor thread to stop
         if self._batch_processor_thread and self._batch_processor_thread.is_alive():
             self._batch_processor_thread.join(timeout=timeout)
         
         # Shutdown executor
-        self._executor.shutdown(wait=True, timeout=timeout)
+        self._executor.shutdown(wait=True)
         
         # Close sessions
         for session in self._sessions.values():
@@ -487,7 +417,7 @@ class ApiBatchManager:
         
         # Create request
         request = ApiRequest(
-            request_id=f"req_{int(time.time() * 1000000)}",
+            request_id=f"req_{int(time.time() * 1000000)}_{next(self._sequence)}",
             api_provider=api_provider,
             endpoint=endpoint,
             method=method,
@@ -512,21 +442,23 @@ class ApiBatchManager:
         # Create future for result
         future = Future()
         
-        with self._lock:
-            self._pending_requests[request.request_id] = request
-            self._request_futures[request.request_id] = future
-        
         with self._stats_lock:
             self._stats['requests_submitted'] += 1
         
+        with self._lock:
+            self._request_futures[request.request_id] = future
+            self._enqueue_request(request)
+            self._wakeup.notify()
+        
         logger.debug(f"Submitted request {request.request_id} to {api_provider}/{endpoint}")
         return future
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive system statistics"""
         with self._lock:
-            pending_count = len(self._pending_requests)
+            pending_count = sum(len(queue.requests) for queue in self._queues.values())
             batch_count = len(self._batch_groups)
+            scheduled_timers = len(self._timers)
             active_sessions = len(self._sessions)
         
         with self._stats_lock:
@@ -540,11 +472,12 @@ class ApiBatchManager:
         
         # Rate limiter stats
         rate_limiter_stats = {}
-        for provider, limiter in self.rate_limiters.items():
+        for provider in self._rate_limited_providers:
+            status = self.rate_limit_service.get_status(provider)
             rate_limiter_stats[provider] = {
-                'can_make_request': limiter.can_make_request(),
-                'wait_time_seconds': limiter.wait_time(),
-                'burst_tokens': limiter._burst_tokens
+                'can_make_request': status['wait_time_seconds'] == 0,
+                'wait_time_seconds': status['wait_time_seconds'],
+                'buckets': status['buckets']
             }
         
         # Circuit breaker stats
@@ -561,6 +494,7 @@ class ApiBatchManager:
                 'running': self._running,
                 'pending_requests': pending_count,
                 'active_batches': batch_count,
+                'scheduled_timers': scheduled_timers,
                 'active_sessions': active_sessions
             },
             'performance': stats,
@@ -602,123 +536,127 @@ class ApiBatchManager:
             session.mount("https://", adapter)
             self._sessions[provider] = session
     
-    def _batch_processor_loop(self) -> None:
-        """Main loop for processing batched requests"""
+    def _scheduler_loop(self) -> None:
+        """Dispatch batches as their windows close, sleeping until the next event"""
         logger.info("API batch processor started")
         
-        while self._running:
-            try:
-                self._create_batches()
-                self._process_batches()
-                time.sleep(0.1)  # Small delay between processing cycles
-                
-            except Exception as e:
-                logger.error(f"Error in batch processor loop: {e}")
-                time.sleep(1.0)
-        
-        logger.info("API batch processor stopped")
-    
-    def _create_batches(self) -> None:
-        """Create batches from pending requests"""
         with self._lock:
-            if not self._pending_requests:
-                return
-            
-            # Group requests by provider and endpoint
-            groups = defaultdict(list)
-            
-            for request in self._pending_requests.values():
-                if request.batch_compatible:
-                    key = (request.api_provider, request.endpoint)
-                    groups[key].append(request)
-            
-            # Create batches
-            current_time = datetime.now()
-            
-            for (provider, endpoint), requests in groups.items():
-                # Sort by priority (lower number = higher priority)
-                requests.sort(key=lambda r: r.priority)
-                
-                # Create batches
-                while requests:
-                    batch_size = min(len(requests), self.batch_config.max_batch_size)
-                    batch_requests = requests[:batch_size]
-                    requests = requests[batch_size:]
+            while self._running:
+                try:
+                    now = time.monotonic()
+                    self._fire_timers(now)
+                    self._dispatch_ready_batches(now)
                     
-                    # Check if batch window has elapsed for oldest request
-                    oldest_request = min(batch_requests, key=lambda r: r.submitted_time)
-                    time_elapsed = (current_time - oldest_request.submitted_time).total_seconds()
+                    timeout = max(0.0, self._timers[0][0] - now) if self._timers else None
+                    self._wakeup.wait(timeout)
                     
-                    if (time_elapsed >= self.batch_config.batch_window_seconds or
-                        len(batch_requests) >= self.batch_config.max_batch_size):
-                        
-                        # Create batch
-                        batch_id = f"batch_{int(time.time() * 1000000)}"
-                        batch_group = BatchedRequestGroup(
-                            batch_id=batch_id,
-                            requests=batch_requests,
-                            api_provider=provider,
-                            endpoint=endpoint
-                        )
-                        
-                        self._batch_groups[batch_id] = batch_group
-                        
-                        # Remove from pending
-                        for req in batch_requests:
-                            del self._pending_requests[req.request_id]
-                        
-                        with self._stats_lock:
-                            self._stats['requests_batched'] += len(batch_requests)
-                        
-                        logger.debug(f"Created batch {batch_id} with {len(batch_requests)} requests")
-    
-    def _process_batches(self) -> None:
-        """Process ready batches"""
-        with self._lock:
-            ready_batches = [
-                batch for batch in self._batch_groups.values()
-                if batch.status == RequestStatus.PENDING
-            ]
+                except Exception as e:
+                    logger.error(f"Error in batch processor loop: {e}")
+                    self._wakeup.wait(1.0)
         
-        # Limit concurrent batch processing
-        active_batches = sum(1 for batch in self._batch_groups.values()
-                           if batch.status == RequestStatus.IN_PROGRESS)
+        logger.info("API batch processor stopped")
+    
+    def _schedule(self, due: float, item: Any) -> None:
+        """Add a timer for a queue's window deadline or a deferred batch (lock held)"""
+        heapq.heappush(self._timers, (due, next(self._sequence), item))
+    
+    def _enqueue_request(self, request: ApiRequest) -> None:
+        """Add a request to its (provider, endpoint) queue (lock held)"""
+        if not request.batch_compatible:
+            self._create_batch(request.api_provider, request.endpoint, [request])
+            return
         
-        available_slots = self.batch_config.max_concurrent_batches - active_batches
+        key = (request.api_provider, request.endpoint)
+        queue = self._queues.setdefault(key, _RequestQueue())
+        queue.requests.append(request)
+        
+        if len(queue.requests) >= self.batch_config.max_batch_size:
+            self._flush_queue(key, full_batches_only=True)
+        elif queue.deadline is None:
+            queue.deadline = time.monotonic() + self.batch_config.batch_window_seconds
+            self._schedule(queue.deadline, key)
+    
+    def _flush_queue(self, key: Tuple[str, str], full_batches_only: bool = False) -> None:
+        """Turn queued requests into batches, highest priority first (lock held)"""
+        queue = self._queues[key]
+        # Sort by priority (lower number = higher priority); stable, so FIFO within a priority
+        queue.requests.sort(key=lambda r: r.priority)
+        
+        max_size = self.batch_config.max_batch_size
+        while queue.requests and (len(queue.requests) >= max_size or not full_batches_only):
+            batch_requests, queue.requests = queue.requests[:max_size], queue.requests[max_size:]
+            self._create_batch(key[0], key[1], batch_requests)
+        
+        if not queue.requests:
+            del self._queues[key]
+    
+    def _create_batch(self, provider: str, endpoint: str, batch_requests: List[ApiRequest]) -> None:
+        """Queue a batch for dispatch (lock held)"""
+        batch_id = f"batch_{int(time.time() * 1000000)}_{next(self._sequence)}"
+        batch_group = BatchedRequestGroup(
+            batch_id=batch_id,
+            requests=batch_requests,
+            api_provider=provider,
+            endpoint=endpoint
+        )
+        self._batch_groups[batch_id] = batch_group
+        self._ready_batches.append(batch_group)
         
-        for batch in ready_batches[:available_slots]:
-            batch.status = RequestStatus.IN_PROGRESS
-            batch.processing_started = datetime.now()
+        with self._stats_lock:
+            self._stats['requests_batched'] += len(batch_requests)
+        
+        logger.debug(f"Created batch {batch_id} with {len(batch_requests)} requests")
+    
+    def _fire_timers(self, now: float) -> None:
+        """Close expired batch windows and release deferred batches (lock held)"""
+        while self._timers and self._timers[0][0] <= now:
+            _, _, item = heapq.heappop(self._timers)
             
-            # Submit batch for processing
-            self._executor.submit(self._execute_batch, batch)
+            if isinstance(item, BatchedRequestGroup):
+                self._ready_batches.append(item)
+                continue
+            
+            # Window timers are stale once their queue was flushed and restarted
+            queue = self._queues.get(item)
+            if queue and queue.deadline is not None and queue.deadline <= now:
+                queue.deadline = None
+                self._flush_queue(item)
     
-    def _execute_batch(self, batch: BatchedRequestGroup) -> None:
-        """Execute a batch of requests"""
-        provider = batch.api_provider
-        
-        try:
+    def _dispatch_ready_batches(self, now: float) -> None:
+        """Hand ready batches to workers, deferring rate-limited ones (lock held)"""
+        while self._ready_batches and self._active_batches < self.batch_config.max_concurrent_batches:
+            batch = self._ready_batches.popleft()
+            provider = batch.api_provider
+            
             # Check circuit breaker
             circuit_breaker = self.circuit_breakers.get(provider)
             if circuit_breaker and not circuit_breaker.can_execute():
-                # Circuit breaker is open
+                self._batch_groups.pop(batch.batch_id, None)
                 self._handle_batch_failure(batch, "Circuit breaker open")
                 with self._stats_lock:
                     self._stats['circuit_breaker_trips'] += 1
-                return
+                continue
             
-            # Check rate limiting
-            rate_limiter = self.rate_limiters.get(provider)
-            if rate_limiter:
-                wait_time = rate_limiter.wait_time()
-                if wait_time > 0:
-                    logger.debug(f"Rate limit delay: {wait_time:.1f}s for {provider}")
-                    time.sleep(wait_time)
-                    with self._stats_lock:
-                        self._stats['rate_limit_delays'] += 1
-                
-                rate_limiter.record_request()
+            # Take a token from the provider's shared quota, or retry when one is due
+            acquired, wait_time = self.rate_limit_service.try_acquire(provider)
+            if not acquired:
+                logger.debug(f"Rate limit delay: {wait_time:.1f}s for {provider}")
+                self._schedule(now + wait_time, batch)
+                with self._stats_lock:
+                    self._stats['rate_limit_delays'] += 1
+                continue
             
+            batch.status = RequestStatus.IN_PROGRESS
+            batch.processing_started = datetime.now()
+            self._active_batches += 1
+            self._executor.submit(self._execute_batch, batch)
+    
+    def _execute_batch(self, batch: BatchedRequestGroup) -> None:
+        """Execute a batch of requests"""
+        provider = batch.api_provider
+        circuit_breaker = self.circuit_breakers.get(provider)
+        
+        try:
             # Execute the batch request
             start_time = time.time()
             
@@ -758,7 +696,6 @@ class ApiBatchManager:
             self._handle_batch_failure(batch, str(e))
             
             # Record failure with circuit breaker
-            circuit_breaker = self.circuit_breakers.get(provider)
             if circuit_breaker:
                 circuit_breaker.record_failure()
             
@@ -768,10 +705,11 @@ class ApiBatchManager:
             logger.error(f"Batch {batch.batch_id} failed: {e}")
         
         finally:
-            # Clean up
+            # Clean up and let the scheduler use the freed slot
             with self._lock:
-                if batch.batch_id in self._batch_groups:
-                    del self._batch_groups[batch.batch_id]
+                self._batch_groups.pop(batch.batch_id, None)
+                self._active_batches -= 1
+                self._wakeup.notify()
     
     def _execute_single_request(self, request: ApiRequest) -> Any:
         """Execute a single API request"""
@@ -38,6 +38,8 @@ from typing import Any, Dict, List, Optional, Set, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor, Future
 import weakref
 
+from .rate_limiting.rate_limit_service import RateLimit, get_rate_limit_service
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -171,44 +173,6 @@ class AccessTracker:
             }
 
 
-class RateLimiter:
-    """Rate limiter for API calls"""
-    
-    def __init__(self, calls_per_minute: int = 60):
-        self.calls_per_minute = calls_per_minute
-        self.call_times: deque = deque()
-        self._lock = threading.Lock()
-    
-    def can_make_call(self) -> bool:
-        """Check if we can make an API call without exceeding rate limit"""
-        current_time = time.time()
-        
-        with self._lock:
-            # Remove calls older than 1 minute
-            while self.call_times and current_time - self.call_times[0] > 60:
-                self.call_times.popleft()
-            
-            return len(self.call_times) < self.calls_per_minute
-    
-    def record_call(self) -> None:
-        """Record an API call"""
-        with self._lock:
-            self.call_times.append(time.time())
-    
-    def wait_time_seconds(self) -> float:
-        """Get seconds to wait before next call is allowed"""
-        if self.can_make_call():
-            return 0.0
-        
-        with self._lock:
-            if not self.call_times:
-                return 0.0
-            
-            # Time until oldest call is 1 minute old
-            oldest_call_time = self.call_times[0]
-            return max(0.0, 60.0 - (time.time() - oldest_call_time))
-
-
 class BackgroundRefreshManager:
     """
     Manages background refresh of frequently accessed financial data.
@@ -248,7 +212,8 @@ class BackgroundRefreshManager:
         self._access_tracker = AccessTracker()
         self._active_requests: Dict[str, RefreshRequest] = {}
         self._completed_requests: deque = deque(maxlen=1000)  # Keep last 1000 for stats
-        self._rate_limiters: Dict[str, RateLimiter] = defaultdict(lambda: RateLimiter(60))
+        self._rate_limit_service = get_rate_limit_service()
+        self._rate_limited_keys: Set[str] = set()
         self._data_policies: Dict[str, RefreshPolicy] = {}
         
         # Threading
@@ -442,7 +407,7 @@ class BackgroundRefreshManager:
             },
             'access_tracking': self._access_tracker.get_access_statistics(),
             'rate_limiting': {
-                'active_limiters': len(self._rate_limiters),
+                'active_limiters': len(self._rate_limited_keys),
                 'total_delays': stats.get('rate_limit_delays', 0)
             }
         }
@@ -523,6 +488,15 @@ class BackgroundRefreshManager:
                 except Exception as e:
                     logger.error(f"Error processing {priority} queue: {e}")
     
+    def _rate_limit_key(self, data_identifier: str) -> str:
+        """Rate limit service key for a data type (60 calls/minute each)"""
+        key = f"background_refresh:{data_identifier}"
+        if key not in self._rate_limited_keys:
+            self._rate_limit_service.configure(key, [RateLimit.per_minute(60)], override=False)
+            with self._lock:
+                self._rate_limited_keys.add(key)
+        return key
+    
     def _process_refresh_request(self, request: RefreshRequest) -> None:
         """Process a single refresh request"""
         cache_key = request.get_cache_key()
@@ -535,21 +509,18 @@ class BackgroundRefreshManager:
             
             start_time = time.time()
             
-            # Check rate limiting
-            limiter = self._rate_limiters[request.data_identifier]
-            if not limiter.can_make_call():
-                wait_time = limiter.wait_time_seconds()
-                if wait_time > 0:
-                    logger.debug(f"Rate limiting delay: {wait_time:.1f}s for {cache_key}")
-                    time.sleep(wait_time)
-                    with self._stats_lock:
-                        self._stats['rate_limit_delays'] += 1
+            # Take a token from this data type's quota before calling out
+            rate_key = self._rate_limit_key(request.data_identifier)
+            acquired, wait_time = self._rate_limit_service.try_acquire(rate_key)
+            if not acquired:
+                logger.debug(f"Rate limiting delay: {wait_time:.1f}s for {cache_key}")
+                with self._stats_lock:
+                    self._stats['rate_limit_delays'] += 1
+                self._rate_limit_service.acquire(rate_key)
             
             # Perform the actual refresh
             success = self._refresh_data(request)
             
-            # Record API call
-            limiter.record_call()
             with self._stats_lock:
                 self._stats['api_calls_made'] += 1
             
@@ -718,6 +689,5 @@ __all__ = [
     'RefreshPriority',
     'RefreshStatus',
     'AccessTracker',
-    'RateLimiter',
     'get_background_refresh_manager'
 ]
\ No newline at end of file
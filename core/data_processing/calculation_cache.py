@@ -9,7 +9,8 @@ all dependent calculations are automatically invalidated.
 Features:
 - Dependency graph tracking
 - Automatic invalidation cascades
-- Memory-efficient storage with compression
+- Memory-efficient storage with transparent compression and a decompressed hot set
+- Lazy loading of persisted results through a lightweight on-disk index
 - Thread-safe operations
 - Performance metrics and monitoring
 
@@ -33,14 +34,23 @@ import threading
 import pickle
 import gzip
 import hashlib
-from collections import defaultdict, deque
+import os
+import zlib
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 import weakref
 
+# Fast compression codec with zlib fallback
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -66,6 +76,7 @@ class CacheEntry:
     size_bytes: int = 0
     compression_ratio: float = 1.0
     error_message: Optional[str] = None
+    compression_codec: Optional[str] = None  # Set when result holds compressed bytes
     
     def __post_init__(self):
         """Calculate entry size and update metadata"""
@@ -98,6 +109,7 @@ class CacheEntry:
             'status': self.status.value,
             'size_bytes': self.size_bytes,
             'compression_ratio': self.compression_ratio,
+            'compression_codec': self.compression_codec,
             'error_message': self.error_message
         }
 
@@ -123,14 +135,30 @@ class CalculationCache:
     This cache automatically invalidates dependent calculations when input
     data changes, ensuring calculation results are always consistent with
     the underlying data.
+    
+    Persisted entries are described by an index (key, symbol, dependencies,
+    size, timestamp, TTL) kept as a JSON snapshot plus an append-only log.
+    Startup reads only the index; payloads are unpickled on first access and
+    expired files are swept by a background thread.
     """
     
+    INDEX_FILE = "_index.json"
+    INDEX_LOG_FILE = "_index.log"
+    # Minimum number of log records before the log is folded into the snapshot
+    INDEX_COMPACTION_MIN_RECORDS = 1000
+    # Results larger than this are persisted to disk
+    PERSIST_THRESHOLD_BYTES = 10 * 1024
+    # Accesses after which a compressed entry's decoded result is kept in the hot set
+    HOT_SET_MIN_ACCESSES = 2
+    
     def __init__(
         self, 
         cache_dir: str = "./data_cache/calculations",
         max_memory_mb: int = 512,
         default_ttl_seconds: int = 3600,
-        enable_compression: bool = True
+        enable_compression: bool = True,
+        compression_threshold_bytes: int = 1024,
+        hot_set_size: int = 32
     ):
         """
         Initialize the calculation cache.
@@ -140,6 +168,8 @@ class CalculationCache:
             max_memory_mb: Maximum memory usage in MB
             default_ttl_seconds: Default time-to-live for cache entries
             enable_compression: Whether to compress stored results
+            compression_threshold_bytes: Minimum pickled size before a result is compressed
+            hot_set_size: Number of decompressed results kept for frequently accessed keys
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -147,9 +177,20 @@ class CalculationCache:
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.default_ttl_seconds = default_ttl_seconds
         self.enable_compression = enable_compression
+        self.compression_threshold_bytes = compression_threshold_bytes
+        self.compression_codec = 'lz4' if LZ4_AVAILABLE else 'zlib'
+        self.hot_set_size = hot_set_size
+        
+        # In-memory cache in least-recently-used order: {cache_key: CacheEntry}
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         
-        # In-memory cache: {cache_key: CacheEntry}
-        self._cache: Dict[str, CacheEntry] = {}
+        # Running memory total and invalidated keys (evicted before valid ones)
+        self._memory_bytes = 0
+        self._invalid_keys: Set[str] = set()
+        
+        # Decompressed results of frequently hit compressed entries, in LRU order:
+        # {cache_key: (result, decoded size)}; sizes count toward _memory_bytes
+        self._hot_results: OrderedDict[str, Tuple[Any, int]] = OrderedDict()
         
         # Dependency graph: {dependency: set(cache_keys)}
         self._dependency_graph: Dict[str, Set[str]] = defaultdict(set)
@@ -165,14 +206,30 @@ class CalculationCache:
             'invalidations': 0,
             'computations_saved': 0,
             'total_computation_time_saved': 0.0,
-            'dependency_invalidations': 0
+            'dependency_invalidations': 0,
+            'decompressions': 0,
+            'hot_set_hits': 0
         }
         self._metrics_lock = threading.Lock()
         
-        # Load existing cache from disk
+        # Persisted entries not yet loaded into memory: {cache_key: index record}
+        self._disk_index: Dict[str, Dict[str, Any]] = {}
+        self._index_log_records = 0
+        
+        # Load the persisted index (payloads are loaded lazily)
         self._load_cache_index()
         
-        logger.info(f"CalculationCache initialized with {len(self._cache)} entries")
+        # Sweep expired and unindexed files without blocking startup
+        self._sweep_thread = threading.Thread(
+            target=self._sweep_persisted_entries,
+            name="CalculationCacheSweep",
+            daemon=True
+        )
+        self._sweep_thread.start()
+        
+        logger.info(
+            f"CalculationCache initialized with {len(self._disk_index)} persisted entries indexed"
+        )
     
     def get_result(
         self, 
@@ -194,13 +251,12 @@ class CalculationCache:
         cache_key = self._generate_cache_key(symbol, calculation_id, parameters)
         
         with self._lock:
-            if cache_key not in self._cache:
+            entry = self._get_entry(cache_key)
+            if entry is None:
                 with self._metrics_lock:
                     self._metrics['cache_misses'] += 1
                 return None
             
-            entry = self._cache[cache_key]
-            
             # Check if entry is valid and not expired
             if entry.status != CacheEntryStatus.VALID or entry.is_expired(self.default_ttl_seconds):
                 # Remove expired/invalid entry
@@ -211,6 +267,8 @@ class CalculationCache:
             
             # Update access statistics
             entry.mark_accessed()
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
             
             with self._metrics_lock:
                 self._metrics['cache_hits'] += 1
@@ -218,7 +276,7 @@ class CalculationCache:
                 self._metrics['total_computation_time_saved'] += entry.computation_time_seconds
             
             logger.debug(f"Cache hit for {cache_key}")
-            return entry.result
+            return self._resolve_result(cache_key, entry)
     
     def set_result(
         self,
@@ -248,35 +306,13 @@ class CalculationCache:
         
         try:
             with self._lock:
-                # Create cache entry
-                entry = CacheEntry(
-                    result=result,
-                    timestamp=datetime.now(),
-                    dependencies=set(dependencies),
-                    computation_time_seconds=computation_time_seconds
-                )
-                
-                # Compress result if enabled and beneficial
-                if self.enable_compression and entry.size_bytes > 1024:  # Compress if > 1KB
-                    compressed_result = self._compress_result(result)
-                    if len(compressed_result) < entry.size_bytes * 0.8:  # Only if 20% smaller
-                        entry.result = compressed_result
-                        entry.compression_ratio = entry.size_bytes / len(compressed_result)
-                        entry.size_bytes = len(compressed_result)
-                
-                # Update dependency graph
-                self._update_dependency_graph(cache_key, dependencies)
-                
-                # Store entry
-                self._cache[cache_key] = entry
+                entry = self._build_entry(result, dependencies, computation_time_seconds)
+                record = self._store_entry(cache_key, entry, dependencies)
+                self._append_index_records([record] if record else [])
                 
                 # Check memory limits and cleanup if needed
                 self._cleanup_memory_if_needed()
                 
-                # Persist to disk if large or important
-                if entry.size_bytes > 10 * 1024:  # Persist if > 10KB
-                    self._persist_entry(cache_key, entry)
-                
                 logger.debug(f"Cached result for {cache_key} (deps: {dependencies})")
                 return True
                 
@@ -284,6 +320,50 @@ class CalculationCache:
             logger.error(f"Failed to cache result for {cache_key}: {e}")
             return False
     
+    def set_many(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store a batch of calculation results.
+        
+        Index changes are written in a single log append and memory limits are
+        enforced once for the whole batch, so bulk population after a batch
+        valuation run stays linear in the number of results.
+        
+        Args:
+            items: Dicts of set_result keyword arguments (symbol, calculation_id,
+                result and optionally dependencies, parameters,
+                computation_time_seconds)
+            
+        Returns:
+            Number of results stored
+        """
+        stored = 0
+        records = []
+        
+        with self._lock:
+            for item in items:
+                try:
+                    cache_key = self._generate_cache_key(
+                        item['symbol'], item['calculation_id'], item.get('parameters')
+                    )
+                    dependencies = item.get('dependencies') or []
+                    entry = self._build_entry(
+                        item['result'], dependencies, item.get('computation_time_seconds', 0.0)
+                    )
+                    record = self._store_entry(cache_key, entry, dependencies)
+                except Exception as e:
+                    logger.error(f"Failed to cache batch item {item.get('symbol')}: {e}")
+                    continue
+                
+                if record:
+                    records.append(record)
+                stored += 1
+            
+            self._append_index_records(records)
+            self._cleanup_memory_if_needed()
+        
+        logger.debug(f"Cached {stored} results in batch")
+        return stored
+    
     def invalidate_dependencies(self, symbol: str, dependency: str) -> int:
         """
         Invalidate all cache entries that depend on a specific data element.
@@ -314,9 +394,20 @@ class CalculationCache:
                     
                 invalidated_keys.add(cache_key)
                 
-                if cache_key in self._cache:
+                if cache_key not in self._cache and cache_key in self._disk_index:
+                    # Persisted but never loaded: drop it rather than unpickling it
+                    dependencies = self._disk_index[cache_key].get('dependencies', [])
+                    self._remove_entry(cache_key)
+                    invalidated_count += 1
+                    for dep in dependencies:
+                        dep_key = f"{symbol}:{dep}"
+                        if dep_key in self._dependency_graph:
+                            to_invalidate.extend(self._dependency_graph[dep_key])
+                elif cache_key in self._cache:
                     # Mark as invalid
                     self._cache[cache_key].status = CacheEntryStatus.INVALID
+                    self._drop_hot_result(cache_key)
+                    self._invalid_keys.add(cache_key)
                     invalidated_count += 1
                     
                     # Find entries that depend on this one
@@ -344,17 +435,24 @@ class CalculationCache:
         """
         with self._lock:
             if symbol is None:
-                # Clear everything
-                count = len(self._cache)
+                # Clear everything, including persisted entries
+                count = len(set(self._cache) | set(self._disk_index))
+                for cache_key in self._disk_index:
+                    self._remove_persisted_entry(cache_key)
                 self._cache.clear()
+                self._memory_bytes = 0
+                self._invalid_keys.clear()
+                self._hot_results.clear()
+                self._disk_index.clear()
                 self._dependency_graph.clear()
                 self._reverse_dependencies.clear()
+                self._compact_index()
                 logger.info(f"Cleared entire calculation cache ({count} entries)")
                 return count
             else:
                 # Clear symbol-specific entries
                 keys_to_remove = [
-                    key for key in self._cache.keys() 
+                    key for key in set(self._cache) | set(self._disk_index)
                     if key.startswith(f"{symbol}:")
                 ]
                 
@@ -367,7 +465,7 @@ class CalculationCache:
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics"""
         with self._lock:
-            total_size_bytes = sum(entry.size_bytes for entry in self._cache.values())
+            total_size_bytes = self._memory_bytes
             valid_entries = sum(1 for entry in self._cache.values() 
                               if entry.status == CacheEntryStatus.VALID)
             
@@ -388,6 +486,7 @@ class CalculationCache:
                 stats = {
                     'cache_info': {
                         'total_entries': len(self._cache),
+                        'persisted_entries': len(self._disk_index),
                         'valid_entries': valid_entries,
                         'total_size_mb': total_size_bytes / (1024 * 1024),
                         'max_memory_mb': self.max_memory_bytes / (1024 * 1024),
@@ -404,7 +503,12 @@ class CalculationCache:
                     'compression': {
                         'compressed_entries': compressed_entries,
                         'compression_enabled': self.enable_compression,
-                        'avg_compression_ratio': avg_compression_ratio
+                        'compression_codec': self.compression_codec,
+                        'avg_compression_ratio': avg_compression_ratio,
+                        'hot_set_entries': len(self._hot_results),
+                        'hot_set_size_mb': sum(
+                            size for _, size in self._hot_results.values()
+                        ) / (1024 * 1024)
                     },
                     'dependencies': {
                         'dependency_count': len(self._dependency_graph),
@@ -422,15 +526,14 @@ class CalculationCache:
         cache_key = self._generate_cache_key(symbol, calculation_id)
         
         with self._lock:
-            if cache_key not in self._cache:
+            entry = self._get_entry(cache_key)
+            if entry is None:
                 return {}
             
-            entry = self._cache[cache_key]
-            
             # Find what this entry depends on and what depends on it
             depends_on = list(entry.dependencies)
             depended_by = [
-                key for dep_key, cache_keys in self._dependency_graph.items()
+                dep_key for dep_key, cache_keys in self._dependency_graph.items()
                 if cache_key in cache_keys
             ]
             
@@ -447,6 +550,131 @@ class CalculationCache:
     
     # Private helper methods
     
+    def _get_entry(self, cache_key: str) -> Optional[CacheEntry]:
+        """Return an in-memory entry, loading a persisted one on first access"""
+        entry = self._cache.get(cache_key)
+        if entry is not None or cache_key not in self._disk_index:
+            return entry
+        
+        entry = self._load_persisted_entry(cache_key)
+        if entry is None:
+            self._remove_entry(cache_key)
+            return None
+        
+        # An entry larger than the memory limit is served from disk without
+        # being kept in memory, where the cleanup below would evict it at once
+        if entry.size_bytes > self.max_memory_bytes:
+            return entry
+        
+        self._cache[cache_key] = entry
+        self._memory_bytes += entry.size_bytes
+        self._cleanup_memory_if_needed()
+        return entry
+    
+    def _build_entry(
+        self, result: Any, dependencies: List[str], computation_time_seconds: float
+    ) -> CacheEntry:
+        """Create a cache entry, compressing the result when enabled and beneficial"""
+        entry = CacheEntry(
+            result=result,
+            timestamp=datetime.now(),
+            dependencies=set(dependencies),
+            computation_time_seconds=computation_time_seconds
+        )
+        
+        # Compress result if enabled and beneficial
+        if self.enable_compression and entry.size_bytes > self.compression_threshold_bytes:
+            compressed_result = self._compress_result(result)
+            if compressed_result is not None and len(compressed_result) < entry.size_bytes * 0.8:
+                # Only if 20% smaller
+                entry.result = compressed_result
+                entry.compression_codec = self.compression_codec
+                entry.compression_ratio = entry.size_bytes / len(compressed_result)
+                entry.size_bytes = len(compressed_result)
+        
+        return entry
+    
+    def _resolve_result(self, cache_key: str, entry: CacheEntry) -> Any:
+        """Return an entry's result, decompressing it (via the hot set) if needed"""
+        codec = self._entry_codec(entry)
+        if codec is None:
+            return entry.result
+        
+        if cache_key in self._hot_results:
+            self._hot_results.move_to_end(cache_key)
+            with self._metrics_lock:
+                self._metrics['hot_set_hits'] += 1
+            return self._hot_results[cache_key][0]
+        
+        try:
+            result = self._decompress_result(entry.result, codec)
+        except Exception as e:
+            logger.warning(f"Failed to decompress cached result {cache_key}: {e}")
+            self._remove_entry(cache_key)
+            return None
+        with self._metrics_lock:
+            self._metrics['decompressions'] += 1
+        
+        if self.hot_set_size > 0 and entry.access_count >= self.HOT_SET_MIN_ACCESSES:
+            # The decoded copy is about as large as the result before compression
+            decoded_size = int(entry.size_bytes * entry.compression_ratio)
+            if decoded_size <= self.max_memory_bytes:
+                self._hot_results[cache_key] = (result, decoded_size)
+                self._memory_bytes += decoded_size
+                if len(self._hot_results) > self.hot_set_size:
+                    self._drop_hot_result(next(iter(self._hot_results)))
+                self._cleanup_memory_if_needed()
+        return result
+    
+    @staticmethod
+    def _entry_codec(entry: CacheEntry) -> Optional[str]:
+        """Codec of a compressed entry, or None if its result is stored as-is"""
+        codec = getattr(entry, 'compression_codec', None)
+        if codec is None and isinstance(entry.result, bytes) and entry.compression_ratio > 1.0:
+            # Entries persisted before codecs were recorded were gzip-compressed
+            return 'gzip'
+        return codec
+    
+    def _store_entry(
+        self, cache_key: str, entry: CacheEntry, dependencies: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Store an entry in memory and on disk if large enough.
+        
+        Returns the index log record describing the persistence change, or None,
+        leaving the log write to the caller so batches can share one append.
+        """
+        # Update dependency graph
+        self._update_dependency_graph(cache_key, dependencies)
+        
+        # Store entry, replacing any previous result for this key
+        self._discard_from_memory(cache_key)
+        self._cache[cache_key] = entry
+        self._memory_bytes += entry.size_bytes
+        
+        # Persist to disk if large or important
+        if entry.size_bytes > self.PERSIST_THRESHOLD_BYTES:
+            return self._persist_entry(cache_key, entry)
+        if self._disk_index.pop(cache_key, None) is not None:
+            # Drop the stale persisted copy of a previous result
+            self._remove_persisted_entry(cache_key)
+            return {'op': 'del', 'key': cache_key}
+        return None
+    
+    def _discard_from_memory(self, cache_key: str) -> None:
+        """Drop an entry from the memory tier, keeping any persisted copy"""
+        entry = self._cache.pop(cache_key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size_bytes
+        self._invalid_keys.discard(cache_key)
+        self._drop_hot_result(cache_key)
+    
+    def _drop_hot_result(self, cache_key: str) -> None:
+        """Drop a decoded result from the hot set, releasing its memory"""
+        hot = self._hot_results.pop(cache_key, None)
+        if hot is not None:
+            self._memory_bytes -= hot[1]
+    
     def _generate_cache_key(
         self, 
         symbol: str, 
@@ -471,8 +699,9 @@ class CalculationCache:
         symbol = cache_key.split(':')[0]
         
         # Remove old dependencies for this cache key
-        for dep_key, cache_keys in self._dependency_graph.items():
-            cache_keys.discard(cache_key)
+        for dep_key in self._reverse_dependencies.pop(cache_key, set()):
+            if dep_key in self._dependency_graph:
+                self._dependency_graph[dep_key].discard(cache_key)
         
         # Add new dependencies
         for dep in dependencies:
@@ -482,8 +711,10 @@ class CalculationCache:
     
     def _remove_entry(self, cache_key: str) -> None:
         """Remove a cache entry and clean up dependencies"""
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        self._discard_from_memory(cache_key)
+        
+        if self._disk_index.pop(cache_key, None) is not None:
+            self._append_index_records([{'op': 'del', 'key': cache_key}])
         
         # Clean up dependency graph
         for dep_key in self._reverse_dependencies.get(cache_key, set()):
@@ -497,64 +728,90 @@ class CalculationCache:
         self._remove_persisted_entry(cache_key)
     
     def _cleanup_memory_if_needed(self) -> None:
-        """Clean up memory cache if size limit exceeded"""
-        total_size = sum(entry.size_bytes for entry in self._cache.values())
+        """
+        Evict entries until memory usage fits the limit.
         
-        if total_size > self.max_memory_bytes:
-            # Remove 20% of entries, prioritizing least recently used and invalid
-            target_removals = int(len(self._cache) * 0.2)
-            
-            # Sort by priority for removal
-            candidates = []
-            for cache_key, entry in self._cache.items():
-                score = 0
-                
-                # Higher score = higher priority for removal
-                if entry.status != CacheEntryStatus.VALID:
-                    score += 1000
-                
-                # Time since last access (hours)
-                hours_since_access = (datetime.now() - entry.last_accessed).total_seconds() / 3600
-                score += hours_since_access
-                
-                # Inverse access frequency
-                score += 100 / max(entry.access_count, 1)
-                
-                candidates.append((cache_key, score))
-            
-            # Sort by score (highest first) and remove top candidates
-            candidates.sort(key=lambda x: x[1], reverse=True)
-            for cache_key, _ in candidates[:target_removals]:
+        Decoded hot-set copies go first, then invalidated entries, then least
+        recently used ones. Entries with a persisted copy only leave the memory
+        tier and reload lazily on access.
+        """
+        evicted = 0
+        while self._cache and self._memory_bytes > self.max_memory_bytes:
+            if self._hot_results:
+                self._drop_hot_result(next(iter(self._hot_results)))
+                continue
+            if self._invalid_keys:
+                cache_key = self._invalid_keys.pop()
                 self._remove_entry(cache_key)
-            
-            logger.info(f"Cleaned up {target_removals} cache entries to free memory")
+            else:
+                cache_key = next(iter(self._cache))
+                if cache_key in self._disk_index:
+                    self._discard_from_memory(cache_key)
+                else:
+                    self._remove_entry(cache_key)
+            evicted += 1
+        
+        if evicted:
+            logger.info(f"Cleaned up {evicted} cache entries to free memory")
     
-    def _compress_result(self, result: Any) -> bytes:
-        """Compress a result using gzip"""
+    def _compress_result(self, result: Any) -> Optional[bytes]:
+        """Compress a result with the configured fast codec"""
         try:
-            pickled = pickle.dumps(result)
-            return gzip.compress(pickled)
+            pickled = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.compression_codec == 'lz4':
+                return lz4.frame.compress(pickled)
+            return zlib.compress(pickled, 1)
         except Exception as e:
             logger.warning(f"Failed to compress result: {e}")
-            return pickle.dumps(result)
+            return None
     
-    def _decompress_result(self, compressed_data: bytes) -> Any:
-        """Decompress a result"""
-        try:
+    def _decompress_result(self, compressed_data: bytes, codec: str = 'zlib') -> Any:
+        """Decompress a result stored with the given codec"""
+        if codec == 'lz4':
+            pickled = lz4.frame.decompress(compressed_data)
+        elif codec == 'gzip':
             pickled = gzip.decompress(compressed_data)
-            return pickle.loads(pickled)
-        except Exception as e:
-            logger.warning(f"Failed to decompress result: {e}")
-            return pickle.loads(compressed_data)
+        else:
+            pickled = zlib.decompress(compressed_data)
+        return pickle.loads(pickled)
     
-    def _persist_entry(self, cache_key: str, entry: CacheEntry) -> None:
-        """Persist cache entry to disk"""
+    def _persist_entry(self, cache_key: str, entry: CacheEntry) -> Optional[Dict[str, Any]]:
+        """Persist cache entry to disk, returning the index log record to append"""
         try:
             cache_file = self.cache_dir / f"{cache_key}.pkl"
             with open(cache_file, 'wb') as f:
                 pickle.dump(entry, f)
         except Exception as e:
             logger.warning(f"Failed to persist cache entry {cache_key}: {e}")
+            return None
+        
+        record = self._make_index_record(cache_key, entry)
+        self._disk_index[cache_key] = record
+        return {'op': 'put', 'key': cache_key, 'meta': record}
+    
+    def _make_index_record(self, cache_key: str, entry: CacheEntry) -> Dict[str, Any]:
+        """Build the lightweight index record describing a persisted entry"""
+        return {
+            'symbol': cache_key.split(':')[0],
+            'dependencies': sorted(entry.dependencies),
+            'size_bytes': entry.size_bytes,
+            'timestamp': entry.timestamp.isoformat(),
+            'ttl_seconds': self.default_ttl_seconds
+        }
+    
+    def _load_persisted_entry(self, cache_key: str) -> Optional[CacheEntry]:
+        """Unpickle a persisted entry, returning None if missing, unreadable or expired"""
+        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load persisted entry {cache_key}: {e}")
+            return None
+        
+        if entry.is_expired(self.default_ttl_seconds):
+            return None
+        return entry
     
     def _remove_persisted_entry(self, cache_key: str) -> None:
         """Remove persisted cache entry from disk"""
@@ -565,30 +822,129 @@ class CalculationCache:
         except Exception as e:
             logger.warning(f"Failed to remove persisted entry {cache_key}: {e}")
     
+    def _is_record_expired(self, record: Dict[str, Any]) -> bool:
+        """Check an index record against its TTL without loading the payload"""
+        try:
+            timestamp = datetime.fromisoformat(record['timestamp'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        ttl_seconds = record.get('ttl_seconds', self.default_ttl_seconds)
+        return (datetime.now() - timestamp).total_seconds() > ttl_seconds
+    
+    def _index_dependencies(self, cache_key: str, dependencies: List[str]) -> None:
+        """Add an entry's dependencies to the dependency graph"""
+        symbol = cache_key.split(':')[0]
+        for dep in dependencies:
+            dep_key = f"{symbol}:{dep}"
+            self._dependency_graph[dep_key].add(cache_key)
+            self._reverse_dependencies[cache_key].add(dep_key)
+    
     def _load_cache_index(self) -> None:
-        """Load cache entries from disk"""
+        """Load the persisted entry index from its snapshot and append log"""
+        index_file = self.cache_dir / self.INDEX_FILE
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    self._disk_index = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load cache index: {e}")
+                self._disk_index = {}
+        
+        log_file = self.cache_dir / self.INDEX_LOG_FILE
+        if log_file.exists():
+            try:
+                with open(log_file, 'r') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn final line from an interrupted write
+                            continue
+                        if record.get('op') == 'put':
+                            self._disk_index[record['key']] = record['meta']
+                        elif record.get('op') == 'del':
+                            self._disk_index.pop(record['key'], None)
+                        self._index_log_records += 1
+            except Exception as e:
+                logger.warning(f"Failed to replay cache index log: {e}")
+        
+        # Expired records stay indexed until the sweep removes them; get_result
+        # rejects them on load in the meantime
+        for cache_key, record in self._disk_index.items():
+            self._index_dependencies(cache_key, record.get('dependencies', []))
+    
+    def _append_index_records(self, records: List[Dict[str, Any]]) -> None:
+        """Append index changes to the log in a single write, compacting when due"""
+        if not records:
+            return
+        
         try:
+            payload = ''.join(json.dumps(record) + '\n' for record in records)
+            with open(self.cache_dir / self.INDEX_LOG_FILE, 'a') as f:
+                f.write(payload)
+            self._index_log_records += len(records)
+        except Exception as e:
+            logger.warning(f"Failed to append to cache index log: {e}")
+            return
+        
+        if self._index_log_records > max(self.INDEX_COMPACTION_MIN_RECORDS, len(self._disk_index)):
+            self._compact_index()
+    
+    def _compact_index(self) -> None:
+        """Write the index snapshot atomically and truncate the log"""
+        index_file = self.cache_dir / self.INDEX_FILE
+        tmp_file = self.cache_dir / f"{self.INDEX_FILE}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(self._disk_index, f)
+            os.replace(tmp_file, index_file)
+            with open(self.cache_dir / self.INDEX_LOG_FILE, 'w'):
+                pass
+            self._index_log_records = 0
+        except Exception as e:
+            logger.warning(f"Failed to compact cache index: {e}")
+    
+    def _sweep_persisted_entries(self) -> None:
+        """
+        Remove expired persisted entries and index payload files the index
+        does not know about (e.g. written before the index existed).
+        """
+        try:
+            with self._lock:
+                expired = [
+                    cache_key for cache_key, record in self._disk_index.items()
+                    if cache_key not in self._cache and self._is_record_expired(record)
+                ]
+                for cache_key in expired:
+                    self._remove_entry(cache_key)
+                known = set(self._disk_index) | set(self._cache)
+            
             for cache_file in self.cache_dir.glob("*.pkl"):
                 cache_key = cache_file.stem
-                with open(cache_file, 'rb') as f:
-                    entry = pickle.load(f)
-                    
-                # Only load if not expired
-                if not entry.is_expired(self.default_ttl_seconds):
-                    self._cache[cache_key] = entry
-                    
-                    # Rebuild dependency graph
-                    symbol = cache_key.split(':')[0]
-                    for dep in entry.dependencies:
-                        dep_key = f"{symbol}:{dep}"
-                        self._dependency_graph[dep_key].add(cache_key)
-                        self._reverse_dependencies[cache_key].add(dep_key)
-                else:
-                    # Remove expired file
-                    cache_file.unlink()
-                        
+                if cache_key in known:
+                    continue
+                try:
+                    with open(cache_file, 'rb') as f:
+                        entry = pickle.load(f)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable cache file {cache_file.name}: {e}")
+                    continue
+                
+                with self._lock:
+                    if cache_key in self._disk_index or cache_key in self._cache:
+                        continue
+                    if entry.is_expired(self.default_ttl_seconds):
+                        self._remove_persisted_entry(cache_key)
+                        continue
+                    record = self._make_index_record(cache_key, entry)
+                    self._disk_index[cache_key] = record
+                    self._append_index_records([{'op': 'put', 'key': cache_key, 'meta': record}])
+                    self._index_dependencies(cache_key, record['dependencies'])
+            
+            if expired:
+                logger.info(f"Swept {len(expired)} expired persisted calculation entries")
         except Exception as e:
-            logger.warning(f"Failed to load cache index: {e}")
+            logger.warning(f"Failed to sweep persisted cache entries: {e}")
 
 
 # Global cache instance
@@ -52,6 +52,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 
+from utils.alias_matcher import AliasMatcher
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -305,6 +307,7 @@ class FinancialVariableRegistry:
         }
         self._alias_index: Dict[str, Dict[str, str]] = {}  # source -> {alias -> standard_name}
         self._tags_index: Dict[str, Set[str]] = {}         # tag -> {variable_names}
+        self._alias_matcher: Optional[AliasMatcher] = None  # compiled lazily, reset on change
         self._access_lock = threading.RLock()
         
         logger.info("FinancialVariableRegistry initialized")
@@ -330,6 +333,7 @@ class FinancialVariableRegistry:
             
             # Store the variable
             self._variables[variable_def.name] = variable_def
+            self._alias_matcher = None
             
             # Update category index
             self._category_index[variable_def.category].add(variable_def.name)
@@ -406,6 +410,21 @@ class FinancialVariableRegistry:
         with self._access_lock:
             return self._alias_index.get(source, {}).get(alias)
     
+    def get_alias_matcher(self) -> AliasMatcher:
+        """
+        Get the compiled label matcher for all registered variables
+        
+        The matcher is built on first use and rebuilt after any registration
+        or clear, so callers should fetch it per batch rather than keep it.
+        
+        Returns:
+            AliasMatcher over variable names, aliases and name tokens
+        """
+        with self._access_lock:
+            if self._alias_matcher is None:
+                self._alias_matcher = AliasMatcher.from_variables(self._variables.values())
+            return self._alias_matcher
+    
     def get_aliases_for_source(self, source: str) -> Dict[str, str]:
         """
         Get all aliases for a specific source
@@ -569,6 +588,7 @@ class FinancialVariableRegistry:
             self._category_index = {category: set() for category in VariableCategory}
             self._alias_index.clear()
             self._tags_index.clear()
+            self._alias_matcher = None
             logger.warning(f"Cleared {count} variables from registry")
 
 
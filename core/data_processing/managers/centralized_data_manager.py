@@ -211,6 +211,9 @@ from utils.yfinance_logger import get_yfinance_logger
 # Import enhanced rate limiter
 from core.data_processing.rate_limiting.enhanced_rate_limiter import get_rate_limiter
 
+# Import read-only streaming statement parser
+from utils.excel_processor import build_typed_dataframe, stream_statement_rows
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -248,6 +251,7 @@ class CentralizedDataManager:
         base_path: str,
         cache_dir: str = "data_cache",
         validation_level: ValidationLevel = ValidationLevel.MODERATE,
+        streaming_excel: bool = False,
     ):
         """
         Initialize the centralized data manager.
@@ -256,8 +260,11 @@ class CentralizedDataManager:
             base_path (str): Base directory path for data files
             cache_dir (str): Directory for caching data
             validation_level (ValidationLevel): Level of input validation strictness
+            streaming_excel (bool): Parse Excel files with the read-only streaming parser,
+                keeping rows from the FY header onward
         """
         self.base_path = Path(base_path)
+        self.streaming_excel = streaming_excel
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
 
@@ -448,6 +455,14 @@ class CentralizedDataManager:
         for category, files in file_categories.items():
             for excel_file in files:
                 key = f"{category}{suffix}"
+                if self.streaming_excel:
+                    try:
+                        excel_data[key] = self._load_excel_file_streaming(excel_file)
+                        logger.debug(f"Stream-loaded {excel_file.name} as {key}")
+                    except Exception as e:
+                        logger.error(f"Error loading {excel_file}: {e}")
+                    continue
+
                 try:
                     # Optimized pandas read with performance settings
                     df = pd.read_excel(
@@ -487,6 +502,22 @@ class CentralizedDataManager:
 
         return excel_data
 
+    def _load_excel_file_streaming(self, excel_file: Path) -> pd.DataFrame:
+        """Read-only streaming load of a statement file, starting at the FY header row"""
+        header, rows = stream_statement_rows(str(excel_file))
+        if header is None:
+            # No FY header: treat the first row as the header like pd.read_excel
+            if not rows:
+                return pd.DataFrame()
+            header, rows = rows[0], rows[1:]
+
+        df = build_typed_dataframe(rows, header)
+        df.columns = [
+            f"Unnamed: {idx}" if label is None else str(label)
+            for idx, label in enumerate(df.columns)
+        ]
+        return df
+
     def _standardize_excel_data(
         self, excel_data: Dict[str, pd.DataFrame]
     ) -> Dict[str, pd.DataFrame]:
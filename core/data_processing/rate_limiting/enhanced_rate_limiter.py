@@ -6,7 +6,7 @@ Comprehensive rate limiting solution for Yahoo Finance and other APIs with:
 - Adaptive rate limiting with dynamic delay adjustment
 - Circuit breaker pattern for API health management
 - Request queuing system to serialize API calls
-- Request spacing with minimum delays
+- Request spacing through the shared token-bucket rate limit service
 - Intelligent fallback source selection
 """
 
@@ -23,6 +23,7 @@ import re
 from contextlib import contextmanager
 
 from config.settings import get_api_config, get_cache_config
+from .rate_limit_service import RateLimitService, get_rate_limit_service
 
 logger = logging.getLogger(__name__)
 
@@ -175,10 +176,13 @@ class RequestQueue:
 class EnhancedRateLimiter:
     """Enhanced rate limiting manager with circuit breaker, queuing, and adaptive delays"""
     
-    def __init__(self):
+    def __init__(self, rate_limit_service: Optional[RateLimitService] = None):
         self.config = get_api_config()
         self.cache_config = get_cache_config()
         
+        # Shared per-provider token buckets
+        self.rate_limit_service = rate_limit_service or get_rate_limit_service()
+        
         # Circuit breakers per API source
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         
@@ -336,6 +340,12 @@ class EnhancedRateLimiter:
         
         return True
     
+    def acquire(self, source: str = 'yahoo_finance', cost: float = 1, timeout: Optional[float] = None) -> bool:
+        """Take request tokens for a source from the shared rate limit service"""
+        if timeout is None:
+            timeout = self.config.queue_timeout
+        return self.rate_limit_service.acquire(source, cost, timeout)
+    
     @contextmanager
     def rate_limited_request(self, source: str, attempt: int = 0):
         """Context manager for making rate-limited requests"""
@@ -348,9 +358,9 @@ class EnhancedRateLimiter:
             if not self.can_make_request(source):
                 raise RuntimeError(f"Request to {source} blocked by rate limiter")
             
-            # Apply minimum request spacing
-            if self.config.min_request_spacing > 0:
-                time.sleep(self.config.min_request_spacing)
+            # Wait for the source's shared token buckets
+            if not self.acquire(source):
+                raise RuntimeError(f"Request to {source} timed out waiting for rate limit tokens")
             
             yield
             
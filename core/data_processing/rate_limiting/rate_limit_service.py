@@ -0,0 +1,532 @@
+"""
+Shared Token-Bucket Rate Limit Service
+======================================
+
+Single rate limiter used by every API path (batch manager, multi-API manager,
+background refresh, adapters and the enhanced rate limiter).
+
+Features:
+- O(1) token buckets per provider, one bucket per limit window
+  (e.g. per second, per minute and per hour)
+- Atomic acquire(provider, cost, timeout): checking and consuming tokens is a
+  single step, so concurrent threads cannot overshoot a quota
+- Optional cross-process coordination through a SQLite database or a locked
+  JSON state file, so several worker processes on one host share a provider's
+  quota
+
+Usage Example:
+>>> from core.data_processing.rate_limiting.rate_limit_service import get_rate_limit_service
+>>> service = get_rate_limit_service()
+>>> if service.acquire("fmp", timeout=30):
+...     response = fetch_from_fmp()
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    One token bucket: ``calls`` per ``period_seconds``.
+
+    The bucket holds up to ``burst`` tokens (default: ``calls``) and refills
+    continuously at ``calls / period_seconds`` tokens per second.
+    """
+    calls: float
+    period_seconds: float
+    burst: Optional[float] = None
+
+    def __post_init__(self):
+        if self.calls <= 0 or self.period_seconds <= 0:
+            raise ValueError("RateLimit calls and period_seconds must be positive")
+
+    @property
+    def capacity(self) -> float:
+        return float(self.burst if self.burst is not None else self.calls)
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added per second"""
+        return self.calls / self.period_seconds
+
+    @classmethod
+    def per_second(cls, calls: float, burst: Optional[float] = None) -> 'RateLimit':
+        return cls(calls, 1.0, burst)
+
+    @classmethod
+    def per_minute(cls, calls: float, burst: Optional[float] = None) -> 'RateLimit':
+        return cls(calls, 60.0, burst)
+
+    @classmethod
+    def per_hour(cls, calls: float, burst: Optional[float] = None) -> 'RateLimit':
+        return cls(calls, 3600.0, burst)
+
+    @classmethod
+    def per_day(cls, calls: float, burst: Optional[float] = None) -> 'RateLimit':
+        return cls(calls, 86400.0, burst)
+
+
+# Bucket state: (tokens, last update timestamp)
+BucketState = Tuple[float, float]
+
+# Published provider quotas; callers with their own configuration override these
+DEFAULT_PROVIDER_LIMITS: Dict[str, Tuple[RateLimit, ...]] = {
+    'yfinance': (RateLimit.per_second(2), RateLimit.per_minute(60), RateLimit.per_hour(1000)),
+    'fmp': (RateLimit.per_second(10), RateLimit.per_minute(300), RateLimit.per_hour(10000)),
+    'alpha_vantage': (RateLimit.per_minute(5), RateLimit.per_hour(500)),
+    'polygon': (RateLimit.per_minute(100), RateLimit.per_hour(5000)),
+    'twelve_data': (RateLimit.per_minute(500), RateLimit.per_hour(10000)),
+}
+
+# Alternative spellings used across the code base for the same quota
+PROVIDER_ALIASES = {
+    'yahoo': 'yfinance',
+    'yahoo_finance': 'yfinance',
+    'financial_modeling_prep': 'fmp',
+    'alphavantage': 'alpha_vantage',
+}
+
+
+def window_limits(
+    per_second: Optional[float] = None,
+    per_minute: Optional[float] = None,
+    per_hour: Optional[float] = None,
+    per_day: Optional[float] = None,
+    burst: float = 0
+) -> Tuple[RateLimit, ...]:
+    """
+    Token buckets for per-window call quotas.
+
+    ``burst`` extra calls are allowed on top of the shortest window's quota.
+    """
+    windows = [(calls, period) for calls, period in
+               ((per_second, 1.0), (per_minute, 60.0), (per_hour, 3600.0), (per_day, 86400.0))
+               if calls]
+    return tuple(
+        RateLimit(calls, period, calls + burst if i == 0 and burst else None)
+        for i, (calls, period) in enumerate(windows)
+    )
+
+
+def normalize_provider(provider: Union[str, Enum]) -> str:
+    """Canonical provider key (accepts DataSourceType members and aliases)"""
+    if isinstance(provider, Enum):
+        provider = provider.value
+    key = str(provider).strip().lower()
+    return PROVIDER_ALIASES.get(key, key)
+
+
+def _refill(limit: RateLimit, state: Optional[BucketState], now: float) -> float:
+    if state is None:
+        return limit.capacity
+    tokens, updated = state
+    return min(limit.capacity, tokens + max(0.0, now - updated) * limit.refill_rate)
+
+
+def _take(
+    limits: Sequence[RateLimit],
+    states: Sequence[Optional[BucketState]],
+    cost: float,
+    now: float,
+    consume: bool = True
+) -> Tuple[List[BucketState], float]:
+    """
+    Refill every bucket and take ``cost`` tokens from all of them, or none.
+
+    Returns:
+        (new bucket states, seconds until the request could be served; 0 if taken)
+    """
+    tokens = [_refill(limit, state, now) for limit, state in zip(limits, states)]
+    wait = max(
+        ((cost - available) / limit.refill_rate for limit, available in zip(limits, tokens)
+         if available < cost),
+        default=0.0
+    )
+    if consume and wait == 0.0:
+        tokens = [available - cost for available in tokens]
+    return [(available, now) for available in tokens], wait
+
+
+class MemoryBucketStore:
+    """Bucket state for a single process"""
+
+    def __init__(self):
+        self._states: Dict[str, List[Optional[BucketState]]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, provider: str, size: int, func: Callable) -> Any:
+        """Apply ``func(states) -> (new_states, result)`` atomically"""
+        with self._lock:
+            states = self._states.get(provider)
+            if states is None or len(states) != size:
+                states = [None] * size
+            self._states[provider], result = func(states)
+            return result
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        with self._lock:
+            if provider is None:
+                self._states.clear()
+            else:
+                self._states.pop(provider, None)
+
+
+class SQLiteBucketStore:
+    """Bucket state shared by all processes using the same database file"""
+
+    def __init__(self, db_path: Union[str, Path], timeout: float = 30.0):
+        self.db_path = str(db_path)
+        self.timeout = timeout
+        self._local = threading.local()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "provider TEXT NOT NULL, bucket INTEGER NOT NULL, "
+                "tokens REAL NOT NULL, updated REAL NOT NULL, "
+                "PRIMARY KEY (provider, bucket))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        # IMMEDIATE takes the write lock up front so read-modify-write is serialized
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def update(self, provider: str, size: int, func: Callable) -> Any:
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT bucket, tokens, updated FROM rate_limit_buckets WHERE provider = ?",
+                (provider,)
+            ).fetchall()
+            states: List[Optional[BucketState]] = [None] * size
+            if len(rows) == size:
+                for bucket, tokens, updated in rows:
+                    states[bucket] = (tokens, updated)
+            new_states, result = func(states)
+            conn.execute("DELETE FROM rate_limit_buckets WHERE provider = ?", (provider,))
+            conn.executemany(
+                "INSERT INTO rate_limit_buckets (provider, bucket, tokens, updated) VALUES (?, ?, ?, ?)",
+                [(provider, bucket, tokens, updated) for bucket, (tokens, updated) in enumerate(new_states)]
+            )
+            return result
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        with self._transaction() as conn:
+            if provider is None:
+                conn.execute("DELETE FROM rate_limit_buckets")
+            else:
+                conn.execute("DELETE FROM rate_limit_buckets WHERE provider = ?", (provider,))
+
+
+class FileLockBucketStore:
+    """Bucket state in a JSON file, serialized across processes by an exclusive file lock"""
+
+    def __init__(self, state_path: Union[str, Path]):
+        self.state_path = Path(state_path)
+        self.lock_path = self.state_path.with_name(self.state_path.name + '.lock')
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock, open(self.lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read(self) -> Dict[str, List[List[float]]]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable rate limit state {self.state_path}: {e}")
+            return {}
+
+    def _write(self, data: Dict[str, List[List[float]]]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.state_path.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def update(self, provider: str, size: int, func: Callable) -> Any:
+        with self._locked():
+            data = self._read()
+            stored = data.get(provider)
+            states: List[Optional[BucketState]] = (
+                [tuple(state) for state in stored] if stored and len(stored) == size else [None] * size
+            )
+            new_states, result = func(states)
+            data[provider] = [list(state) for state in new_states]
+            self._write(data)
+            return result
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        with self._locked():
+            data = {} if provider is None else self._read()
+            data.pop(provider, None)
+            self._write(data)
+
+
+BucketStore = Union[MemoryBucketStore, SQLiteBucketStore, FileLockBucketStore]
+
+
+def create_bucket_store(backend: str = "memory", state_path: Optional[str] = None) -> BucketStore:
+    """
+    Build a bucket store by name.
+
+    Args:
+        backend: "memory" (per process), "sqlite" or "file" (shared by processes)
+        state_path: Database/state file for the shared backends
+    """
+    backend = (backend or "memory").lower()
+    if backend == "memory":
+        return MemoryBucketStore()
+
+    if state_path is None:
+        from config.settings import get_settings
+        state_path = os.path.join(get_settings().data_dir, "rate_limits" + (".db" if backend == "sqlite" else ".json"))
+
+    if backend == "sqlite":
+        return SQLiteBucketStore(state_path)
+    if backend == "file":
+        return FileLockBucketStore(state_path)
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+class RateLimitService:
+    """
+    Token-bucket rate limiting keyed by provider.
+
+    Providers without configured limits are not throttled. Limits live in the
+    process (every process configures the same quotas); bucket state lives in
+    the store, which is what makes a shared backend coordinate processes.
+    """
+
+    def __init__(
+        self,
+        store: Optional[BucketStore] = None,
+        limits: Optional[Dict[str, Iterable[RateLimit]]] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            store: Bucket state backend (default: in-process memory)
+            limits: Per-provider limits (default: DEFAULT_PROVIDER_LIMITS)
+            clock: Wall-clock source; shared backends need a clock common to all processes
+            sleep: Sleep function used while waiting for tokens
+        """
+        self._store = store or MemoryBucketStore()
+        self._clock = clock
+        self._sleep = sleep
+        self._limits: Dict[str, Tuple[RateLimit, ...]] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+        for provider, provider_limits in (DEFAULT_PROVIDER_LIMITS if limits is None else limits).items():
+            self.configure(provider, provider_limits)
+
+    def configure(self, provider: Union[str, Enum], limits: Iterable[RateLimit], override: bool = True) -> None:
+        """
+        Set the limits for a provider.
+
+        Args:
+            provider: Provider name or DataSourceType
+            limits: Token buckets that must all have capacity for a call to proceed
+            override: Replace existing limits (False only fills in unconfigured providers)
+        """
+        key = normalize_provider(provider)
+        limits = tuple(limits)
+        with self._lock:
+            if not override and key in self._limits:
+                return
+            self._limits[key] = limits
+        logger.debug(f"Configured rate limits for {key}: {limits}")
+
+    def get_limits(self, provider: Union[str, Enum]) -> Tuple[RateLimit, ...]:
+        return self._limits.get(normalize_provider(provider), ())
+
+    def _record(self, key: str, name: str, amount: float = 1) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(key, {'acquired': 0, 'denied': 0, 'waits': 0, 'wait_seconds': 0.0})
+            stats[name] += amount
+
+    def try_acquire(self, provider: Union[str, Enum], cost: float = 1) -> Tuple[bool, float]:
+        """
+        Take ``cost`` tokens if they are available right now.
+
+        Returns:
+            (acquired, seconds to wait before retrying when not acquired)
+        """
+        key = normalize_provider(provider)
+        limits = self._limits.get(key)
+        if not limits:
+            return True, 0.0
+        if cost > min(limit.capacity for limit in limits):
+            raise ValueError(f"Cost {cost} exceeds the bucket capacity for {key}")
+
+        now = self._clock()
+        wait = self._store.update(key, len(limits), lambda states: _take(limits, states, cost, now))
+        return wait == 0.0, wait
+
+    def acquire(self, provider: Union[str, Enum], cost: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take ``cost`` tokens, waiting for the buckets to refill if needed.
+
+        Args:
+            provider: Provider name or DataSourceType
+            cost: Tokens the call consumes
+            timeout: Maximum seconds to wait (None waits as long as needed, 0 never waits)
+
+        Returns:
+            True if the tokens were taken, False if they could not be within the timeout
+        """
+        key = normalize_provider(provider)
+        deadline = None if timeout is None else self._clock() + timeout
+        waited = 0.0
+
+        while True:
+            acquired, wait = self.try_acquire(key, cost)
+            if acquired:
+                self._record(key, 'acquired')
+                if waited:
+                    self._record(key, 'waits')
+                    self._record(key, 'wait_seconds', waited)
+                return True
+
+            if deadline is not None and self._clock() + wait > deadline:
+                self._record(key, 'denied')
+                return False
+
+            self._sleep(wait)
+            waited += wait
+
+    def wait_time(self, provider: Union[str, Enum], cost: float = 1) -> float:
+        """Seconds until ``cost`` tokens would be available (does not consume)"""
+        key = normalize_provider(provider)
+        limits = self._limits.get(key)
+        if not limits:
+            return 0.0
+        now = self._clock()
+        return self._store.update(
+            key, len(limits), lambda states: _take(limits, states, cost, now, consume=False)
+        )
+
+    def get_status(self, provider: Union[str, Enum]) -> Dict[str, Any]:
+        """Available tokens per bucket and wait time for one call"""
+        key = normalize_provider(provider)
+        limits = self._limits.get(key, ())
+        now = self._clock()
+
+        def peek(states):
+            # Refilled states are what the next call would see; untouched buckets become full
+            refilled, wait = _take(limits, states, 1, now, consume=False)
+            return refilled, ([available for available, _ in refilled], wait)
+
+        tokens, wait = self._store.update(key, len(limits), peek) if limits else ([], 0.0)
+        with self._lock:
+            stats = dict(self._stats.get(key, {}))
+        return {
+            'provider': key,
+            'buckets': [
+                {'calls': limit.calls, 'period_seconds': limit.period_seconds,
+                 'capacity': limit.capacity, 'available': round(available, 3)}
+                for limit, available in zip(limits, tokens)
+            ],
+            'wait_time_seconds': wait,
+            **stats,
+        }
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {provider: dict(stats) for provider, stats in self._stats.items()}
+
+    def reset(self, provider: Optional[Union[str, Enum]] = None) -> None:
+        """Refill buckets (all providers, or one) and clear statistics"""
+        key = None if provider is None else normalize_provider(provider)
+        self._store.reset(key)
+        with self._lock:
+            if key is None:
+                self._stats.clear()
+            else:
+                self._stats.pop(key, None)
+
+
+# Global rate limit service instance
+_rate_limit_service: Optional[RateLimitService] = None
+_service_lock = threading.Lock()
+
+
+def get_rate_limit_service() -> RateLimitService:
+    """Get the process-wide rate limit service, using the backend from ApiConfig"""
+    global _rate_limit_service
+    if _rate_limit_service is None:
+        with _service_lock:
+            if _rate_limit_service is None:
+                store = None
+                try:
+                    from config.settings import get_api_config
+                    config = get_api_config()
+                    store = create_bucket_store(config.rate_limit_backend, config.rate_limit_state_path)
+                except Exception as e:
+                    logger.warning(f"Falling back to in-process rate limiting: {e}")
+                _rate_limit_service = RateLimitService(store)
+    return _rate_limit_service
+
+
+def reset_rate_limit_service() -> None:
+    """Drop the global service (useful for testing)"""
+    global _rate_limit_service
+    with _service_lock:
+        _rate_limit_service = None
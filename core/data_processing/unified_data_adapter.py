@@ -18,6 +18,7 @@ import os
 import json
 import logging
 import threading
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
@@ -124,7 +125,10 @@ class UnifiedDataAdapter:
         self.configurations: Dict[DataSourceType, DataSourceConfig] = {}
         self.usage_stats: Dict[DataSourceType, UsageStatistics] = {}
         self.cache: Dict[str, CacheEntry] = {}
+        # Guards cache, usage_stats and _in_flight; never held across provider I/O
         self._lock = threading.Lock()
+        # Cache key -> shared future of the fetch currently running for that key
+        self._in_flight: Dict[str, Future] = {}
 
         # Load configuration
         self._load_configuration()
@@ -367,7 +371,10 @@ class UnifiedDataAdapter:
             cache_file = self.base_path / "unified_data_cache.json"
             cache_data = {}
 
-            for key, entry in self.cache.items():
+            with self._lock:
+                entries = list(self.cache.items())
+
+            for key, entry in entries:
                 if not entry.is_expired():
                     cache_data[key] = {
                         'data': entry.data,
@@ -423,7 +430,10 @@ class UnifiedDataAdapter:
             stats_file = self.base_path / "usage_statistics.json"
             stats_data = {}
 
-            for source_type, stats in self.usage_stats.items():
+            with self._lock:
+                usage_stats = list(self.usage_stats.items())
+
+            for source_type, stats in usage_stats:
                 stats_data[source_type.value] = {
                     'total_calls': stats.total_calls,
                     'total_cost': stats.total_cost,
@@ -494,74 +504,115 @@ class UnifiedDataAdapter:
         """
         Fetch financial data using the best available source.
 
+        The adapter lock only guards cache and statistics access; provider calls run
+        without it so different tickers are fetched in parallel. Concurrent requests
+        for the same cache key are coalesced into one in-flight fetch whose response
+        is shared by all waiting callers.
+
         Args:
             request (FinancialDataRequest): Data request parameters
 
         Returns:
             DataSourceResponse: Response with data or error information
         """
+        cache_key = self._generate_cache_key(request)
+
+        # Check cache first (unless force refresh requested)
+        if not request.force_refresh:
+            cached_response = self._get_cached_response(cache_key, request.ticker)
+            if cached_response is not None:
+                return cached_response
+
         with self._lock:
-            # Check cache first (unless force refresh requested)
-            if not request.force_refresh:
-                cache_key = self._generate_cache_key(request)
-                if cache_key in self.cache:
-                    entry = self.cache[cache_key]
-                    if not entry.is_expired():
-                        logger.info(f"Cache hit for {request.ticker}")
-                        response = DataSourceResponse(
-                            success=True,
-                            data=entry.data,
-                            source_type=entry.source_type,
-                            cache_hit=True,
-                        )
-                        response.quality_metrics = DataQualityMetrics()
-                        response.quality_metrics.overall_score = entry.quality_score
-                        return response
+            future = self._in_flight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[cache_key] = future
+
+        if not is_leader:
+            logger.info(f"Joining in-flight fetch for {request.ticker}")
+            return future.result()
 
-            # Try providers in priority order
+        try:
+            # A previous leader may have filled the cache after our first check
+            response = None
+            if not request.force_refresh:
+                response = self._get_cached_response(cache_key, request.ticker)
+            if response is None:
+                response = self._fetch_from_providers(request, cache_key)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(cache_key, None)
+
+    def _get_cached_response(self, cache_key: str, ticker: str) -> Optional[DataSourceResponse]:
+        """Build a response from a non-expired cache entry, if present"""
+        with self._lock:
+            entry = self.cache.get(cache_key)
+            if entry is None or entry.is_expired():
+                return None
+
+        logger.info(f"Cache hit for {ticker}")
+        response = DataSourceResponse(
+            success=True,
+            data=entry.data,
+            source_type=entry.source_type,
+            cache_hit=True,
+        )
+        response.quality_metrics = DataQualityMetrics()
+        response.quality_metrics.overall_score = entry.quality_score
+        return response
+
+    def _fetch_from_providers(
+        self, request: FinancialDataRequest, cache_key: str
+    ) -> DataSourceResponse:
+        """Try providers in priority order without holding the adapter lock"""
+        with self._lock:
             sorted_providers = self._get_sorted_providers()
 
-            for source_type, provider in sorted_providers:
-                try:
-                    logger.info(f"Trying {source_type.value} for {request.ticker}")
+        for source_type, provider in sorted_providers:
+            try:
+                logger.info(f"Trying {source_type.value} for {request.ticker}")
 
-                    response = provider.fetch_data(request)
+                response = provider.fetch_data(request)
 
+                with self._lock:
                     # Update usage statistics
                     if source_type in self.usage_stats:
                         self.usage_stats[source_type].update_stats(response)
 
-                    if response.success:
-                        # Cache successful response
-                        if response.data and response.quality_metrics:
-                            config = self.configurations.get(source_type)
-                            cache_key = self._generate_cache_key(request)
-
-                            entry = CacheEntry(
-                                data=response.data,
-                                timestamp=datetime.now(),
-                                source_type=source_type,
-                                quality_score=response.quality_metrics.overall_score,
-                                ttl_hours=config.cache_ttl_hours if config else 24,
-                            )
-
-                            self.cache[cache_key] = entry
-
-                        logger.info(f"Successfully fetched data from {source_type.value}")
-                        return response
-                    else:
-                        logger.warning(f"{source_type.value} failed: {response.error_message}")
-                        continue
+                    # Cache successful response
+                    if response.success and response.data and response.quality_metrics:
+                        config = self.configurations.get(source_type)
+                        self.cache[cache_key] = CacheEntry(
+                            data=response.data,
+                            timestamp=datetime.now(),
+                            source_type=source_type,
+                            quality_score=response.quality_metrics.overall_score,
+                            ttl_hours=config.cache_ttl_hours if config else 24,
+                        )
 
-                except Exception as e:
-                    logger.error(f"Error with {source_type.value}: {e}")
+                if response.success:
+                    logger.info(f"Successfully fetched data from {source_type.value}")
+                    return response
+                else:
+                    logger.warning(f"{source_type.value} failed: {response.error_message}")
                     continue
 
-            # All providers failed
-            logger.error(f"All data sources failed for {request.ticker}")
-            return DataSourceResponse(
-                success=False, error_message="All configured data sources failed"
-            )
+            except Exception as e:
+                logger.error(f"Error with {source_type.value}: {e}")
+                continue
+
+        # All providers failed
+        logger.error(f"All data sources failed for {request.ticker}")
+        return DataSourceResponse(
+            success=False, error_message="All configured data sources failed"
+        )
 
     def get_usage_report(self) -> Dict[str, Any]:
         """Get comprehensive usage report"""
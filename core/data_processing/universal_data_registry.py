@@ -26,11 +26,12 @@ import hashlib
 import logging
 import threading
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Type
+from typing import Any, Dict, List, Optional, Tuple, Union, Type
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 import pickle
+import sys
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -92,8 +93,57 @@ class DataResponse:
     validation_errors: List[str] = field(default_factory=list)
     performance_metrics: Dict[str, float] = field(default_factory=dict)
 
+def _estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate the deep memory footprint of a cached object in bytes.
+
+    DataFrames and Series report ``memory_usage(deep=True)``, numpy arrays their
+    buffer size; containers and dataclass-like objects are walked recursively.
+    Shared objects are counted once.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    memory_usage = getattr(obj, 'memory_usage', None)
+    if callable(memory_usage) and hasattr(obj, 'index'):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except Exception:
+            pass
+
+    nbytes = getattr(obj, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        size += sum(_estimate_size(k, _seen) + _estimate_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, _seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += _estimate_size(vars(obj), _seen)
+    return size
+
 class DataCache:
-    """Multi-layer caching system with memory and disk storage"""
+    """Multi-layer caching system with memory and disk storage
+
+    The metadata index is persisted incrementally: puts and removals append one
+    JSON record per line to ``cache_index.log``, and the log is compacted into the
+    ``cache_index.json`` snapshot once it outgrows the live index.
+    """
+
+    INDEX_FILE = "cache_index.json"
+    INDEX_LOG_FILE = "cache_index.log"
+    # Minimum number of log records before the log is folded into the snapshot
+    INDEX_COMPACTION_MIN_RECORDS = 1000
+    # Upper bound on memory tier entries regardless of their size
+    MAX_MEMORY_ENTRIES = 1000
     
     def __init__(self, cache_dir: str = "./data_cache", memory_limit_mb: int = 256):
         self.cache_dir = Path(cache_dir)
@@ -105,19 +155,28 @@ class DataCache:
         self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
         self.cache_metadata: Dict[str, Dict] = {}
         
-        # Access tracking for intelligent eviction
+        # Size accounting for the memory tier, computed once per insert
+        self._memory_sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._eviction_count = 0
+        self._evicted_bytes = 0
+        
+        # Access tracking
         self.access_counts: Dict[str, int] = {}
         self.last_access: Dict[str, datetime] = {}
         
         # Thread lock for cache operations
         self._lock = threading.RLock()
         
+        # Number of records appended to the index log since the last compaction
+        self._index_log_records = 0
+        
         # Load cache index
         self._load_cache_index()
         
     def _load_cache_index(self):
-        """Load cache metadata index from disk"""
-        index_file = self.cache_dir / "cache_index.json"
+        """Load cache metadata snapshot from disk and replay the index log"""
+        index_file = self.cache_dir / self.INDEX_FILE
         if index_file.exists():
             try:
                 with open(index_file, 'r') as f:
@@ -125,13 +184,70 @@ class DataCache:
             except Exception as e:
                 logger.warning(f"Failed to load cache index: {e}")
                 self.cache_metadata = {}
+        
+        log_file = self.cache_dir / self.INDEX_LOG_FILE
+        if not log_file.exists():
+            return
+        
+        try:
+            with open(log_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final line from an interrupted write
+                        logger.warning("Skipping malformed cache index log record")
+                        continue
+                    self._apply_index_record(record)
+                    self._index_log_records += 1
+        except Exception as e:
+            logger.warning(f"Failed to replay cache index log: {e}")
+        
+        if self._index_log_records > self._compaction_threshold():
+            self._save_cache_index()
+    
+    def _apply_index_record(self, record: Dict[str, Any]):
+        """Apply a single index log record to the in-memory metadata"""
+        if record.get('op') == 'put':
+            self.cache_metadata[record['key']] = record['meta']
+        elif record.get('op') == 'del':
+            self.cache_metadata.pop(record['key'], None)
+    
+    def _compaction_threshold(self) -> int:
+        """Log size at which compaction pays for itself"""
+        return max(self.INDEX_COMPACTION_MIN_RECORDS, len(self.cache_metadata))
+    
+    def _append_index_records(self, records: List[Dict[str, Any]]):
+        """Append index changes to the log in a single write, compacting when due"""
+        if not records:
+            return
+        
+        log_file = self.cache_dir / self.INDEX_LOG_FILE
+        try:
+            payload = ''.join(json.dumps(record, default=str) + '\n' for record in records)
+            with open(log_file, 'a') as f:
+                f.write(payload)
+            self._index_log_records += len(records)
+        except Exception as e:
+            logger.error(f"Failed to append to cache index log: {e}")
+            return
+        
+        if self._index_log_records > self._compaction_threshold():
+            self._save_cache_index()
     
     def _save_cache_index(self):
-        """Save cache metadata index to disk"""
-        index_file = self.cache_dir / "cache_index.json"
+        """Compact the cache metadata index into a snapshot and truncate the log"""
+        index_file = self.cache_dir / self.INDEX_FILE
+        tmp_file = self.cache_dir / f"{self.INDEX_FILE}.tmp"
         try:
-            with open(index_file, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump(self.cache_metadata, f, indent=2, default=str)
+            os.replace(tmp_file, index_file)
+            
+            # Snapshot now covers everything in the log
+            with open(self.cache_dir / self.INDEX_LOG_FILE, 'w'):
+                pass
+            self._index_log_records = 0
         except Exception as e:
             logger.error(f"Failed to save cache index: {e}")
     
@@ -169,9 +285,7 @@ class DataCache:
                     return self.memory_cache[cache_key]
                 else:
                     # Remove expired memory cache entry
-                    del self.memory_cache[cache_key]
-                    self.access_counts.pop(cache_key, None)
-                    self.last_access.pop(cache_key, None)
+                    self._discard_from_memory(cache_key)
             
             # Check disk cache
             return self._get_from_disk(cache_key)
@@ -190,7 +304,7 @@ class DataCache:
                 cache_file.unlink()
                 if cache_key in self.cache_metadata:
                     del self.cache_metadata[cache_key]
-                    self._save_cache_index()
+                    self._append_index_records([{'op': 'del', 'key': cache_key}])
             except Exception as e:
                 logger.warning(f"Failed to remove expired cache: {e}")
             return None
@@ -199,7 +313,7 @@ class DataCache:
             with open(cache_file, 'rb') as f:
                 response = pickle.load(f)
                 # Load into memory cache for faster future access
-                self.memory_cache[cache_key] = response
+                self._store_in_memory(cache_key, response)
                 
                 # Update access tracking
                 self.access_counts[cache_key] = self.access_counts.get(cache_key, 0) + 1
@@ -233,33 +347,60 @@ class DataCache:
         """Store data in cache"""
         if request.cache_policy == CachePolicy.NO_CACHE:
             return
-            
-        cache_key = self._generate_cache_key(request)
         
         with self._lock:
-            # Update response to indicate cache storage
-            response.cache_hit = False  # This is a fresh response being cached
-            
-            # Store in memory cache
-            self.memory_cache[cache_key] = response
-            
-            # Store metadata
-            expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-            self.cache_metadata[cache_key] = {
-                'timestamp': datetime.now().isoformat(),
-                'expiry': expiry.isoformat(),
-                'data_type': request.data_type,
-                'symbol': request.symbol,
-                'ttl': ttl_seconds
-            }
-            
-            # Store on disk
-            self._put_to_disk(cache_key, response)
-            self._save_cache_index()
+            record = self._store_entry(request, response, ttl_seconds)
+            self._append_index_records([record])
             
             # Cleanup memory if needed
             self._cleanup_memory_cache()
     
+    def put_many(self, items: List[Tuple[DataRequest, DataResponse]], ttl_seconds: int = 3600) -> int:
+        """
+        Store many responses with a single index log write.
+        
+        Args:
+            items: (request, response) pairs to cache
+            ttl_seconds: Time to live applied to every entry
+            
+        Returns:
+            int: Number of entries stored (NO_CACHE requests are skipped)
+        """
+        with self._lock:
+            records = [
+                self._store_entry(request, response, ttl_seconds)
+                for request, response in items
+                if request.cache_policy != CachePolicy.NO_CACHE
+            ]
+            self._append_index_records(records)
+            self._cleanup_memory_cache()
+            return len(records)
+    
+    def _store_entry(self, request: DataRequest, response: DataResponse, ttl_seconds: int) -> Dict[str, Any]:
+        """Store a response in memory and on disk, returning its index log record"""
+        cache_key = self._generate_cache_key(request)
+        
+        # Update response to indicate cache storage
+        response.cache_hit = False  # This is a fresh response being cached
+        
+        # Store in memory cache
+        self._store_in_memory(cache_key, response)
+        
+        # Store metadata
+        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
+        metadata = {
+            'timestamp': datetime.now().isoformat(),
+            'expiry': expiry.isoformat(),
+            'data_type': request.data_type,
+            'symbol': request.symbol,
+            'ttl': ttl_seconds
+        }
+        self.cache_metadata[cache_key] = metadata
+        
+        # Store on disk
+        self._put_to_disk(cache_key, response)
+        return {'op': 'put', 'key': cache_key, 'meta': metadata}
+    
     def _put_to_disk(self, cache_key: str, response: DataResponse):
         """Store data to disk cache"""
         cache_file = self.cache_dir / f"{cache_key}.pkl"
@@ -269,43 +410,51 @@ class DataCache:
         except Exception as e:
             logger.error(f"Failed to save to disk cache: {e}")
     
+    def _store_in_memory(self, cache_key: str, response: DataResponse):
+        """Insert or replace a memory tier entry, recording its size once"""
+        self._discard_from_memory(cache_key)
+        size = _estimate_size(response)
+        self.memory_cache[cache_key] = response
+        self._memory_sizes[cache_key] = size
+        self._memory_bytes += size
+    
+    def _discard_from_memory(self, cache_key: str) -> int:
+        """Remove a memory tier entry and return the bytes it accounted for"""
+        if cache_key not in self.memory_cache:
+            return 0
+        del self.memory_cache[cache_key]
+        size = self._memory_sizes.pop(cache_key, 0)
+        self._memory_bytes -= size
+        self.access_counts.pop(cache_key, None)
+        self.last_access.pop(cache_key, None)
+        return size
+    
     def _cleanup_memory_cache(self):
-        """Remove old entries if memory limit exceeded using intelligent eviction"""
-        # Check memory usage
-        import sys
-        current_size = sum(sys.getsizeof(item) for item in self.memory_cache.values())
-        
-        if current_size > self.memory_limit_bytes or len(self.memory_cache) > 1000:
-            # Remove 25% of entries to create buffer
-            target_count = int(len(self.memory_cache) * 0.75)
-            items_to_remove = len(self.memory_cache) - target_count
-            
-            if items_to_remove > 0:
-                # Combine LRU and LFU strategies
-                # Get candidates by access frequency and recency
-                candidates = []
-                current_time = datetime.now()
-                
-                for key in self.memory_cache:
-                    access_count = self.access_counts.get(key, 0)
-                    last_used = self.last_access.get(key, current_time)
-                    time_since_access = (current_time - last_used).total_seconds()
-                    
-                    # Lower score = higher priority for eviction
-                    # Weight: 60% time since access, 40% inverse frequency
-                    score = (time_since_access * 0.6) + ((1 / max(access_count, 1)) * 1000 * 0.4)
-                    candidates.append((key, score))
-                
-                # Sort by score (highest score = first to evict)
-                candidates.sort(key=lambda x: x[1], reverse=True)
-                
-                # Remove candidates
-                for key, _ in candidates[:items_to_remove]:
-                    del self.memory_cache[key]
-                    self.access_counts.pop(key, None)
-                    self.last_access.pop(key, None)
-                
-                logger.debug(f"Evicted {items_to_remove} cache entries to free memory")
+        """Evict least recently used entries until the memory tier fits its budget"""
+        evicted = 0
+        while self.memory_cache and (
+            self._memory_bytes > self.memory_limit_bytes
+            or len(self.memory_cache) > self.MAX_MEMORY_ENTRIES
+        ):
+            # OrderedDict front is the least recently used entry
+            cache_key = next(iter(self.memory_cache))
+            self._evicted_bytes += self._discard_from_memory(cache_key)
+            evicted += 1
+        
+        if evicted:
+            self._eviction_count += evicted
+            logger.debug(f"Evicted {evicted} cache entries to free memory")
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Memory tier size and eviction statistics"""
+        with self._lock:
+            return {
+                'memory_entries': len(self.memory_cache),
+                'memory_bytes': self._memory_bytes,
+                'memory_limit_bytes': self.memory_limit_bytes,
+                'evictions': self._eviction_count,
+                'evicted_bytes': self._evicted_bytes,
+            }
     
     def invalidate(self, pattern: str = None):
         """Invalidate cache entries matching pattern"""
@@ -313,6 +462,10 @@ class DataCache:
             if pattern is None:
                 # Clear all cache
                 self.memory_cache.clear()
+                self._memory_sizes.clear()
+                self._memory_bytes = 0
+                self.access_counts.clear()
+                self.last_access.clear()
                 self.cache_metadata.clear()
                 # Remove all cache files
                 for cache_file in self.cache_dir.glob("*.pkl"):
@@ -320,6 +473,7 @@ class DataCache:
                         cache_file.unlink()
                     except Exception as e:
                         logger.warning(f"Failed to remove cache file {cache_file}: {e}")
+                self._save_cache_index()
             else:
                 # Pattern-based invalidation (simple implementation)
                 keys_to_remove = [
@@ -327,8 +481,7 @@ class DataCache:
                     if pattern in str(self.cache_metadata[key])
                 ]
                 for key in keys_to_remove:
-                    if key in self.memory_cache:
-                        del self.memory_cache[key]
+                    self._discard_from_memory(key)
                     if key in self.cache_metadata:
                         del self.cache_metadata[key]
                     cache_file = self.cache_dir / f"{key}.pkl"
@@ -337,8 +490,7 @@ class DataCache:
                             cache_file.unlink()
                         except Exception as e:
                             logger.warning(f"Failed to remove cache file: {e}")
-            
-            self._save_cache_index()
+                self._append_index_records([{'op': 'del', 'key': key} for key in keys_to_remove])
 
 class UniversalDataRegistry:
     """
@@ -630,7 +782,8 @@ class UniversalDataRegistry:
         
         return {
             **self.metrics,
-            'cache_hit_rate': cache_hit_rate
+            'cache_hit_rate': cache_hit_rate,
+            'memory_cache': self.cache.get_metrics()
         }
     
     def invalidate_cache(self, pattern: str = None):
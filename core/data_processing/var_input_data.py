@@ -45,6 +45,7 @@ Usage Example:
 
 import json
 import logging
+import re
 import threading
 import time
 import weakref
@@ -53,9 +54,12 @@ from collections import defaultdict, deque, OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Callable, Set, Tuple
 from weakref import WeakSet
+import numpy as np
+import pandas as pd
 import psutil
 import gc
 
@@ -281,6 +285,575 @@ class LazyLoadManager:
         return stats
 
 
+# Maximum historical points kept per (symbol, variable) series
+MAX_HISTORY_POINTS = 50
+
+# Storage backends selectable through VarInputData(storage_backend=...)
+STORAGE_BACKENDS = ("object", "columnar")
+
+
+@lru_cache(maxsize=4096)
+def _period_sort_key(period: str) -> int:
+    """Parse period string into integer for sorting (most recent first)"""
+    try:
+        # Handle different period formats
+        if period == "latest":
+            return 999999  # Latest should sort first
+        elif period.isdigit() and len(period) == 4:  # Year format like "2023"
+            return int(period)
+        elif "Q" in period:  # Quarter format like "Q1-2023"
+            parts = period.split("-")
+            if len(parts) == 2:
+                quarter_part = parts[0].replace("Q", "")
+                year_part = parts[1]
+                return int(year_part) * 10 + int(quarter_part)
+        else:
+            # Try to extract year from other formats
+            year_match = re.search(r'20\d{2}', period)
+            if year_match:
+                return int(year_match.group())
+    except (ValueError, IndexError):
+        pass
+
+    # Default to 0 for unparseable periods
+    return 0
+
+
+class ObjectSeriesStore:
+    """
+    Default VarInputData storage backend.
+
+    Keeps {symbol: {variable_name: {period: VariableValue}}} plus a parallel
+    list of HistoricalDataPoint objects per series.
+    """
+
+    def __init__(self):
+        # Structure: {symbol: {variable_name: {period: VariableValue}}}
+        self._data: Dict[str, Dict[str, Dict[str, VariableValue]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+        # Structure: {symbol: {variable_name: [HistoricalDataPoint]}}
+        self._historical_data: Dict[str, Dict[str, List[HistoricalDataPoint]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+
+    def put(
+        self, symbol: str, variable_name: str, period: str, value: Any, metadata: VariableMetadata
+    ) -> None:
+        self._data[symbol][variable_name][period] = VariableValue(value=value, metadata=metadata)
+        self._add_to_historical_data(symbol, variable_name, period, value, metadata)
+
+    def get(self, symbol: str, variable_name: str, period: str) -> Optional[VariableValue]:
+        if symbol not in self._data or variable_name not in self._data[symbol]:
+            return None
+        periods = self._data[symbol][variable_name]
+        if period == "latest" and periods:
+            # Most recent period; among equal sort keys the last stored wins,
+            # matching ColumnarSeriesStore
+            period = max(reversed(list(periods)), key=_period_sort_key)
+        return periods.get(period)
+
+    def value(self, symbol: str, variable_name: str, period: str) -> Any:
+        var_value = self.get(symbol, variable_name, period)
+        return var_value.value if var_value is not None else None
+
+    def has(self, symbol: str, variable_name: str, period: str) -> bool:
+        if period == "latest":
+            return symbol in self._data and len(self._data[symbol].get(variable_name, {})) > 0
+        return self.has_period(symbol, variable_name, period)
+
+    def has_period(self, symbol: str, variable_name: str, period: str) -> bool:
+        """Exact period match, treating "latest" as a literal period key"""
+        return (
+            symbol in self._data and
+            variable_name in self._data[symbol] and
+            period in self._data[symbol][variable_name]
+        )
+
+    def history(
+        self, symbol: str, variable_name: str, limit: int
+    ) -> List[Tuple[str, Any, VariableMetadata]]:
+        if symbol not in self._historical_data or variable_name not in self._historical_data[symbol]:
+            return []
+        # Sort by period (most recent first)
+        sorted_points = sorted(
+            self._historical_data[symbol][variable_name],
+            key=lambda x: _period_sort_key(x.period),
+            reverse=True
+        )
+        if limit > 0:
+            sorted_points = sorted_points[:limit]
+        return [(point.period, point.value, point.metadata) for point in sorted_points]
+
+    def periods(self, symbol: str, variable_name: str) -> List[str]:
+        if symbol in self._data and variable_name in self._data[symbol]:
+            return sorted(
+                reversed(list(self._data[symbol][variable_name])), key=_period_sort_key, reverse=True
+            )
+        return []
+
+    def series_arrays(
+        self, symbol: str, variable_name: str
+    ) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """Periods, sort keys and values of a series, oldest first"""
+        stored = self._data.get(symbol, {}).get(variable_name)
+        if not stored:
+            return None
+        periods = sorted(stored, key=_period_sort_key)
+        keys = np.fromiter((_period_sort_key(period) for period in periods), dtype=np.int64, count=len(periods))
+        values = np.fromiter((stored[period].value for period in periods), dtype=object, count=len(periods))
+        return periods, keys, values
+
+    def symbols(self) -> List[str]:
+        return list(self._data.keys())
+
+    def variables(self, symbol: str) -> List[str]:
+        return list(self._data[symbol].keys()) if symbol in self._data else []
+
+    def items(self, symbol: str):
+        """Yield (variable_name, period, VariableValue) for a symbol"""
+        for variable_name, periods in self._data.get(symbol, {}).items():
+            for period, var_value in periods.items():
+                yield variable_name, period, var_value
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'symbols': len(self._data),
+            'variables': sum(len(variables) for variables in self._data.values()),
+            'data_points': sum(
+                len(periods)
+                for symbol_vars in self._data.values()
+                for periods in symbol_vars.values()
+            ),
+            'historical_points': sum(
+                len(data_points)
+                for symbol_data in self._historical_data.values()
+                for data_points in symbol_data.values()
+            ),
+        }
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._historical_data.clear()
+
+    def remove_symbol(self, symbol: str) -> int:
+        """Remove a symbol, returning how many variables it held"""
+        if symbol not in self._data:
+            return 0
+        removed = len(self._data[symbol])
+        del self._data[symbol]
+        self._historical_data.pop(symbol, None)
+        return removed
+
+    def remove_variable(self, symbol: str, variable_name: str) -> bool:
+        if symbol not in self._data or variable_name not in self._data[symbol]:
+            return False
+        del self._data[symbol][variable_name]
+        if symbol in self._historical_data:
+            self._historical_data[symbol].pop(variable_name, None)
+        return True
+
+    def remove_periods(self, symbol: str, variable_name: str, periods: List[str]) -> int:
+        if symbol not in self._data or variable_name not in self._data[symbol]:
+            return 0
+        stored = self._data[symbol][variable_name]
+        removed = 0
+        for period in periods:
+            if period in stored:
+                del stored[period]
+                removed += 1
+        return removed
+
+    def update_metadata(
+        self, symbol: str, variable_name: str, period: str, metadata_updates: Dict[str, Any]
+    ) -> bool:
+        if not self.has_period(symbol, variable_name, period):
+            return False
+        metadata = self._data[symbol][variable_name][period].metadata
+        for name, value in metadata_updates.items():
+            if hasattr(metadata, name):
+                setattr(metadata, name, value)
+        metadata.timestamp = datetime.now()
+        return True
+
+    def _add_to_historical_data(
+        self,
+        symbol: str,
+        variable_name: str,
+        period: str,
+        value: Any,
+        metadata: VariableMetadata
+    ) -> None:
+        """Add a data point to historical storage"""
+        data_point = HistoricalDataPoint(
+            symbol=symbol,
+            variable_name=variable_name,
+            period=period,
+            value=value,
+            metadata=metadata
+        )
+
+        # Check if this data point already exists
+        existing_points = self._historical_data[symbol][variable_name]
+        for i, existing_point in enumerate(existing_points):
+            if existing_point.period == period:
+                # Update existing point
+                existing_points[i] = data_point
+                return
+
+        # Add new point
+        existing_points.append(data_point)
+
+        # Keep historical data sorted and limited
+        if len(existing_points) > MAX_HISTORY_POINTS:
+            # Sort by period and keep most recent
+            sorted_points = sorted(
+                existing_points,
+                key=lambda x: _period_sort_key(x.period),
+                reverse=True
+            )
+            self._historical_data[symbol][variable_name] = sorted_points[:MAX_HISTORY_POINTS]
+
+
+# Per-point metadata columns; sources are interned into a store-wide table
+_METADATA_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('quality_score', 'f8'),
+    ('validation_passed', '?'),
+    ('source_id', 'i4'),
+])
+
+
+def _is_numeric_value(value: Any) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def _select_periods(
+    series_periods: List[str],
+    keys: np.ndarray,
+    values: np.ndarray,
+    periods: np.ndarray,
+    period_keys: np.ndarray,
+    latest: np.ndarray
+) -> np.ndarray:
+    """
+    Numeric values of a sorted series at the requested periods (NaN if absent).
+
+    Periods are located by binary search on their sort keys; only a requested
+    period that shares its key with another stored period (e.g. "FY" and
+    "LTM") falls back to a scan of the equal-key run.
+    """
+    if values.dtype == object:
+        values = np.array([value if _is_numeric_value(value) else np.nan for value in values], dtype=np.float64)
+
+    positions = np.searchsorted(keys, period_keys, side='right') - 1
+    positions[latest] = len(keys) - 1
+    candidates = np.maximum(positions, 0)
+    found = (positions >= 0) & ((keys[candidates] == period_keys) | latest)
+
+    names = np.asarray(series_periods, dtype=object)[candidates]
+    for k in np.flatnonzero(found & ~latest & (names != periods)):
+        index = candidates[k]
+        while index >= 0 and keys[index] == period_keys[k] and series_periods[index] != periods[k]:
+            index -= 1
+        if index >= 0 and keys[index] == period_keys[k]:
+            candidates[k] = index
+        else:
+            found[k] = False
+
+    result = np.full(len(periods), np.nan)
+    result[found] = values[candidates[found]]
+    return result
+
+
+def _array_insert(array: np.ndarray, position: int, item: Any) -> np.ndarray:
+    """Insert one element, storing containers as single object elements"""
+    result = np.empty(len(array) + 1, dtype=array.dtype)
+    result[:position] = array[:position]
+    result[position + 1:] = array[position:]
+    result[position] = item
+    return result
+
+
+class _ColumnarSeries:
+    """One (symbol, variable) series held as arrays sorted oldest to newest"""
+
+    __slots__ = ('keys', 'periods', 'values', 'metadata')
+
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.int64)
+        self.periods: List[str] = []
+        self.values = np.empty(0, dtype=np.float64)
+        self.metadata = np.empty(0, dtype=_METADATA_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def find(self, period: str) -> int:
+        """Binary search for a period, returning its index or -1"""
+        key = _period_sort_key(period)
+        lo = int(np.searchsorted(self.keys, key, side='left'))
+        hi = int(np.searchsorted(self.keys, key, side='right'))
+        for index in range(lo, hi):
+            if self.periods[index] == period:
+                return index
+        return -1
+
+    def value_at(self, index: int) -> Any:
+        value = self.values[index]
+        return value.item() if self.values.dtype != object else value
+
+    def delete(self, indices: List[int]) -> None:
+        self.keys = np.delete(self.keys, indices)
+        self.values = np.delete(self.values, indices)
+        self.metadata = np.delete(self.metadata, indices)
+        for index in sorted(indices, reverse=True):
+            del self.periods[index]
+
+
+class ColumnarSeriesStore:
+    """
+    Compact VarInputData storage backend.
+
+    Each (symbol, variable) series is stored as sorted period keys, a value
+    array (float64 while every value is numeric, object otherwise) and a
+    structured metadata array. Sources are interned in a side table, and the
+    rarely used calculation_method/dependencies/lineage_id fields are kept in a
+    sparse side table. Period lookup is a binary search, "latest" is the last
+    element, and history reads are array slices.
+
+    VariableMetadata objects are rebuilt on read, so changes must go through
+    update_metadata rather than by mutating a returned object.
+    """
+
+    def __init__(self, max_points_per_series: int = MAX_HISTORY_POINTS):
+        self.max_points_per_series = max_points_per_series
+        self._series: Dict[str, Dict[str, _ColumnarSeries]] = {}
+        self._sources: List[str] = []
+        self._source_ids: Dict[str, int] = {}
+        # {(symbol, variable_name, period): (calculation_method, dependencies, lineage_id)}
+        self._metadata_extras: Dict[Tuple[str, str, str], Tuple[str, List[str], str]] = {}
+
+    def _get_series(self, symbol: str, variable_name: str) -> Optional[_ColumnarSeries]:
+        return self._series.get(symbol, {}).get(variable_name)
+
+    def _encode_metadata(self, metadata: VariableMetadata) -> Tuple:
+        source_id = self._source_ids.get(metadata.source)
+        if source_id is None:
+            source_id = len(self._sources)
+            self._sources.append(metadata.source)
+            self._source_ids[metadata.source] = source_id
+        timestamp = metadata.timestamp or datetime.now()
+        return (
+            timestamp.timestamp(),
+            metadata.quality_score,
+            metadata.validation_passed,
+            source_id,
+        )
+
+    def _decode_metadata(self, symbol: str, variable_name: str, period: str, row) -> VariableMetadata:
+        calculation_method, dependencies, lineage_id = self._metadata_extras.get(
+            (symbol, variable_name, period), ('', [], '')
+        )
+        return VariableMetadata(
+            source=self._sources[row['source_id']],
+            timestamp=datetime.fromtimestamp(row['timestamp']),
+            quality_score=float(row['quality_score']),
+            validation_passed=bool(row['validation_passed']),
+            calculation_method=calculation_method,
+            dependencies=list(dependencies),
+            lineage_id=lineage_id,
+            period=period
+        )
+
+    def _set_metadata_extras(self, symbol: str, variable_name: str, period: str,
+                             metadata: VariableMetadata) -> None:
+        key = (symbol, variable_name, period)
+        if metadata.calculation_method or metadata.dependencies or metadata.lineage_id:
+            self._metadata_extras[key] = (
+                metadata.calculation_method, list(metadata.dependencies), metadata.lineage_id
+            )
+        else:
+            self._metadata_extras.pop(key, None)
+
+    def _drop_metadata_extras(self, symbol: str, variable_name: str, periods) -> None:
+        if self._metadata_extras:
+            for period in periods:
+                self._metadata_extras.pop((symbol, variable_name, period), None)
+
+    def put(
+        self, symbol: str, variable_name: str, period: str, value: Any, metadata: VariableMetadata
+    ) -> None:
+        series = self._series.setdefault(symbol, {}).get(variable_name)
+        if series is None:
+            series = self._series[symbol][variable_name] = _ColumnarSeries()
+
+        if series.values.dtype != object and not _is_numeric_value(value):
+            series.values = series.values.astype(object)
+        row = self._encode_metadata(metadata)
+
+        index = series.find(period)
+        if index >= 0:
+            series.values[index] = value
+            series.metadata[index] = row
+        else:
+            key = _period_sort_key(period)
+            position = int(np.searchsorted(series.keys, key, side='right'))
+            series.keys = _array_insert(series.keys, position, key)
+            series.values = _array_insert(series.values, position, value)
+            series.metadata = _array_insert(series.metadata, position, row)
+            series.periods.insert(position, period)
+
+        self._set_metadata_extras(symbol, variable_name, period, metadata)
+
+        # Keep the most recent points
+        excess = len(series) - self.max_points_per_series
+        if excess > 0:
+            self._drop_metadata_extras(symbol, variable_name, series.periods[:excess])
+            series.delete(list(range(excess)))
+
+    def get(self, symbol: str, variable_name: str, period: str) -> Optional[VariableValue]:
+        series = self._get_series(symbol, variable_name)
+        if series is None or len(series) == 0:
+            return None
+        index = len(series) - 1 if period == "latest" else series.find(period)
+        if index < 0:
+            return None
+        resolved_period = series.periods[index]
+        return VariableValue(
+            value=series.value_at(index),
+            metadata=self._decode_metadata(
+                symbol, variable_name, resolved_period, series.metadata[index]
+            )
+        )
+
+    def value(self, symbol: str, variable_name: str, period: str) -> Any:
+        """Value only, without rebuilding metadata"""
+        series = self._get_series(symbol, variable_name)
+        if series is None or len(series) == 0:
+            return None
+        index = len(series) - 1 if period == "latest" else series.find(period)
+        return series.value_at(index) if index >= 0 else None
+
+    def has(self, symbol: str, variable_name: str, period: str) -> bool:
+        series = self._get_series(symbol, variable_name)
+        if series is None:
+            return False
+        if period == "latest":
+            return len(series) > 0
+        return series.find(period) >= 0
+
+    def has_period(self, symbol: str, variable_name: str, period: str) -> bool:
+        """Exact period match, treating "latest" as a literal period key"""
+        series = self._get_series(symbol, variable_name)
+        return series is not None and series.find(period) >= 0
+
+    def history_arrays(
+        self, symbol: str, variable_name: str, limit: int
+    ) -> Tuple[List[str], np.ndarray]:
+        """Periods and values for the most recent points, newest first"""
+        series = self._get_series(symbol, variable_name)
+        if series is None:
+            return [], np.empty(0, dtype=np.float64)
+        start = max(0, len(series) - limit) if limit > 0 else 0
+        return series.periods[start:][::-1], series.values[start:][::-1]
+
+    def history(
+        self, symbol: str, variable_name: str, limit: int
+    ) -> List[Tuple[str, Any, VariableMetadata]]:
+        series = self._get_series(symbol, variable_name)
+        if series is None:
+            return []
+        periods, values = self.history_arrays(symbol, variable_name, limit)
+        rows = series.metadata[len(series) - len(periods):][::-1]
+        return [
+            (period, value, self._decode_metadata(symbol, variable_name, period, row))
+            for period, value, row in zip(periods, values.tolist(), rows)
+        ]
+
+    def periods(self, symbol: str, variable_name: str) -> List[str]:
+        series = self._get_series(symbol, variable_name)
+        return series.periods[::-1] if series is not None else []
+
+    def series_arrays(
+        self, symbol: str, variable_name: str
+    ) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """Periods, sort keys and values of a series, oldest first (no copies)"""
+        series = self._get_series(symbol, variable_name)
+        if series is None or len(series) == 0:
+            return None
+        return series.periods, series.keys, series.values
+
+    def symbols(self) -> List[str]:
+        return list(self._series.keys())
+
+    def variables(self, symbol: str) -> List[str]:
+        return list(self._series.get(symbol, {}).keys())
+
+    def items(self, symbol: str):
+        """Yield (variable_name, period, VariableValue) for a symbol"""
+        for variable_name, series in self._series.get(symbol, {}).items():
+            for period in list(series.periods):
+                yield variable_name, period, self.get(symbol, variable_name, period)
+
+    def counts(self) -> Dict[str, int]:
+        points = sum(
+            len(series) for variables in self._series.values() for series in variables.values()
+        )
+        return {
+            'symbols': len(self._series),
+            'variables': sum(len(variables) for variables in self._series.values()),
+            'data_points': points,
+            'historical_points': points,
+        }
+
+    def clear(self) -> None:
+        self._series.clear()
+        self._metadata_extras.clear()
+
+    def remove_symbol(self, symbol: str) -> int:
+        variables = self._series.pop(symbol, None)
+        if variables is None:
+            return 0
+        if self._metadata_extras:
+            for key in [key for key in self._metadata_extras if key[0] == symbol]:
+                del self._metadata_extras[key]
+        return len(variables)
+
+    def remove_variable(self, symbol: str, variable_name: str) -> bool:
+        series = self._series.get(symbol, {}).pop(variable_name, None)
+        if series is None:
+            return False
+        self._drop_metadata_extras(symbol, variable_name, series.periods)
+        return True
+
+    def remove_periods(self, symbol: str, variable_name: str, periods: List[str]) -> int:
+        series = self._get_series(symbol, variable_name)
+        if series is None:
+            return 0
+        indices = [index for index in (series.find(period) for period in periods) if index >= 0]
+        if indices:
+            self._drop_metadata_extras(symbol, variable_name, [series.periods[i] for i in indices])
+            series.delete(indices)
+        return len(indices)
+
+    def update_metadata(
+        self, symbol: str, variable_name: str, period: str, metadata_updates: Dict[str, Any]
+    ) -> bool:
+        series = self._get_series(symbol, variable_name)
+        index = series.find(period) if series is not None else -1
+        if index < 0:
+            return False
+        metadata = self._decode_metadata(symbol, variable_name, period, series.metadata[index])
+        for name, value in metadata_updates.items():
+            if hasattr(metadata, name):
+                setattr(metadata, name, value)
+        metadata.timestamp = datetime.now()
+        series.metadata[index] = self._encode_metadata(metadata)
+        self._set_metadata_extras(symbol, variable_name, period, metadata)
+        return True
+
+
 class VarInputData:
     """
     Centralized variable storage and access system with thread-safe operations.
@@ -298,7 +871,7 @@ class VarInputData:
     _instance = None
     _lock = threading.Lock()
     
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         """Singleton pattern implementation with double-checked locking"""
         if cls._instance is None:
             with cls._lock:
@@ -306,24 +879,30 @@ class VarInputData:
                     cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self, lazy_config: LazyLoadConfig = None):
-        """Initialize the VarInputData system if not already initialized"""
+    def __init__(self, lazy_config: LazyLoadConfig = None, storage_backend: str = "object"):
+        """
+        Initialize the VarInputData system if not already initialized
+
+        Args:
+            lazy_config: Lazy loading and eviction configuration
+            storage_backend: "object" (default) keeps VariableValue objects per
+                period; "columnar" keeps each series as NumPy arrays, which is
+                much smaller for large universes. Numeric values are stored
+                as float64 by the columnar backend.
+        """
         if hasattr(self, '_initialized'):
             return
+
+        if storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"Unknown storage backend '{storage_backend}', expected one of {STORAGE_BACKENDS}"
+            )
             
         self._initialized = True
         
-        # Core data storage
-        # Structure: {symbol: {variable_name: {period: VariableValue}}}
-        self._data: Dict[str, Dict[str, Dict[str, VariableValue]]] = defaultdict(
-            lambda: defaultdict(dict)
-        )
-        
-        # Historical data storage for time-series analysis
-        # Structure: {symbol: {variable_name: [HistoricalDataPoint]}}
-        self._historical_data: Dict[str, Dict[str, List[HistoricalDataPoint]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
+        # Core data and historical storage for time-series analysis
+        self.storage_backend = storage_backend
+        self._store = ColumnarSeriesStore() if storage_backend == "columnar" else ObjectSeriesStore()
         
         # Thread safety
         self._data_lock = threading.RLock()
@@ -400,23 +979,16 @@ class VarInputData:
         
         with self._data_lock:
             # Check if we have the data in memory
-            if symbol in self._data and variable_name in self._data[symbol]:
-                if period == "latest":
-                    # Get the most recent period for this variable
-                    periods = sorted(self._data[symbol][variable_name].keys(), reverse=True)
-                    if periods:
-                        period = periods[0]
-                        
-                if period in self._data[symbol][variable_name]:
-                    with self._stats_lock:
-                        self._access_stats['cache_hits'] += 1
-                    
-                    var_value = self._data[symbol][variable_name][period]
-                    logger.debug(f"Retrieved {symbol}.{variable_name}[{period}] from memory cache")
-                    
-                    if include_metadata:
-                        return var_value.value, var_value.metadata
-                    return var_value.value
+            var_value = self._store.get(symbol, variable_name, period)
+            if var_value is not None:
+                with self._stats_lock:
+                    self._access_stats['cache_hits'] += 1
+
+                logger.debug(f"Retrieved {symbol}.{variable_name}[{period}] from memory cache")
+
+                if include_metadata:
+                    return var_value.value, var_value.metadata
+                return var_value.value
             
             # Data not in memory cache - check if lazy loading should apply
             if not force_load and self._lazy_manager.should_lazy_load() and not self._is_priority_data(symbol, variable_name):
@@ -506,30 +1078,20 @@ class VarInputData:
                 period=period
             )
         
-        # Create variable value object
-        var_value = VariableValue(value=value, metadata=metadata)
-        
         # Store the data
         with self._data_lock:
             # Determine if this is an update or new value
-            is_update = (
-                symbol in self._data and 
-                variable_name in self._data[symbol] and 
-                period in self._data[symbol][variable_name]
-            )
+            is_update = self._store.has_period(symbol, variable_name, period)
             
             # Check if we need to evict data before storing
             self._check_and_evict_data(symbol, variable_name)
             
-            # Store the value
-            self._data[symbol][variable_name][period] = var_value
+            # Store the value and its historical data point
+            self._store.put(symbol, variable_name, period, value, metadata)
             
             # Track the symbol as loaded
             self._loaded_symbols.add(symbol)
             
-            # Add to historical data if it's not already there
-            self._add_to_historical_data(symbol, variable_name, period, value, metadata)
-            
             logger.debug(f"{'Updated' if is_update else 'Set'} {symbol}.{variable_name}[{period}] = {value}")
         
         # Emit change event
@@ -570,31 +1132,21 @@ class VarInputData:
         variable_name = variable_name.lower().strip()
         
         with self._data_lock:
-            if symbol not in self._historical_data or variable_name not in self._historical_data[symbol]:
+            if include_metadata:
+                results = self._store.history(symbol, variable_name, years)
+            elif isinstance(self._store, ColumnarSeriesStore):
+                periods, values = self._store.history_arrays(symbol, variable_name, years)
+                results = list(zip(periods, values.tolist()))
+            else:
+                results = [
+                    (period, value)
+                    for period, value, _ in self._store.history(symbol, variable_name, years)
+                ]
+
+            if not results:
                 logger.debug(f"No historical data found for {symbol}.{variable_name}")
                 return []
             
-            historical_points = self._historical_data[symbol][variable_name]
-            
-            # Sort by period (most recent first)
-            sorted_points = sorted(
-                historical_points, 
-                key=lambda x: self._parse_period_for_sorting(x.period), 
-                reverse=True
-            )
-            
-            # Limit to requested number of years
-            if years > 0:
-                sorted_points = sorted_points[:years]
-            
-            # Format results
-            results = []
-            for point in sorted_points:
-                if include_metadata:
-                    results.append((point.period, point.value, point.metadata))
-                else:
-                    results.append((point.period, point.value))
-            
             logger.debug(f"Retrieved {len(results)} historical points for {symbol}.{variable_name}")
             return results
     
@@ -617,9 +1169,8 @@ class VarInputData:
         with self._data_lock:
             if symbol is None:
                 # Clear all data
-                cleared_symbols = len(self._data)
-                self._data.clear()
-                self._historical_data.clear()
+                cleared_symbols = len(self._store.symbols())
+                self._store.clear()
                 logger.info(f"Cleared all cached data for {cleared_symbols} symbols")
                 
                 # Clear Universal Data Registry cache if requested
@@ -632,13 +1183,10 @@ class VarInputData:
                         
             else:
                 symbol = symbol.upper().strip()
-                if symbol in self._data:
+                if symbol in self._store.symbols():
                     if variable_name is None:
                         # Clear all variables for this symbol
-                        cleared_vars = len(self._data[symbol])
-                        del self._data[symbol]
-                        if symbol in self._historical_data:
-                            del self._historical_data[symbol]
+                        cleared_vars = self._store.remove_symbol(symbol)
                         logger.info(f"Cleared {cleared_vars} variables for symbol {symbol}")
                         
                         # Clear Universal Data Registry cache for this symbol
@@ -652,11 +1200,7 @@ class VarInputData:
                     else:
                         # Clear specific variable for this symbol
                         variable_name = variable_name.lower().strip()
-                        if variable_name in self._data[symbol]:
-                            del self._data[symbol][variable_name]
-                            if (symbol in self._historical_data and 
-                                variable_name in self._historical_data[symbol]):
-                                del self._historical_data[symbol][variable_name]
+                        if self._store.remove_variable(symbol, variable_name):
                             logger.info(f"Cleared {symbol}.{variable_name} from cache")
                             
                             # Clear Universal Data Registry cache for this specific variable
@@ -679,19 +1223,7 @@ class VarInputData:
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about the VarInputData system including memory usage"""
         with self._data_lock:
-            symbol_count = len(self._data)
-            variable_count = sum(len(variables) for variables in self._data.values())
-            total_data_points = sum(
-                len(periods) 
-                for symbol_vars in self._data.values() 
-                for periods in symbol_vars.values()
-            )
-            
-            historical_count = sum(
-                len(data_points)
-                for symbol_data in self._historical_data.values()
-                for data_points in symbol_data.values()
-            )
+            counts = self._store.counts()
         
         # Get memory information
         process = psutil.Process()
@@ -701,11 +1233,12 @@ class VarInputData:
         with self._stats_lock:
             stats = {
                 'data_storage': {
-                    'symbols': symbol_count,
+                    'symbols': counts['symbols'],
                     'loaded_symbols': len(self._loaded_symbols),
-                    'unique_variables': variable_count,
-                    'total_data_points': total_data_points,
-                    'historical_data_points': historical_count
+                    'unique_variables': counts['variables'],
+                    'total_data_points': counts['data_points'],
+                    'historical_data_points': counts['historical_points'],
+                    'storage_backend': self.storage_backend
                 },
                 'performance': dict(self._access_stats),
                 'cache_hit_rate': (
@@ -776,15 +1309,165 @@ class VarInputData:
                         results['errors'].append(f"Failed to set {symbol}.{variable_name}[{period}]")
         
         # Emit single bulk update event
-        self._event_system.emit(
-            DataChangeEvent.BULK_UPDATE,
-            data_count=results['successful'],
-            source=source
-        )
+        self.emit_bulk_update(results['successful'], source)
         
         logger.info(f"Bulk update completed: {results['successful']} successful, {results['failed']} failed")
         return results
     
+    def get_panel(
+        self,
+        symbols: List[str],
+        variables: List[str],
+        periods: Union[str, List[str]] = "latest",
+        as_array: bool = False
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Read one or more variables across many symbols in a single pass.
+
+        The panel is read from memory under one lock acquisition; it does not
+        fall back to the Universal Data Registry. Missing and non-numeric
+        values are NaN.
+        
+        Args:
+            symbols: Stock symbols (rows)
+            variables: Variable names (columns)
+            periods: "latest" or a list of periods
+            as_array: Return a float64 array of shape (symbols, variables, periods)
+                instead of a DataFrame
+            
+        Returns:
+            DataFrame indexed by symbol for "latest", or by (symbol, period)
+            for a list of periods, with one column per variable
+        """
+        with self._stats_lock:
+            self._access_stats['get_operations'] += 1
+
+        symbols = [symbol.upper().strip() for symbol in symbols]
+        variables = [variable_name.lower().strip() for variable_name in variables]
+        period_list = [periods] if isinstance(periods, str) else list(periods)
+        requested = np.asarray(period_list, dtype=object)
+        requested_keys = np.fromiter(
+            (_period_sort_key(period) for period in period_list), dtype=np.int64, count=len(period_list)
+        )
+        latest = requested == "latest"
+
+        # Each series' arrays are fetched once and indexed for all periods
+        block = np.full((len(symbols), len(variables), len(period_list)), np.nan)
+        with self._data_lock:
+            for i, symbol in enumerate(symbols):
+                for j, variable_name in enumerate(variables):
+                    series = self._store.series_arrays(symbol, variable_name)
+                    if series is not None:
+                        block[i, j] = _select_periods(*series, requested, requested_keys, latest)
+
+        if as_array:
+            return block
+        if isinstance(periods, str):
+            return pd.DataFrame(block[:, :, 0], index=pd.Index(symbols, name='symbol'), columns=variables)
+        index = pd.MultiIndex.from_product([symbols, period_list], names=['symbol', 'period'])
+        return pd.DataFrame(
+            block.transpose(0, 2, 1).reshape(len(symbols) * len(period_list), len(variables)),
+            index=index,
+            columns=variables
+        )
+
+    def set_panel(
+        self,
+        panel: pd.DataFrame,
+        period: str = "latest",
+        source: str = "panel",
+        validate: bool = True,
+        emit_event: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Write a panel of values in one pass with a single BULK_UPDATE event.
+        
+        Args:
+            panel: DataFrame in the get_panel layout: indexed by symbol (all
+                values for ``period``) or by (symbol, period), one column per
+                variable. NaN cells are skipped.
+            period: Period for a symbol-indexed panel
+            source: Source identifier for all data
+            validate: Whether to validate values against the variable registry
+            emit_event: Whether to emit the bulk update event
+            
+        Returns:
+            Dictionary with success/failure statistics
+        """
+        results = {
+            'successful': 0,
+            'failed': 0,
+            'errors': []
+        }
+
+        # Resolve each column's definition once rather than per cell
+        columns = []
+        for column in panel.columns:
+            variable_name = str(column).lower().strip()
+            var_def = self._variable_registry.get_variable_definition(variable_name)
+            if not var_def:
+                cells = int(panel[column].notna().sum())
+                results['failed'] += cells
+                results['errors'].append(f"Cannot set unknown variable '{variable_name}'")
+                continue
+            columns.append((panel.columns.get_loc(column), variable_name, var_def))
+
+        if isinstance(panel.index, pd.MultiIndex):
+            row_keys = [(str(symbol), str(row_period)) for symbol, row_period in panel.index]
+        else:
+            row_keys = [(str(symbol), period) for symbol in panel.index]
+
+        values = panel.to_numpy(dtype=object)
+        timestamp = datetime.now()
+        validation_failures = 0
+
+        with self._data_lock:
+            for row, (symbol, row_period) in enumerate(row_keys):
+                symbol = symbol.upper().strip()
+                for column, variable_name, var_def in columns:
+                    value = values[row, column]
+                    if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+                        continue
+
+                    is_valid = True
+                    if validate:
+                        is_valid, _ = var_def.validate_value(value)
+                        if not is_valid:
+                            validation_failures += 1
+
+                    metadata = VariableMetadata(
+                        source=source,
+                        timestamp=timestamp,
+                        quality_score=1.0 if is_valid else 0.8,
+                        validation_passed=is_valid,
+                        period=row_period
+                    )
+                    self._check_and_evict_data(symbol, variable_name)
+                    self._store.put(symbol, variable_name, row_period, value, metadata)
+                    results['successful'] += 1
+
+                self._loaded_symbols.add(symbol)
+
+        with self._stats_lock:
+            self._access_stats['set_operations'] += 1
+            self._access_stats['validation_failures'] += validation_failures
+
+        if emit_event:
+            self.emit_bulk_update(results['successful'], source)
+
+        logger.info(f"Panel update completed: {results['successful']} successful, {results['failed']} failed")
+        return results
+    
+    def emit_bulk_update(self, data_count: int, source: str) -> None:
+        """
+        Emit one BULK_UPDATE event for values written with emit_event=False.
+        
+        Args:
+            data_count: Number of values written
+            source: Source identifier for the data
+        """
+        self._event_system.emit(DataChangeEvent.BULK_UPDATE, data_count=data_count, source=source)
+    
     def subscribe_to_events(self, event_type: DataChangeEvent, callback: Callable) -> None:
         """Subscribe to data change events"""
         self._event_system.subscribe(event_type, callback)
@@ -796,7 +1479,7 @@ class VarInputData:
     def get_available_symbols(self) -> List[str]:
         """Get list of all symbols with data in the system"""
         with self._data_lock:
-            return sorted(list(self._data.keys()))
+            return sorted(self._store.symbols())
     
     def get_available_variables(self, symbol: Optional[str] = None) -> List[str]:
         """
@@ -812,14 +1495,12 @@ class VarInputData:
             if symbol is None:
                 # Get all unique variable names across all symbols
                 all_variables = set()
-                for symbol_data in self._data.values():
-                    all_variables.update(symbol_data.keys())
+                for stored_symbol in self._store.symbols():
+                    all_variables.update(self._store.variables(stored_symbol))
                 return sorted(list(all_variables))
             else:
                 symbol = symbol.upper().strip()
-                if symbol in self._data:
-                    return sorted(list(self._data[symbol].keys()))
-                return []
+                return sorted(self._store.variables(symbol))
     
     def get_available_periods(self, symbol: str, variable_name: str) -> List[str]:
         """
@@ -836,11 +1517,7 @@ class VarInputData:
         variable_name = variable_name.lower().strip()
         
         with self._data_lock:
-            if (symbol in self._data and 
-                variable_name in self._data[symbol]):
-                periods = list(self._data[symbol][variable_name].keys())
-                return sorted(periods, key=self._parse_period_for_sorting, reverse=True)
-            return []
+            return self._store.periods(symbol, variable_name)
     
     def has_variable(self, symbol: str, variable_name: str, period: str = "latest") -> bool:
         """
@@ -858,13 +1535,7 @@ class VarInputData:
         variable_name = variable_name.lower().strip()
         
         with self._data_lock:
-            if symbol not in self._data or variable_name not in self._data[symbol]:
-                return False
-                
-            if period == "latest":
-                return len(self._data[symbol][variable_name]) > 0
-            else:
-                return period in self._data[symbol][variable_name]
+            return self._store.has(symbol, variable_name, period)
     
     def update_metadata(
         self,
@@ -889,21 +1560,10 @@ class VarInputData:
         variable_name = variable_name.lower().strip()
         
         with self._data_lock:
-            if (symbol not in self._data or 
-                variable_name not in self._data[symbol] or
-                period not in self._data[symbol][variable_name]):
+            # Update metadata fields and the timestamp to reflect the change
+            if not self._store.update_metadata(symbol, variable_name, period, metadata_updates):
                 return False
             
-            var_value = self._data[symbol][variable_name][period]
-            
-            # Update metadata fields
-            for field, value in metadata_updates.items():
-                if hasattr(var_value.metadata, field):
-                    setattr(var_value.metadata, field, value)
-            
-            # Update timestamp to reflect metadata change
-            var_value.metadata.timestamp = datetime.now()
-            
             logger.debug(f"Updated metadata for {symbol}.{variable_name}[{period}]")
             return True
     
@@ -927,23 +1587,23 @@ class VarInputData:
         with self._data_lock:
             export_data = {}
             
-            symbols_to_export = [symbol.upper()] if symbol else list(self._data.keys())
+            stored_symbols = self._store.symbols()
+            symbols_to_export = [symbol.upper()] if symbol else stored_symbols
             
             for sym in symbols_to_export:
-                if sym not in self._data:
+                if sym not in stored_symbols:
                     continue
                     
                 export_data[sym] = {}
-                for var_name, periods in self._data[sym].items():
-                    export_data[sym][var_name] = {}
-                    for period, var_value in periods.items():
-                        if include_metadata:
-                            export_data[sym][var_name][period] = {
-                                'value': var_value.value,
-                                'metadata': var_value.metadata.to_dict()
-                            }
-                        else:
-                            export_data[sym][var_name][period] = var_value.value
+                for var_name, period, var_value in self._store.items(sym):
+                    periods = export_data[sym].setdefault(var_name, {})
+                    if include_metadata:
+                        periods[period] = {
+                            'value': var_value.value,
+                            'metadata': var_value.metadata.to_dict()
+                        }
+                    else:
+                        periods[period] = var_value.value
             
             if format == "json":
                 return json.dumps(export_data, indent=2, default=str)
@@ -973,39 +1633,37 @@ class VarInputData:
     def _check_and_evict_data(self, symbol: str, variable_name: str) -> None:
         """Check if we need to evict data before storing new data"""
         with self._data_lock:
-            if symbol in self._data and variable_name in self._data[symbol]:
-                periods = self._data[symbol][variable_name]
-                if len(periods) > self._lazy_manager.config.max_periods_per_variable:
-                    # Evict older periods
-                    candidates = self._lazy_manager.get_eviction_candidates(
-                        periods, 
-                        self._lazy_manager.config.max_periods_per_variable
-                    )
-                    for period_key in candidates:
-                        if period_key in periods:
-                            del periods[period_key]
-                            logger.debug(f"Evicted period {period_key} for {symbol}.{variable_name}")
-                    
-                    with self._stats_lock:
-                        self._access_stats['memory_evictions'] += len(candidates)
+            periods = dict.fromkeys(self._store.periods(symbol, variable_name))
+            if len(periods) > self._lazy_manager.config.max_periods_per_variable:
+                # Evict older periods
+                candidates = self._lazy_manager.get_eviction_candidates(
+                    periods, 
+                    self._lazy_manager.config.max_periods_per_variable
+                )
+                evicted = [period_key for period_key in candidates if period_key in periods]
+                if evicted:
+                    self._store.remove_periods(symbol, variable_name, evicted)
+                    logger.debug(f"Evicted periods {evicted} for {symbol}.{variable_name}")
+                
+                with self._stats_lock:
+                    self._access_stats['memory_evictions'] += len(candidates)
     
     def _evict_symbols(self) -> None:
         """Evict less frequently accessed symbols from memory"""
         with self._data_lock:
             # Get symbols to evict
             target_count = int(self._lazy_manager.config.max_cached_symbols * 0.8)  # Remove 20% buffer
+            stored_symbols = dict.fromkeys(self._store.symbols())
             candidates = self._lazy_manager.get_eviction_candidates(
-                self._data, 
+                stored_symbols, 
                 target_count
             )
             
             evicted_count = 0
             for symbol in candidates:
-                if symbol in self._data:
+                if symbol in stored_symbols:
                     # Remove symbol data
-                    del self._data[symbol]
-                    if symbol in self._historical_data:
-                        del self._historical_data[symbol]
+                    self._store.remove_symbol(symbol)
                     self._loaded_symbols.discard(symbol)
                     evicted_count += 1
                     logger.debug(f"Evicted symbol {symbol} from memory cache")
@@ -1015,69 +1673,9 @@ class VarInputData:
                     self._access_stats['memory_evictions'] += evicted_count
                 logger.info(f"Evicted {evicted_count} symbols to free memory")
     
-    def _add_to_historical_data(
-        self,
-        symbol: str,
-        variable_name: str,
-        period: str,
-        value: Any,
-        metadata: VariableMetadata
-    ) -> None:
-        """Add a data point to historical storage"""
-        data_point = HistoricalDataPoint(
-            symbol=symbol,
-            variable_name=variable_name,
-            period=period,
-            value=value,
-            metadata=metadata
-        )
-        
-        # Check if this data point already exists
-        existing_points = self._historical_data[symbol][variable_name]
-        for i, existing_point in enumerate(existing_points):
-            if existing_point.period == period:
-                # Update existing point
-                existing_points[i] = data_point
-                return
-        
-        # Add new point
-        self._historical_data[symbol][variable_name].append(data_point)
-        
-        # Keep historical data sorted and limited (e.g., last 50 years)
-        if len(existing_points) > 50:
-            # Sort by period and keep most recent
-            sorted_points = sorted(
-                existing_points,
-                key=lambda x: self._parse_period_for_sorting(x.period),
-                reverse=True
-            )
-            self._historical_data[symbol][variable_name] = sorted_points[:50]
-    
     def _parse_period_for_sorting(self, period: str) -> int:
         """Parse period string into integer for sorting (most recent first)"""
-        try:
-            # Handle different period formats
-            if period == "latest":
-                return 999999  # Latest should sort first
-            elif period.isdigit() and len(period) == 4:  # Year format like "2023"
-                return int(period)
-            elif "Q" in period:  # Quarter format like "Q1-2023"
-                parts = period.split("-")
-                if len(parts) == 2:
-                    quarter_part = parts[0].replace("Q", "")
-                    year_part = parts[1]
-                    return int(year_part) * 10 + int(quarter_part)
-            else:
-                # Try to extract year from other formats
-                import re
-                year_match = re.search(r'20\d{2}', period)
-                if year_match:
-                    return int(year_match.group())
-        except (ValueError, IndexError):
-            pass
-        
-        # Default to 0 for unparseable periods
-        return 0
+        return _period_sort_key(period)
     
     def _load_from_registry(
         self,
@@ -1112,10 +1710,8 @@ class VarInputData:
                 )
                 
                 # Store in memory cache for future access
-                var_value = VariableValue(value=response.data, metadata=metadata)
                 with self._data_lock:
-                    self._data[symbol][variable_name][period] = var_value
-                    self._add_to_historical_data(symbol, variable_name, period, response.data, metadata)
+                    self._store.put(symbol, variable_name, period, response.data, metadata)
                 
                 logger.debug(f"Loaded {symbol}.{variable_name}[{period}] from Universal Data Registry")
                 return response.data, metadata
@@ -1173,6 +1769,8 @@ __all__ = [
     'VariableMetadata',
     'VariableValue',
     'HistoricalDataPoint',
+    'ObjectSeriesStore',
+    'ColumnarSeriesStore',
     'DataChangeEvent',
     'get_variable',
     'set_variable', 
@@ -12,6 +12,8 @@ Key Features:
 - Industry statistics calculation (median, quartiles, range)
 - Minimum peer company validation
 - 1-day TTL caching to minimize API calls
+- Shared peer universe cache per (sector, industry) and P/B snapshot cache per peer,
+  so tickers in the same industry reuse one peer fetch
 - Integration with existing data source infrastructure
 
 Classes:
@@ -24,11 +26,13 @@ Usage:
     >>> stats = industry_service.get_industry_pb_statistics("AAPL")
     >>> print(f"Industry median P/B: {stats.median_pb}")
     >>> print(f"Based on {stats.peer_count} peer companies")
+    >>> 
+    >>> # Prefetch a whole industry before analyzing many of its members
+    >>> industry_service.warmup_industry("Financial Services", "Banks - Regional")
 """
 
 import os
 import json
-import time
 import yfinance as yf
 import numpy as np
 import pandas as pd
@@ -38,12 +42,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import logging
 import hashlib
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import existing data source utilities
 try:
     from .interfaces.data_sources import DataSourceType
-    from ..data_processing.rate_limiting.enhanced_rate_limiter import EnhancedRateLimiter
+    from ..data_processing.rate_limiting.rate_limit_service import get_rate_limit_service
     from core.data_processing.converters.yfinance_converter import YFinanceConverter
     from core.data_processing.converters.alpha_vantage_converter import AlphaVantageConverter
     from core.data_processing.converters.fmp_converter import FMPConverter
@@ -53,7 +58,7 @@ except ImportError:
     # Fallback imports for testing
     from enum import Enum
     DataSourceType = None
-    EnhancedRateLimiter = None
+    get_rate_limit_service = None
     get_error_handler = None
     DataQualityValidator = None
 
@@ -110,41 +115,57 @@ class IndustryDataService:
     Service for fetching real-time industry P/B data from market APIs
     """
     
-    def __init__(self, cache_dir: str = "data/cache", cache_ttl_hours: int = 24):
+    PEER_SNAPSHOT_FILE = "peer_pb_snapshots.json"
+    
+    def __init__(
+        self,
+        cache_dir: str = "data/cache",
+        cache_ttl_hours: int = 24,
+        peer_universe_ttl_hours: Optional[int] = None,
+        peer_snapshot_ttl_hours: Optional[int] = None
+    ):
         """
         Initialize the industry data service
         
         Args:
             cache_dir: Directory for caching industry data
             cache_ttl_hours: Time-to-live for cached data in hours (default 24)
+            peer_universe_ttl_hours: Time-to-live for the peer list of a (sector, industry)
+                (default 7x cache_ttl_hours, peer membership changes slowly)
+            peer_snapshot_ttl_hours: Time-to-live for a peer's P/B snapshot
+                (default cache_ttl_hours)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        self.peer_universe_ttl = timedelta(
+            hours=peer_universe_ttl_hours if peer_universe_ttl_hours is not None else cache_ttl_hours * 7
+        )
+        self.peer_snapshot_ttl = timedelta(
+            hours=peer_snapshot_ttl_hours if peer_snapshot_ttl_hours is not None else cache_ttl_hours
+        )
         self.minimum_peer_count = 5  # Minimum required peer companies
         self.maximum_peer_count = 50  # Maximum to process for performance
         
-        # Initialize rate limiters for different APIs
-        self.rate_limiters = {}
-        self._initialize_rate_limiters()
+        # Shared per-provider API quotas
+        self.rate_limit_service = get_rate_limit_service() if get_rate_limit_service else None
         
         # Initialize data quality validator
         self.data_quality_validator = DataQualityValidator() if DataQualityValidator else None
         
+        # Shared caches: {(sector, industry): (peer_tickers, fetched_at)} and
+        # {peer_ticker: (IndustryPeerData or None, fetched_at)}; None records a failed fetch
+        self._peer_universes: Dict[Tuple[str, str], Tuple[List[str], datetime]] = {}
+        self._peer_snapshots: Dict[str, Tuple[Optional[IndustryPeerData], datetime]] = {}
+        self._shared_cache_lock = threading.RLock()
+        self._load_peer_snapshots()
+        
         logger.info(f"Industry data service initialized with cache_dir={cache_dir}, ttl={cache_ttl_hours}h")
 
-    def _initialize_rate_limiters(self):
-        """Initialize rate limiters for different data sources"""
-        try:
-            if EnhancedRateLimiter:
-                self.rate_limiters = {
-                    'yfinance': EnhancedRateLimiter(calls_per_second=1, calls_per_minute=60),
-                    'alpha_vantage': EnhancedRateLimiter(calls_per_second=1, calls_per_minute=5),
-                    'fmp': EnhancedRateLimiter(calls_per_second=10, calls_per_minute=250)
-                }
-        except Exception as e:
-            logger.warning(f"Failed to initialize rate limiters: {e}")
-            self.rate_limiters = {}
+    def _wait_for_rate_limit(self, provider: str) -> None:
+        """Take a request token for a provider, waiting for its shared quota"""
+        if self.rate_limit_service:
+            self.rate_limit_service.acquire(provider)
 
     @performance_timer("industry_pb_statistics", include_args=True)
     def get_industry_pb_statistics(self, ticker: str) -> Optional[IndustryStatistics]:
@@ -173,14 +194,14 @@ class IndustryDataService:
                 logger.warning(f"Could not determine sector for {ticker}")
                 return None
                 
-            # Step 2: Find peer companies in same sector
-            peer_tickers = self._find_peer_companies(sector_info['sector'], sector_info['industry'])
+            # Step 2: Find peer companies in same sector (shared per sector/industry)
+            peer_tickers = self._get_peer_universe(sector_info['sector'], sector_info['industry'])
             if len(peer_tickers) < self.minimum_peer_count:
                 logger.warning(f"Insufficient peer companies for {ticker}: {len(peer_tickers)} < {self.minimum_peer_count}")
                 return None
                 
-            # Step 3: Fetch P/B ratios for all peers
-            peer_data = self._fetch_peer_pb_data(peer_tickers)
+            # Step 3: Fetch P/B ratios for peers without a fresh cached snapshot
+            peer_data = self._get_peer_snapshots(peer_tickers)
             
             # Step 4: Calculate industry statistics
             statistics = self._calculate_industry_statistics(
@@ -226,6 +247,81 @@ class IndustryDataService:
             logger.error(f"Error calculating industry statistics for {ticker}: {e}")
             return None
 
+    def warmup_industry(self, sector: str, industry: str) -> Optional[IndustryStatistics]:
+        """
+        Prefetch the peer universe and every peer's P/B snapshot for one industry
+        
+        Subsequent get_industry_pb_statistics calls for tickers in this industry
+        only need their own sector classification.
+        
+        Args:
+            sector: Sector name
+            industry: Industry name
+            
+        Returns:
+            IndustryStatistics for the industry, or None if insufficient peer data
+        """
+        peer_tickers = self._get_peer_universe(sector, industry)
+        if len(peer_tickers) < self.minimum_peer_count:
+            logger.warning(f"Insufficient peer companies to warm up {sector}/{industry}: {len(peer_tickers)}")
+            return None
+        
+        peer_data = self._get_peer_snapshots(peer_tickers)
+        logger.info(f"Warmed up {sector}/{industry}: {len(peer_data)}/{len(peer_tickers)} peer snapshots")
+        return self._calculate_industry_statistics(sector, industry, peer_data)
+
+    def _get_peer_universe(self, sector: str, industry: str) -> List[str]:
+        """Get peer tickers for a (sector, industry), using the shared peer universe cache"""
+        key = (sector, industry)
+        with self._shared_cache_lock:
+            cached = self._peer_universes.get(key)
+            if cached is None:
+                cached = self._load_peer_universe(sector, industry)
+            if cached and datetime.now() - cached[1] < self.peer_universe_ttl:
+                self._peer_universes[key] = cached
+                return list(cached[0])
+        
+        peer_tickers = self._find_peer_companies(sector, industry)
+        
+        # Only cache usable universes; a short list may be a transient verification failure
+        if len(peer_tickers) >= self.minimum_peer_count:
+            with self._shared_cache_lock:
+                self._peer_universes[key] = (list(peer_tickers), datetime.now())
+                self._save_peer_universe(sector, industry, peer_tickers)
+        return peer_tickers
+
+    def _get_peer_snapshots(self, peer_tickers: List[str]) -> List[IndustryPeerData]:
+        """Get P/B data for peers, fetching only those without a fresh cached snapshot"""
+        now = datetime.now()
+        cached_data = []
+        missing = []
+        with self._shared_cache_lock:
+            for peer in peer_tickers:
+                snapshot = self._peer_snapshots.get(peer)
+                if snapshot and now - snapshot[1] < self.peer_snapshot_ttl:
+                    if snapshot[0] is not None:
+                        cached_data.append(snapshot[0])
+                else:
+                    missing.append(peer)
+        
+        if not missing:
+            logger.info(f"Using {len(cached_data)} cached peer P/B snapshots")
+            return cached_data
+        
+        fetched = self._fetch_peer_pb_data(missing)
+        fetched_by_ticker = {data.ticker: data for data in fetched}
+        
+        with self._shared_cache_lock:
+            fetched_at = datetime.now()
+            for peer in missing:
+                self._peer_snapshots[peer] = (fetched_by_ticker.get(peer), fetched_at)
+            self._save_peer_snapshots()
+        
+        # Preserve peer order so statistics are stable regardless of cache state
+        by_ticker = {data.ticker: data for data in cached_data}
+        by_ticker.update(fetched_by_ticker)
+        return [by_ticker[peer] for peer in peer_tickers if peer in by_ticker]
+
     def _get_sector_classification(self, ticker: str) -> Optional[Dict[str, str]]:
         """
         Get sector and industry classification for a ticker using yfinance
@@ -237,8 +333,7 @@ class IndustryDataService:
             Dictionary with sector and industry info or None
         """
         def _fetch_sector_data():
-            if 'yfinance' in self.rate_limiters:
-                self.rate_limiters['yfinance'].wait_if_needed()
+            self._wait_for_rate_limit('yfinance')
                 
             stock = yf.Ticker(ticker)
             info = stock.info
@@ -408,8 +503,7 @@ class IndustryDataService:
                 break
                 
             try:
-                if 'yfinance' in self.rate_limiters:
-                    self.rate_limiters['yfinance'].wait_if_needed()
+                self._wait_for_rate_limit('yfinance')
                     
                 peer_info = yf.Ticker(potential_peer).info
                 peer_sector = peer_info.get('sector', '')
@@ -421,9 +515,6 @@ class IndustryDataService:
                      target_sector.lower() in peer_sector.lower())):
                     verified_peers.append(potential_peer)
                     logger.debug(f"Verified peer {potential_peer}: {peer_sector}")
-                    
-                # Shorter delay for batch processing
-                time.sleep(0.05)
                 
             except Exception as e:
                 logger.debug(f"Error verifying peer {potential_peer}: {e}")
@@ -580,8 +671,7 @@ class IndustryDataService:
             IndustryPeerData object or None
         """
         def _fetch_yfinance_data():
-            if 'yfinance' in self.rate_limiters:
-                self.rate_limiters['yfinance'].wait_if_needed()
+            self._wait_for_rate_limit('yfinance')
                 
             stock = yf.Ticker(ticker)
             info = stock.info
@@ -743,6 +833,68 @@ class IndustryDataService:
         except Exception as e:
             logger.error(f"Error saving cache for {ticker}: {e}")
 
+    def _get_peer_universe_file_path(self, sector: str, industry: str) -> Path:
+        """Get cache file path for a (sector, industry) peer universe"""
+        cache_key = hashlib.md5(f"peer_universe_{sector}|{industry}".encode()).hexdigest()
+        return self.cache_dir / f"peer_universe_{cache_key}.json"
+
+    def _load_peer_universe(self, sector: str, industry: str) -> Optional[Tuple[List[str], datetime]]:
+        """Load a peer universe from disk"""
+        try:
+            cache_file = self._get_peer_universe_file_path(sector, industry)
+            if cache_file.exists():
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                return data['peer_tickers'], datetime.fromisoformat(data['fetched_at'])
+        except Exception as e:
+            logger.debug(f"Error loading peer universe for {sector}/{industry}: {e}")
+        return None
+
+    def _save_peer_universe(self, sector: str, industry: str, peer_tickers: List[str]):
+        """Save a peer universe to disk"""
+        try:
+            with open(self._get_peer_universe_file_path(sector, industry), 'w') as f:
+                json.dump({
+                    'sector': sector,
+                    'industry': industry,
+                    'peer_tickers': list(peer_tickers),
+                    'fetched_at': datetime.now().isoformat()
+                }, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving peer universe for {sector}/{industry}: {e}")
+
+    def _load_peer_snapshots(self):
+        """Load persisted peer P/B snapshots (successful fetches only)"""
+        try:
+            cache_file = self.cache_dir / self.PEER_SNAPSHOT_FILE
+            if not cache_file.exists():
+                return
+            with open(cache_file, 'r') as f:
+                data = json.load(f)
+            for ticker, entry in data.items():
+                if entry.get('last_updated'):
+                    entry['last_updated'] = datetime.fromisoformat(entry['last_updated'])
+                peer = IndustryPeerData(**entry)
+                self._peer_snapshots[ticker] = (peer, peer.last_updated or datetime.min)
+        except Exception as e:
+            logger.debug(f"Error loading peer snapshots: {e}")
+
+    def _save_peer_snapshots(self):
+        """Persist fresh, successful peer P/B snapshots"""
+        try:
+            now = datetime.now()
+            data = {}
+            for ticker, (peer, fetched_at) in self._peer_snapshots.items():
+                if peer is None or now - fetched_at >= self.peer_snapshot_ttl:
+                    continue
+                entry = peer.__dict__.copy()
+                entry['last_updated'] = fetched_at.isoformat()
+                data[ticker] = entry
+            with open(self.cache_dir / self.PEER_SNAPSHOT_FILE, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            logger.error(f"Error saving peer snapshots: {e}")
+
     def _is_cache_valid(self, statistics: IndustryStatistics) -> bool:
         """Check if cached statistics are still valid"""
         if not statistics.cache_expiry:
@@ -770,6 +922,16 @@ class IndustryDataService:
                     cache_file.unlink()
                 logger.info(f"Cleared {len(cache_files)} industry cache files")
                 
+                # Clear shared peer caches
+                with self._shared_cache_lock:
+                    self._peer_universes.clear()
+                    self._peer_snapshots.clear()
+                    for cache_file in self.cache_dir.glob("peer_universe_*.json"):
+                        cache_file.unlink()
+                    snapshot_file = self.cache_dir / self.PEER_SNAPSHOT_FILE
+                    if snapshot_file.exists():
+                        snapshot_file.unlink()
+                
         except Exception as e:
             logger.error(f"Error clearing cache: {e}")
 
@@ -782,6 +944,10 @@ class IndustryDataService:
                 'cache_dir': str(self.cache_dir),
                 'total_cached_files': len(cache_files),
                 'cache_ttl_hours': self.cache_ttl.total_seconds() / 3600,
+                'peer_universe_ttl_hours': self.peer_universe_ttl.total_seconds() / 3600,
+                'peer_snapshot_ttl_hours': self.peer_snapshot_ttl.total_seconds() / 3600,
+                'cached_peer_universes': len(list(self.cache_dir.glob("peer_universe_*.json"))),
+                'cached_peer_snapshots': len(self._peer_snapshots),
                 'files': []
             }
             
@@ -28,6 +28,8 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from core.data_processing.rate_limiting.rate_limit_service import RateLimit, get_rate_limit_service
+
 # Import enhanced logging
 try:
     from utils.logging_config import get_api_logger, get_data_logger, log_exception
@@ -186,19 +188,22 @@ class FinancialDataProvider(ABC):
         pass
 
     def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting"""
+        """Take a request token from the provider's shared quota, waiting if necessary"""
         if not self.config.credentials:
             return
 
-        time_since_last = (datetime.now() - self.last_request_time).total_seconds()
-        min_interval = (
-            self.config.credentials.rate_limit_period / self.config.credentials.rate_limit_calls
-        )
+        credentials = self.config.credentials
+        service = get_rate_limit_service()
+        if credentials.rate_limit_calls > 0 and credentials.rate_limit_period > 0:
+            # Configured credentials (e.g. a premium tier) replace the published defaults
+            limits = (RateLimit(credentials.rate_limit_calls, credentials.rate_limit_period),)
+            if service.get_limits(self.config.source_type) != limits:
+                service.configure(self.config.source_type, limits)
 
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        acquired, wait_time = service.try_acquire(self.config.source_type)
+        if not acquired:
+            logger.debug(f"Rate limiting: waiting up to {wait_time:.2f} seconds")
+            service.acquire(self.config.source_type)
 
     def _standardize_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize data format across providers"""
@@ -507,7 +512,7 @@ class AlphaVantageProvider(FinancialDataProvider):
             if "annualReports" in income_data:
                 statements["income_statement"] = income_data["annualReports"]
 
-            time.sleep(1)  # Respect rate limits
+            self._enforce_rate_limit()
 
             # Get Balance Sheet
             balance_url = f"{self.base_url}?function=BALANCE_SHEET&symbol={ticker}&apikey={self.config.credentials.api_key}"
@@ -519,7 +524,7 @@ class AlphaVantageProvider(FinancialDataProvider):
             if "annualReports" in balance_data:
                 statements["balance_sheet"] = balance_data["annualReports"]
 
-            time.sleep(1)  # Respect rate limits
+            self._enforce_rate_limit()
 
             # Get Cash Flow Statement
             cashflow_url = f"{self.base_url}?function=CASH_FLOW&symbol={ticker}&apikey={self.config.credentials.api_key}"
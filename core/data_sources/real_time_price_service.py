@@ -10,12 +10,14 @@ Features:
 - Manual refresh capability
 - Graceful degradation and fallback logic
 - Background price update capability
+- Concurrent batch fetching with per-provider concurrency limits and a batch deadline
 - Error handling and logging
 """
 
 import asyncio
 import time
 import json
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass, asdict
@@ -93,20 +95,46 @@ class PriceCacheEntry:
         return age <= max_age_minutes
 
 
+@dataclass
+class PriceFetchResult:
+    """Outcome of fetching a single ticker within a batch"""
+    ticker: str
+    price_data: Optional[PriceData] = None
+    provider: Optional[str] = None
+    latency_ms: float = 0.0
+    cache_hit: bool = False
+    timed_out: bool = False
+    error_message: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether a price was obtained"""
+        return self.price_data is not None
+
+
 class RealTimePriceService:
     """
     Real-time price fetching service with multi-source support and intelligent caching
     """
     
-    def __init__(self, cache_dir: Optional[str] = None, cache_ttl_minutes: int = 15):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        cache_ttl_minutes: int = 15,
+        max_workers: int = 4,
+        max_concurrency_per_provider: int = 4,
+    ):
         """
         Initialize the Real-Time Price Service
         
         Args:
             cache_dir: Directory for persistent cache (optional)
             cache_ttl_minutes: Cache time-to-live in minutes (default: 15)
+            max_workers: Size of the thread pool used for blocking provider calls
+            max_concurrency_per_provider: Maximum in-flight requests per provider in a batch
         """
         self.cache_ttl_minutes = cache_ttl_minutes
+        self.max_concurrency_per_provider = max_concurrency_per_provider
         self.cache_dir = Path(cache_dir) if cache_dir else Path("data/cache/prices")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
@@ -118,7 +146,7 @@ class RealTimePriceService:
         self._provider_configs: Dict[DataSourceType, DataSourceConfig] = {}
         
         # Thread pool for concurrent API calls
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
         
         # Initialize data source providers
         self._initialize_providers()
@@ -232,6 +260,15 @@ class RealTimePriceService:
         Returns:
             PriceData object or None if all sources fail
         """
+        return await self._get_price(ticker, force_refresh)
+
+    async def _get_price(
+        self,
+        ticker: str,
+        force_refresh: bool = False,
+        semaphores: Optional[Dict[DataSourceType, asyncio.Semaphore]] = None,
+    ) -> Optional[PriceData]:
+        """Cache-aware price lookup shared by single and batch fetches"""
         ticker = ticker.upper()
         logger.info(f"Fetching real-time price for {ticker}, force_refresh={force_refresh}")
         
@@ -244,7 +281,7 @@ class RealTimePriceService:
                 return cached_data.price_data
         
         # Fetch fresh data from providers
-        price_data = await self._fetch_price_from_providers(ticker)
+        price_data = await self._fetch_price_from_providers(ticker, semaphores)
         
         if price_data:
             # Cache the successful result
@@ -262,46 +299,140 @@ class RealTimePriceService:
         
         return price_data
     
-    async def get_multiple_prices(self, tickers: List[str], force_refresh: bool = False) -> Dict[str, Optional[PriceData]]:
+    async def get_multiple_prices(
+        self,
+        tickers: List[str],
+        force_refresh: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Optional[PriceData]]:
         """
         Get real-time prices for multiple tickers concurrently
         
         Args:
             tickers: List of ticker symbols
             force_refresh: Force refresh from API, bypassing cache
+            timeout: Batch deadline in seconds; tickers not done by then map to None
             
         Returns:
             Dictionary mapping tickers to PriceData objects
         """
-        logger.info(f"Fetching prices for {len(tickers)} tickers")
-        
-        # Create concurrent tasks for all tickers
-        tasks = []
-        for ticker in tickers:
-            task = asyncio.create_task(self.get_real_time_price(ticker, force_refresh))
-            tasks.append((ticker.upper(), task))
-        
-        # Wait for all tasks to complete
+        results = await self.fetch_prices_batch(tickers, force_refresh, timeout)
+        return {ticker: result.price_data for ticker, result in results.items()}
+
+    async def fetch_prices_batch(
+        self,
+        tickers: List[str],
+        force_refresh: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, PriceFetchResult]:
+        """
+        Fetch prices for many tickers concurrently and report per-ticker outcomes
+
+        Blocking provider calls run on the service thread pool, with at most
+        max_concurrency_per_provider requests in flight per provider. Tickers that
+        have not completed when the batch deadline expires are cancelled and reported
+        as timed out.
+
+        Args:
+            tickers: List of ticker symbols
+            force_refresh: Force refresh from API, bypassing cache
+            timeout: Batch deadline in seconds (None waits for all tickers)
+
+        Returns:
+            Dictionary mapping tickers to PriceFetchResult (latency, provider, errors)
+        """
+        unique_tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        logger.info(f"Fetching prices for {len(unique_tickers)} tickers")
+        if not unique_tickers:
+            return {}
+
+        semaphores = self._create_provider_semaphores()
+        tasks = {
+            ticker: asyncio.create_task(self._fetch_with_report(ticker, force_refresh, semaphores))
+            for ticker in unique_tickers
+        }
+
+        batch_start = time.perf_counter()
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(
+                f"Batch deadline of {timeout}s reached with {len(pending)} tickers outstanding"
+            )
+
         results = {}
-        for ticker, task in tasks:
+        for ticker, task in tasks.items():
+            if task in pending:
+                results[ticker] = PriceFetchResult(
+                    ticker=ticker,
+                    latency_ms=(time.perf_counter() - batch_start) * 1000,
+                    timed_out=True,
+                    error_message=f"Batch deadline of {timeout}s exceeded",
+                )
+                continue
             try:
-                results[ticker] = await task
+                results[ticker] = task.result()
             except Exception as e:
                 logger.error(f"Failed to fetch price for {ticker}: {e}")
-                results[ticker] = None
-        
+                results[ticker] = PriceFetchResult(ticker=ticker, error_message=str(e))
+
+        success_count = sum(1 for result in results.values() if result.success)
+        logger.info(
+            f"Batch price fetch completed: {success_count}/{len(results)} successful "
+            f"in {time.perf_counter() - batch_start:.2f}s"
+        )
         return results
+
+    async def _fetch_with_report(
+        self,
+        ticker: str,
+        force_refresh: bool,
+        semaphores: Dict[DataSourceType, asyncio.Semaphore],
+    ) -> PriceFetchResult:
+        """Fetch one ticker and record latency and the answering source"""
+        start = time.perf_counter()
+        price_data = await self._get_price(ticker, force_refresh, semaphores)
+        return PriceFetchResult(
+            ticker=ticker,
+            price_data=price_data,
+            provider=price_data.source if price_data else None,
+            latency_ms=(time.perf_counter() - start) * 1000,
+            cache_hit=bool(price_data and price_data.cache_hit),
+            error_message=None if price_data else "All providers failed",
+        )
+
+    def _create_provider_semaphores(self) -> Dict[DataSourceType, asyncio.Semaphore]:
+        """Create per-provider concurrency limits for one batch (bound to the running loop)"""
+        semaphores = {}
+        for source_type, config in self._provider_configs.items():
+            limit = self.max_concurrency_per_provider
+            if config.credentials is not None and config.credentials.rate_limit_calls > 0:
+                limit = min(limit, config.credentials.rate_limit_calls)
+            semaphores[source_type] = asyncio.Semaphore(max(1, limit))
+        return semaphores
     
-    async def _fetch_price_from_providers(self, ticker: str) -> Optional[PriceData]:
+    async def _fetch_price_from_providers(
+        self,
+        ticker: str,
+        semaphores: Optional[Dict[DataSourceType, asyncio.Semaphore]] = None,
+    ) -> Optional[PriceData]:
         """
         Fetch price data from providers in priority order with fallback logic
+
+        Provider calls are blocking, so they run on the service thread pool to keep
+        the event loop free for other tickers.
         
         Args:
             ticker: Stock ticker symbol
+            semaphores: Optional per-provider concurrency limits
             
         Returns:
             PriceData object or None if all providers fail
         """
+        loop = asyncio.get_running_loop()
+
         # Sort providers by priority
         sorted_providers = sorted(
             self._providers.items(),
@@ -324,8 +455,12 @@ class RealTimePriceService:
                     force_refresh=True
                 )
                 
-                # Fetch data from provider
-                response = provider.fetch_data(request)
+                # Fetch data from provider without blocking the event loop
+                limit = semaphores.get(source_type) if semaphores else None
+                async with limit if limit is not None else nullcontext():
+                    response = await loop.run_in_executor(
+                        self._executor, provider.fetch_data, request
+                    )
                 
                 if response.success and response.data:
                     # Convert provider response to PriceData
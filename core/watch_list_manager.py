@@ -8,6 +8,11 @@ DCF analysis results across multiple companies and time periods.
 import json
 import sqlite3
 import logging
+import itertools
+import os
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Union
@@ -29,18 +34,237 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# SQLite connection settings
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# Seconds between a mutation and the background refresh of the watch_lists.json mirror
+JSON_EXPORT_INTERVAL_SECONDS = 30.0
+
+# Statements shared across methods so the per-connection statement cache reuses them
+_SELECT_WATCH_LIST_ID_SQL = 'SELECT id FROM watch_lists WHERE name = ?'
+_TOUCH_WATCH_LIST_SQL = 'UPDATE watch_lists SET updated_date = ? WHERE id = ?'
+_INSERT_ANALYSIS_SQL = '''
+    INSERT INTO analysis_records
+    (watch_list_id, ticker, company_name, analysis_date, current_price,
+     fair_value, discount_rate, terminal_growth_rate, upside_downside_pct,
+     fcf_type, dcf_assumptions, analysis_metadata, pb_ratio, book_value_per_share,
+     pb_industry_median, pb_valuation_fair, pb_analysis_data, analysis_type)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+# Stock fields returned by get_watch_list / get_stock_analysis_history, in column order
+STOCK_COLUMNS = (
+    'ticker',
+    'company_name',
+    'analysis_date',
+    'current_price',
+    'fair_value',
+    'discount_rate',
+    'terminal_growth_rate',
+    'upside_downside_pct',
+    'fcf_type',
+    'dcf_assumptions',
+    'analysis_metadata',
+    'analysis_type',
+)
+# Columns stored as JSON text and decoded on read
+JSON_STOCK_COLUMNS = frozenset({'dcf_assumptions', 'analysis_metadata'})
+
+
+# Connection owned by one thread; collected with the thread's local storage when it exits
+class _ThreadConnection:
+    __slots__ = ('conn', 'release', '__weakref__')
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.release = None
+
+
+def _release_connection(
+    connections: Dict[int, sqlite3.Connection],
+    lock: threading.Lock,
+    key: int,
+    conn: sqlite3.Connection,
+):
+    """Forget a thread's connection and close it"""
+    with lock:
+        connections.pop(key, None)
+    try:
+        conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Error closing watch list database connection: {e}")
+
+
+def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: List[Tuple[str, str]]):
+    """Add columns that an older database file does not have yet"""
+    cursor.execute(f'PRAGMA table_info({table})')
+    existing = {row[1] for row in cursor.fetchall()}
+    for column, declaration in columns:
+        if column not in existing:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {declaration}')
+
+
+def _migrate_v1_base_schema(cursor: sqlite3.Cursor):
+    """Create the watch_lists and analysis_records tables"""
+    cursor.execute(
+        '''
+    CREATE TABLE IF NOT EXISTS watch_lists (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        description TEXT,
+        created_date TEXT NOT NULL,
+        updated_date TEXT NOT NULL
+    )
+    '''
+    )
+    cursor.execute(
+        '''
+    CREATE TABLE IF NOT EXISTS analysis_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        watch_list_id INTEGER,
+        ticker TEXT NOT NULL,
+        company_name TEXT,
+        analysis_date TEXT NOT NULL,
+        current_price REAL,
+        fair_value REAL,
+        discount_rate REAL,
+        terminal_growth_rate REAL,
+        upside_downside_pct REAL,
+        fcf_type TEXT,
+        dcf_assumptions TEXT,
+        analysis_metadata TEXT,
+        FOREIGN KEY (watch_list_id) REFERENCES watch_lists (id)
+    )
+    '''
+    )
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ticker ON analysis_records (ticker)')
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_analysis_date ON analysis_records (analysis_date)'
+    )
+
+
+def _migrate_v2_pb_columns(cursor: sqlite3.Cursor):
+    """Add the P/B analysis columns and analysis_type"""
+    _add_missing_columns(
+        cursor,
+        'analysis_records',
+        [
+            ('pb_ratio', 'REAL'),
+            ('book_value_per_share', 'REAL'),
+            ('pb_industry_median', 'REAL'),
+            ('pb_valuation_fair', 'REAL'),
+            ('pb_analysis_data', 'TEXT'),
+            ('analysis_type', 'TEXT DEFAULT "DCF"'),
+        ],
+    )
+
+
+def _migrate_v3_latest_analysis(cursor: sqlite3.Cursor):
+    """
+    Add the (watch_list_id, ticker, analysis_date) index and the latest_analysis table
+
+    latest_analysis holds the newest record per ticker in each watch list and is
+    maintained by triggers, so latest-only reads no longer aggregate the full history.
+    """
+    cursor.execute(
+        '''
+    CREATE INDEX IF NOT EXISTS idx_records_list_ticker_date
+    ON analysis_records (watch_list_id, ticker, analysis_date)
+    '''
+    )
+    cursor.execute(
+        '''
+    CREATE TABLE IF NOT EXISTS latest_analysis (
+        watch_list_id INTEGER NOT NULL,
+        ticker TEXT NOT NULL,
+        record_id INTEGER NOT NULL,
+        analysis_date TEXT NOT NULL,
+        PRIMARY KEY (watch_list_id, ticker)
+    )
+    '''
+    )
+    cursor.execute(
+        '''
+    CREATE TRIGGER IF NOT EXISTS trg_latest_analysis_insert
+    AFTER INSERT ON analysis_records
+    BEGIN
+        INSERT INTO latest_analysis (watch_list_id, ticker, record_id, analysis_date)
+        VALUES (NEW.watch_list_id, NEW.ticker, NEW.id, NEW.analysis_date)
+        ON CONFLICT (watch_list_id, ticker) DO UPDATE
+        SET record_id = excluded.record_id, analysis_date = excluded.analysis_date
+        WHERE excluded.analysis_date >= latest_analysis.analysis_date;
+    END
+    '''
+    )
+    # Only removing the current latest record needs a lookup of the next newest one
+    cursor.execute(
+        '''
+    CREATE TRIGGER IF NOT EXISTS trg_latest_analysis_delete
+    AFTER DELETE ON analysis_records
+    WHEN EXISTS (
+        SELECT 1 FROM latest_analysis
+        WHERE watch_list_id = OLD.watch_list_id AND ticker = OLD.ticker AND record_id = OLD.id
+    )
+    BEGIN
+        DELETE FROM latest_analysis
+        WHERE watch_list_id = OLD.watch_list_id AND ticker = OLD.ticker;
+        INSERT INTO latest_analysis (watch_list_id, ticker, record_id, analysis_date)
+        SELECT watch_list_id, ticker, id, analysis_date
+        FROM analysis_records
+        WHERE watch_list_id = OLD.watch_list_id AND ticker = OLD.ticker
+        ORDER BY analysis_date DESC, id DESC
+        LIMIT 1;
+    END
+    '''
+    )
+
+    # Backfill from existing history, preferring the last inserted record on date ties
+    cursor.execute('DELETE FROM latest_analysis')
+    cursor.execute(
+        '''
+    INSERT INTO latest_analysis (watch_list_id, ticker, record_id, analysis_date)
+    SELECT watch_list_id, ticker, id, analysis_date
+    FROM (
+        SELECT watch_list_id, ticker, id, analysis_date,
+               ROW_NUMBER() OVER (
+                   PARTITION BY watch_list_id, ticker
+                   ORDER BY analysis_date DESC, id DESC
+               ) AS rank
+        FROM analysis_records
+        WHERE watch_list_id IS NOT NULL
+    )
+    WHERE rank = 1
+    '''
+    )
+
+
+# Ordered (version, migration) pairs; each runs once per database file
+_SCHEMA_MIGRATIONS = [
+    (1, _migrate_v1_base_schema),
+    (2, _migrate_v2_pb_columns),
+    (3, _migrate_v3_latest_analysis),
+]
+
 
 class WatchListManager:
     """
     Manages watch lists with analysis tracking capabilities
     """
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        json_export_interval: Optional[float] = JSON_EXPORT_INTERVAL_SECONDS,
+    ):
         """
         Initialize watch list manager
 
         Args:
             data_dir (str): Directory to store watch list data
+            json_export_interval (float): Seconds to batch mutations before the
+                watch_lists.json mirror is rewritten in the background. None
+                disables the automatic mirror; export_json() still works on demand.
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
@@ -48,6 +272,17 @@ class WatchListManager:
         self.db_file = self.data_dir / "watch_lists.db"
         self.preferences_file = self.data_dir / "user_preferences.json"
 
+        # One SQLite connection per live thread, opened lazily by _get_connection
+        self._local = threading.local()
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        self._connection_keys = itertools.count()
+
+        # Debounced JSON mirror; SQLite is the source of truth
+        self.json_export_interval = json_export_interval
+        self._json_export_timer: Optional[threading.Timer] = None
+        self._json_export_lock = threading.Lock()
+
         # Initialize storage
         self._init_json_storage()
         self._init_sqlite_storage()
@@ -73,7 +308,7 @@ class WatchListManager:
 
     def _init_json_storage(self):
         """Initialize JSON storage file if it doesn't exist"""
-        if not self.json_file.exists():
+        if self.json_export_interval is not None and not self.json_file.exists():
             initial_data = {
                 "watch_lists": {},
                 "metadata": {"created": datetime.now().isoformat(), "version": "1.0"},
@@ -82,86 +317,249 @@ class WatchListManager:
                 json.dump(initial_data, f, indent=2)
 
     def _init_sqlite_storage(self):
-        """Initialize SQLite database for watch lists"""
-        conn = sqlite3.connect(self.db_file)
+        """Initialize SQLite database for watch lists, running pending migrations once"""
+        conn = self._get_connection()
         cursor = conn.cursor()
-
-        # Create watch_lists table
         cursor.execute(
             '''
-        CREATE TABLE IF NOT EXISTS watch_lists (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            description TEXT,
-            created_date TEXT NOT NULL,
-            updated_date TEXT NOT NULL
-        )
-        '''
-        )
-
-        # Create analysis_records table
-        cursor.execute(
-            '''
-        CREATE TABLE IF NOT EXISTS analysis_records (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            watch_list_id INTEGER,
-            ticker TEXT NOT NULL,
-            company_name TEXT,
-            analysis_date TEXT NOT NULL,
-            current_price REAL,
-            fair_value REAL,
-            discount_rate REAL,
-            terminal_growth_rate REAL,
-            upside_downside_pct REAL,
-            fcf_type TEXT,
-            dcf_assumptions TEXT,
-            analysis_metadata TEXT,
-            pb_ratio REAL,
-            book_value_per_share REAL,
-            pb_industry_median REAL,
-            pb_valuation_fair REAL,
-            pb_analysis_data TEXT,
-            FOREIGN KEY (watch_list_id) REFERENCES watch_lists (id)
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            applied_date TEXT NOT NULL
         )
         '''
         )
+        conn.commit()
 
-        # Add P/B columns to existing tables if they don't exist
+        # BEGIN IMMEDIATE serializes managers that start up against the same file
+        cursor.execute('BEGIN IMMEDIATE')
         try:
-            cursor.execute('ALTER TABLE analysis_records ADD COLUMN pb_ratio REAL')
-        except:
-            pass  # Column already exists
-        try:
-            cursor.execute('ALTER TABLE analysis_records ADD COLUMN book_value_per_share REAL')
-        except:
-            pass  # Column already exists
-        try:
-            cursor.execute('ALTER TABLE analysis_records ADD COLUMN pb_industry_median REAL')
-        except:
-            pass  # Column already exists
-        try:
-            cursor.execute('ALTER TABLE analysis_records ADD COLUMN pb_valuation_fair REAL')
-        except:
-            pass  # Column already exists
+            cursor.execute('SELECT MAX(version) FROM schema_version')
+            current_version = cursor.fetchone()[0] or 0
+            for version, migration in _SCHEMA_MIGRATIONS:
+                if version <= current_version:
+                    continue
+                migration(cursor)
+                cursor.execute(
+                    'INSERT INTO schema_version (version, applied_date) VALUES (?, ?)',
+                    (version, datetime.now().isoformat()),
+                )
+                logger.info(f"Applied watch list schema migration v{version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the SQLite connection owned by the calling thread
+
+        Connections are opened once per thread in WAL mode and reused for the
+        lifetime of that thread, so statements stay in the connection's
+        prepared statement cache. A connection is closed when its thread exits.
+        """
+        holder = getattr(self._local, 'connection', None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.db_file,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+                check_same_thread=False,
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            holder = _ThreadConnection(conn)
+            key = next(self._connection_keys)
+            with self._connections_lock:
+                self._connections[key] = conn
+            holder.release = weakref.finalize(
+                holder, _release_connection, self._connections, self._connections_lock, key, conn
+            )
+            self._local.connection = holder
+        return holder.conn
+
+    def _close_thread_connection(self):
+        """Close the calling thread's connection, if it has one"""
+        holder = getattr(self._local, 'connection', None)
+        if holder is not None:
+            del self._local.connection
+            holder.release()
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a cursor on the thread's connection, committing on success"""
+        conn = self._get_connection()
+        with conn:
+            yield conn.cursor()
+
+    def close(self):
+        """
+        Flush any pending JSON export and close the calling thread's connection
+
+        Connections opened by other threads stay usable until those threads exit.
+        """
+        with self._json_export_lock:
+            timer, self._json_export_timer = self._json_export_timer, None
+        if timer is not None:
+            timer.cancel()
+            self.export_json()
+
+        self._close_thread_connection()
+
+    def _schedule_json_export(self):
+        """Arrange for the JSON mirror to be rewritten once the export interval passes"""
+        if self.json_export_interval is None:
+            return
+        with self._json_export_lock:
+            if self._json_export_timer is not None:
+                return
+            timer = threading.Timer(self.json_export_interval, self._run_scheduled_json_export)
+            timer.daemon = True
+            self._json_export_timer = timer
+        timer.start()
+
+    def _run_scheduled_json_export(self):
+        """
+        Timer callback: clear the pending marker and write the snapshot
+
+        Each timer runs on a fresh thread, so the connection it opens is closed
+        as soon as the snapshot is written.
+        """
+        with self._json_export_lock:
+            self._json_export_timer = None
         try:
-            cursor.execute('ALTER TABLE analysis_records ADD COLUMN pb_analysis_data TEXT')
-        except:
-            pass  # Column already exists
+            self.export_json()
+        finally:
+            self._close_thread_connection()
+
+    def export_json(self, output_file: Optional[Union[str, Path]] = None) -> Optional[str]:
+        """
+        Write a snapshot of every watch list and its latest analyses to JSON
+
+        Args:
+            output_file (str): Destination file (default: watch_lists.json in the data directory)
+
+        Returns:
+            str: Path to the written file or None if failed
+        """
+        output_path = Path(output_file) if output_file is not None else self.json_file
         try:
-            cursor.execute(
-                'ALTER TABLE analysis_records ADD COLUMN analysis_type TEXT DEFAULT "DCF"'
-            )
-        except:
-            pass  # Column already exists
+            data = {
+                "watch_lists": {},
+                "metadata": {"exported": datetime.now().isoformat(), "version": "1.0"},
+            }
+            for summary in self.list_watch_lists():
+                watch_list = self.get_watch_list(summary["name"])
+                if watch_list is None:
+                    continue
+                data["watch_lists"][summary["name"]] = {
+                    "description": watch_list["description"],
+                    "created_date": watch_list["created_date"],
+                    "updated_date": watch_list["updated_date"],
+                    "stocks": watch_list["stocks"],
+                }
 
-        # Create index for faster queries
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ticker ON analysis_records (ticker)')
-        cursor.execute(
-            'CREATE INDEX IF NOT EXISTS idx_analysis_date ON analysis_records (analysis_date)'
-        )
+            temp_path = output_path.with_name(output_path.name + '.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, output_path)
 
-        conn.commit()
-        conn.close()
+            logger.debug(f"Exported {len(data['watch_lists'])} watch lists to {output_path}")
+            return str(output_path)
+
+        except Exception as e:
+            logger.error(f"Error exporting watch lists to JSON: {e}")
+            return None
+
+    def _get_watch_list_id(self, cursor: sqlite3.Cursor, name: str) -> Optional[int]:
+        """Look up a watch list's row id by name"""
+        cursor.execute(_SELECT_WATCH_LIST_ID_SQL, (name,))
+        result = cursor.fetchone()
+        return result[0] if result else None
+
+    @staticmethod
+    def _resolve_stock_columns(columns: Optional[List[str]]) -> Tuple[str, ...]:
+        """Validate a column projection, always keeping ticker first"""
+        if columns is None:
+            return STOCK_COLUMNS
+        unknown = set(columns) - set(STOCK_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown watch list columns: {sorted(unknown)}")
+        return ('ticker',) + tuple(c for c in STOCK_COLUMNS if c in columns and c != 'ticker')
+
+    @staticmethod
+    def _stock_from_row(columns: Tuple[str, ...], record: Tuple) -> Dict:
+        """Build a stock dict from a projected row, decoding JSON columns"""
+        stock_data = dict(zip(columns, record))
+        for column in JSON_STOCK_COLUMNS.intersection(stock_data):
+            value = stock_data[column]
+            stock_data[column] = json.loads(value) if value else {}
+        return stock_data
+
+    @staticmethod
+    def _build_analysis_row(watch_list_id: int, analysis_data: Dict) -> Tuple:
+        """Convert an analysis result dict into an analysis_records row"""
+        ticker = analysis_data.get('ticker', 'UNKNOWN')
+        company_name = analysis_data.get('company_name', '')
+        analysis_date = datetime.now().isoformat()
+        current_price = analysis_data.get('current_price', 0.0)
+        fair_value = analysis_data.get('fair_value', 0.0)
+        discount_rate = analysis_data.get('discount_rate', 0.0)
+        terminal_growth_rate = analysis_data.get('terminal_growth_rate', 0.0)
+
+        # Calculate upside/downside percentage
+        if current_price and fair_value:
+            upside_downside_pct = ((fair_value - current_price) / current_price) * 100
+        else:
+            upside_downside_pct = 0.0
+
+        fcf_type = analysis_data.get('fcf_type', 'FCFE')
+        dcf_assumptions = json.dumps(analysis_data.get('dcf_assumptions', {}))
+        analysis_metadata = json.dumps(analysis_data.get('metadata', {}))
+        analysis_type = analysis_data.get('analysis_type', 'DCF')
+
+        # Extract P/B analysis data if available
+        pb_data = analysis_data.get('pb_analysis', {})
+        pb_ratio = None
+        book_value_per_share = None
+        pb_industry_median = None
+        pb_valuation_fair = None
+        pb_analysis_data = None
+
+        if pb_data:
+            current_data = pb_data.get('current_data', {})
+            pb_ratio = current_data.get('pb_ratio')
+            book_value_per_share = current_data.get('book_value_per_share')
+
+            industry_comp = pb_data.get('industry_comparison', {})
+            benchmarks = industry_comp.get('benchmarks', {})
+            pb_industry_median = benchmarks.get('median')
+
+            valuation_analysis = pb_data.get('valuation_analysis', {})
+            valuation_ranges = valuation_analysis.get('valuation_ranges', {})
+            pb_valuation_fair = valuation_ranges.get('fair_value')
+
+            pb_analysis_data = json.dumps(pb_data)
+
+        return (
+            watch_list_id,
+            ticker,
+            company_name,
+            analysis_date,
+            current_price,
+            fair_value,
+            discount_rate,
+            terminal_growth_rate,
+            upside_downside_pct,
+            fcf_type,
+            dcf_assumptions,
+            analysis_metadata,
+            pb_ratio,
+            book_value_per_share,
+            pb_industry_median,
+            pb_valuation_fair,
+            pb_analysis_data,
+            analysis_type,
+        )
 
     def create_watch_list(self, name: str, description: str = "") -> bool:
         """
@@ -175,41 +573,22 @@ class WatchListManager:
             bool: True if created successfully, False if name already exists
         """
         try:
-            # Check if name already exists
-            if self.get_watch_list(name):
-                logger.warning(f"Watch list '{name}' already exists")
-                return False
-
-            # Add to SQLite
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
-
             current_time = datetime.now().isoformat()
-            cursor.execute(
-                '''
-            INSERT INTO watch_lists (name, description, created_date, updated_date)
-            VALUES (?, ?, ?, ?)
-            ''',
-                (name, description, current_time, current_time),
-            )
-
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                # Check if name already exists
+                if self._get_watch_list_id(cursor, name) is not None:
+                    logger.warning(f"Watch list '{name}' already exists")
+                    return False
 
-            # Add to JSON as backup
-            with open(self.json_file, 'r') as f:
-                data = json.load(f)
-
-            data["watch_lists"][name] = {
-                "description": description,
-                "created_date": current_time,
-                "updated_date": current_time,
-                "stocks": [],
-            }
-
-            with open(self.json_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                cursor.execute(
+                    '''
+                INSERT INTO watch_lists (name, description, created_date, updated_date)
+                VALUES (?, ?, ?, ?)
+                ''',
+                    (name, description, current_time, current_time),
+                )
 
+            self._schedule_json_export()
             logger.info(f"Created watch list: {name}")
             return True
 
@@ -217,20 +596,26 @@ class WatchListManager:
             logger.error(f"Error creating watch list '{name}': {e}")
             return False
 
-    def get_watch_list(self, name: str, latest_only: bool = True) -> Optional[Dict]:
+    def get_watch_list(
+        self, name: str, latest_only: bool = True, columns: Optional[List[str]] = None
+    ) -> Optional[Dict]:
         """
         Get watch list by name
 
         Args:
             name (str): Watch list name
             latest_only (bool): If True, returns only latest analysis per ticker
+            columns (list): Stock fields to return (see STOCK_COLUMNS; ticker is
+                always included). JSON columns are only decoded when requested,
+                so numeric-only views skip that cost. Default returns all fields.
 
         Returns:
             dict: Watch list data or None if not found
         """
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            stock_columns = self._resolve_stock_columns(columns)
+            select_list = ', '.join(f'ar.{column}' for column in stock_columns)
+            cursor = self._get_connection().cursor()
 
             cursor.execute('SELECT * FROM watch_lists WHERE name = ?', (name,))
             result = cursor.fetchone()
@@ -239,59 +624,32 @@ class WatchListManager:
                 watch_list_id, name, description, created_date, updated_date = result
 
                 if latest_only:
-                    # Get only the latest analysis for each ticker
+                    # Latest record per ticker, maintained by the latest_analysis triggers
                     cursor.execute(
-                        '''
-                    SELECT ar.ticker, ar.company_name, ar.analysis_date, ar.current_price, ar.fair_value,
-                           ar.discount_rate, ar.terminal_growth_rate, ar.upside_downside_pct, ar.fcf_type,
-                           ar.dcf_assumptions, ar.analysis_metadata, ar.analysis_type
-                    FROM analysis_records ar
-                    INNER JOIN (
-                        SELECT ticker, MAX(analysis_date) as latest_date
-                        FROM analysis_records 
-                        WHERE watch_list_id = ?
-                        GROUP BY ticker
-                    ) latest ON ar.ticker = latest.ticker AND ar.analysis_date = latest.latest_date
-                    WHERE ar.watch_list_id = ?
-                    ORDER BY ar.analysis_date DESC
+                        f'''
+                    SELECT {select_list}
+                    FROM latest_analysis la
+                    INNER JOIN analysis_records ar ON ar.id = la.record_id
+                    WHERE la.watch_list_id = ?
+                    ORDER BY la.analysis_date DESC
                     ''',
-                        (watch_list_id, watch_list_id),
+                        (watch_list_id,),
                     )
                 else:
                     # Get all analysis records
                     cursor.execute(
-                        '''
-                    SELECT ticker, company_name, analysis_date, current_price, fair_value,
-                           discount_rate, terminal_growth_rate, upside_downside_pct, fcf_type,
-                           dcf_assumptions, analysis_metadata, analysis_type
-                    FROM analysis_records 
-                    WHERE watch_list_id = ?
-                    ORDER BY analysis_date DESC
+                        f'''
+                    SELECT {select_list}
+                    FROM analysis_records ar
+                    WHERE ar.watch_list_id = ?
+                    ORDER BY ar.analysis_date DESC
                     ''',
                         (watch_list_id,),
                     )
 
-                records = cursor.fetchall()
-                stocks = []
-
-                for record in records:
-                    stock_data = {
-                        "ticker": record[0],
-                        "company_name": record[1],
-                        "analysis_date": record[2],
-                        "current_price": record[3],
-                        "fair_value": record[4],
-                        "discount_rate": record[5],
-                        "terminal_growth_rate": record[6],
-                        "upside_downside_pct": record[7],
-                        "fcf_type": record[8],
-                        "dcf_assumptions": json.loads(record[9]) if record[9] else {},
-                        "analysis_metadata": json.loads(record[10]) if record[10] else {},
-                        "analysis_type": record[11] if len(record) > 11 else "DCF",
-                    }
-                    stocks.append(stock_data)
-
-                conn.close()
+                stocks = [
+                    self._stock_from_row(stock_columns, record) for record in cursor.fetchall()
+                ]
 
                 return {
                     "name": name,
@@ -302,7 +660,6 @@ class WatchListManager:
                     "latest_only": latest_only,
                 }
 
-            conn.close()
             return None
 
         except Exception as e:
@@ -317,8 +674,7 @@ class WatchListManager:
             list: List of watch list summaries
         """
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
 
             cursor.execute(
                 '''
@@ -332,7 +688,6 @@ class WatchListManager:
             )
 
             results = cursor.fetchall()
-            conn.close()
 
             watch_lists = []
             for result in results:
@@ -389,112 +744,60 @@ class WatchListManager:
             bool: True if added successfully
         """
         try:
-            # Get watch list ID
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            with self._transaction() as cursor:
+                watch_list_id = self._get_watch_list_id(cursor, watch_list_name)
+                if watch_list_id is None:
+                    logger.error(f"Watch list '{watch_list_name}' not found")
+                    return False
 
-            cursor.execute('SELECT id FROM watch_lists WHERE name = ?', (watch_list_name,))
-            result = cursor.fetchone()
+                row = self._build_analysis_row(watch_list_id, analysis_data)
+                cursor.execute(_INSERT_ANALYSIS_SQL, row)
 
-            if not result:
-                logger.error(f"Watch list '{watch_list_name}' not found")
-                conn.close()
-                return False
-
-            watch_list_id = result[0]
-
-            # Prepare analysis data
-            ticker = analysis_data.get('ticker', 'UNKNOWN')
-            company_name = analysis_data.get('company_name', '')
-            analysis_date = datetime.now().isoformat()
-            current_price = analysis_data.get('current_price', 0.0)
-            fair_value = analysis_data.get('fair_value', 0.0)
-            discount_rate = analysis_data.get('discount_rate', 0.0)
-            terminal_growth_rate = analysis_data.get('terminal_growth_rate', 0.0)
-
-            # Calculate upside/downside percentage
-            if current_price and fair_value:
-                upside_downside_pct = ((fair_value - current_price) / current_price) * 100
-            else:
-                upside_downside_pct = 0.0
-
-            fcf_type = analysis_data.get('fcf_type', 'FCFE')
-            dcf_assumptions = json.dumps(analysis_data.get('dcf_assumptions', {}))
-            analysis_metadata = json.dumps(analysis_data.get('metadata', {}))
-            analysis_type = analysis_data.get('analysis_type', 'DCF')
+                # Update watch list updated_date
+                cursor.execute(_TOUCH_WATCH_LIST_SQL, (row[3], watch_list_id))
 
-            # Extract P/B analysis data if available
-            pb_data = analysis_data.get('pb_analysis', {})
-            pb_ratio = None
-            book_value_per_share = None
-            pb_industry_median = None
-            pb_valuation_fair = None
-            pb_analysis_data = None
+            self._schedule_json_export()
+            logger.info(f"Added analysis for {row[1]} to watch list '{watch_list_name}'")
+            return True
 
-            if pb_data:
-                current_data = pb_data.get('current_data', {})
-                pb_ratio = current_data.get('pb_ratio')
-                book_value_per_share = current_data.get('book_value_per_share')
+        except Exception as e:
+            logger.error(f"Error adding analysis to watch list '{watch_list_name}': {e}")
+            return False
 
-                industry_comp = pb_data.get('industry_comparison', {})
-                benchmarks = industry_comp.get('benchmarks', {})
-                pb_industry_median = benchmarks.get('median')
+    def add_analyses_to_watch_list(self, watch_list_name: str, analyses: List[Dict]) -> int:
+        """
+        Add a batch of analysis results to a watch list in a single transaction
 
-                valuation_analysis = pb_data.get('valuation_analysis', {})
-                valuation_ranges = valuation_analysis.get('valuation_ranges', {})
-                pb_valuation_fair = valuation_ranges.get('fair_value')
+        Either every record is stored or, on error, none are.
 
-                pb_analysis_data = json.dumps(pb_data)
+        Args:
+            watch_list_name (str): Watch list name
+            analyses (list): Analysis data dicts, as accepted by add_analysis_to_watch_list
 
-            # Insert analysis record
-            cursor.execute(
-                '''
-            INSERT INTO analysis_records 
-            (watch_list_id, ticker, company_name, analysis_date, current_price, 
-             fair_value, discount_rate, terminal_growth_rate, upside_downside_pct, 
-             fcf_type, dcf_assumptions, analysis_metadata, pb_ratio, book_value_per_share,
-             pb_industry_median, pb_valuation_fair, pb_analysis_data, analysis_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''',
-                (
-                    watch_list_id,
-                    ticker,
-                    company_name,
-                    analysis_date,
-                    current_price,
-                    fair_value,
-                    discount_rate,
-                    terminal_growth_rate,
-                    upside_downside_pct,
-                    fcf_type,
-                    dcf_assumptions,
-                    analysis_metadata,
-                    pb_ratio,
-                    book_value_per_share,
-                    pb_industry_median,
-                    pb_valuation_fair,
-                    pb_analysis_data,
-                    analysis_type,
-                ),
-            )
+        Returns:
+            int: Number of analyses added (0 if the watch list is missing or the batch failed)
+        """
+        try:
+            with self._transaction() as cursor:
+                watch_list_id = self._get_watch_list_id(cursor, watch_list_name)
+                if watch_list_id is None:
+                    logger.error(f"Watch list '{watch_list_name}' not found")
+                    return 0
 
-            # Update watch list updated_date
-            cursor.execute(
-                '''
-            UPDATE watch_lists SET updated_date = ? WHERE id = ?
-            ''',
-                (analysis_date, watch_list_id),
-            )
+                rows = [self._build_analysis_row(watch_list_id, data) for data in analyses]
+                if not rows:
+                    return 0
 
-            conn.commit()
-            conn.close()
+                cursor.executemany(_INSERT_ANALYSIS_SQL, rows)
+                cursor.execute(_TOUCH_WATCH_LIST_SQL, (rows[-1][3], watch_list_id))
 
-            logger.info(f"Added analysis for {ticker} to watch list '{watch_list_name}'")
-            return True
+            self._schedule_json_export()
+            logger.info(f"Added {len(rows)} analyses to watch list '{watch_list_name}'")
+            return len(rows)
 
         except Exception as e:
-            logger.error(f"Error adding analysis to watch list '{watch_list_name}': {e}")
-            return False
+            logger.error(f"Error adding analyses to watch list '{watch_list_name}': {e}")
+            return 0
 
     def remove_stock_from_watch_list(self, watch_list_name: str, ticker: str) -> bool:
         """
@@ -508,40 +811,31 @@ class WatchListManager:
             bool: True if removed successfully
         """
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
-
-            # Get watch list ID
-            cursor.execute('SELECT id FROM watch_lists WHERE name = ?', (watch_list_name,))
-            result = cursor.fetchone()
-
-            if not result:
-                logger.error(f"Watch list '{watch_list_name}' not found")
-                conn.close()
-                return False
+            with self._transaction() as cursor:
+                watch_list_id = self._get_watch_list_id(cursor, watch_list_name)
+                if watch_list_id is None:
+                    logger.error(f"Watch list '{watch_list_name}' not found")
+                    return False
 
-            watch_list_id = result[0]
-
-            # Remove analysis records
-            cursor.execute(
-                '''
-            DELETE FROM analysis_records 
-            WHERE watch_list_id = ? AND ticker = ?
-            ''',
-                (watch_list_id, ticker),
-            )
+                # Drop the latest pointer first so the delete trigger has nothing to repair
+                cursor.execute(
+                    'DELETE FROM latest_analysis WHERE watch_list_id = ? AND ticker = ?',
+                    (watch_list_id, ticker),
+                )
 
-            # Update watch list updated_date
-            cursor.execute(
-                '''
-            UPDATE watch_lists SET updated_date = ? WHERE id = ?
-            ''',
-                (datetime.now().isoformat(), watch_list_id),
-            )
+                # Remove analysis records
+                cursor.execute(
+                    '''
+                DELETE FROM analysis_records 
+                WHERE watch_list_id = ? AND ticker = ?
+                ''',
+                    (watch_list_id, ticker),
+                )
 
-            conn.commit()
-            conn.close()
+                # Update watch list updated_date
+                cursor.execute(_TOUCH_WATCH_LIST_SQL, (datetime.now().isoformat(), watch_list_id))
 
+            self._schedule_json_export()
             logger.info(f"Removed {ticker} from watch list '{watch_list_name}'")
             return True
 
@@ -560,42 +854,24 @@ class WatchListManager:
             bool: True if deleted successfully
         """
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            with self._transaction() as cursor:
+                watch_list_id = self._get_watch_list_id(cursor, name)
+                if watch_list_id is None:
+                    logger.warning(f"Watch list '{name}' not found")
+                    return False
 
-            # Get watch list ID
-            cursor.execute('SELECT id FROM watch_lists WHERE name = ?', (name,))
-            result = cursor.fetchone()
-
-            if not result:
-                logger.warning(f"Watch list '{name}' not found")
-                conn.close()
-                return False
-
-            watch_list_id = result[0]
-
-            # Delete analysis records first (foreign key constraint)
-            cursor.execute('DELETE FROM analysis_records WHERE watch_list_id = ?', (watch_list_id,))
-
-            # Delete watch list
-            cursor.execute('DELETE FROM watch_lists WHERE id = ?', (watch_list_id,))
-
-            conn.commit()
-            conn.close()
-
-            # Remove from JSON backup
-            try:
-                with open(self.json_file, 'r') as f:
-                    data = json.load(f)
-
-                if name in data["watch_lists"]:
-                    del data["watch_lists"][name]
+                # Delete analysis records first (foreign key constraint)
+                cursor.execute(
+                    'DELETE FROM latest_analysis WHERE watch_list_id = ?', (watch_list_id,)
+                )
+                cursor.execute(
+                    'DELETE FROM analysis_records WHERE watch_list_id = ?', (watch_list_id,)
+                )
 
-                    with open(self.json_file, 'w') as f:
-                        json.dump(data, f, indent=2)
-            except Exception as e:
-                logger.warning(f"Could not update JSON backup: {e}")
+                # Delete watch list
+                cursor.execute('DELETE FROM watch_lists WHERE id = ?', (watch_list_id,))
 
+            self._schedule_json_export()
             logger.info(f"Deleted watch list: {name}")
             return True
 
@@ -617,7 +893,19 @@ class WatchListManager:
             str: Path to exported file or None if failed
         """
         try:
-            watch_list = self.get_watch_list(watch_list_name)
+            watch_list = self.get_watch_list(
+                watch_list_name,
+                columns=[
+                    'company_name',
+                    'analysis_date',
+                    'current_price',
+                    'fair_value',
+                    'upside_downside_pct',
+                    'discount_rate',
+                    'terminal_growth_rate',
+                    'fcf_type',
+                ],
+            )
             if not watch_list:
                 logger.error(f"Watch list '{watch_list_name}' not found")
                 return None
@@ -683,7 +971,7 @@ class WatchListManager:
             dict: Performance summary statistics
         """
         try:
-            watch_list = self.get_watch_list(watch_list_name)
+            watch_list = self.get_watch_list(watch_list_name, columns=['upside_downside_pct'])
             if not watch_list or not watch_list['stocks']:
                 return None
 
@@ -726,27 +1014,19 @@ class WatchListManager:
             dict: Historical analysis data
         """
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
 
-            # Get watch list ID
-            cursor.execute('SELECT id FROM watch_lists WHERE name = ?', (watch_list_name,))
-            result = cursor.fetchone()
-
-            if not result:
+            watch_list_id = self._get_watch_list_id(cursor, watch_list_name)
+            if watch_list_id is None:
                 logger.error(f"Watch list '{watch_list_name}' not found")
-                conn.close()
                 return None
 
-            watch_list_id = result[0]
-
             # Build query based on whether ticker is specified
+            select_list = ', '.join(STOCK_COLUMNS)
             if ticker:
                 cursor.execute(
-                    '''
-                SELECT ticker, company_name, analysis_date, current_price, fair_value,
-                       discount_rate, terminal_growth_rate, upside_downside_pct, fcf_type,
-                       dcf_assumptions, analysis_metadata, analysis_type
+                    f'''
+                SELECT {select_list}
                 FROM analysis_records 
                 WHERE watch_list_id = ? AND ticker = ?
                 ORDER BY analysis_date DESC
@@ -755,10 +1035,8 @@ class WatchListManager:
                 )
             else:
                 cursor.execute(
-                    '''
-                SELECT ticker, company_name, analysis_date, current_price, fair_value,
-                       discount_rate, terminal_growth_rate, upside_downside_pct, fcf_type,
-                       dcf_assumptions, analysis_metadata, analysis_type
+                    f'''
+                SELECT {select_list}
                 FROM analysis_records 
                 WHERE watch_list_id = ?
                 ORDER BY ticker, analysis_date DESC
@@ -767,29 +1045,12 @@ class WatchListManager:
                 )
 
             records = cursor.fetchall()
-            conn.close()
 
             if not records:
                 return {'watch_list_name': watch_list_name, 'ticker': ticker, 'history': []}
 
             # Organize data
-            history = []
-            for record in records:
-                history_item = {
-                    "ticker": record[0],
-                    "company_name": record[1],
-                    "analysis_date": record[2],
-                    "current_price": record[3],
-                    "fair_value": record[4],
-                    "discount_rate": record[5],
-                    "terminal_growth_rate": record[6],
-                    "upside_downside_pct": record[7],
-                    "fcf_type": record[8],
-                    "dcf_assumptions": json.loads(record[9]) if record[9] else {},
-                    "analysis_metadata": json.loads(record[10]) if record[10] else {},
-                    "analysis_type": record[11] if len(record) > 11 else "DCF",
-                }
-                history.append(history_item)
+            history = [self._stock_from_row(STOCK_COLUMNS, record) for record in records]
 
             return {
                 'watch_list_name': watch_list_name,
@@ -905,29 +1166,18 @@ class WatchListManager:
                 logger.error(f"No data found for {ticker} in '{source_watch_list}'")
                 return False
 
-            # Get target watch list ID
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
-
-            cursor.execute('SELECT id FROM watch_lists WHERE name = ?', (target_watch_list,))
-            result = cursor.fetchone()
-
-            if not result:
-                logger.error(f"Target watch list '{target_watch_list}' not found")
-                conn.close()
-                return False
-
-            target_watch_list_id = result[0]
-
             # Determine which analyses to copy
             analyses_to_copy = source_history['history']
             if copy_latest_only:
                 analyses_to_copy = [source_history['history'][0]]  # Most recent first
 
-            # Copy each analysis
-            copied_count = 0
-            for analysis in analyses_to_copy:
-                cursor.execute(
+            with self._transaction() as cursor:
+                target_watch_list_id = self._get_watch_list_id(cursor, target_watch_list)
+                if target_watch_list_id is None:
+                    logger.error(f"Target watch list '{target_watch_list}' not found")
+                    return False
+
+                cursor.executemany(
                     '''
                 INSERT INTO analysis_records 
                 (watch_list_id, ticker, company_name, analysis_date, current_price, 
@@ -935,35 +1185,33 @@ class WatchListManager:
                  fcf_type, dcf_assumptions, analysis_metadata, analysis_type)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''',
-                    (
-                        target_watch_list_id,
-                        analysis['ticker'],
-                        analysis['company_name'],
-                        analysis['analysis_date'],
-                        analysis['current_price'],
-                        analysis['fair_value'],
-                        analysis['discount_rate'],
-                        analysis['terminal_growth_rate'],
-                        analysis['upside_downside_pct'],
-                        analysis['fcf_type'],
-                        json.dumps(analysis['dcf_assumptions']),
-                        json.dumps(analysis['analysis_metadata']),
-                        analysis.get('analysis_type', 'DCF'),
-                    ),
+                    [
+                        (
+                            target_watch_list_id,
+                            analysis['ticker'],
+                            analysis['company_name'],
+                            analysis['analysis_date'],
+                            analysis['current_price'],
+                            analysis['fair_value'],
+                            analysis['discount_rate'],
+                            analysis['terminal_growth_rate'],
+                            analysis['upside_downside_pct'],
+                            analysis['fcf_type'],
+                            json.dumps(analysis['dcf_assumptions']),
+                            json.dumps(analysis['analysis_metadata']),
+                            analysis.get('analysis_type', 'DCF'),
+                        )
+                        for analysis in analyses_to_copy
+                    ],
                 )
-                copied_count += 1
+                copied_count = len(analyses_to_copy)
 
-            # Update target watch list updated_date
-            cursor.execute(
-                '''
-            UPDATE watch_lists SET updated_date = ? WHERE id = ?
-            ''',
-                (datetime.now().isoformat(), target_watch_list_id),
-            )
-
-            conn.commit()
-            conn.close()
+                # Update target watch list updated_date
+                cursor.execute(
+                    _TOUCH_WATCH_LIST_SQL, (datetime.now().isoformat(), target_watch_list_id)
+                )
 
+            self._schedule_json_export()
             logger.info(
                 f"Copied {copied_count} analyses for {ticker} from '{source_watch_list}' to '{target_watch_list}'"
             )
@@ -986,8 +1234,7 @@ class WatchListManager:
             list: List of watch list info dictionaries
         """
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            cursor = self._get_connection().cursor()
 
             cursor.execute(
                 '''
@@ -1004,7 +1251,6 @@ class WatchListManager:
             )
 
             results = cursor.fetchall()
-            conn.close()
 
             watch_lists = []
             for result in results:
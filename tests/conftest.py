@@ -13,6 +13,8 @@ from unittest.mock import Mock, patch
 from openpyxl import Workbook, load_workbook
 import tempfile
 import shutil
+from datetime import datetime
+from functools import partial
 from typing import Dict, List, Any
 
 # Import fixtures from organized modules
@@ -102,6 +104,62 @@ def mock_config():
     return config
 
 
+
+@pytest.fixture
+def make_calculation_cache():
+    """Factory for CalculationCache instances whose startup sweep has finished"""
+    from core.data_processing.calculation_cache import CalculationCache
+
+    def make(cache_dir, **kwargs):
+        cache = CalculationCache(cache_dir=str(cache_dir), **kwargs)
+        cache._sweep_thread.join(timeout=5)
+        return cache
+
+    return make
+
+
+@pytest.fixture
+def make_uncompressed_cache(make_calculation_cache):
+    """CalculationCache factory with compression off, so entry sizes follow the pickled results"""
+    return partial(make_calculation_cache, enable_compression=False)
+
+
+@pytest.fixture
+def make_data_request():
+    """Factory for daily market data DataRequests"""
+    from core.data_processing.universal_data_registry import DataRequest
+
+    def make(symbol, **kwargs):
+        return DataRequest(data_type="market_data", symbol=symbol, period="daily", **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def make_data_response():
+    """Factory for DataResponses wrapping the given data"""
+    from core.data_processing.universal_data_registry import (
+        DataLineage,
+        DataResponse,
+        DataSourceType,
+    )
+
+    def make(data):
+        now = datetime.now()
+        return DataResponse(
+            data=data,
+            source=DataSourceType.EXCEL,
+            timestamp=now,
+            quality_score=1.0,
+            cache_hit=False,
+            lineage=DataLineage(
+                source_type=DataSourceType.EXCEL, source_details="test", timestamp=now
+            ),
+        )
+
+    return make
+
+
 # Pytest markers for test categorization
 def pytest_configure(config):
     """Configure pytest markers"""
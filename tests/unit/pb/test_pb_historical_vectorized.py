@@ -0,0 +1,166 @@
+"""
+Unit tests for the vectorized kernels in PBHistoricalAnalysisEngine.
+
+Tests cover:
+- Date-indexed frame built once: sorted, NaT for bad dates, NaN for missing ratios
+- FFT autocorrelation matching the direct per-lag definition
+- Sliding-window rolling mean/median/std over date-sorted valid ratios
+- Vectorized peak/trough cycle detection
+- Shared frame reuse across quality, summary and trend calculations
+- 20 years of daily P/B history analyzed without per-point date parsing
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.analysis.pb.pb_calculation_engine import PBDataPoint
+from core.analysis.pb.pb_historical_analysis import (
+    PBHistoricalAnalysisEngine,
+    PBHistoricalQualityMetrics,
+    _autocorrelation_function,
+    _build_pb_frame,
+)
+
+
+def make_points(n, freq='QS', seed=0, shuffle=True):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2004-01-01', periods=n, freq=freq)
+    ratios = 2.0 + 0.5 * np.sin(np.arange(n) / 20) + rng.normal(0, 0.05, n)
+    points = [
+        PBDataPoint(date=d.strftime('%Y-%m-%d'), pb_ratio=float(r), price=10.0,
+                    book_value_per_share=5.0, data_quality=0.9)
+        for d, r in zip(dates, ratios)
+    ]
+    if shuffle:
+        rng.shuffle(points)
+    return points
+
+
+def direct_autocorrelation(values, lag):
+    values = np.asarray(values, dtype=float)
+    mean = values.mean()
+    autocovariance = np.mean((values[lag:] - mean) * (values[:-lag] - mean))
+    return autocovariance / values.var()
+
+
+@pytest.fixture
+def engine():
+    return PBHistoricalAnalysisEngine()
+
+
+@pytest.fixture
+def quality_metrics():
+    metrics = PBHistoricalQualityMetrics()
+    metrics.overall_score = 0.8
+    return metrics
+
+
+class TestBuildPBFrame:
+    def test_sorted_with_missing_values(self):
+        points = [
+            PBDataPoint(date='2021-01-01', pb_ratio=2.0),
+            PBDataPoint(date='', pb_ratio=1.5),
+            PBDataPoint(date='2020-01-01', pb_ratio=None, data_quality=0.7),
+        ]
+
+        frame = _build_pb_frame(points)
+
+        assert frame.index[:2].tolist() == [pd.Timestamp('2020-01-01'), pd.Timestamp('2021-01-01')]
+        assert pd.isna(frame.index[2])
+        assert np.isnan(frame['pb_ratio'].iloc[0])
+        assert frame['data_quality'].iloc[0] == 0.7
+
+    def test_empty(self):
+        assert _build_pb_frame([]).empty
+
+
+class TestAutocorrelation:
+    @pytest.mark.parametrize('lag', [1, 2, 7, 50])
+    def test_matches_direct_definition(self, lag):
+        values = np.random.default_rng(1).normal(2.0, 0.3, 300)
+        acf = _autocorrelation_function(values, 60)
+        assert acf[0] == pytest.approx(1.0)
+        assert acf[lag] == pytest.approx(direct_autocorrelation(values, lag))
+
+    def test_constant_series(self, engine):
+        assert engine._calculate_autocorrelation([2.0] * 10, 1) == 0.0
+
+    def test_lag_beyond_series(self, engine):
+        assert engine._calculate_autocorrelation([1.0, 2.0], 2) == 0.0
+
+
+class TestRollingStats:
+    def test_windows_follow_date_order(self, engine):
+        points = make_points(12)
+        ordered = [p.pb_ratio for p in sorted(points, key=lambda p: p.date)]
+
+        rolling_mean = engine._calculate_rolling_stats(points, 'mean', 4)
+        rolling_median = engine._calculate_rolling_stats(points, 'median', 4)
+        rolling_std = engine._calculate_rolling_stats(points, 'std', 4)
+
+        expected = [ordered[i - 3:i + 1] for i in range(3, 12)]
+        assert rolling_mean == pytest.approx([np.mean(w) for w in expected])
+        assert rolling_median == pytest.approx([np.median(w) for w in expected])
+        assert rolling_std == pytest.approx([np.std(w) for w in expected])
+
+    def test_invalid_ratios_skipped(self, engine):
+        points = make_points(6, shuffle=False)
+        points[2].pb_ratio = -1.0
+        assert len(engine._calculate_rolling_stats(points, 'mean', 4)) == 2
+
+    def test_too_few_points(self, engine):
+        assert engine._calculate_rolling_stats(make_points(3), 'mean', 4) == []
+
+
+class TestCycleDetection:
+    def test_peaks_and_troughs(self, engine):
+        ratios = [1.0, 2.0, 1.0, 2.0, 1.0, 2.0, 1.0, 1.05]
+        cycles = engine._detect_cycles(ratios)
+
+        assert cycles['cycle_count'] == 2
+        assert cycles['avg_duration'] == pytest.approx(6.0)
+
+    def test_short_series(self, engine):
+        assert engine._detect_cycles([1.0, 2.0])['cycle_count'] == 0
+
+
+class TestSharedFrame:
+    def test_dates_parsed_once(self, engine, quality_metrics):
+        points = make_points(40)
+        response = Mock(quality_metrics=None)
+
+        with patch('core.analysis.pb.pb_historical_analysis._build_pb_frame',
+                   wraps=_build_pb_frame) as build:
+            frame = build(points)
+            engine._calculate_pb_quality_metrics(points, response, frame)
+            engine._calculate_statistical_summary(points, quality_metrics, frame)
+            engine._analyze_trends(points, frame)
+
+        assert build.call_count == 1
+
+    def test_quality_weights_fall_back_to_overall_score(self, engine, quality_metrics):
+        points = [
+            PBDataPoint(date='2020-01-01', pb_ratio=1.0, data_quality=0.0),
+            PBDataPoint(date='2020-04-01', pb_ratio=3.0, data_quality=None),
+        ]
+        summary = engine._calculate_statistical_summary(points, quality_metrics)
+        assert summary.quality_weighted_mean == pytest.approx(2.0)
+
+    def test_twenty_years_of_daily_history(self, engine, quality_metrics):
+        points = make_points(5200, freq='B')
+        response = Mock(quality_metrics=None)
+
+        start = time.perf_counter()
+        frame = _build_pb_frame(points)
+        engine._calculate_pb_quality_metrics(points, response, frame)
+        summary = engine._calculate_statistical_summary(points, quality_metrics, frame)
+        trend = engine._analyze_trends(points, frame)
+        elapsed = time.perf_counter() - start
+
+        assert len(summary.rolling_mean_12m) == 5200 - 3
+        assert trend.r_squared >= 0.0
+        assert elapsed < 1.0
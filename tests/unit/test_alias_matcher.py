@@ -0,0 +1,198 @@
+"""
+Unit tests for the compiled alias matcher.
+
+Tests cover:
+- Label normalization and tokenization
+- Exact name/alias lookups per source and category, earliest registration winning
+- Token-index partial matches with the legacy word-overlap threshold and deterministic ranking
+- FinancialVariableRegistry caching the compiled matcher and rebuilding it on registration
+- ExcelDataAdapter, YFinanceAdapter and FieldNormalizer resolving labels through the matcher
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from core.data_processing.financial_variable_registry import (
+    DataType,
+    FinancialVariableRegistry,
+    VariableCategory,
+    VariableDefinition,
+)
+from utils.alias_matcher import AliasMatcher, label_tokens, normalize_label
+
+INCOME = VariableCategory.INCOME_STATEMENT
+BALANCE = VariableCategory.BALANCE_SHEET
+
+
+def make_variable(name, category=INCOME, **aliases):
+    return VariableDefinition(name=name, category=category, data_type=DataType.CURRENCY, aliases=aliases)
+
+
+def make_registry(*variables):
+    """Fresh registry instance, independent of the process-wide singleton"""
+    registry = object.__new__(FinancialVariableRegistry)
+    registry.__init__()
+    for variable in variables:
+        registry.register_variable(variable)
+    return registry
+
+
+@pytest.fixture
+def registry():
+    return make_registry(
+        make_variable("revenue", excel="Revenue", yfinance="Sales Revenue"),
+        make_variable("total_revenue", excel="Total Revenue", fmp="Sales Revenue"),
+        make_variable("net_income", excel="Net Income"),
+        make_variable("net_income_common", fmp="netIncomeCommon"),
+        make_variable("operating_cash_flow", VariableCategory.CASH_FLOW, excel="Cash from Operations"),
+        make_variable("total_assets", BALANCE, excel="Total Assets"),
+    )
+
+
+class TestNormalization:
+    def test_normalize_label(self):
+        assert normalize_label("  Long-Term_Debt \n") == "long term debt"
+
+    def test_tokens_split_punctuation(self):
+        assert label_tokens("EBT, Incl. Unusual Items") == ["ebt", "incl", "unusual", "items"]
+
+
+class TestExactMatching:
+    def test_name_and_alias(self, registry):
+        matcher = registry.get_alias_matcher()
+        assert matcher.match_exact("NET_INCOME") == "net_income"
+        assert matcher.match_exact("Total Revenue", source="yfinance") == "total_revenue"
+        assert matcher.match_exact("cash from operations") == "operating_cash_flow"
+
+    def test_source_preferred_then_any_source(self, registry):
+        matcher = registry.get_alias_matcher()
+        assert matcher.match_exact("Sales Revenue", source="fmp") == "total_revenue"
+        assert matcher.match_exact("Sales Revenue", source="yfinance") == "revenue"
+        assert matcher.match_exact("Sales Revenue", source="excel") == "revenue"
+        assert matcher.match_exact("Sales Revenue") == "revenue"
+        assert matcher.match_exact("netIncomeCommon", source="excel", any_source=False) is None
+
+    def test_category_restriction(self, registry):
+        matcher = registry.get_alias_matcher()
+        assert matcher.match_exact("Total Assets", [INCOME]) is None
+        assert matcher.match_exact("Total Assets", [INCOME, BALANCE]) == "total_assets"
+
+    def test_list_aliases(self):
+        matcher = AliasMatcher([("capex", None, {"fmp": ["capitalExpenditure", "capex"]})])
+        assert matcher.match_exact("CAPITALEXPENDITURE", source="fmp") == "capex"
+
+
+class TestPartialMatching:
+    @staticmethod
+    def legacy_rule(label, var_name):
+        label_words = set(label.lower().replace('_', ' ').replace('&', ' ').split())
+        var_words = set(var_name.replace('_', ' ').split())
+        return len(label_words & var_words) >= min(2, max(1, len(var_words) * 0.6))
+
+    @pytest.mark.parametrize("label", [
+        "Net Income to Common", "Total Assets Reported", "Other Income", "Cash Taxes", "Operating Cash",
+    ])
+    def test_threshold_matches_legacy_rule(self, registry, label):
+        matcher = registry.get_alias_matcher()
+        names = registry.list_all_variables()
+        assert set(matcher.partial_candidates(label)) == {n for n in names if self.legacy_rule(label, n)}
+
+    def test_punctuation_does_not_block_words(self, registry):
+        assert registry.get_alias_matcher().partial_candidates("Revenue, Net") == ["revenue"]
+
+    def test_ranking_prefers_more_shared_words(self, registry):
+        matcher = registry.get_alias_matcher()
+        assert matcher.partial_candidates("Net Income Common Shareholders")[0] == "net_income_common"
+        assert matcher.match("Net Income Attributable") == "net_income"
+
+    def test_no_match(self, registry):
+        assert registry.get_alias_matcher().match("Shares Outstanding") is None
+
+
+class TestRegistryMatcher:
+    def test_cached_until_registration(self, registry):
+        matcher = registry.get_alias_matcher()
+        assert registry.get_alias_matcher() is matcher
+
+        registry.register_variable(make_variable("gross_profit", excel="Gross Income"))
+
+        rebuilt = registry.get_alias_matcher()
+        assert rebuilt is not matcher
+        assert rebuilt.match_exact("Gross Income") == "gross_profit"
+
+    def test_cleared_registry(self, registry):
+        registry.get_alias_matcher()
+        registry.clear_registry()
+        assert len(registry.get_alias_matcher()) == 0
+
+
+class TestAdapters:
+    def test_excel_row_matching(self, registry):
+        from core.data_processing.adapters.excel_adapter import ExcelDataAdapter
+
+        adapter = ExcelDataAdapter()
+        adapter.variable_registry = registry
+
+        assert adapter._match_row_to_variable("Total Revenue", "income").name == "total_revenue"
+        assert adapter._match_row_to_variable("Net Earnings", "income").name == "net_income"
+        assert adapter._match_row_to_variable("Net Income Common", "income").name == "net_income_common"
+        assert adapter._match_row_to_variable("Total Assets", "income") is None
+        assert adapter._match_row_to_variable("Total Assets", "balance").name == "total_assets"
+
+    def test_yfinance_rows_matched_once(self, registry):
+        pytest.importorskip("yfinance")
+        from core.data_processing.adapters.yfinance_adapter import YFinanceAdapter
+
+        adapter = YFinanceAdapter.__new__(YFinanceAdapter)
+        adapter.variable_registry = registry
+        data = pd.DataFrame(
+            {"2024": [10.0, 2.0, 1.5]},
+            index=["Operating Revenue", "Net Income From Continuing Ops", "Net Income Common Stockholders"],
+        )
+
+        matched = adapter._match_statement_rows(data, "income")
+
+        # Same rows the per-variable scan picked: the first qualifying row in index order
+        legacy = {}
+        for name in ("revenue", "total_revenue", "net_income", "net_income_common"):
+            for index_name in data.index:
+                if TestPartialMatching.legacy_rule(index_name, name):
+                    legacy[name] = index_name
+                    break
+        assert matched == legacy
+        assert matched["net_income"] == "Net Income From Continuing Ops"
+
+
+class TestFieldNormalizer:
+    @pytest.fixture
+    def normalizer(self, tmp_path):
+        from utils.field_normalizer import FieldNormalizer
+
+        mappings = {
+            "standard_fields": {"ebit": "ebit", "ebitda": "ebitda", "net_income": "net_income"},
+            "api_mappings": {
+                "fmp": {
+                    "ebit": ["operatingIncome", "ebitda"],
+                    "ebitda": ["ebitda", "operatingIncome"],
+                    "net_income": ["netIncome"],
+                },
+            },
+        }
+        path = tmp_path / "field_mappings.json"
+        path.write_text(json.dumps(mappings))
+        return FieldNormalizer(str(path))
+
+    def test_resolve_standard_field(self, normalizer):
+        assert normalizer.resolve_standard_field("NETINCOME", "fmp") == "net_income"
+        assert normalizer.resolve_standard_field("netIncome", "alpha_vantage") is None
+
+    def test_metrics_keep_variant_order(self, normalizer):
+        data = {"ebitda": 50.0, "operatingIncome": 30.0, "netincome": "12"}
+        metrics = normalizer.extract_financial_metrics(data, "fmp")
+        assert metrics == {"ebit": 30.0, "ebitda": 50.0, "net_income": 12.0}
+
+    def test_nested_fields_still_found(self, normalizer):
+        data = {"report": {"netIncome": 7.0}}
+        assert normalizer.extract_field_value(data, "net_income", "fmp") == 7.0
@@ -0,0 +1,114 @@
+"""
+Unit tests for the event-driven ApiBatchManager scheduler.
+
+Tests cover:
+- Requests for one (provider, endpoint) dispatched as a single batch when the window closes
+- Full batches dispatched immediately, highest priority first
+- Rate-limited batches deferred without occupying a worker slot
+- No scheduler wake-ups while idle
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core.data_processing.api_batch_manager import ApiBatchManager, BatchConfig
+from core.data_processing.rate_limiting.rate_limit_service import RateLimit, RateLimitService
+
+
+class Recorder:
+    """Stands in for the HTTP call: records (endpoint, symbol, time) and echoes the symbol"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.calls.append((request.endpoint, request.params.get("symbol"), time.monotonic()))
+        return request.params.get("symbol")
+
+
+@pytest.fixture
+def make_manager():
+    managers = []
+
+    def factory(limits=None, **batch_options):
+        manager = ApiBatchManager(
+            batch_config=BatchConfig(**batch_options),
+            rate_limit_service=RateLimitService(limits=limits or {})
+        )
+        manager._execute_single_request = Recorder()
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        manager.stop(timeout=5)
+
+
+class TestBatchWindows:
+    def test_window_groups_requests(self, make_manager):
+        manager = make_manager(batch_window_seconds=0.1)
+        submitted = time.monotonic()
+        futures = [manager.submit_request("fmp", "quote", {"symbol": s}) for s in ("A", "B", "C")]
+
+        assert [f.result(timeout=5) for f in futures] == ["A", "B", "C"]
+        stats = manager.get_statistics()
+        assert stats["performance"]["batches_processed"] == 1
+        assert stats["performance"]["requests_batched"] == 3
+
+        first_call = manager._execute_single_request.calls[0][2]
+        assert first_call - submitted >= 0.1
+
+    def test_endpoints_batched_separately(self, make_manager):
+        manager = make_manager(batch_window_seconds=0.05)
+        futures = [manager.submit_request("fmp", endpoint, {"symbol": endpoint})
+                   for endpoint in ("quote", "profile")]
+        assert [f.result(timeout=5) for f in futures] == ["quote", "profile"]
+        assert manager.get_statistics()["performance"]["batches_processed"] == 2
+
+    def test_full_batch_skips_window(self, make_manager):
+        manager = make_manager(batch_window_seconds=30.0, max_batch_size=3)
+        futures = [manager.submit_request("fmp", "quote", {"symbol": s}, priority=p)
+                   for s, p in (("low", 9), ("high", 1), ("mid", 5))]
+
+        assert [f.result(timeout=5) for f in futures] == ["low", "high", "mid"]
+        assert [symbol for _, symbol, _ in manager._execute_single_request.calls] == ["high", "mid", "low"]
+
+
+class TestRateLimitDeferral:
+    def test_deferred_batch_does_not_block_worker(self, make_manager):
+        manager = make_manager(
+            limits={"slow": [RateLimit(1, 0.3)]},
+            batch_window_seconds=0.0,
+            max_concurrent_batches=1
+        )
+        futures = [
+            manager.submit_request("slow", "a", {"symbol": "a"}),
+            manager.submit_request("slow", "b", {"symbol": "b"}),
+            manager.submit_request("fast", "x", {"symbol": "x"}),
+        ]
+        for future in futures:
+            future.result(timeout=5)
+
+        calls = manager._execute_single_request.calls
+        assert [symbol for _, symbol, _ in calls] == ["a", "x", "b"]
+        assert calls[2][2] - calls[0][2] >= 0.25
+        assert manager.get_statistics()["performance"]["rate_limit_delays"] >= 1
+
+
+class TestIdle:
+    def test_no_wakeups_while_idle(self, make_manager):
+        manager = make_manager(batch_window_seconds=0.01)
+        with patch.object(manager, "_fire_timers", wraps=manager._fire_timers) as fire:
+            manager.start()
+            manager.submit_request("fmp", "quote", {"symbol": "A"}).result(timeout=5)
+            time.sleep(0.05)  # let the worker release its slot
+            woken = fire.call_count
+            time.sleep(0.3)
+
+            assert fire.call_count == woken
+        assert manager.get_statistics()["system_status"]["scheduled_timers"] == 0
@@ -0,0 +1,120 @@
+"""
+Unit tests for compressed result storage in CalculationCache.
+
+Tests cover:
+- Transparent decompression on get_result (no raw bytes returned)
+- Compression threshold and codec selection
+- Decompressed hot set for frequently accessed keys, counted against the memory limit
+- Compressed entries surviving persistence and lazy reload
+- Legacy gzip-compressed entries
+"""
+
+import gzip
+import pickle
+from datetime import datetime
+
+from core.data_processing.calculation_cache import CacheEntry
+
+
+def compressible_result(n=2000):
+    return {"projected_fcf": [1.5e10] * n, "discount_rate": 0.09}
+
+
+class TestCompressedRoundTrip:
+    def test_get_returns_original_result(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path)
+        result = compressible_result()
+        cache.set_result("AAPL", "dcf", result)
+
+        entry = cache._cache[cache._generate_cache_key("AAPL", "dcf")]
+        assert isinstance(entry.result, bytes)
+        assert entry.compression_codec == cache.compression_codec
+        assert entry.compression_ratio > 1.0
+        assert cache.get_result("AAPL", "dcf") == result
+
+    def test_below_threshold_stored_as_is(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path, compression_threshold_bytes=1_000_000)
+        cache.set_result("AAPL", "dcf", compressible_result())
+        entry = cache._cache[cache._generate_cache_key("AAPL", "dcf")]
+        assert entry.compression_codec is None
+        assert isinstance(entry.result, dict)
+
+    def test_compression_disabled(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path, enable_compression=False)
+        cache.set_result("AAPL", "dcf", compressible_result())
+        assert cache.get_statistics()["compression"]["compressed_entries"] == 0
+
+    def test_persisted_compressed_entry_reloads(self, tmp_path, make_calculation_cache):
+        # Varied floats compress ~2x, leaving the payload above the persistence threshold
+        result = {"present_values": [i * 1.2345678 for i in range(20_000)]}
+        make_calculation_cache(tmp_path).set_result("AAPL", "dcf", result)
+        assert make_calculation_cache(tmp_path).get_result("AAPL", "dcf") == result
+
+    def test_legacy_gzip_entry(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path)
+        result = compressible_result()
+        entry = CacheEntry(result=gzip.compress(pickle.dumps(result)), timestamp=datetime.now())
+        entry.compression_ratio = 5.0
+        cache._cache["AAPL:dcf:legacy01"] = entry
+        assert cache._resolve_result("AAPL:dcf:legacy01", entry) == result
+
+
+class TestHotSet:
+    def test_frequently_hit_keys_skip_decompression(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path, hot_set_size=4)
+        cache.set_result("AAPL", "dcf", compressible_result())
+
+        for _ in range(5):
+            cache.get_result("AAPL", "dcf")
+
+        perf = cache.get_statistics()["performance"]
+        assert perf["decompressions"] == 2
+        assert perf["hot_set_hits"] == 3
+
+    def test_hot_set_bounded(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path, hot_set_size=2)
+        for i in range(4):
+            cache.set_result(f"T{i}", "dcf", compressible_result())
+            cache.get_result(f"T{i}", "dcf")
+            cache.get_result(f"T{i}", "dcf")
+        assert len(cache._hot_results) == 2
+
+    def test_hot_set_counted_in_memory(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", compressible_result())
+        entry = cache._cache[cache._generate_cache_key("AAPL", "dcf")]
+        cache.get_result("AAPL", "dcf")
+        cache.get_result("AAPL", "dcf")
+
+        decoded_size = len(pickle.dumps(compressible_result()))
+        assert cache._memory_bytes == entry.size_bytes + decoded_size
+
+        cache.clear_cache("AAPL")
+        assert cache._memory_bytes == 0
+
+    def test_memory_limit_bounds_hot_set(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path, hot_set_size=8)
+        decoded_size = len(pickle.dumps(compressible_result()))
+        cache.max_memory_bytes = 2 * decoded_size
+        for i in range(4):
+            cache.set_result(f"T{i}", "dcf", compressible_result())
+            cache.get_result(f"T{i}", "dcf")
+            cache.get_result(f"T{i}", "dcf")
+
+        assert cache._memory_bytes <= cache.max_memory_bytes
+        assert len(cache._hot_results) == 1
+        assert len(cache._cache) == 4
+
+    def test_hot_set_dropped_on_invalidation_and_replace(self, tmp_path, make_calculation_cache):
+        cache = make_calculation_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", compressible_result(), dependencies=["revenue"])
+        cache.get_result("AAPL", "dcf")
+        cache.get_result("AAPL", "dcf")
+        assert cache._hot_results
+
+        cache.invalidate_dependencies("AAPL", "revenue")
+        assert not cache._hot_results
+        assert cache.get_result("AAPL", "dcf") is None
+
+        cache.set_result("AAPL", "dcf", compressible_result(3000))
+        assert cache.get_result("AAPL", "dcf") == compressible_result(3000)
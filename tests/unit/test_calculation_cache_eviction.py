@@ -0,0 +1,129 @@
+"""
+Unit tests for memory accounting, eviction and bulk insert in CalculationCache.
+
+Tests cover:
+- Running memory total kept in step with inserts, replacements and removals
+- Eviction of invalidated entries first, then least recently used
+- Persisted entries leaving only the memory tier on eviction
+- set_many batching index writes and memory cleanup
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+def sized_result(n_floats, seed=0):
+    return {"seed": seed, "values": [seed + i * 0.1 for i in range(n_floats)]}
+
+
+def total_size(cache):
+    return sum(entry.size_bytes for entry in cache._cache.values())
+
+
+class TestMemoryAccounting:
+    def test_running_total_matches_entries(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", sized_result(10))
+        cache.set_result("MSFT", "dcf", sized_result(100))
+        cache.set_result("AAPL", "dcf", sized_result(50))
+        assert cache._memory_bytes == total_size(cache)
+
+        cache.clear_cache("MSFT")
+        assert cache._memory_bytes == total_size(cache)
+        cache.clear_cache()
+        assert cache._memory_bytes == 0
+
+    def test_statistics_use_running_total(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", sized_result(100))
+        stats = cache.get_statistics()
+        assert stats["cache_info"]["total_size_mb"] == cache._memory_bytes / (1024 * 1024)
+
+
+class TestEviction:
+    def test_evicts_least_recently_used(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("T0", "dcf", sized_result(50))
+        entry_bytes = cache._memory_bytes
+        cache.max_memory_bytes = entry_bytes * 3
+
+        cache.set_result("T1", "dcf", sized_result(50))
+        cache.set_result("T2", "dcf", sized_result(50))
+        cache.get_result("T0", "dcf")
+        cache.set_result("T3", "dcf", sized_result(50))
+
+        assert cache._memory_bytes <= cache.max_memory_bytes
+        assert cache.get_result("T0", "dcf") is not None
+        assert cache.get_result("T1", "dcf") is None
+
+    def test_invalid_entries_evicted_first(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("T0", "dcf", sized_result(50), dependencies=["revenue"])
+        cache.max_memory_bytes = cache._memory_bytes * 3
+        cache.set_result("T1", "dcf", sized_result(50))
+        cache.set_result("T2", "dcf", sized_result(50), dependencies=["revenue"])
+        cache.invalidate_dependencies("T2", "revenue")
+
+        cache.set_result("T3", "dcf", sized_result(50))
+
+        assert cache._generate_cache_key("T2", "dcf") not in cache._cache
+        assert cache.get_result("T0", "dcf") is not None
+
+    def test_persisted_entry_reloads_after_eviction(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("BIG", "dcf", sized_result(3000), dependencies=["revenue"])
+        big_key = cache._generate_cache_key("BIG", "dcf")
+        cache.max_memory_bytes = cache._memory_bytes
+
+        cache.set_result("SMALL", "dcf", sized_result(10))
+
+        assert big_key not in cache._cache
+        assert big_key in cache._dependency_graph["BIG:revenue"]
+        assert cache.get_result("BIG", "dcf") == sized_result(3000)
+
+
+class TestSetMany:
+    def test_set_many_stores_batch(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        items = [
+            {"symbol": f"T{i}", "calculation_id": "dcf", "result": sized_result(10, i),
+             "dependencies": ["revenue"]}
+            for i in range(20)
+        ]
+        items.append({"symbol": "BAD"})
+
+        assert cache.set_many(items) == 20
+        assert cache.get_result("T7", "dcf") == sized_result(10, 7)
+        assert cache.invalidate_dependencies("T7", "revenue") == 1
+
+    def test_set_many_single_index_write_and_cleanup(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        items = [
+            {"symbol": f"T{i}", "calculation_id": "dcf", "result": sized_result(3000, i)}
+            for i in range(5)
+        ]
+        with patch.object(cache, "_append_index_records", wraps=cache._append_index_records) as append, \
+                patch.object(cache, "_cleanup_memory_if_needed") as cleanup:
+            cache.set_many(items)
+
+        append.assert_called_once()
+        assert len(append.call_args[0][0]) == 5
+        cleanup.assert_called_once()
+        assert len(make_uncompressed_cache(tmp_path)._disk_index) == 5
+
+    @pytest.mark.slow
+    def test_bulk_population_is_not_quadratic(self, tmp_path, make_uncompressed_cache):
+        import time
+
+        cache = make_uncompressed_cache(tmp_path)
+        cache.max_memory_bytes = 200_000
+        items = [
+            {"symbol": f"T{i}", "calculation_id": "dcf", "result": {"v": i},
+             "dependencies": ["revenue", "fcf"]}
+            for i in range(20_000)
+        ]
+        start = time.perf_counter()
+        cache.set_many(items)
+        assert time.perf_counter() - start < 5.0
+        assert cache._memory_bytes <= cache.max_memory_bytes
@@ -0,0 +1,119 @@
+"""
+Unit tests for the lazy, indexed startup of CalculationCache.
+
+Tests cover:
+- Startup reading only the index, without unpickling payloads
+- Lazy payload loading on first get_result
+- Dependency invalidation of persisted entries that were never loaded
+- Background sweep of expired files and legacy unindexed payloads
+- Stale persisted copies dropped when a result is replaced
+"""
+
+import pickle
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from core.data_processing.calculation_cache import CacheEntry, CalculationCache
+
+
+def large_result(seed=0):
+    """A result big enough (>10KB pickled) to be persisted."""
+    return {"seed": seed, "cash_flows": [seed + i * 0.123456789 for i in range(3000)]}
+
+
+class TestLazyStartup:
+    def test_startup_does_not_unpickle_payloads(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        for i in range(5):
+            cache.set_result(f"T{i}", "dcf", large_result(i), dependencies=["revenue"])
+
+        with patch("core.data_processing.calculation_cache.pickle.load") as load:
+            restarted = CalculationCache(cache_dir=str(tmp_path), enable_compression=False)
+            restarted._sweep_thread.join(timeout=5)
+        load.assert_not_called()
+        assert len(restarted._disk_index) == 5
+        assert restarted._cache == {}
+
+    def test_payload_loaded_on_first_get(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", large_result(1), dependencies=["revenue"])
+
+        restarted = make_uncompressed_cache(tmp_path)
+        assert restarted.get_result("AAPL", "dcf") == large_result(1)
+        assert len(restarted._cache) == 1
+        assert restarted.get_dependency_info("AAPL", "dcf")["depends_on"] == ["revenue"]
+
+    def test_entry_larger_than_memory_limit_served_from_disk(
+        self, tmp_path, make_uncompressed_cache
+    ):
+        make_uncompressed_cache(tmp_path).set_result("AAA", "dcf", large_result(2))
+
+        restarted = make_uncompressed_cache(tmp_path)
+        restarted.max_memory_bytes = 1024
+        assert restarted.get_result("AAA", "dcf") == large_result(2)
+        assert restarted.get_result("AAA", "dcf") == large_result(2)
+        assert len(restarted._cache) == 0
+        assert restarted._memory_bytes == 0
+
+    def test_unloaded_entry_invalidated_by_dependency(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", large_result(), dependencies=["revenue"])
+
+        restarted = make_uncompressed_cache(tmp_path)
+        assert restarted.invalidate_dependencies("AAPL", "revenue") == 1
+        assert restarted.get_result("AAPL", "dcf") is None
+        assert make_uncompressed_cache(tmp_path)._disk_index == {}
+
+    def test_clear_cache_removes_persisted_entries(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", large_result())
+        cache.set_result("MSFT", "dcf", large_result())
+
+        assert make_uncompressed_cache(tmp_path).clear_cache("AAPL") == 1
+        restarted = make_uncompressed_cache(tmp_path)
+        assert list(restarted._disk_index) == [cache._generate_cache_key("MSFT", "dcf")]
+        assert make_uncompressed_cache(tmp_path).clear_cache() == 1
+        assert list(tmp_path.glob("*.pkl")) == []
+
+    def test_small_result_replaces_persisted_copy(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        cache.set_result("AAPL", "dcf", large_result())
+        cache.set_result("AAPL", "dcf", {"value": 1.0})
+
+        restarted = make_uncompressed_cache(tmp_path)
+        assert restarted._disk_index == {}
+        assert restarted.get_result("AAPL", "dcf") is None
+
+
+class TestBackgroundSweep:
+    def test_expired_files_swept(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path, default_ttl_seconds=60)
+        cache.set_result("AAPL", "dcf", large_result())
+        key = cache._generate_cache_key("AAPL", "dcf")
+        cache._disk_index[key]["timestamp"] = (datetime.now() - timedelta(hours=1)).isoformat()
+        cache._compact_index()
+
+        restarted = make_uncompressed_cache(tmp_path, default_ttl_seconds=60)
+        assert restarted._disk_index == {}
+        assert not (tmp_path / f"{key}.pkl").exists()
+
+    def test_legacy_payloads_indexed(self, tmp_path, make_uncompressed_cache):
+        entry = CacheEntry(result=large_result(), timestamp=datetime.now(), dependencies={"revenue"})
+        with open(tmp_path / "AAPL:dcf:legacy01.pkl", "wb") as f:
+            pickle.dump(entry, f)
+
+        cache = make_uncompressed_cache(tmp_path)
+        assert cache._disk_index["AAPL:dcf:legacy01"]["dependencies"] == ["revenue"]
+        assert "AAPL:dcf:legacy01" in cache._dependency_graph["AAPL:revenue"]
+
+    @pytest.mark.slow
+    def test_startup_independent_of_payload_size(self, tmp_path, make_uncompressed_cache):
+        cache = make_uncompressed_cache(tmp_path)
+        for i in range(50):
+            cache.set_result(f"T{i}", "dcf", large_result(i))
+
+        start = datetime.now()
+        CalculationCache(cache_dir=str(tmp_path), enable_compression=False)
+        assert (datetime.now() - start).total_seconds() < 0.5
@@ -0,0 +1,110 @@
+"""
+Unit tests for incremental DataCache index persistence.
+
+Tests cover:
+- Puts append to the index log instead of rewriting the snapshot
+- Index rebuilt from snapshot plus log replay on restart
+- Expiry and pattern invalidation recorded as delete records
+- Log compaction into the snapshot
+- put_many storing a batch with a single log write
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from core.data_processing.universal_data_registry import CachePolicy, DataCache
+
+
+def log_records(cache_dir):
+    log_file = cache_dir / DataCache.INDEX_LOG_FILE
+    if not log_file.exists():
+        return []
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+class TestIncrementalIndex:
+    def test_put_appends_without_rewriting_snapshot(
+        self, tmp_path, make_data_request, make_data_response
+    ):
+        cache = DataCache(str(tmp_path))
+        with patch.object(cache, "_save_cache_index") as save:
+            for i in range(10):
+                cache.put(make_data_request(f"T{i}"), make_data_response(i))
+        save.assert_not_called()
+        assert [record["op"] for record in log_records(tmp_path)] == ["put"] * 10
+
+    def test_index_survives_restart(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path))
+        cache.put(make_data_request("AAPL"), make_data_response(1))
+        cache.put(make_data_request("MSFT"), make_data_response(2))
+        cache.invalidate("MSFT")
+
+        reloaded = DataCache(str(tmp_path))
+        assert set(reloaded.cache_metadata) == set(cache.cache_metadata)
+        assert reloaded.get(make_data_request("AAPL")).data == 1
+        assert reloaded.get(make_data_request("MSFT")) is None
+
+    def test_expired_entry_logged_as_delete(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path))
+        cache.put(make_data_request("AAPL"), make_data_response(1), ttl_seconds=-1)
+        cache.memory_cache.clear()
+
+        assert cache.get(make_data_request("AAPL")) is None
+        assert log_records(tmp_path)[-1]["op"] == "del"
+        assert DataCache(str(tmp_path)).cache_metadata == {}
+
+    def test_malformed_trailing_record_is_skipped(
+        self, tmp_path, make_data_request, make_data_response
+    ):
+        cache = DataCache(str(tmp_path))
+        cache.put(make_data_request("AAPL"), make_data_response(1))
+        with open(tmp_path / DataCache.INDEX_LOG_FILE, "a") as f:
+            f.write('{"op": "put", "key"')
+
+        assert len(DataCache(str(tmp_path)).cache_metadata) == 1
+
+    def test_log_compacts_into_snapshot(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path))
+        cache.INDEX_COMPACTION_MIN_RECORDS = 5
+        for i in range(6):
+            cache.put(make_data_request("AAPL"), make_data_response(i))
+
+        assert log_records(tmp_path) == []
+        snapshot = json.loads((tmp_path / DataCache.INDEX_FILE).read_text())
+        assert set(snapshot) == set(cache.cache_metadata)
+
+
+class TestPutMany:
+    def test_put_many_single_log_write(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path))
+        items = [(make_data_request(f"T{i}"), make_data_response(i)) for i in range(50)]
+        skipped = make_data_request("SKIP", cache_policy=CachePolicy.NO_CACHE)
+        items.append((skipped, make_data_response(0)))
+
+        with patch.object(cache, "_append_index_records", wraps=cache._append_index_records) as append:
+            stored = cache.put_many(items)
+
+        assert stored == 50
+        append.assert_called_once()
+        assert len(log_records(tmp_path)) == 50
+        assert cache.get(make_data_request("T7")).data == 7
+        assert cache.get(make_data_request("SKIP")) is None
+
+    def test_put_many_empty(self, tmp_path):
+        cache = DataCache(str(tmp_path))
+        assert cache.put_many([]) == 0
+        assert log_records(tmp_path) == []
+
+
+@pytest.mark.slow
+def test_put_cost_independent_of_index_size(tmp_path, make_data_request, make_data_response):
+    """Each put appends one record, so the log grows linearly, not quadratically."""
+    cache = DataCache(str(tmp_path))
+    cache.INDEX_COMPACTION_MIN_RECORDS = 10**9
+    cache.put_many([(make_data_request(f"T{i}"), make_data_response(i)) for i in range(2000)])
+    size_before = (tmp_path / DataCache.INDEX_LOG_FILE).stat().st_size
+    cache.put(make_data_request("NEW"), make_data_response(0))
+    size_after = (tmp_path / DataCache.INDEX_LOG_FILE).stat().st_size
+    assert size_after - size_before < 1000
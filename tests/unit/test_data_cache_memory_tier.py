@@ -0,0 +1,89 @@
+"""
+Unit tests for size-aware eviction in the DataCache memory tier.
+
+Tests cover:
+- Deep size estimation for DataFrames, arrays and nested containers
+- Running byte total maintained across puts, replacements and invalidation
+- LRU eviction against the byte budget and the entry cap
+- Eviction counters exposed through get_metrics
+"""
+
+
+import numpy as np
+import pandas as pd
+
+from core.data_processing.universal_data_registry import DataCache, _estimate_size
+
+
+def frame(rows):
+    return pd.DataFrame({"close": np.arange(rows, dtype=float), "label": ["x" * 20] * rows})
+
+
+class TestEstimateSize:
+    def test_dataframe_uses_deep_memory_usage(self, make_data_response):
+        df = frame(10_000)
+        assert _estimate_size(df) == df.memory_usage(deep=True).sum()
+        assert _estimate_size(make_data_response(df)) > df.memory_usage(deep=True).sum()
+
+    def test_array_and_nested_containers(self):
+        arr = np.zeros(50_000)
+        assert _estimate_size(arr) == arr.nbytes
+        assert _estimate_size({"a": [arr]}) > arr.nbytes
+
+    def test_shared_objects_counted_once(self):
+        arr = np.zeros(50_000)
+        assert _estimate_size([arr, arr]) < 2 * arr.nbytes
+
+
+class TestMemoryTierAccounting:
+    def test_running_total_tracks_entries(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path))
+        cache.put(make_data_request("A"), make_data_response(frame(1000)))
+        cache.put(make_data_request("B"), make_data_response(frame(2000)))
+        assert cache._memory_bytes == sum(cache._memory_sizes.values())
+
+        cache.put(make_data_request("A"), make_data_response(frame(10)))
+        assert cache._memory_bytes == sum(cache._memory_sizes.values())
+
+        cache.invalidate("B")
+        assert set(cache._memory_sizes) == set(cache.memory_cache)
+        assert cache._memory_bytes == sum(cache._memory_sizes.values())
+
+        cache.invalidate()
+        assert cache._memory_bytes == 0
+
+    def test_evicts_lru_until_under_budget(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path), memory_limit_mb=1)
+        entry_bytes = _estimate_size(make_data_response(frame(500)))
+        per_budget = cache.memory_limit_bytes // entry_bytes
+
+        for i in range(per_budget + 3):
+            cache.put(make_data_request(f"T{i}"), make_data_response(frame(500)))
+            if i == per_budget - 1:
+                # Touch T0 just before the budget fills so T1 is evicted first
+                cache.get(make_data_request("T0"))
+
+        assert cache._memory_bytes <= cache.memory_limit_bytes
+        assert cache._generate_cache_key(make_data_request("T0")) in cache.memory_cache
+        assert cache._generate_cache_key(make_data_request("T1")) not in cache.memory_cache
+
+        metrics = cache.get_metrics()
+        assert metrics["evictions"] >= 3
+        assert metrics["evicted_bytes"] >= 3 * entry_bytes * 0.9
+        assert metrics["memory_bytes"] == cache._memory_bytes
+
+    def test_entry_cap(self, tmp_path, make_data_request, make_data_response):
+        cache = DataCache(str(tmp_path))
+        cache.MAX_MEMORY_ENTRIES = 5
+        cache.put_many([(make_data_request(f"T{i}"), make_data_response(i)) for i in range(8)])
+        assert len(cache.memory_cache) == 5
+        assert cache.get_metrics()["evictions"] == 3
+
+    def test_evicted_entry_still_served_from_disk(
+        self, tmp_path, make_data_request, make_data_response
+    ):
+        cache = DataCache(str(tmp_path))
+        cache.MAX_MEMORY_ENTRIES = 1
+        cache.put(make_data_request("A"), make_data_response(1))
+        cache.put(make_data_request("B"), make_data_response(2))
+        assert cache.get(make_data_request("A")).data == 1
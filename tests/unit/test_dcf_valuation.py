@@ -10,9 +10,11 @@ Tests cover:
 - FCF projection logic
 - Edge cases: zero FCF, negative FCF, very high discount rate
 - Boundary: growth_rate >= discount_rate handling
+- Monte Carlo valuation over sampled assumptions
 - External dependencies are fully mocked
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 
@@ -563,3 +565,201 @@ class TestDCFEdgeCases:
         result = valuator._project_future_fcf([base], assumptions, {})
         for v in result["projected_fcf"]:
             assert v == pytest.approx(base, rel=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# Test class: sensitivity_analysis — vectorized grid vs per-cell valuation
+# ---------------------------------------------------------------------------
+
+class TestSensitivityAnalysis:
+    """The vectorized grid must reproduce the per-cell calculate_dcf_projections path."""
+
+    def _make_valuator(self, fcfe_values, fcf_type="FCFE"):
+        calc = make_mock_financial_calculator(shares=1_000.0, price=100.0, fcfe=fcfe_values)
+        valuator, mock_var = build_dcf_valuator(financial_calculator=calc)
+        mock_var.get_historical_data.return_value = None
+        valuator.default_assumptions["fcf_type"] = fcf_type
+        return valuator
+
+    @pytest.mark.parametrize("fcf_type", ["FCFE", "FCFF"])
+    def test_vectorized_matches_per_cell(self, fcf_type):
+        valuator = self._make_valuator([1_000.0, 1_100.0, 1_200.0], fcf_type=fcf_type)
+        discount_rates = [0.08, 0.10, 0.12]
+        growth_rates = [0.02, 0.05, 0.08, 0.11]
+
+        fast = valuator.sensitivity_analysis(discount_rates, growth_rates)
+        slow = valuator.sensitivity_analysis(discount_rates, growth_rates, vectorized=False)
+
+        np.testing.assert_allclose(fast["valuations"], slow["valuations"], rtol=1e-9)
+        np.testing.assert_allclose(fast["upside_downside"], slow["upside_downside"], rtol=1e-9)
+        assert fast["current_price"] == slow["current_price"]
+
+    def test_discount_equal_to_terminal_growth_matches_per_cell(self):
+        valuator = self._make_valuator([1_000.0, 1_100.0, 1_200.0])
+        discount_rates = [0.025, 0.10]
+
+        fast = valuator.sensitivity_analysis(discount_rates, [0.05])
+        slow = valuator.sensitivity_analysis(discount_rates, [0.05], vectorized=False)
+
+        np.testing.assert_allclose(fast["valuations"], slow["valuations"], rtol=1e-9)
+
+    def test_no_fcf_data_returns_zero_grid(self):
+        calc = make_mock_financial_calculator()
+        calc.fcf_results = {}
+        valuator, mock_var = build_dcf_valuator(financial_calculator=calc)
+        mock_var.get_historical_data.return_value = None
+
+        result = valuator.sensitivity_analysis([0.08, 0.10], [0.03, 0.05])
+        assert result["valuations"] == [[0.0, 0.0], [0.0, 0.0]]
+        assert result["upside_downside"] == [[0.0, 0.0], [0.0, 0.0]]
+
+    def test_vectorized_does_not_write_per_cell_results(self):
+        valuator = self._make_valuator([1_000.0, 1_100.0, 1_200.0])
+        valuator.var_data.set_variable.reset_mock()
+        valuator.sensitivity_analysis([0.08, 0.10], [0.03, 0.05])
+        stored = {c.kwargs.get("variable_name") for c in valuator.var_data.set_variable.call_args_list}
+        assert "intrinsic_value" not in stored
+
+    def test_large_grid_is_fast(self):
+        import time
+
+        valuator = self._make_valuator([1_000.0, 1_100.0, 1_200.0])
+        discount_rates = list(np.linspace(0.06, 0.15, 100))
+        growth_rates = list(np.linspace(-0.05, 0.20, 100))
+
+        start = time.perf_counter()
+        result = valuator.sensitivity_analysis(discount_rates, growth_rates)
+        elapsed = time.perf_counter() - start
+
+        assert len(result["valuations"]) == 100
+        assert all(len(row) == 100 for row in result["valuations"])
+        assert elapsed < 1.0
+
+
+# ---------------------------------------------------------------------------
+# Test class: monte_carlo_valuation — probabilistic DCF
+# ---------------------------------------------------------------------------
+
+class TestMonteCarloValuation:
+    """Sampled-assumption DCF must agree with the deterministic path."""
+
+    FIXED = {
+        "discount_rate": 0.10,
+        "growth_rate_yr1_5": 0.10,
+        "growth_rate_yr5_10": 0.05,
+        "terminal_growth_rate": 0.025,
+    }
+
+    def _make_valuator(self, fcfe_values=None, fcf_type="FCFE"):
+        calc = make_mock_financial_calculator(
+            shares=1_000.0, price=100.0, fcfe=fcfe_values or [1_000.0, 1_100.0, 1_200.0]
+        )
+        valuator, mock_var = build_dcf_valuator(financial_calculator=calc)
+        mock_var.get_historical_data.return_value = None
+        valuator.default_assumptions["fcf_type"] = fcf_type
+        return valuator
+
+    @pytest.mark.parametrize("fcf_type", ["FCFE", "FCFF"])
+    def test_fixed_assumptions_match_point_estimate(self, fcf_type):
+        valuator = self._make_valuator(fcf_type=fcf_type)
+
+        result = valuator.monte_carlo_valuation(n_paths=10, distributions=self.FIXED)
+        grid = valuator.sensitivity_analysis([0.10], [0.10])
+
+        np.testing.assert_allclose(result["value_per_share"], grid["valuations"][0][0], rtol=1e-9)
+        assert result["std"] == pytest.approx(0.0, abs=1e-6)
+
+    def test_distribution_and_percentiles(self):
+        valuator = self._make_valuator()
+        result = valuator.monte_carlo_valuation(n_paths=20_000, seed=3)
+
+        assert result["value_per_share"].shape == (20_000,)
+        percentiles = list(result["percentiles"].values())
+        assert list(result["percentiles"]) == ["5%", "10%", "25%", "50%", "75%", "90%", "95%"]
+        assert percentiles == sorted(percentiles)
+        assert result["percentiles"]["50%"] == pytest.approx(np.median(result["value_per_share"]))
+        assert 0.0 <= result["probability_above_price"] <= 1.0
+
+    def test_seed_reproducible(self):
+        valuator = self._make_valuator()
+        first = valuator.monte_carlo_valuation(n_paths=1_000, seed=42)
+        second = valuator.monte_carlo_valuation(n_paths=1_000, seed=42)
+        np.testing.assert_array_equal(first["value_per_share"], second["value_per_share"])
+
+    def test_custom_distributions(self):
+        valuator = self._make_valuator()
+        result = valuator.monte_carlo_valuation(
+            n_paths=5_000,
+            seed=1,
+            distributions={
+                "discount_rate": {"distribution": "uniform", "low": 0.09, "high": 0.11},
+                "growth_rate_yr1_5": {"distribution": "triangular", "low": 0.0, "high": 0.2},
+                "terminal_growth_rate": 0.02,
+            },
+        )
+        assert result["distributions"]["terminal_growth_rate"] == 0.02
+        assert np.all(np.isfinite(result["value_per_share"]))
+
+    def test_unknown_distribution_rejected(self):
+        valuator = self._make_valuator()
+        with pytest.raises(ValueError):
+            valuator.monte_carlo_valuation(
+                n_paths=10, distributions={"discount_rate": {"distribution": "cauchy"}}
+            )
+
+    def test_terminal_growth_kept_below_discount_rate(self):
+        valuator = self._make_valuator()
+        result = valuator.monte_carlo_valuation(
+            n_paths=1_000,
+            seed=2,
+            distributions={"discount_rate": 0.03, "terminal_growth_rate": {"std": 0.02}},
+        )
+        assert result["clipped_terminal_paths"] > 0
+        assert np.all(np.isfinite(result["value_per_share"]))
+        assert np.all(result["value_per_share"] > 0)
+
+    def test_no_fcf_data(self):
+        calc = make_mock_financial_calculator()
+        calc.fcf_results = {}
+        valuator, mock_var = build_dcf_valuator(financial_calculator=calc)
+        mock_var.get_historical_data.return_value = None
+
+        assert valuator.monte_carlo_valuation(n_paths=100)["error"] == "fcf_data_unavailable"
+
+    def test_does_not_write_results(self):
+        valuator = self._make_valuator()
+        valuator.var_data.set_variable.reset_mock()
+        valuator.monte_carlo_valuation(n_paths=1_000)
+        stored = {c.kwargs.get("variable_name") for c in valuator.var_data.set_variable.call_args_list}
+        assert "intrinsic_value" not in stored
+
+    def test_large_run_streams_within_memory_limit(self):
+        import tracemalloc
+
+        from core.analysis.monte_carlo import MonteCarloEngine
+
+        limit = 4 * 1024 * 1024
+        valuator = self._make_valuator()
+        valuator.monte_carlo = MonteCarloEngine(memory_limit_bytes=limit)
+        tracemalloc.start()
+        try:
+            result = valuator.monte_carlo_valuation(n_paths=200_000, seed=4)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert result["value_per_share"] is None
+        assert peak < 2 * limit
+        percentiles = list(result["percentiles"].values())
+        assert percentiles == sorted(percentiles)
+
+    def test_100k_paths_under_a_second(self):
+        import time
+
+        valuator = self._make_valuator()
+        start = time.perf_counter()
+        result = valuator.monte_carlo_valuation(n_paths=100_000, seed=1)
+        elapsed = time.perf_counter() - start
+
+        assert result["value_per_share"].shape == (100_000,)
+        assert elapsed < 1.0
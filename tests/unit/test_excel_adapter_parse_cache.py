@@ -0,0 +1,162 @@
+"""
+Unit tests for single-pass workbook parsing in ExcelDataAdapter.
+
+Tests cover:
+- ParsedSheet read-only parse and FY header row detection
+- Lossless to_arrays/from_arrays round trip (numbers, ints, text, dates, ragged rows)
+- One workbook parse per file across analysis and variable extraction
+- ParsedSheetCache hits for unchanged files and invalidation on mtime/size change
+- Re-ingesting an unchanged company folder without parsing
+"""
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from openpyxl import Workbook
+
+from core.data_processing.adapters import excel_adapter
+from core.data_processing.adapters.excel_adapter import (
+    ExcelDataAdapter,
+    ParsedSheet,
+    ParsedSheetCache,
+)
+
+
+def write_statement(path, n_metrics=5, scale=1.0):
+    """Write a statement workbook with two title rows above the FY header."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Test Company Inc"])
+    ws.append(["Income Statement"])
+    ws.append([None, None, None, "FY-2", "FY-1", "FY"])
+    ws.append(["Period End Date", None, None, datetime(2022, 12, 31), datetime(2023, 12, 31), "12/31/2024"])
+    for i in range(n_metrics):
+        ws.append([f"Metric {i}", None, None, i * scale, None, i * 3])
+    wb.save(path)
+
+
+def make_company(root, symbol="TEST"):
+    for period in ("FY", "LTM"):
+        folder = root / symbol / period
+        folder.mkdir(parents=True)
+        write_statement(folder / f"{symbol} - Income Statement.xlsx")
+        write_statement(folder / f"{symbol} - Balance Sheet.xlsx")
+    return str(root / symbol)
+
+
+@pytest.fixture
+def statement_file(tmp_path):
+    path = tmp_path / "Test - Income Statement.xlsx"
+    write_statement(path, scale=1.5)
+    return str(path)
+
+
+def count_workbook_loads():
+    return patch.object(excel_adapter, "load_workbook", wraps=excel_adapter.load_workbook)
+
+
+class TestParsedSheet:
+    def test_parse_finds_header(self, statement_file):
+        sheet = ParsedSheet.from_file(statement_file)
+        assert sheet.header_row == 2
+        assert sheet.rows[2][3:] == ("FY-2", "FY-1", "FY")
+        assert len(sheet.rows) == 9
+
+    def test_array_round_trip(self, statement_file):
+        sheet = ParsedSheet(
+            file_path="x.xlsx",
+            rows=[("Revenue", 1, 2.5, None, True), ("Date", datetime(2024, 3, 31)), ()],
+            header_row=None,
+        )
+        restored = ParsedSheet.from_arrays("x.xlsx", sheet.to_arrays())
+
+        assert restored.rows == sheet.rows
+        assert [type(v) for v in restored.rows[0]] == [str, int, float, type(None), bool]
+        assert restored.header_row is None
+
+        parsed = ParsedSheet.from_file(statement_file)
+        assert ParsedSheet.from_arrays(statement_file, parsed.to_arrays()) == parsed
+
+
+class TestSinglePass:
+    def test_load_single_file_parses_once(self, statement_file):
+        adapter = ExcelDataAdapter()
+        with count_workbook_loads() as load:
+            results = adapter.load_single_file("TEST", statement_file, "income", "FY")
+
+        assert load.call_count == 1
+        assert load.call_args.kwargs["read_only"] is True
+        assert results["periods_covered"] == ["FY", "FY-1", "FY-2"]
+
+    def test_analyze_without_shared_sheet_still_parses(self, statement_file):
+        adapter = ExcelDataAdapter()
+        file_info = adapter._analyze_excel_file(statement_file, "TEST", "income", "FY")
+        assert file_info.header_row == 2
+        assert adapter.get_adapter_statistics()["adapter_stats"]["sheets_parsed"] == 1
+
+    def test_missing_header_reported(self, tmp_path):
+        path = tmp_path / "Test - Income Statement.xlsx"
+        wb = Workbook()
+        wb.active.append(["no", "periods"])
+        wb.save(path)
+
+        results = ExcelDataAdapter().load_single_file("TEST", str(path), "income", "FY")
+        assert "Could not find header row" in results["errors"][0]
+
+
+class TestParsedSheetCache:
+    def test_hit_and_invalidation(self, statement_file, tmp_path):
+        cache = ParsedSheetCache(tmp_path / "parse_cache")
+        sheet = ParsedSheet.from_file(statement_file)
+        stat = os.stat(statement_file)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        assert cache.load(statement_file, key) is None
+        cache.store(sheet, key)
+
+        assert cache.load(statement_file, key) == sheet
+        assert cache.load(statement_file, (key[0] + 1, key[1])) is None
+        assert cache.load(statement_file, (key[0], key[1] + 1)) is None
+
+    def test_corrupt_entry_ignored(self, statement_file, tmp_path):
+        cache = ParsedSheetCache(tmp_path / "parse_cache")
+        cache._entry_path(statement_file).write_bytes(b"not an npz")
+        assert cache.load(statement_file, (0, 0)) is None
+
+    def test_reingest_unchanged_folder_skips_parsing(self, tmp_path):
+        company_path = make_company(tmp_path / "companies")
+        cache_dir = tmp_path / "parse_cache"
+
+        first = ExcelDataAdapter(parse_cache_dir=cache_dir)
+        with count_workbook_loads() as load:
+            first_results = first.load_company_data("TEST", company_path)
+        assert load.call_count == 4
+
+        second = ExcelDataAdapter(parse_cache_dir=cache_dir)
+        with count_workbook_loads() as load:
+            second_results = second.load_company_data("TEST", company_path)
+
+        assert load.call_count == 0
+        assert second._stats["parse_cache_hits"] == 4
+        assert second_results["files_processed"] == first_results["files_processed"] == 4
+        assert [d["periods_covered"] for d in second_results["file_details"]] == \
+            [d["periods_covered"] for d in first_results["file_details"]]
+
+    def test_modified_file_reparsed(self, tmp_path):
+        company_path = make_company(tmp_path / "companies")
+        cache_dir = tmp_path / "parse_cache"
+        ExcelDataAdapter(parse_cache_dir=cache_dir).load_company_data("TEST", company_path)
+
+        changed = os.path.join(company_path, "FY", "TEST - Income Statement.xlsx")
+        write_statement(changed, n_metrics=8)
+        stat = os.stat(changed)
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        adapter = ExcelDataAdapter(parse_cache_dir=cache_dir)
+        with count_workbook_loads() as load:
+            adapter.load_company_data("TEST", company_path)
+
+        assert load.call_count == 1
+        assert adapter._stats["parse_cache_hits"] == 3
@@ -0,0 +1,158 @@
+"""
+Unit tests for parallel multi-company Excel ingestion.
+
+Tests cover:
+- FileExtraction packing results into arrays and rebuilding them losslessly
+- load_companies_data in-process matching load_company_data
+- Process-pool ingestion storing worker results in the parent's VarInputData
+- Per-folder error isolation and progress callbacks
+- One BULK_UPDATE event per stored company instead of one event per value
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+from openpyxl import Workbook
+
+from core.data_processing.adapters.excel_adapter import (
+    ExcelDataAdapter,
+    ExcelFileInfo,
+    FileExtraction,
+    VariableExtractionResult,
+)
+from core.data_processing.financial_variable_registry import (
+    DataType,
+    VariableCategory,
+    VariableDefinition,
+    get_registry,
+)
+from core.data_processing.var_input_data import (
+    DataChangeEvent,
+    VariableMetadata,
+    get_var_input_data,
+)
+
+SYMBOLS = ["BATCHA", "BATCHB", "BATCHC"]
+
+
+def write_statement(path, scale):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Batch Company"])
+    ws.append([None, "FY-2", "FY-1", "FY"])
+    ws.append(["Zyx Sales", 100.0 * scale, 110.0 * scale, 121.0 * scale])
+    ws.append(["Zyx Cash", None, 5.0 * scale, 6.0 * scale])
+    wb.save(path)
+
+
+def make_company(root, symbol, scale=1.0):
+    folder = root / symbol / "FY"
+    folder.mkdir(parents=True)
+    write_statement(folder / f"{symbol} - Income Statement.xlsx", scale)
+    write_statement(folder / f"{symbol} - Cash Flow Statement.xlsx", scale)
+    return str(root / symbol)
+
+
+@pytest.fixture(autouse=True)
+def batch_variables():
+    registry = get_registry()
+    for name, category in (("zyx_sales", VariableCategory.INCOME_STATEMENT),
+                           ("zyx_cash", VariableCategory.CASH_FLOW)):
+        if registry.get_variable_definition(name) is None:
+            registry.register_variable(VariableDefinition(
+                name=name, category=category, data_type=DataType.FLOAT,
+                aliases={"excel": name.replace("_", " ").title()}
+            ))
+    yield
+    var_data = get_var_input_data()
+    for symbol in SYMBOLS:
+        var_data.clear_cache(symbol)
+
+
+@pytest.fixture
+def companies(tmp_path):
+    return {symbol: make_company(tmp_path, symbol, scale=i + 1) for i, symbol in enumerate(SYMBOLS)}
+
+
+class TestFileExtraction:
+    def test_round_trip(self):
+        file_info = ExcelFileInfo(
+            file_path="x.xlsx", sheet_type="income", period_type="FY", company_symbol="ABC",
+            available_periods=["FY", "FY-1", "FY-2"], header_row=1, data_quality_score=0.9
+        )
+        metadata = VariableMetadata(source="excel", timestamp=None, quality_score=0.72,
+                                    validation_passed=False, period="FY", lineage_id="external-lineage")
+        result = VariableExtractionResult(
+            variable_name="revenue", excel_column_name="Revenue", values={"FY": 3.5, "FY-2": "n.m."},
+            metadata=metadata, quality_score=0.0, missing_periods=["FY-1"], conversion_applied=None,
+            row_index=7
+        )
+
+        packed = FileExtraction.from_results(file_info, [result])
+        restored = pickle.loads(pickle.dumps(packed)).to_results("ABC")[0]
+
+        assert packed.values.shape == (1, 3)
+        assert np.isnan(packed.values[0, 1])
+        assert restored.values == {"FY": 3.5, "FY-2": "n.m."}
+        assert restored.missing_periods == ["FY-1"]
+        assert restored.row_index == 7
+        assert restored.metadata.lineage_id == "ABC_income_7"
+        assert restored.metadata.validation_passed is False
+        assert restored.quality_score == pytest.approx(result.quality_score)
+
+
+class TestBatchLoading:
+    def test_in_process_matches_single_company_load(self, companies):
+        single = ExcelDataAdapter().load_company_data("BATCHA", companies["BATCHA"], load_ltm=False)
+        batch = ExcelDataAdapter().load_companies_data(companies, load_ltm=False, max_workers=1)
+
+        for key in ("files_processed", "variables_loaded", "data_points_loaded"):
+            assert batch["BATCHA"][key] == single[key]
+        assert single["data_points_loaded"] == 5
+
+    def test_process_pool_stores_in_parent(self, companies, tmp_path):
+        (tmp_path / "BROKEN" / "FY").mkdir(parents=True)
+        (tmp_path / "BROKEN" / "FY" / "BROKEN - Income Statement.xlsx").write_bytes(b"not a workbook")
+        folders = list(companies.values()) + [str(tmp_path / "BROKEN")]
+        progress = []
+
+        adapter = ExcelDataAdapter()
+        results = adapter.load_companies_data(
+            folders, load_ltm=False, max_workers=2,
+            progress_callback=lambda done, total, symbol, result: progress.append((done, total, symbol))
+        )
+
+        assert set(results) == set(SYMBOLS) | {"BROKEN"}
+        assert results["BROKEN"]["errors"] and results["BROKEN"]["files_processed"] == 1
+        assert all(results[symbol]["data_points_loaded"] == 5 and not results[symbol]["errors"]
+                   for symbol in SYMBOLS)
+        assert [done for done, _, _ in progress] == [1, 2, 3, 4]
+        assert {total for _, total, _ in progress} == {4}
+
+        var_data = get_var_input_data()
+        assert var_data.get_variable("BATCHC", "zyx_sales", period="FY") == pytest.approx(363.0)
+        assert adapter.get_adapter_statistics()["adapter_stats"]["sheets_parsed"] == 6
+
+    def test_one_bulk_event_per_company(self, companies):
+        events = []
+
+        def record(event_type, **kwargs):
+            events.append((event_type, kwargs.get("data_count")))
+
+        var_data = get_var_input_data()
+        for event_type in DataChangeEvent:
+            var_data.subscribe_to_events(event_type, record)
+        try:
+            ExcelDataAdapter().load_companies_data(companies, load_ltm=False, max_workers=1)
+        finally:
+            for event_type in DataChangeEvent:
+                var_data.unsubscribe_from_events(event_type, record)
+
+        assert events == [(DataChangeEvent.BULK_UPDATE, 5)] * len(SYMBOLS)
+
+    def test_missing_folder_isolated(self, companies, tmp_path):
+        companies = dict(companies, GHOST=str(tmp_path / "GHOST"))
+        results = ExcelDataAdapter().load_companies_data(companies, max_workers=1)
+        assert results["GHOST"]["files_processed"] == 0
+        assert results["BATCHB"]["data_points_loaded"] == 5
@@ -0,0 +1,147 @@
+"""
+Unit tests for content-keyed, per-instance growth rate memoization.
+
+Tests cover:
+- content_key equality across lists, tuples, arrays and Series
+- ContentKeyedCache hit/miss/eviction counters and size bound
+- content_memoized caches living on (and dying with) each instance
+- FinancialCalculator.calculate_growth_rates accepting lists and caching by content
+- DCFValuator._calculate_historical_growth_rates cache stats
+"""
+
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.memoization import ContentKeyedCache, content_key, content_memoized
+
+
+class Doubler:
+    def __init__(self):
+        self.calls = 0
+
+    @content_memoized(maxsize=4)
+    def double(self, values, scale=2):
+        self.calls += 1
+        return [v * scale for v in values]
+
+
+class TestContentKey:
+    def test_equal_content_same_key(self):
+        keys = {
+            content_key(([1.0, 2.0, 3.0],), {}),
+            content_key(((1, 2, 3),), {}),
+            content_key((np.array([1.0, 2.0, 3.0]),), {}),
+            content_key((pd.Series([1.0, 2.0, 3.0]),), {}),
+        }
+        assert len(keys) == 1
+
+    def test_different_content_different_key(self):
+        assert content_key(([1.0, 2.0],), {}) != content_key(([1.0, 2.5],), {})
+        assert content_key(([1.0, 2.0],), {}) != content_key(([[1.0, 2.0]],), {})
+        assert content_key(([1.0],), {'periods': (1,)}) != content_key(([1.0],), {'periods': (3,)})
+
+    def test_non_numeric_arguments(self):
+        assert content_key((['a', 'b'],), {}) == content_key((['a', 'b'],), {})
+        assert content_key((lambda: None,), {})
+
+
+class TestContentKeyedCache:
+    def test_hits_and_misses(self):
+        cache = ContentKeyedCache(maxsize=2)
+        assert cache.get_or_compute(b'a', lambda: 1) == 1
+        assert cache.get_or_compute(b'a', lambda: 2) == 1
+
+        stats = cache.cache_info()
+        assert (stats.hits, stats.misses, stats.currsize) == (1, 1, 1)
+
+    def test_least_recently_used_evicted(self):
+        cache = ContentKeyedCache(maxsize=2)
+        cache.get_or_compute(b'a', lambda: 1)
+        cache.get_or_compute(b'b', lambda: 2)
+        cache.get_or_compute(b'a', lambda: 1)
+        cache.get_or_compute(b'c', lambda: 3)
+
+        assert cache.get_or_compute(b'b', lambda: 'recomputed') == 'recomputed'
+        assert cache.cache_info().evictions == 2
+        assert len(cache) == 2
+
+    def test_zero_size_disables_storage(self):
+        cache = ContentKeyedCache(maxsize=0)
+        cache.get_or_compute(b'a', lambda: 1)
+        assert len(cache) == 0
+
+
+class TestContentMemoized:
+    def test_cached_by_content(self):
+        doubler = Doubler()
+        assert doubler.double([1, 2]) == [2, 4]
+        assert doubler.double((1.0, 2.0)) == [2, 4]
+        assert doubler.double(np.array([1, 2]), scale=3) == [3, 6]
+
+        assert doubler.calls == 2
+        assert doubler.double.cache_info().hits == 1
+
+    def test_caches_are_per_instance(self):
+        first, second = Doubler(), Doubler()
+        first.double([1])
+        second.double([1])
+
+        assert first.calls == second.calls == 1
+        assert first.double.cache_info().currsize == 1
+
+    def test_cache_bounded(self):
+        doubler = Doubler()
+        for i in range(10):
+            doubler.double([i])
+        assert doubler.double.cache_info().currsize == 4
+
+    def test_cache_clear(self):
+        doubler = Doubler()
+        doubler.double([1])
+        doubler.double.cache_clear()
+        doubler.double([1])
+        assert doubler.calls == 2
+
+    def test_instances_released(self):
+        refs = []
+        for _ in range(50):
+            doubler = Doubler()
+            doubler.double([1, 2, 3])
+            refs.append(weakref.ref(doubler))
+        del doubler
+        gc.collect()
+
+        assert all(ref() is None for ref in refs)
+
+
+class TestCalculatorGrowthRates:
+    def test_financial_calculator_accepts_lists(self):
+        from core.analysis.engines.financial_calculations import FinancialCalculator
+
+        calculator = FinancialCalculator.__new__(FinancialCalculator)
+        values = [100.0, 110.0, 121.0, 133.1]
+
+        rates = calculator.calculate_growth_rates(values, periods=(1, 3))
+        assert rates['1Y'] == pytest.approx(0.10)
+        assert rates['3Y'] == pytest.approx(0.10)
+
+        calculator.calculate_growth_rates(tuple(values), periods=(1, 3))
+        stats = calculator.calculate_growth_rates.cache_info()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_dcf_valuator_released_with_cache(self):
+        from core.analysis.dcf.dcf_valuation import DCFValuator
+
+        valuator = DCFValuator.__new__(DCFValuator)
+        valuator._calculate_historical_growth_rates((100.0, 110.0, 121.0))
+        valuator._calculate_historical_growth_rates((100.0, 110.0, 121.0))
+        assert valuator._calculate_historical_growth_rates.cache_info().hits == 1
+
+        ref = weakref.ref(valuator)
+        del valuator
+        gc.collect()
+        assert ref() is None
@@ -0,0 +1,133 @@
+"""
+Unit tests for the shared peer caches in IndustryDataService.
+
+Tests cover:
+- One peer universe lookup and one P/B fetch per peer across many tickers in an industry
+- Separate TTLs for peer universes and peer P/B snapshots
+- Persistence of shared caches across service instances
+- warmup_industry prefetching an industry in a single pass
+- clear_cache removing shared caches
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from core.data_sources.industry_data_service import IndustryDataService, IndustryPeerData
+
+PEERS = ["JPM", "BAC", "WFC", "C", "USB", "PNC", "TFC"]
+SECTOR = {"sector": "Financial Services", "industry": "Banks - Diversified"}
+
+
+def peer_data(ticker):
+    return IndustryPeerData(
+        ticker=ticker,
+        sector=SECTOR["sector"],
+        industry=SECTOR["industry"],
+        pb_ratio=1.0 + PEERS.index(ticker) * 0.1 if ticker in PEERS else 1.5,
+        data_source="test",
+        last_updated=datetime.now(),
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = IndustryDataService(cache_dir=str(tmp_path))
+    svc.data_quality_validator = None
+    return svc
+
+
+@pytest.fixture
+def mocked(service):
+    with patch.object(service, "_get_sector_classification", return_value=dict(SECTOR)) as classify, \
+            patch.object(service, "_find_peer_companies", return_value=list(PEERS)) as find, \
+            patch.object(service, "_fetch_single_ticker_pb_data", side_effect=peer_data) as fetch:
+        yield classify, find, fetch
+
+
+class TestSharedPeerCache:
+    def test_industry_peers_fetched_once_for_many_tickers(self, service, mocked):
+        classify, find, fetch = mocked
+        banks = [f"BANK{i}" for i in range(40)]
+
+        results = [service.get_industry_pb_statistics(ticker) for ticker in banks]
+
+        assert all(stats is not None for stats in results)
+        assert classify.call_count == 40
+        assert find.call_count == 1
+        assert fetch.call_count == len(PEERS)
+        assert {stats.median_pb for stats in results} == {results[0].median_pb}
+
+    def test_expired_snapshots_refetched(self, service, mocked):
+        _, find, fetch = mocked
+        service.get_industry_pb_statistics("BANK0")
+        for ticker, (data, _) in list(service._peer_snapshots.items()):
+            service._peer_snapshots[ticker] = (data, datetime.now() - timedelta(days=2))
+
+        service.get_industry_pb_statistics("BANK1")
+
+        assert find.call_count == 1  # universe TTL is longer than snapshot TTL
+        assert fetch.call_count == 2 * len(PEERS)
+
+    def test_expired_universe_rebuilt(self, tmp_path, mocked):
+        service = IndustryDataService(cache_dir=str(tmp_path), peer_universe_ttl_hours=0)
+        service.data_quality_validator = None
+        with patch.object(service, "_get_sector_classification", return_value=dict(SECTOR)), \
+                patch.object(service, "_find_peer_companies", return_value=list(PEERS)) as find, \
+                patch.object(service, "_fetch_single_ticker_pb_data", side_effect=peer_data) as fetch:
+            service.get_industry_pb_statistics("BANK0")
+            service.get_industry_pb_statistics("BANK1")
+        assert find.call_count == 2
+        assert fetch.call_count == len(PEERS)
+
+    def test_failed_peer_not_refetched_within_ttl(self, service, mocked):
+        _, _, fetch = mocked
+        fetch.side_effect = lambda ticker: None if ticker == "TFC" else peer_data(ticker)
+
+        service.get_industry_pb_statistics("BANK0")
+        service.get_industry_pb_statistics("BANK1")
+
+        assert fetch.call_count == len(PEERS)
+
+    def test_shared_caches_persist(self, service, mocked, tmp_path):
+        service.get_industry_pb_statistics("BANK0")
+
+        restarted = IndustryDataService(cache_dir=str(tmp_path))
+        restarted.data_quality_validator = None
+        with patch.object(restarted, "_get_sector_classification", return_value=dict(SECTOR)), \
+                patch.object(restarted, "_find_peer_companies") as find, \
+                patch.object(restarted, "_fetch_single_ticker_pb_data") as fetch:
+            stats = restarted.get_industry_pb_statistics("BANK1")
+
+        assert stats.peer_count == len(PEERS)
+        find.assert_not_called()
+        fetch.assert_not_called()
+
+
+class TestWarmupAndClear:
+    def test_warmup_industry(self, service, mocked):
+        classify, find, fetch = mocked
+
+        stats = service.warmup_industry(SECTOR["sector"], SECTOR["industry"])
+        service.get_industry_pb_statistics("BANK0")
+
+        assert stats.peer_count == len(PEERS)
+        assert find.call_count == 1
+        assert fetch.call_count == len(PEERS)
+
+    def test_warmup_insufficient_peers(self, service, mocked):
+        _, find, _ = mocked
+        find.return_value = PEERS[:2]
+        assert service.warmup_industry(SECTOR["sector"], SECTOR["industry"]) is None
+        assert service._peer_universes == {}
+
+    def test_clear_cache_clears_shared_caches(self, service, mocked, tmp_path):
+        service.get_industry_pb_statistics("BANK0")
+        assert service.get_cache_info()["cached_peer_universes"] == 1
+
+        service.clear_cache()
+
+        assert service._peer_universes == {}
+        assert service._peer_snapshots == {}
+        assert list(tmp_path.glob("peer_*")) == []
@@ -0,0 +1,106 @@
+"""
+Unit tests for MetricRowIndex and its use in FinancialCalculator._extract_metric_values.
+
+Tests cover:
+- Exact, case-insensitive and best-partial label resolution
+- Labels taken from the first non-null cell of the first three columns
+- Numeric row values coerced on first use, only by unvalidated extraction
+- Memoization of lookups and reuse of one index per DataFrame
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.analysis.engines.financial_calculations import FinancialCalculator, MetricRowIndex
+
+
+@pytest.fixture
+def statement():
+    return pd.DataFrame(
+        [
+            ["Revenue", None, None, 100, 110, 120],
+            [None, "Total Revenue Adjusted", None, 1, 2, 3],
+            ["Net Income", None, None, "(5)", "1,200", None],
+            [None, None, "Net Income to Company", 7, 8, 9],
+            ["Free Cash Flow", None, None, "", "n/a", 4.5],
+        ],
+        columns=[None, None, None, "FY-2", "FY-1", "FY"],
+    )
+
+
+@pytest.fixture
+def calculator():
+    calc = FinancialCalculator(None)
+    calc.validation_enabled = False
+    return calc
+
+
+class TestMetricRowIndex:
+    def test_labels_from_first_three_columns(self, statement):
+        index = MetricRowIndex(statement)
+        assert index.labels == [
+            "Revenue",
+            "Total Revenue Adjusted",
+            "Net Income",
+            "Net Income to Company",
+            "Free Cash Flow",
+        ]
+
+    def test_exact_match_is_case_insensitive(self, statement):
+        index = MetricRowIndex(statement)
+        assert index.find("net income") == (2, 1.0)
+
+    def test_partial_match_uses_best_score(self, statement):
+        index = MetricRowIndex(statement)
+        pos, score = index.find("Income to")
+        assert pos == 3
+        assert score == pytest.approx(len("Income to") / len("Net Income to Company"))
+
+    def test_missing_metric(self, statement):
+        assert MetricRowIndex(statement).find("EBITDA") == (None, 0)
+
+    def test_lookups_are_memoized(self, statement):
+        index = MetricRowIndex(statement)
+        index.find("Revenue Adj")
+        index.labels = []  # a second scan would now find nothing
+        assert index.find("Revenue Adj")[0] == 1
+
+    def test_numeric_matrix(self, statement):
+        index = MetricRowIndex(statement)
+        assert index._numeric_values is None
+        np.testing.assert_array_equal(index.numeric_values[2], [-5.0, 1200.0, 0.0])
+        np.testing.assert_array_equal(index.empty_mask[4], [True, False, False])
+
+
+class TestExtractMetricValuesWithIndex:
+    def test_unvalidated_extraction(self, calculator, statement):
+        assert calculator._extract_metric_values(statement, "Net Income") == [-5.0, 1200.0]
+        assert calculator._extract_metric_values(statement, "Revenue", reverse=True) == [
+            120.0,
+            110.0,
+            100.0,
+        ]
+
+    def test_validated_extraction_matches_unvalidated(self, calculator, statement):
+        unvalidated = calculator._extract_metric_values(statement, "Net Income to Company")
+        calculator.validation_enabled = True
+        assert calculator._extract_metric_values(statement, "Net Income to Company") == unvalidated
+
+    def test_validated_extraction_skips_numeric_matrix(self, calculator, statement):
+        calculator.validation_enabled = True
+        calculator._extract_metric_values(statement, "Revenue")
+        assert calculator._get_metric_index(statement)._numeric_values is None
+
+    def test_index_is_built_once_per_dataframe(self, calculator, statement):
+        with patch.object(pd.DataFrame, "iterrows", side_effect=AssertionError("row scan")):
+            calculator._extract_metric_values(statement, "Revenue")
+            first = calculator._get_metric_index(statement)
+            calculator._extract_metric_values(statement, "Net Income")
+            assert calculator._get_metric_index(statement) is first
+
+    def test_new_dataframe_gets_new_index(self, calculator, statement):
+        first = calculator._get_metric_index(statement)
+        assert calculator._get_metric_index(statement.copy()) is not first
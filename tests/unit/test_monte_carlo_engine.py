@@ -0,0 +1,188 @@
+"""
+Unit tests for the shared Monte Carlo engine.
+
+Tests cover:
+- Reproducible draws from a seeded numpy Generator
+- Batched (series x paths) simulation with per-series statistics
+- Single quantile pass serving confidence intervals and VaR
+- Chunked streaming matching in-memory results within histogram resolution
+- P/B historical Monte Carlo and batched PBFairValueCalculator distributions
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from core.analysis.monte_carlo import (
+    MonteCarloEngine,
+    bootstrap_sampler,
+    normal_sampler,
+    quantile_levels,
+)
+
+
+class RecordingSampler:
+    """Wraps a sampler and keeps every chunk it produces"""
+
+    def __init__(self, sampler):
+        self.sampler = sampler
+        self.chunks = []
+
+    def __call__(self, rng, n_paths):
+        draws = self.sampler(rng, n_paths)
+        self.chunks.append(draws.copy())
+        return draws
+
+
+class TestQuantileLevels:
+    def test_ci_and_var_levels_merged(self):
+        assert quantile_levels((0.90,), (0.05, 0.01)) == (0.01, 0.05, 0.5, 0.95)
+
+
+class TestInMemory:
+    def test_seeded_runs_reproducible(self):
+        sampler = normal_sampler(1.5, 0.3)
+        first = MonteCarloEngine(seed=7).simulate(sampler, 1000, keep_samples=True)
+        second = MonteCarloEngine(seed=7).simulate(sampler, 1000, keep_samples=True)
+        other = MonteCarloEngine(seed=8).simulate(sampler, 1000, keep_samples=True)
+
+        np.testing.assert_array_equal(first.samples, second.samples)
+        assert not np.array_equal(first.samples, other.samples)
+
+    def test_reseed_restarts_sequence(self):
+        engine = MonteCarloEngine(seed=3)
+        first = engine.simulate(normal_sampler(0.0, 1.0), 100).mean
+        engine.reseed()
+        assert engine.simulate(normal_sampler(0.0, 1.0), 100).mean == first
+
+    def test_batched_series(self):
+        summary = MonteCarloEngine(seed=1).simulate(
+            normal_sampler([1.0, 2.0, 3.0], [0.1, 0.2, 0.3]), 50_000
+        )
+
+        assert summary.mean.shape == (3,)
+        np.testing.assert_allclose(summary.mean, [1.0, 2.0, 3.0], atol=0.01)
+        np.testing.assert_allclose(summary.std, [0.1, 0.2, 0.3], rtol=0.02)
+        lower, upper = summary.confidence_interval(0.95)
+        np.testing.assert_allclose(lower, np.array([1.0, 2.0, 3.0]) - 1.96 * np.array([0.1, 0.2, 0.3]), rtol=0.02)
+        assert np.all(upper > summary.mean)
+
+    def test_single_quantile_call(self):
+        with patch('core.analysis.monte_carlo.np.quantile', wraps=np.quantile) as quantile:
+            summary = MonteCarloEngine(seed=1).simulate(normal_sampler(1.0, 0.1), 1000)
+            summary.confidence_interval(0.99)
+            summary.value_at_risk(0.001)
+        assert quantile.call_count == 1
+
+    def test_unknown_quantile(self):
+        summary = MonteCarloEngine(seed=1).simulate(normal_sampler(1.0, 0.1), 100, quantiles=[0.5])
+        with pytest.raises(KeyError):
+            summary.value_at_risk(0.05)
+
+    def test_minimum_floor(self):
+        summary = MonteCarloEngine(seed=1).simulate(normal_sampler(0.0, 1.0, minimum=0.01), 1000)
+        assert summary.minimum == pytest.approx(0.01)
+
+    def test_bootstrap_draws_observed_values(self):
+        values = [[1.0, 2.0, 3.0], [10.0, 20.0, 30.0]]
+        summary = MonteCarloEngine(seed=1).simulate(bootstrap_sampler(values), 500, keep_samples=True)
+        assert set(np.unique(summary.samples[1])) <= {10.0, 20.0, 30.0}
+
+
+class TestChunked:
+    def test_matches_exact_statistics_of_same_draws(self):
+        recorder = RecordingSampler(normal_sampler([1.0, 4.0], [0.2, 1.0]))
+        engine = MonteCarloEngine(seed=5, memory_limit_bytes=256 * 1024)
+
+        summary = engine.simulate(recorder, 200_000)
+
+        assert summary.chunked
+        first_pass = recorder.chunks[1:1 + (len(recorder.chunks) - 1) // 2]
+        draws = np.concatenate(first_pass, axis=-1)
+        assert draws.shape == (2, 200_000)
+        np.testing.assert_allclose(summary.mean, draws.mean(axis=-1))
+        np.testing.assert_allclose(summary.std, draws.std(axis=-1))
+        exact = np.quantile(draws, summary.quantile_levels, axis=-1)
+        resolution = (draws.max(axis=-1) - draws.min(axis=-1)) / engine.histogram_bins
+        assert np.all(np.abs(summary.quantiles - exact) <= 2 * resolution)
+
+    def test_chunks_respect_memory_limit(self):
+        recorder = RecordingSampler(normal_sampler(1.0, 0.1))
+        MonteCarloEngine(seed=5, memory_limit_bytes=64 * 1024).simulate(recorder, 50_000)
+        assert max(chunk.nbytes for chunk in recorder.chunks) <= 64 * 1024
+
+    def test_declared_workspace_sizes_chunks(self):
+        recorder = RecordingSampler(normal_sampler(1.0, 0.1))
+        summary = MonteCarloEngine(seed=5, memory_limit_bytes=64 * 1024).simulate(
+            recorder, 5_000, bytes_per_path=64
+        )
+        assert summary.chunked
+        assert max(chunk.shape[-1] for chunk in recorder.chunks) == 1_024
+
+    def test_chunked_runs_reproducible(self):
+        sampler = normal_sampler(1.0, 0.1)
+        first = MonteCarloEngine(seed=9).simulate(sampler, 10_000, chunk_size=1_000)
+        second = MonteCarloEngine(seed=9).simulate(sampler, 10_000, chunk_size=1_000)
+        np.testing.assert_array_equal(first.quantiles, second.quantiles)
+
+    def test_constant_series(self):
+        summary = MonteCarloEngine(seed=1).simulate(normal_sampler(2.0, 0.0), 5_000, chunk_size=1_000)
+        np.testing.assert_allclose(summary.quantiles, 2.0)
+
+
+class TestPBIntegration:
+    def test_historical_monte_carlo_seeded(self):
+        from core.analysis.pb.pb_historical_analysis import (
+            PBHistoricalAnalysisEngine,
+            PBHistoricalQualityMetrics,
+            PBStatisticalSummary,
+        )
+
+        quality = PBHistoricalQualityMetrics()
+        quality.overall_score = 0.8
+        ratios = list(np.random.default_rng(0).normal(2.0, 0.3, 40))
+
+        results = []
+        for _ in range(2):
+            summary = PBStatisticalSummary(is_normal_distribution=False)
+            engine = PBHistoricalAnalysisEngine(seed=11, monte_carlo_paths=20_000)
+            results.append(engine._run_monte_carlo_simulation(summary, ratios, quality))
+
+        assert results[0].monte_carlo_value_at_risk == results[1].monte_carlo_value_at_risk
+        assert set(results[0].monte_carlo_confidence_intervals) == {'90%', '95%', '99%'}
+        assert set(results[0].monte_carlo_value_at_risk) == {'5.0%', '1.0%', '0.1%'}
+        lower, upper = results[0].monte_carlo_confidence_intervals['95%']
+        assert lower < results[0].monte_carlo_mean < upper
+
+    def test_fair_value_distribution_batched(self):
+        from core.analysis.pb.pb_fair_value_calculator import PBFairValueCalculator
+        from core.analysis.pb.pb_historical_analysis import (
+            PBHistoricalAnalysisResult,
+            PBHistoricalQualityMetrics,
+            PBStatisticalSummary,
+        )
+
+        def analysis(mean, std):
+            quality = PBHistoricalQualityMetrics()
+            quality.overall_score = 1.0
+            return PBHistoricalAnalysisResult(
+                success=True,
+                statistics=PBStatisticalSummary(quality_weighted_mean=mean, median_pb=mean, std_pb=std),
+                quality_metrics=quality,
+            )
+
+        calculator = PBFairValueCalculator(monte_carlo=MonteCarloEngine(seed=2))
+        with patch.object(calculator.monte_carlo, 'simulate', wraps=calculator.monte_carlo.simulate) as simulate:
+            distributions = calculator.simulate_fair_value_distribution(
+                {'JPM': analysis(1.5, 0.2), 'BAC': analysis(1.0, 0.1), 'NONE': analysis(1.0, 0.1)},
+                {'JPM': 100.0, 'BAC': 30.0},
+                n_paths=50_000,
+            )
+
+        assert simulate.call_count == 1
+        assert set(distributions) == {'JPM', 'BAC'}
+        assert distributions['JPM']['mean'] == pytest.approx(150.0, rel=0.01)
+        assert distributions['BAC']['std'] == pytest.approx(3.0, rel=0.03)
+        lower, upper = distributions['JPM']['confidence_intervals']['95%']
+        assert lower < 150.0 < upper
@@ -0,0 +1,144 @@
+"""
+Unit tests for concurrent batch fetching in RealTimePriceService.
+
+Tests cover:
+- Blocking providers run off the event loop, so a batch overlaps provider calls
+- Per-provider concurrency limits
+- Batch deadline reporting timed-out tickers
+- Per-ticker latency, answering provider and fallback order
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.data_sources.interfaces.data_sources import (
+    ApiCredentials,
+    DataSourceConfig,
+    DataSourcePriority,
+    DataSourceResponse,
+    DataSourceType,
+)
+from core.data_sources.real_time_price_service import RealTimePriceService
+
+
+class SleepyProvider:
+    """Blocking provider stub that records its peak concurrency."""
+
+    def __init__(self, delay=0.1, fail_tickers=()):
+        self.delay = delay
+        self.fail_tickers = set(fail_tickers)
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_data(self, request):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if request.ticker in self.fail_tickers:
+            return DataSourceResponse(success=False, error_message="not found")
+        return DataSourceResponse(success=True, data={"current_price": 10.0})
+
+
+def make_service(tmp_path, providers, max_workers=16, max_concurrency_per_provider=8):
+    service = RealTimePriceService(
+        cache_dir=str(tmp_path),
+        max_workers=max_workers,
+        max_concurrency_per_provider=max_concurrency_per_provider,
+    )
+    service._providers = {}
+    service._provider_configs = {}
+    for source_type, priority, provider, credentials in providers:
+        service._providers[source_type] = provider
+        service._provider_configs[source_type] = DataSourceConfig(
+            source_type=source_type, priority=priority, credentials=credentials
+        )
+    return service
+
+
+class TestBatchConcurrency:
+    def test_blocking_providers_run_concurrently(self, tmp_path):
+        provider = SleepyProvider(delay=0.2)
+        service = make_service(
+            tmp_path, [(DataSourceType.YFINANCE, DataSourcePriority.PRIMARY, provider, None)]
+        )
+        tickers = [f"T{i}" for i in range(16)]
+
+        start = time.perf_counter()
+        results = asyncio.run(service.fetch_prices_batch(tickers, force_refresh=True))
+        elapsed = time.perf_counter() - start
+
+        assert all(result.success for result in results.values())
+        # 16 x 0.2s serially would take 3.2s; 8 at a time takes ~0.4s
+        assert elapsed < 1.5
+        assert provider.peak > 1
+
+    def test_per_provider_limit_respected(self, tmp_path):
+        provider = SleepyProvider(delay=0.05)
+        service = make_service(
+            tmp_path,
+            [(DataSourceType.YFINANCE, DataSourcePriority.PRIMARY, provider, None)],
+            max_concurrency_per_provider=3,
+        )
+        asyncio.run(service.fetch_prices_batch([f"T{i}" for i in range(12)], force_refresh=True))
+        assert provider.peak <= 3
+
+    def test_credential_rate_limit_caps_concurrency(self, tmp_path):
+        provider = SleepyProvider(delay=0.05)
+        credentials = ApiCredentials(api_key="x", base_url="http://example", rate_limit_calls=2)
+        service = make_service(
+            tmp_path,
+            [(DataSourceType.ALPHA_VANTAGE, DataSourcePriority.PRIMARY, provider, credentials)],
+        )
+        asyncio.run(service.fetch_prices_batch([f"T{i}" for i in range(8)], force_refresh=True))
+        assert provider.peak <= 2
+
+
+class TestBatchReporting:
+    def test_deadline_marks_outstanding_tickers(self, tmp_path):
+        provider = SleepyProvider(delay=0.5)
+        service = make_service(
+            tmp_path,
+            [(DataSourceType.YFINANCE, DataSourcePriority.PRIMARY, provider, None)],
+            max_concurrency_per_provider=1,
+        )
+        results = asyncio.run(
+            service.fetch_prices_batch(["A", "B", "C"], force_refresh=True, timeout=0.7)
+        )
+        timed_out = [ticker for ticker, result in results.items() if result.timed_out]
+        assert results["A"].success
+        assert timed_out == ["B", "C"]
+
+    def test_reports_provider_latency_and_fallback(self, tmp_path):
+        primary = SleepyProvider(delay=0.01, fail_tickers={"MSFT"})
+        secondary = SleepyProvider(delay=0.01)
+        service = make_service(
+            tmp_path,
+            [
+                (DataSourceType.YFINANCE, DataSourcePriority.PRIMARY, primary, None),
+                (DataSourceType.POLYGON, DataSourcePriority.SECONDARY, secondary, None),
+            ],
+        )
+        results = asyncio.run(service.fetch_prices_batch(["aapl", "MSFT"], force_refresh=True))
+
+        assert set(results) == {"AAPL", "MSFT"}
+        assert results["AAPL"].provider == "yfinance_price"
+        assert results["MSFT"].provider == "polygon_price"
+        assert all(result.latency_ms > 0 for result in results.values())
+
+    def test_get_multiple_prices_returns_price_data(self, tmp_path):
+        provider = SleepyProvider(delay=0.01, fail_tickers={"BAD"})
+        service = make_service(
+            tmp_path, [(DataSourceType.YFINANCE, DataSourcePriority.PRIMARY, provider, None)]
+        )
+        prices = asyncio.run(service.get_multiple_prices(["GOOD", "BAD"], force_refresh=True))
+        assert prices["GOOD"].current_price == pytest.approx(10.0)
+        assert prices["BAD"] is None
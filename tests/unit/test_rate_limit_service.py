@@ -0,0 +1,283 @@
+"""
+Unit tests for the shared token-bucket rate limit service.
+
+Tests cover:
+- Token bucket refill, wait times and all-or-nothing consumption across windows
+- acquire() blocking, timeouts and cost validation
+- Provider name normalization (aliases and DataSourceType members share a quota)
+- Atomic acquisition under concurrent threads for every backend
+- SQLite and file-lock backends sharing one quota across worker processes
+- Status reporting on every backend, including providers that were never charged
+- ApiBatchManager configuring quotas on the shared service
+- One token per API call when EnhancedApiManager drives an adapter
+- Configured provider credentials overriding the default quotas
+- YFinanceAdapter calls drawing from the shared quota instead of fixed sleeps
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from core.data_processing.adapters.base_adapter import DataSourceType
+from core.data_processing.rate_limiting.rate_limit_service import (
+    FileLockBucketStore,
+    MemoryBucketStore,
+    RateLimit,
+    RateLimitService,
+    SQLiteBucketStore,
+    create_bucket_store,
+    window_limits,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_service(limits, store=None, clock=None):
+    clock = clock or FakeClock()
+    return RateLimitService(store, limits=limits, clock=clock, sleep=clock.sleep), clock
+
+
+def make_store(kind, tmp_path):
+    if kind == "memory":
+        return MemoryBucketStore()
+    if kind == "sqlite":
+        return SQLiteBucketStore(tmp_path / "limits.db")
+    return FileLockBucketStore(tmp_path / "limits.json")
+
+
+def acquire_in_worker(backend, state_path, attempts):
+    """Worker process: count tokens taken from a slow-refilling shared bucket"""
+    service = RateLimitService(create_bucket_store(backend, state_path),
+                               limits={"shared": [RateLimit(10, 3600)]})
+    return sum(service.try_acquire("shared")[0] for _ in range(attempts))
+
+
+class TestTokenBucket:
+    def test_capacity_and_refill(self):
+        service, clock = make_service({"api": [RateLimit.per_second(2)]})
+
+        assert service.try_acquire("api") == (True, 0.0)
+        assert service.try_acquire("api") == (True, 0.0)
+        acquired, wait = service.try_acquire("api")
+        assert not acquired and wait == pytest.approx(0.5)
+
+        clock.now += 0.5
+        assert service.try_acquire("api")[0]
+
+    def test_all_windows_must_have_tokens(self):
+        service, clock = make_service({"api": [RateLimit.per_second(5), RateLimit.per_minute(3)]})
+
+        assert all(service.try_acquire("api")[0] for _ in range(3))
+        acquired, wait = service.try_acquire("api")
+        assert not acquired and wait == pytest.approx(20.0)
+
+        # A denied call must not drain the per-second bucket
+        status = service.get_status("api")
+        assert status["buckets"][0]["available"] == pytest.approx(2.0)
+
+    def test_wait_time_does_not_consume(self):
+        service, _ = make_service({"api": [RateLimit.per_minute(1)]})
+        assert service.wait_time("api") == 0.0
+        assert service.wait_time("api") == 0.0
+        assert service.try_acquire("api")[0]
+        assert service.wait_time("api") == pytest.approx(60.0)
+
+    def test_window_limits_burst_on_shortest_window(self):
+        limits = window_limits(per_minute=60, per_hour=1000, burst=10)
+        assert [(l.calls, l.period_seconds, l.capacity) for l in limits] == \
+            [(60, 60.0, 70), (1000, 3600.0, 1000)]
+
+
+class TestAcquire:
+    def test_blocks_until_refilled(self):
+        service, clock = make_service({"api": [RateLimit.per_second(1)]})
+        assert service.acquire("api")
+        assert service.acquire("api", timeout=5)
+        assert clock.sleeps == [pytest.approx(1.0)]
+        assert service.get_statistics()["api"]["waits"] == 1
+
+    def test_timeout(self):
+        service, clock = make_service({"api": [RateLimit.per_minute(1)]})
+        assert service.acquire("api", timeout=0)
+        assert not service.acquire("api", timeout=10)
+        assert clock.sleeps == []
+        assert service.get_statistics()["api"]["denied"] == 1
+
+    def test_cost(self):
+        service, _ = make_service({"api": [RateLimit.per_second(3)]})
+        assert service.acquire("api", cost=3, timeout=0)
+        assert not service.acquire("api", cost=1, timeout=0)
+        with pytest.raises(ValueError):
+            service.try_acquire("api", cost=4)
+
+    def test_unconfigured_provider_unlimited(self):
+        service, clock = make_service({})
+        assert all(service.acquire("excel", timeout=0) for _ in range(100))
+        assert service.get_status("excel")["buckets"] == []
+
+    def test_aliases_share_quota(self):
+        service, _ = make_service({"yfinance": [RateLimit.per_minute(2)]})
+        assert service.acquire("yahoo_finance", timeout=0)
+        assert service.acquire(DataSourceType.YFINANCE, timeout=0)
+        assert not service.acquire("Yahoo", timeout=0)
+
+    def test_configure_without_override_keeps_existing(self):
+        service, _ = make_service({"api": [RateLimit.per_minute(5)]})
+        service.configure("api", [RateLimit.per_minute(1)], override=False)
+        assert service.get_limits("api") == (RateLimit.per_minute(5),)
+
+    def test_default_quotas(self):
+        service = RateLimitService()
+        assert service.get_limits("alpha_vantage")[0] == RateLimit.per_minute(5)
+
+
+class TestBackends:
+    @pytest.mark.parametrize("kind", ["memory", "sqlite", "file"])
+    def test_concurrent_threads_never_overshoot(self, kind, tmp_path):
+        service, _ = make_service({"api": [RateLimit.per_minute(50)]}, make_store(kind, tmp_path))
+        taken = []
+        lock = threading.Lock()
+
+        def worker():
+            count = sum(service.try_acquire("api")[0] for _ in range(20))
+            with lock:
+                taken.append(count)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(taken) == 50
+
+    @pytest.mark.parametrize("kind", ["sqlite", "file"])
+    def test_state_persists_across_service_instances(self, kind, tmp_path):
+        first, clock = make_service({"api": [RateLimit.per_minute(2)]}, make_store(kind, tmp_path))
+        second, _ = make_service({"api": [RateLimit.per_minute(2)]}, make_store(kind, tmp_path), clock)
+
+        assert first.try_acquire("api")[0]
+        assert second.try_acquire("api")[0]
+        assert not first.try_acquire("api")[0]
+
+        second.reset("api")
+        assert first.try_acquire("api")[0]
+
+    @pytest.mark.parametrize("kind", ["memory", "sqlite", "file"])
+    def test_status_of_uncharged_provider(self, kind, tmp_path):
+        service, clock = make_service({"api": [RateLimit.per_minute(2)]}, make_store(kind, tmp_path))
+
+        status = service.get_status("api")
+        assert status["buckets"][0]["available"] == 2
+        assert status["wait_time_seconds"] == 0.0
+
+        assert service.try_acquire("api")[0]
+        assert service.try_acquire("api")[0]
+        clock.now += 15
+        status = service.get_status("api")
+        assert status["buckets"][0]["available"] == pytest.approx(0.5)
+        assert status["wait_time_seconds"] == pytest.approx(15.0)
+        assert service.try_acquire("api") == (False, pytest.approx(15.0))
+
+    @pytest.mark.parametrize("backend, filename", [("sqlite", "limits.db"), ("file", "limits.json")])
+    def test_processes_share_quota(self, backend, filename, tmp_path):
+        state_path = str(tmp_path / filename)
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            counts = list(executor.map(acquire_in_worker, [backend] * 4, [state_path] * 4, [8] * 4))
+        assert sum(counts) == 10
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_bucket_store("redis")
+
+
+class TestApiBatchManager:
+    def test_quotas_configured_on_shared_service(self):
+        from core.data_processing.api_batch_manager import ApiBatchManager, RateLimitConfig
+
+        service, _ = make_service({})
+        manager = ApiBatchManager(
+            rate_limit_config={"test_provider": RateLimitConfig(calls_per_minute=2, burst_allowance=1)},
+            rate_limit_service=service
+        )
+
+        assert service.get_limits("test_provider")[0].capacity == 3
+        assert all(service.acquire("test_provider", timeout=0) for _ in range(3))
+
+        stats = manager.get_statistics()["rate_limiters"]["test_provider"]
+        assert stats["can_make_request"] is False
+        assert stats["wait_time_seconds"] == pytest.approx(30.0)
+
+
+class TestEnhancedApiManager:
+    def test_request_charged_once(self, monkeypatch):
+        from core.data_processing.adapters import base_adapter
+        from core.data_processing.adapters.alpha_vantage_adapter import AlphaVantageAdapter
+        from core.data_processing.adapters.enhanced_api_manager import EnhancedApiManager
+
+        service, _ = make_service({"alpha_vantage": [RateLimit.per_minute(5)]})
+        monkeypatch.setattr(base_adapter, "get_rate_limit_service", lambda: service)
+        manager = EnhancedApiManager.__new__(EnhancedApiManager)
+        manager.rate_limit_service = service
+
+        assert manager._can_make_request(DataSourceType.ALPHA_VANTAGE)
+        AlphaVantageAdapter(api_key="demo").enforce_rate_limit()
+
+        assert service.get_status("alpha_vantage")["buckets"][0]["available"] == 4
+
+
+class TestFinancialDataProvider:
+    def test_credentials_override_default_quota(self, monkeypatch):
+        from core.data_sources.interfaces import data_sources as ds
+
+        class Provider(ds.FinancialDataProvider):
+            def fetch_data(self, request):
+                return None
+
+            def validate_credentials(self):
+                return True
+
+        service, _ = make_service(None)
+        monkeypatch.setattr(ds, "get_rate_limit_service", lambda: service)
+        credentials = ds.ApiCredentials(api_key="key", base_url="", rate_limit_calls=75, rate_limit_period=60)
+        provider = Provider(ds.DataSourceConfig(
+            ds.DataSourceType.ALPHA_VANTAGE, ds.DataSourcePriority.SECONDARY, credentials
+        ))
+
+        for _ in range(10):
+            provider._enforce_rate_limit()
+
+        assert service.get_limits("alpha_vantage") == (RateLimit(75, 60),)
+        assert service.get_status("alpha_vantage")["buckets"][0]["available"] == 65
+
+
+class TestYFinanceAdapter:
+    def test_api_calls_use_shared_quota(self, monkeypatch):
+        from unittest.mock import MagicMock
+
+        from core.data_processing.adapters import yfinance_adapter
+
+        service, clock = make_service({"yfinance": [RateLimit.per_second(2)]})
+        monkeypatch.setattr(yfinance_adapter, "get_rate_limit_service", lambda: service)
+        sleeps = []
+        monkeypatch.setattr(yfinance_adapter.time, "sleep", sleeps.append)
+        adapter = yfinance_adapter.YFinanceAdapter(rate_limit_delay=0.5)
+
+        for _ in range(4):
+            adapter._safe_api_call(MagicMock(), "financials")
+
+        assert sleeps == []
+        assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert adapter._stats["rate_limit_hits"] == 2
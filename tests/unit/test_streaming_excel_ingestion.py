@@ -0,0 +1,104 @@
+"""
+Unit tests for the read-only streaming Excel ingestion path.
+
+Tests cover:
+- stream_statement_rows / build_typed_dataframe helpers in utils/excel_processor.py
+- FinancialCalculator(streaming_excel=True) matching the full-workbook loader
+- CentralizedDataManager(streaming_excel=True) loading a company folder
+"""
+
+import numpy as np
+import pytest
+from openpyxl import Workbook
+
+from utils.excel_processor import build_typed_dataframe, stream_statement_rows
+
+
+def write_statement(path, n_metrics=20):
+    """Write a statement workbook with two title rows above the FY header."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Test Company Inc"])
+    ws.append(["Income Statement"])
+    ws.append([None, None, None, "FY-2", "FY-1", "FY"])
+    ws.append(["Period End Date", None, None, "12/31/2022", "12/31/2023", "12/31/2024"])
+    for i in range(n_metrics):
+        ws.append([f"Metric {i}", None, None, float(i), None, float(i * 3)])
+    wb.save(path)
+
+
+@pytest.fixture
+def statement_file(tmp_path):
+    path = tmp_path / "Test - Income Statement.xlsx"
+    write_statement(path)
+    return str(path)
+
+
+class TestStreamingHelpers:
+    def test_stream_starts_after_fy_header(self, statement_file):
+        header, rows = stream_statement_rows(statement_file)
+        assert header[3:] == ("FY-2", "FY-1", "FY")
+        assert rows[0][0] == "Period End Date"
+        assert len(rows) == 21
+
+    def test_no_header_returns_all_rows(self, tmp_path):
+        path = tmp_path / "plain.xlsx"
+        wb = Workbook()
+        wb.active.append(["a", 1])
+        wb.active.append(["b", 2])
+        wb.save(path)
+
+        header, rows = stream_statement_rows(str(path))
+        assert header is None
+        assert rows == [("a", 1), ("b", 2)]
+
+    def test_typed_columns(self):
+        rows = [("Revenue", 1, None), ("Cost", 2.5, "n/a")]
+        df = build_typed_dataframe(rows, ["label", "FY-1", "FY"])
+        assert df["FY-1"].dtype == np.float64
+        assert df["FY"].dtype == object
+        assert df["label"].tolist() == ["Revenue", "Cost"]
+
+    def test_duplicate_and_missing_labels(self):
+        rows = [(1, 2, 3)]
+        df = build_typed_dataframe(rows, [None, None])
+        assert df.shape == (1, 3)
+        assert list(df.columns) == [None, None, None]
+
+    def test_empty_rows(self):
+        df = build_typed_dataframe([], ["a", "b"])
+        assert df.empty
+        assert list(df.columns) == ["a", "b"]
+
+
+class TestFinancialCalculatorStreaming:
+    def test_streaming_matches_full_loader(self, statement_file):
+        from core.analysis.engines.financial_calculations import FinancialCalculator
+
+        full = FinancialCalculator(None)._load_excel_data(statement_file)
+        fast_calc = FinancialCalculator(None, streaming_excel=True)
+        fast = fast_calc._load_excel_data(statement_file)
+
+        assert fast.shape == full.shape
+        assert list(fast.columns) == list(full.columns)
+        assert fast.attrs["fy_date_range"] == full.attrs["fy_date_range"]
+        assert fast_calc._extract_metric_values(fast, "Metric 7") == [7.0, 0.0, 21.0]
+
+
+class TestCentralizedDataManagerStreaming:
+    def test_streaming_folder_load(self, tmp_path):
+        from core.data_processing.managers.centralized_data_manager import CentralizedDataManager
+
+        company = tmp_path / "TEST"
+        (company / "FY").mkdir(parents=True)
+        write_statement(company / "FY" / "Test - Income Statement.xlsx")
+
+        manager = CentralizedDataManager(
+            str(tmp_path), cache_dir=str(tmp_path / "cache"), streaming_excel=True
+        )
+        data = manager._load_excel_folder(company / "FY", "_fy")
+
+        df = data["income_fy"]
+        assert list(df.columns) == ["Unnamed: 0", "Unnamed: 1", "Unnamed: 2", "FY-2", "FY-1", "FY"]
+        assert df.iloc[0, 0] == "Period End Date"
+        assert len(df) == 21
@@ -0,0 +1,161 @@
+"""
+Unit tests for lock scope and request coalescing in UnifiedDataAdapter.fetch_data.
+
+Tests cover:
+- Provider calls for different tickers run in parallel (no global lock across I/O)
+- Concurrent requests for the same cache key share one provider call
+- Cache hits and force_refresh behaviour
+- A caller that becomes leader after a finished fetch reusing its cached result
+- Provider exceptions propagating to coalesced callers as a failed response
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.data_processing.unified_data_adapter import UnifiedDataAdapter
+from core.data_sources.interfaces.data_sources import (
+    DataQualityMetrics,
+    DataSourceConfig,
+    DataSourcePriority,
+    DataSourceResponse,
+    DataSourceType,
+    FinancialDataRequest,
+)
+
+
+class SleepyProvider:
+    """Blocking provider stub that counts calls and records peak concurrency."""
+
+    def __init__(self, delay=0.1, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_data(self, request):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if self.error is not None:
+            raise self.error
+        quality = DataQualityMetrics()
+        quality.overall_score = 0.9
+        response = DataSourceResponse(success=True, data={"ticker": request.ticker})
+        response.quality_metrics = quality
+        return response
+
+
+def make_adapter(tmp_path, provider):
+    adapter = UnifiedDataAdapter(
+        config_file=str(tmp_path / "config.json"), base_path=str(tmp_path)
+    )
+    adapter.providers = {DataSourceType.EXCEL: provider}
+    adapter.configurations = {
+        DataSourceType.EXCEL: DataSourceConfig(
+            source_type=DataSourceType.EXCEL, priority=DataSourcePriority.PRIMARY
+        )
+    }
+    adapter.usage_stats = {}
+    adapter.cache = {}
+    return adapter
+
+
+class TestFetchConcurrency:
+    def test_different_tickers_fetch_in_parallel(self, tmp_path):
+        provider = SleepyProvider(delay=0.2)
+        adapter = make_adapter(tmp_path, provider)
+        requests = [FinancialDataRequest(ticker=f"T{i}") for i in range(8)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(adapter.fetch_data, requests))
+        elapsed = time.perf_counter() - start
+
+        assert all(response.success for response in responses)
+        # 8 x 0.2s serially would take 1.6s
+        assert elapsed < 1.0
+        assert provider.peak > 1
+
+    def test_same_key_requests_are_coalesced(self, tmp_path):
+        provider = SleepyProvider(delay=0.3)
+        adapter = make_adapter(tmp_path, provider)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            responses = list(
+                pool.map(
+                    lambda _: adapter.fetch_data(FinancialDataRequest(ticker="AAPL")), range(6)
+                )
+            )
+
+        assert provider.calls == 1
+        assert all(response.data == {"ticker": "AAPL"} for response in responses)
+        assert adapter._in_flight == {}
+
+    def test_provider_exception_reported_to_all_callers(self, tmp_path):
+        provider = SleepyProvider(delay=0.2, error=RuntimeError("boom"))
+        adapter = make_adapter(tmp_path, provider)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(
+                pool.map(
+                    lambda _: adapter.fetch_data(FinancialDataRequest(ticker="AAPL")), range(4)
+                )
+            )
+
+        assert provider.calls == 1
+        assert not any(response.success for response in responses)
+        assert adapter._in_flight == {}
+
+
+class TestFetchCaching:
+    def test_cache_hit_skips_provider(self, tmp_path):
+        provider = SleepyProvider(delay=0.0)
+        adapter = make_adapter(tmp_path, provider)
+
+        first = adapter.fetch_data(FinancialDataRequest(ticker="MSFT"))
+        second = adapter.fetch_data(FinancialDataRequest(ticker="MSFT"))
+
+        assert provider.calls == 1
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert second.quality_metrics.overall_score == pytest.approx(0.9)
+
+    def test_force_refresh_bypasses_cache(self, tmp_path):
+        provider = SleepyProvider(delay=0.0)
+        adapter = make_adapter(tmp_path, provider)
+
+        adapter.fetch_data(FinancialDataRequest(ticker="MSFT"))
+        adapter.fetch_data(FinancialDataRequest(ticker="MSFT", force_refresh=True))
+
+        assert provider.calls == 2
+
+    def test_new_leader_rechecks_cache(self, tmp_path):
+        provider = SleepyProvider(delay=0.0)
+        adapter = make_adapter(tmp_path, provider)
+        adapter.fetch_data(FinancialDataRequest(ticker="MSFT"))
+
+        # First lookup misses as if it ran just before the previous leader cached its result
+        lookup = adapter._get_cached_response
+        calls = []
+
+        def racing_lookup(*args):
+            calls.append(args)
+            return lookup(*args) if len(calls) > 1 else None
+
+        adapter._get_cached_response = racing_lookup
+        response = adapter.fetch_data(FinancialDataRequest(ticker="MSFT"))
+
+        assert provider.calls == 1
+        assert response.cache_hit
+        assert len(calls) == 2
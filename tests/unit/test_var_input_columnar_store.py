@@ -0,0 +1,207 @@
+"""
+Unit tests for the columnar VarInputData storage backend.
+
+Tests cover:
+- Sorted period storage with binary-search lookup and O(1) latest
+- Numeric and mixed-type value arrays
+- Metadata side table round trip, including sparse extras
+- History slices, period trimming and removal
+- VarInputData(storage_backend="columnar") parity with the object backend
+- Both backends resolving "latest" and period order identically
+- Memory footprint against the object backend
+"""
+
+import tracemalloc
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from core.data_processing.var_input_data import (
+    ColumnarSeriesStore,
+    DataChangeEvent,
+    ObjectSeriesStore,
+    VariableMetadata,
+    VarInputData,
+)
+
+
+def make_metadata(source="excel", **kwargs):
+    return VariableMetadata(source=source, timestamp=datetime(2024, 3, 1, 12, 30), **kwargs)
+
+
+@pytest.fixture
+def store():
+    return ColumnarSeriesStore()
+
+
+class TestColumnarSeriesStore:
+    def test_periods_kept_sorted(self, store):
+        for period in ["2021", "2023", "2019", "2022"]:
+            store.put("AAPL", "revenue", period, float(period), make_metadata())
+        for period in ["Q3-2023", "Q1-2024", "Q4-2023"]:
+            store.put("AAPL", "eps", period, 1.0, make_metadata())
+
+        assert store.periods("AAPL", "revenue") == ["2023", "2022", "2021", "2019"]
+        assert store.get("AAPL", "revenue", "latest").value == 2023.0
+        assert store.periods("AAPL", "eps") == ["Q1-2024", "Q4-2023", "Q3-2023"]
+
+    def test_lookup_and_overwrite(self, store):
+        store.put("AAPL", "revenue", "2022", 100.0, make_metadata())
+        store.put("AAPL", "revenue", "2023", 110.0, make_metadata())
+        store.put("AAPL", "revenue", "2022", 105.0, make_metadata(source="api"))
+
+        value = store.get("AAPL", "revenue", "2022")
+        assert value.value == 105.0
+        assert value.metadata.source == "api"
+        assert store.counts()["data_points"] == 2
+        assert store.get("AAPL", "revenue", "2010") is None
+        assert store.get("MSFT", "revenue", "latest") is None
+
+    def test_series_stays_float_until_non_numeric(self, store):
+        store.put("AAPL", "revenue", "2022", 100, make_metadata())
+        series = store._series["AAPL"]["revenue"]
+        assert series.values.dtype == np.float64
+
+        store.put("AAPL", "revenue", "2023", {"note": "restated"}, make_metadata())
+        assert series.values.dtype == object
+        assert store.get("AAPL", "revenue", "2023").value == {"note": "restated"}
+        assert store.get("AAPL", "revenue", "2022").value == 100.0
+
+    def test_metadata_round_trip(self, store):
+        metadata = make_metadata(
+            quality_score=0.95,
+            validation_passed=False,
+            calculation_method="fcff",
+            dependencies=["ebit", "capex"],
+            lineage_id="L1",
+        )
+        store.put("AAPL", "fcf", "2023", 1.0, metadata)
+
+        restored = store.get("AAPL", "fcf", "2023").metadata
+        assert restored.to_dict() == {**metadata.to_dict(), "period": "2023"}
+
+        store.put("AAPL", "fcf", "2023", 2.0, make_metadata())
+        assert store._metadata_extras == {}
+
+    def test_history_newest_first(self, store):
+        for year in range(2015, 2025):
+            store.put("AAPL", "revenue", str(year), float(year), make_metadata())
+
+        periods, values = store.history_arrays("AAPL", "revenue", 3)
+        assert periods == ["2024", "2023", "2022"]
+        assert values.tolist() == [2024.0, 2023.0, 2022.0]
+        assert [p for p, _, _ in store.history("AAPL", "revenue", 0)][-1] == "2015"
+
+    def test_oldest_points_trimmed(self):
+        store = ColumnarSeriesStore(max_points_per_series=5)
+        for year in range(2010, 2020):
+            store.put("AAPL", "revenue", str(year), float(year), make_metadata(lineage_id=str(year)))
+
+        assert store.periods("AAPL", "revenue") == ["2019", "2018", "2017", "2016", "2015"]
+        assert len(store._metadata_extras) == 5
+
+    def test_removal(self, store):
+        store.put("AAPL", "revenue", "2023", 1.0, make_metadata(lineage_id="x"))
+        store.put("AAPL", "capex", "2023", 1.0, make_metadata())
+        store.put("MSFT", "revenue", "2023", 1.0, make_metadata())
+
+        assert store.remove_periods("AAPL", "capex", ["2023", "1999"]) == 1
+        assert store.remove_variable("AAPL", "revenue")
+        assert store._metadata_extras == {}
+        assert store.remove_symbol("MSFT") == 1
+        assert store.symbols() == ["AAPL"]
+
+    def test_update_metadata(self, store):
+        store.put("AAPL", "revenue", "2023", 1.0, make_metadata())
+        assert store.update_metadata("AAPL", "revenue", "2023", {"quality_score": 0.5, "lineage_id": "L9"})
+
+        metadata = store.get("AAPL", "revenue", "2023").metadata
+        assert metadata.quality_score == 0.5
+        assert metadata.lineage_id == "L9"
+        assert not store.update_metadata("AAPL", "revenue", "1999", {"quality_score": 0.1})
+
+
+class TestVarInputDataColumnarBackend:
+    def setup_method(self):
+        VarInputData._instance = None
+        with patch('core.data_processing.var_input_data.get_registry') as mock_registry, \
+                patch('core.data_processing.var_input_data.UniversalDataRegistry'):
+            mock_registry.return_value = Mock()
+            mock_registry.return_value.list_all_variables.return_value = []
+            mock_registry.return_value.get_variable_definition.return_value.validate_value.return_value = (True, [])
+            self.var_data = VarInputData(storage_backend="columnar")
+
+    def teardown_method(self):
+        VarInputData._instance = None
+
+    def test_set_get_and_history(self):
+        for year, revenue in [("2021", 365817), ("2023", 383285), ("2022", 394328)]:
+            assert self.var_data.set_variable("aapl", "Revenue", revenue, year, "excel")
+
+        assert self.var_data.get_variable("AAPL", "revenue", "latest") == 383285
+        assert self.var_data.get_variable("AAPL", "revenue", "2022") == 394328
+        assert self.var_data.get_historical_data("AAPL", "revenue", years=2) == [
+            ("2023", 383285.0), ("2022", 394328.0)
+        ]
+        assert self.var_data.get_available_periods("AAPL", "revenue") == ["2023", "2022", "2021"]
+        assert self.var_data.get_statistics()["data_storage"]["storage_backend"] == "columnar"
+
+    def test_update_event_and_clear(self):
+        events = []
+        callback = lambda **kwargs: events.append(kwargs["event_type"])
+        self.var_data.subscribe_to_events(DataChangeEvent.VARIABLE_UPDATED, callback)
+        self.var_data.set_variable("AAPL", "revenue", 1.0, "2023")
+        self.var_data.set_variable("AAPL", "revenue", 2.0, "2023")
+        assert len(events) == 1
+
+        self.var_data.clear_cache("AAPL", "revenue", clear_registry_cache=False)
+        assert not self.var_data.has_variable("AAPL", "revenue")
+
+    def test_unknown_backend_rejected(self):
+        VarInputData._instance = None
+        with pytest.raises(ValueError):
+            VarInputData(storage_backend="parquet")
+
+
+class TestBackendParity:
+    @pytest.mark.parametrize("periods, latest_period", [
+        (["2022", "FY", "2023", "LTM"], "2023"),          # lexicographic order would pick "LTM"
+        (["Q4-2023", "2023", "FY2023", "Q1-2024"], "Q1-2024"),
+        (["FY", "LTM"], "LTM"),                           # equal sort keys: last stored wins
+    ])
+    def test_latest_and_period_order_match(self, periods, latest_period):
+        stores = [ObjectSeriesStore(), ColumnarSeriesStore()]
+        for store in stores:
+            for i, period in enumerate(periods):
+                store.put("AAPL", "revenue", period, float(i), make_metadata())
+            store.put("AAPL", "revenue", periods[0], -1.0, make_metadata())
+
+        object_store, columnar_store = stores
+        assert object_store.periods("AAPL", "revenue") == columnar_store.periods("AAPL", "revenue")
+        expected = float(periods.index(latest_period))
+        for store in stores:
+            assert store.get("AAPL", "revenue", "latest").value == expected
+            assert store.value("AAPL", "revenue", "latest") == expected
+
+
+def populate(store, symbols, variables, periods):
+    for s in range(symbols):
+        for v in range(variables):
+            for p in range(periods):
+                store.put(f"S{s}", f"var{v}", str(2000 + p), float(p), make_metadata())
+
+
+class TestFootprint:
+    def test_columnar_much_smaller_than_object_store(self):
+        sizes = {}
+        for name, factory in (("object", ObjectSeriesStore), ("columnar", ColumnarSeriesStore)):
+            tracemalloc.start()
+            store = factory()
+            populate(store, symbols=20, variables=10, periods=20)
+            sizes[name] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del store
+
+        assert sizes["columnar"] < sizes["object"] / 3
@@ -0,0 +1,147 @@
+"""
+Unit tests for VarInputData panel reads and writes.
+
+Tests cover:
+- get_panel for the latest period and for explicit periods, as DataFrame or array
+- Missing and non-numeric values surfacing as NaN
+- Periods sharing a sort key and one series fetch per (symbol, variable)
+- set_panel round trip with a single BULK_UPDATE event
+- Unknown variables and NaN cells in set_panel
+- Both storage backends
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.data_processing.var_input_data import DataChangeEvent, VarInputData
+
+KNOWN_VARIABLES = {"revenue", "free_cash_flow", "net_income"}
+
+
+@pytest.fixture(params=["object", "columnar"])
+def var_data(request):
+    VarInputData._instance = None
+    with patch('core.data_processing.var_input_data.get_registry') as mock_registry, \
+            patch('core.data_processing.var_input_data.UniversalDataRegistry'):
+        registry = Mock()
+        definition = Mock()
+        definition.validate_value.return_value = (True, [])
+        registry.get_variable_definition.side_effect = (
+            lambda name: definition if name in KNOWN_VARIABLES else None
+        )
+        mock_registry.return_value = registry
+        instance = VarInputData(storage_backend=request.param)
+    yield instance
+    VarInputData._instance = None
+
+
+def seed(var_data):
+    for symbol, base in (("AAPL", 100.0), ("MSFT", 200.0)):
+        for year in ("2022", "2023"):
+            var_data.set_variable(symbol, "free_cash_flow", base + int(year) - 2022, year)
+            var_data.set_variable(symbol, "revenue", base * 10, year)
+
+
+class TestGetPanel:
+    def test_latest_panel(self, var_data):
+        seed(var_data)
+        panel = var_data.get_panel(["aapl", "MSFT", "GOOG"], ["free_cash_flow", "revenue"])
+
+        assert list(panel.index) == ["AAPL", "MSFT", "GOOG"]
+        assert panel.loc["AAPL", "free_cash_flow"] == 101.0
+        assert panel.loc["MSFT", "revenue"] == 2000.0
+        assert panel.loc["GOOG"].isna().all()
+
+    def test_period_panel(self, var_data):
+        seed(var_data)
+        panel = var_data.get_panel(["AAPL", "MSFT"], ["free_cash_flow"], periods=["2022", "2023"])
+
+        assert panel.index.names == ["symbol", "period"]
+        assert panel.loc[("MSFT", "2022"), "free_cash_flow"] == 200.0
+        assert panel.loc[("AAPL", "2023"), "free_cash_flow"] == 101.0
+
+    def test_array_block(self, var_data):
+        seed(var_data)
+        block = var_data.get_panel(
+            ["AAPL", "MSFT"], ["free_cash_flow", "revenue"], periods=["2022", "2023"], as_array=True
+        )
+
+        assert block.shape == (2, 2, 2)
+        np.testing.assert_array_equal(block[:, 0, 1], [101.0, 201.0])
+
+    def test_non_numeric_is_nan(self, var_data):
+        var_data.set_variable("AAPL", "net_income", "n/a", "2023")
+        assert np.isnan(var_data.get_panel(["AAPL"], ["net_income"], as_array=True)).all()
+
+    def test_periods_sharing_sort_key(self, var_data):
+        for period, value in (("FY", 1.0), ("2023", 2.0), ("LTM", 3.0), ("FY2023", "n/a")):
+            var_data.set_variable("AAPL", "revenue", value, period)
+
+        block = var_data.get_panel(
+            ["AAPL"], ["revenue"], periods=["LTM", "FY", "2023", "FY2023", "2019", "latest"], as_array=True
+        )
+
+        np.testing.assert_array_equal(block[0, 0], [3.0, 1.0, 2.0, np.nan, np.nan, np.nan])
+
+    def test_each_series_read_once(self, var_data):
+        seed(var_data)
+        with patch.object(var_data._store, "series_arrays", wraps=var_data._store.series_arrays) as reads, \
+                patch.object(var_data._store, "value") as value:
+            var_data.get_panel(["AAPL", "MSFT"], ["free_cash_flow", "revenue"], periods=["2022", "2023", "2021"])
+
+        assert reads.call_count == 4
+        value.assert_not_called()
+
+    def test_single_lock_acquisition(self, var_data):
+        seed(var_data)
+        lock = Mock(wraps=var_data._data_lock)
+        lock.__enter__ = Mock(return_value=None)
+        lock.__exit__ = Mock(return_value=None)
+        var_data._data_lock = lock
+
+        var_data.get_panel(["AAPL", "MSFT"] * 50, ["free_cash_flow", "revenue"])
+
+        assert lock.__enter__.call_count == 1
+
+
+class TestSetPanel:
+    def test_round_trip_with_one_event(self, var_data):
+        events = []
+        callback = lambda **kwargs: events.append(kwargs)
+        var_data.subscribe_to_events(DataChangeEvent.BULK_UPDATE, callback)
+        var_data.subscribe_to_events(DataChangeEvent.VARIABLE_SET, callback)
+        panel = pd.DataFrame(
+            {"free_cash_flow": [10.0, 20.0, 30.0], "revenue": [1.0, np.nan, 3.0]},
+            index=["AAPL", "MSFT", "GOOG"],
+        )
+
+        results = var_data.set_panel(panel, period="2024", source="screen")
+
+        assert results["successful"] == 5
+        assert len(events) == 1
+        assert events[0]["event_type"] == DataChangeEvent.BULK_UPDATE
+        pd.testing.assert_frame_equal(
+            var_data.get_panel(["AAPL", "MSFT", "GOOG"], ["free_cash_flow", "revenue"], ["2024"])
+            .droplevel("period"),
+            panel.rename_axis("symbol"),
+        )
+        assert var_data.get_variable("GOOG", "revenue", "2024", include_metadata=True)[1].source == "screen"
+
+    def test_multiindex_panel(self, var_data):
+        index = pd.MultiIndex.from_tuples([("AAPL", "2022"), ("AAPL", "2023")])
+        var_data.set_panel(pd.DataFrame({"revenue": [5.0, 6.0]}, index=index))
+
+        assert var_data.get_variable("AAPL", "revenue", "latest") == 6.0
+        assert var_data.get_available_periods("AAPL", "revenue") == ["2023", "2022"]
+
+    def test_unknown_variable_counted_as_failed(self, var_data):
+        panel = pd.DataFrame({"revenue": [1.0, 2.0], "made_up": [1.0, np.nan]}, index=["AAPL", "MSFT"])
+
+        results = var_data.set_panel(panel)
+
+        assert results["successful"] == 2
+        assert results["failed"] == 1
+        assert "made_up" in results["errors"][0]
@@ -0,0 +1,326 @@
+"""
+Unit tests for the SQLite storage layer of WatchListManager.
+
+Tests cover:
+- Schema migrations recorded in schema_version and applied once per database
+- Upgrade of a legacy database created before schema versioning
+- One WAL-mode connection per thread, reused across calls and closed when the thread exits
+- Bulk add_analyses_to_watch_list in a single all-or-nothing transaction
+- Debounced, on-demand JSON mirror kept off the mutation path
+- latest_analysis table kept current on insert, copy, remove and delete
+- Column projection in get_watch_list skipping JSON decoding
+"""
+
+import json
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from core.watch_list_manager import WatchListManager, _SCHEMA_MIGRATIONS
+
+
+def make_analysis(ticker, price=100.0, fair_value=120.0):
+    return {
+        'ticker': ticker,
+        'company_name': f'{ticker} Inc',
+        'current_price': price,
+        'fair_value': fair_value,
+        'discount_rate': 0.1,
+        'terminal_growth_rate': 0.03,
+        'dcf_assumptions': {'projection_years': 5},
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = WatchListManager(str(tmp_path), json_export_interval=None)
+    yield manager
+    manager.close()
+
+
+class TestSchemaMigrations:
+    def test_versions_recorded(self, manager):
+        rows = manager._get_connection().execute('SELECT version FROM schema_version').fetchall()
+        assert [row[0] for row in rows] == [version for version, _ in _SCHEMA_MIGRATIONS]
+
+    def test_migrations_not_rerun(self, manager, tmp_path):
+        manager.close()
+        with patch('core.watch_list_manager._add_missing_columns') as add_columns:
+            WatchListManager(str(tmp_path)).close()
+        add_columns.assert_not_called()
+
+    def test_legacy_database_upgraded(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "watch_lists.db")
+        conn.execute(
+            'CREATE TABLE watch_lists (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE '
+            'NOT NULL, description TEXT, created_date TEXT NOT NULL, updated_date TEXT NOT NULL)'
+        )
+        conn.execute(
+            'CREATE TABLE analysis_records (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'watch_list_id INTEGER, ticker TEXT NOT NULL, company_name TEXT, '
+            'analysis_date TEXT NOT NULL, current_price REAL, fair_value REAL, '
+            'discount_rate REAL, terminal_growth_rate REAL, upside_downside_pct REAL, '
+            'fcf_type TEXT, dcf_assumptions TEXT, analysis_metadata TEXT, pb_ratio REAL)'
+        )
+        conn.execute(
+            "INSERT INTO watch_lists VALUES (1, 'legacy', '', '2024-01-01', '2024-01-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        manager = WatchListManager(str(tmp_path))
+        assert manager.add_analysis_to_watch_list('legacy', make_analysis('AAPL'))
+        stock = manager.get_watch_list('legacy')['stocks'][0]
+        assert stock['analysis_type'] == 'DCF'
+        manager.close()
+
+
+class TestConnections:
+    def test_wal_mode(self, manager):
+        mode = manager._get_connection().execute('PRAGMA journal_mode').fetchone()[0]
+        assert mode.lower() == 'wal'
+
+    def test_connection_reused_across_calls(self, manager):
+        manager.create_watch_list('growth')
+        with patch('core.watch_list_manager.sqlite3.connect') as connect:
+            for i in range(10):
+                manager.add_analysis_to_watch_list('growth', make_analysis(f'T{i}'))
+            manager.get_watch_list('growth')
+        connect.assert_not_called()
+
+    def test_each_thread_gets_own_connection(self, manager):
+        manager.create_watch_list('growth')
+        seen = []
+
+        def worker(i):
+            seen.append(manager._get_connection())
+            manager.add_analysis_to_watch_list('growth', make_analysis(f'T{i}'))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(conn) for conn in seen}) == 4
+        assert len(manager.get_watch_list('growth')['stocks']) == 4
+
+    def test_exited_thread_connections_released(self, manager):
+        manager.create_watch_list('growth')
+        seen = []
+
+        def worker(i):
+            seen.append(manager._get_connection())
+            manager.add_analysis_to_watch_list('growth', make_analysis(f'T{i}'))
+
+        for i in range(20):
+            thread = threading.Thread(target=worker, args=(i,))
+            thread.start()
+            thread.join()
+
+        assert len(manager._connections) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            seen[0].execute('SELECT 1')
+
+    def test_close_leaves_other_threads_connections_open(self, manager):
+        ready, release = threading.Event(), threading.Event()
+        results = []
+
+        def worker():
+            conn = manager._get_connection()
+            ready.set()
+            release.wait(5)
+            results.append(conn.execute('SELECT COUNT(*) FROM watch_lists').fetchone()[0])
+            results.append(manager._get_connection() is conn)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        ready.wait(5)
+        manager.close()
+        release.set()
+        thread.join()
+
+        assert results == [0, True]
+
+
+class TestBulkInsert:
+    def test_batch_added(self, manager):
+        manager.create_watch_list('nightly')
+        records = [make_analysis(f'T{i:04d}') for i in range(500)]
+
+        assert manager.add_analyses_to_watch_list('nightly', records) == 500
+
+        watch_list = manager.get_watch_list('nightly')
+        assert len(watch_list['stocks']) == 500
+        assert watch_list['stocks'][0]['upside_downside_pct'] == pytest.approx(20.0)
+        assert watch_list['stocks'][0]['dcf_assumptions'] == {'projection_years': 5}
+
+    def test_failed_batch_rolls_back(self, manager):
+        manager.create_watch_list('nightly')
+        records = [make_analysis('AAPL'), make_analysis(None)]
+
+        assert manager.add_analyses_to_watch_list('nightly', records) == 0
+        assert manager.get_watch_list('nightly')['stocks'] == []
+
+    def test_missing_watch_list(self, manager):
+        assert manager.add_analyses_to_watch_list('missing', [make_analysis('AAPL')]) == 0
+
+
+class TestJsonExport:
+    def test_mutations_do_not_touch_json(self, manager, tmp_path):
+        with patch('core.watch_list_manager.json.dump') as dump:
+            manager.create_watch_list('growth')
+            manager.add_analysis_to_watch_list('growth', make_analysis('AAPL'))
+            manager.remove_stock_from_watch_list('growth', 'AAPL')
+            manager.delete_watch_list('growth')
+        dump.assert_not_called()
+        assert not (tmp_path / "watch_lists.json").exists()
+
+    def test_export_json_snapshot(self, manager, tmp_path):
+        manager.create_watch_list('growth', 'Growth names')
+        manager.add_analyses_to_watch_list('growth', [make_analysis('AAPL'), make_analysis('MSFT')])
+
+        path = manager.export_json()
+
+        with open(path) as f:
+            data = json.load(f)
+        snapshot = data['watch_lists']['growth']
+        assert snapshot['description'] == 'Growth names'
+        assert sorted(stock['ticker'] for stock in snapshot['stocks']) == ['AAPL', 'MSFT']
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_mutations_debounced_into_one_export(self, tmp_path):
+        manager = WatchListManager(str(tmp_path), json_export_interval=60)
+        with patch.object(manager, 'export_json') as export:
+            manager.create_watch_list('growth')
+            for i in range(20):
+                manager.add_analysis_to_watch_list('growth', make_analysis(f'T{i}'))
+            export.assert_not_called()
+
+            timer = manager._json_export_timer
+            timer.cancel()
+            timer.function()
+            export.assert_called_once()
+            assert manager._json_export_timer is None
+        manager.close()
+
+    def test_scheduled_exports_close_their_connections(self, tmp_path):
+        manager = WatchListManager(str(tmp_path), json_export_interval=0.01)
+        for i in range(20):
+            manager.create_watch_list(f'list{i}')
+            for thread in threading.enumerate():
+                if isinstance(thread, threading.Timer):
+                    thread.join()
+
+        assert len(manager._connections) == 1
+        with open(tmp_path / "watch_lists.json") as f:
+            assert len(json.load(f)['watch_lists']) == 20
+        manager.close()
+
+    def test_close_flushes_pending_export(self, tmp_path):
+        manager = WatchListManager(str(tmp_path), json_export_interval=60)
+        manager.create_watch_list('growth')
+        manager.close()
+
+        with open(tmp_path / "watch_lists.json") as f:
+            assert 'growth' in json.load(f)['watch_lists']
+
+
+def latest_tickers(manager, name):
+    return {stock['ticker']: stock for stock in manager.get_watch_list(name)['stocks']}
+
+
+class TestLatestAnalysis:
+    def test_latest_record_per_ticker(self, manager):
+        manager.create_watch_list('growth')
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL', fair_value=110.0))
+        manager.add_analysis_to_watch_list('growth', make_analysis('MSFT'))
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL', fair_value=150.0))
+
+        stocks = latest_tickers(manager, 'growth')
+        assert set(stocks) == {'AAPL', 'MSFT'}
+        assert stocks['AAPL']['fair_value'] == 150.0
+        assert len(manager.get_watch_list('growth', latest_only=False)['stocks']) == 3
+
+    def test_deleting_latest_falls_back_to_previous(self, manager):
+        manager.create_watch_list('growth')
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL', fair_value=110.0))
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL', fair_value=150.0))
+        with manager._transaction() as cursor:
+            cursor.execute('DELETE FROM analysis_records WHERE fair_value = 150.0')
+
+        assert latest_tickers(manager, 'growth')['AAPL']['fair_value'] == 110.0
+
+    def test_remove_and_delete_clear_latest(self, manager):
+        manager.create_watch_list('growth')
+        manager.add_analyses_to_watch_list('growth', [make_analysis('AAPL'), make_analysis('MSFT')])
+
+        manager.remove_stock_from_watch_list('growth', 'AAPL')
+        assert set(latest_tickers(manager, 'growth')) == {'MSFT'}
+
+        manager.delete_watch_list('growth')
+        count = manager._get_connection().execute('SELECT COUNT(*) FROM latest_analysis').fetchone()
+        assert count[0] == 0
+
+    def test_copied_older_analysis_does_not_replace_latest(self, manager):
+        manager.create_watch_list('source')
+        manager.create_watch_list('target')
+        manager.add_analysis_to_watch_list('source', make_analysis('AAPL', fair_value=110.0))
+        manager.add_analysis_to_watch_list('target', make_analysis('AAPL', fair_value=150.0))
+
+        manager.copy_stock_to_watch_list('source', 'target', 'AAPL')
+
+        assert latest_tickers(manager, 'target')['AAPL']['fair_value'] == 150.0
+
+    def test_existing_history_backfilled(self, tmp_path):
+        manager = WatchListManager(str(tmp_path), json_export_interval=None)
+        manager.create_watch_list('growth')
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL', fair_value=110.0))
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL', fair_value=150.0))
+        with manager._transaction() as cursor:
+            cursor.execute('DELETE FROM latest_analysis')
+            cursor.execute('DELETE FROM schema_version WHERE version = 3')
+        manager.close()
+
+        manager = WatchListManager(str(tmp_path), json_export_interval=None)
+        assert latest_tickers(manager, 'growth')['AAPL']['fair_value'] == 150.0
+        manager.close()
+
+
+class TestColumnProjection:
+    def test_projected_columns_only(self, manager):
+        manager.create_watch_list('growth')
+        manager.add_analysis_to_watch_list('growth', make_analysis('AAPL'))
+
+        stock = manager.get_watch_list('growth', columns=['fair_value', 'current_price'])['stocks'][0]
+
+        assert stock == {'ticker': 'AAPL', 'current_price': 100.0, 'fair_value': 120.0}
+
+    def test_projection_skips_json_decoding(self, manager):
+        manager.create_watch_list('growth')
+        manager.add_analyses_to_watch_list('growth', [make_analysis(f'T{i}') for i in range(20)])
+
+        with patch('core.watch_list_manager.json.loads') as loads:
+            manager.get_watch_list('growth', columns=['upside_downside_pct'])
+        loads.assert_not_called()
+
+    def test_unknown_column_rejected(self, manager):
+        manager.create_watch_list('growth')
+        assert manager.get_watch_list('growth', columns=['not_a_column']) is None
+
+    @pytest.mark.slow
+    def test_large_watch_list_loads_quickly(self, manager):
+        import time
+
+        manager.create_watch_list('universe')
+        for _ in range(20):
+            manager.add_analyses_to_watch_list(
+                'universe', [make_analysis(f'T{i:04d}') for i in range(2000)]
+            )
+
+        start = time.perf_counter()
+        watch_list = manager.get_watch_list('universe', columns=['fair_value', 'upside_downside_pct'])
+        assert time.perf_counter() - start < 0.5
+        assert len(watch_list['stocks']) == 2000
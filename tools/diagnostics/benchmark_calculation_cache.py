@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+CalculationCache Compression Micro-Benchmark
+
+Measures cache hit latency against memory saved for typical DCF and FCF result
+dicts, comparing uncompressed storage, compressed storage with the decompressed
+hot set disabled, and compressed storage with the hot set enabled.
+
+Usage:
+    python tools/diagnostics/benchmark_calculation_cache.py
+    python tools/diagnostics/benchmark_calculation_cache.py --hits 5000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from core.data_processing.calculation_cache import CalculationCache
+
+
+def make_dcf_result(seed: int = 0) -> Dict[str, Any]:
+    """DCF result shaped like DCFValuator output with a 10x10 sensitivity grid"""
+    discount_rates = [0.06 + 0.005 * i for i in range(10)]
+    growth_rates = [0.01 + 0.005 * i for i in range(10)]
+    return {
+        'ticker': f"T{seed}",
+        'fcf_type': 'FCFF',
+        'enterprise_value': 2.5e12 + seed,
+        'equity_value': 2.4e12 + seed,
+        'value_per_share': 320.15 + seed,
+        'projections': {
+            'projected_fcf': [6.5e10 * 1.08 ** year for year in range(1, 11)],
+            'growth_rates': [0.08] * 5 + [0.04] * 5,
+            'discount_factors': [1.09 ** -year for year in range(1, 11)],
+            'present_values': [6.5e10 * (1.08 / 1.09) ** year for year in range(1, 11)],
+        },
+        'terminal_value': 1.9e12,
+        'sensitivity_analysis': {
+            'discount_rates': discount_rates,
+            'terminal_growth_rates': growth_rates,
+            'valuations': [[300.0 + r * 100 - g * 50 for g in growth_rates] for r in discount_rates],
+            'upside_downside': [[(r - g) * 0.1 for g in growth_rates] for r in discount_rates],
+        },
+        'assumptions': {'discount_rate': 0.09, 'terminal_growth_rate': 0.025, 'projection_years': 10},
+    }
+
+
+def make_fcf_result(seed: int = 0) -> Dict[str, Any]:
+    """FCF result with ten years of FCFF/FCFE/LFCF and their components"""
+    years = list(range(2015, 2025))
+
+    def series(base: float) -> List[float]:
+        return [base * (1 + 0.07 * i) + seed for i in range(len(years))]
+
+    return {
+        'years': years,
+        'FCFF': series(5.8e10),
+        'FCFE': series(5.1e10),
+        'LFCF': series(5.4e10),
+        'components': {
+            'operating_cash_flow': series(8.1e10),
+            'capital_expenditures': series(-1.2e10),
+            'ebit': series(9.3e10),
+            'tax_rate': [0.21] * len(years),
+            'net_borrowing': series(1.5e9),
+            'working_capital_change': series(-2.0e9),
+        },
+        'metadata': {'currency': 'USD', 'units': 'USD', 'source': 'excel'},
+    }
+
+
+def _run_case(name: str, results: List[Dict[str, Any]], hits: int, **cache_kwargs) -> Dict[str, Any]:
+    """Populate a fresh cache and time repeated hits across all keys"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = CalculationCache(cache_dir=cache_dir, **cache_kwargs)
+        cache._sweep_thread.join(timeout=5)
+        for i, result in enumerate(results):
+            cache.set_result(f"T{i}", name, result)
+
+        keys = [f"T{i}" for i in range(len(results))]
+        start = time.perf_counter()
+        for n in range(hits):
+            cache.get_result(keys[n % len(keys)], name)
+        elapsed = time.perf_counter() - start
+
+        # _memory_bytes includes the decoded copies held in the hot set
+        return {
+            'memory_bytes': cache._memory_bytes,
+            'hot_set_bytes': sum(size for _, size in cache._hot_results.values()),
+            'hit_latency_us': elapsed / hits * 1e6,
+        }
+
+
+def run_benchmark(n_results: int = 20, hits: int = 2000) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Benchmark hit latency and memory use for DCF and FCF result dicts.
+
+    Returns:
+        {result_type: {case: {'memory_bytes', 'hot_set_bytes', 'hit_latency_us',
+                              'memory_saved_pct'}}}
+
+        memory_bytes covers stored entries plus decoded hot-set copies.
+    """
+    report = {}
+    for name, factory in (('dcf', make_dcf_result), ('fcf', make_fcf_result)):
+        results = [factory(i) for i in range(n_results)]
+        cases = {
+            'uncompressed': _run_case(name, results, hits, enable_compression=False),
+            'compressed': _run_case(
+                name, results, hits, compression_threshold_bytes=256, hot_set_size=0
+            ),
+            'compressed_hot_set': _run_case(
+                name, results, hits, compression_threshold_bytes=256, hot_set_size=n_results
+            ),
+        }
+        baseline = cases['uncompressed']['memory_bytes']
+        for case in cases.values():
+            case['memory_saved_pct'] = (1 - case['memory_bytes'] / max(baseline, 1)) * 100
+        report[name] = cases
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--results', type=int, default=20, help='Distinct results per type')
+    parser.add_argument('--hits', type=int, default=2000, help='Cache hits to time per case')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.results, args.hits)
+    print(
+        f"{'result':<8}{'case':<22}{'memory (KB)':>14}{'hot set (KB)':>14}"
+        f"{'saved %':>10}{'hit (us)':>12}"
+    )
+    for name, cases in report.items():
+        for case, stats in cases.items():
+            print(
+                f"{name:<8}{case:<22}{stats['memory_bytes'] / 1024:>14.1f}"
+                f"{stats['hot_set_bytes'] / 1024:>14.1f}"
+                f"{stats['memory_saved_pct']:>10.1f}{stats['hit_latency_us']:>12.2f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Compiled Alias Matcher
+
+Resolves row labels and API field names to standard variable names in (near)
+constant time per label. The matcher is compiled once from a set of variable
+definitions (or plain source -> {name: aliases} mappings) into:
+
+- hash maps of normalized variable names and aliases, per category and source
+- an inverted token index over variable-name words for partial matches
+
+Used by FinancialVariableRegistry (which caches a compiled matcher and drops it
+whenever a variable is registered), the Excel and yfinance adapters, and
+FieldNormalizer.
+
+Partial matches use the same qualification rule the adapters always used: a
+label matches a variable when it shares at least min(2, max(1, 0.6 * words))
+of the variable name's words. When several variables qualify they are ranked
+deterministically by shared word count, then by the share of the variable's
+words covered, then by registration order.
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Key used for entries without a category and for the "any source" alias map
+ANY = None
+
+_SEPARATORS = re.compile(r'[_\-]')
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+AliasSpec = Union[str, Sequence[str], None]
+
+
+def normalize_label(label: Any) -> str:
+    """Case-fold a label, treat '_' and '-' as spaces and collapse whitespace"""
+    return ' '.join(_SEPARATORS.sub(' ', str(label).lower()).split())
+
+
+def label_tokens(label: Any) -> List[str]:
+    """Alphanumeric words of a label after normalization"""
+    return _TOKEN.findall(normalize_label(label))
+
+
+def _alias_list(aliases: AliasSpec) -> List[str]:
+    if aliases is None:
+        return []
+    if isinstance(aliases, str):
+        return [aliases]
+    return [alias for alias in aliases if alias]
+
+
+class AliasMatcher:
+    """
+    Immutable index resolving labels to variable names.
+
+    Entries are registered in order; on exact-match collisions the earliest
+    entry wins, matching the first-hit behaviour of the former linear scans.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Hashable, Dict[str, AliasSpec]]]):
+        """
+        Compile the matcher.
+
+        Args:
+            entries: (variable name, category, {source: alias or aliases}) tuples
+                in priority order
+        """
+        self._order: Dict[str, int] = {}
+        self._names: Dict[Hashable, Dict[str, str]] = {}
+        self._aliases: Dict[Hashable, Dict[Optional[str], Dict[str, str]]] = {}
+        self._postings: Dict[Hashable, Dict[str, List[str]]] = {}
+        self._token_counts: Dict[str, int] = {}
+        self._thresholds: Dict[str, float] = {}
+
+        for name, category, aliases in entries:
+            if name in self._order:
+                continue
+            self._order[name] = len(self._order)
+
+            names = self._names.setdefault(category, {})
+            names.setdefault(normalize_label(name), name)
+
+            alias_maps = self._aliases.setdefault(category, {})
+            for source, source_aliases in (aliases or {}).items():
+                for alias in _alias_list(source_aliases):
+                    key = normalize_label(alias)
+                    alias_maps.setdefault(source, {}).setdefault(key, name)
+                    alias_maps.setdefault(ANY, {}).setdefault(key, name)
+
+            tokens = set(label_tokens(name))
+            postings = self._postings.setdefault(category, {})
+            for token in tokens:
+                postings.setdefault(token, []).append(name)
+            self._token_counts[name] = len(tokens)
+            self._thresholds[name] = min(2, max(1, len(tokens) * 0.6))
+
+        logger.debug(f"Compiled alias matcher for {len(self._order)} variables")
+
+    @classmethod
+    def from_variables(cls, variable_defs: Iterable[Any]) -> 'AliasMatcher':
+        """Compile from objects with ``name``, ``category`` and ``aliases`` attributes"""
+        return cls(
+            (var_def.name, getattr(var_def, 'category', ANY), getattr(var_def, 'aliases', None) or {})
+            for var_def in variable_defs
+        )
+
+    @classmethod
+    def from_source_mappings(cls, mappings: Dict[str, Dict[str, AliasSpec]]) -> 'AliasMatcher':
+        """Compile from ``{source: {variable name: alias or aliases}}`` mappings"""
+        merged: Dict[str, Dict[str, AliasSpec]] = {}
+        for source, fields in mappings.items():
+            for name, aliases in fields.items():
+                merged.setdefault(name, {})[source] = aliases
+        return cls((name, ANY, aliases) for name, aliases in merged.items())
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _categories(self, categories: Optional[Iterable[Hashable]]) -> List[Hashable]:
+        if categories is None:
+            return list(self._names)
+        return [category for category in categories if category in self._names]
+
+    def _first(self, candidates: Iterable[Optional[str]]) -> Optional[str]:
+        found = [name for name in candidates if name is not None]
+        return min(found, key=self._order.__getitem__) if found else None
+
+    def match_exact(
+        self,
+        label: Any,
+        categories: Optional[Iterable[Hashable]] = None,
+        source: Optional[str] = None,
+        any_source: bool = True
+    ) -> Optional[str]:
+        """
+        Resolve a label by exact (normalized) variable name or alias.
+
+        Args:
+            label: Row label or field name
+            categories: Restrict to these categories (default: all)
+            source: Prefer aliases of this source before aliases of any source
+            any_source: Fall back to aliases of other sources
+
+        Returns:
+            Variable name, or None
+        """
+        key = normalize_label(label)
+        categories = self._categories(categories)
+
+        match = self._first(self._names[category].get(key) for category in categories)
+        if match:
+            return match
+
+        if source is not ANY:
+            match = self._first(
+                self._aliases[category].get(source, {}).get(key) for category in categories
+            )
+            if match or not any_source:
+                return match
+
+        return self._first(
+            self._aliases[category].get(ANY, {}).get(key) for category in categories
+        )
+
+    def partial_candidates(
+        self,
+        label: Any,
+        categories: Optional[Iterable[Hashable]] = None
+    ) -> List[str]:
+        """
+        Variables whose name words overlap the label enough to count as a match.
+
+        Returns:
+            Qualifying variable names, best first
+        """
+        tokens = set(label_tokens(label))
+        shared: Counter = Counter()
+        for category in self._categories(categories):
+            postings = self._postings[category]
+            for token in tokens:
+                shared.update(postings.get(token, ()))
+
+        qualified = [
+            name for name, count in shared.items() if count >= self._thresholds[name]
+        ]
+        qualified.sort(key=lambda name: (
+            -shared[name], -shared[name] / self._token_counts[name], self._order[name]
+        ))
+        return qualified
+
+    def match(
+        self,
+        label: Any,
+        categories: Optional[Iterable[Hashable]] = None,
+        source: Optional[str] = None,
+        partial: bool = True
+    ) -> Optional[str]:
+        """Resolve a label exactly, falling back to the best partial match"""
+        match = self.match_exact(label, categories, source)
+        if match or not partial:
+            return match
+        candidates = self.partial_candidates(label, categories)
+        return candidates[0] if candidates else None
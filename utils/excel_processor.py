@@ -15,6 +15,98 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+def is_fy_header_row(row: Tuple[Any, ...]) -> bool:
+    """
+    Check whether a worksheet row is the FY column header row ('FY-N' / 'FY' cells)
+
+    Args:
+        row: Row of cell values
+
+    Returns:
+        True if the row contains FY period headers
+    """
+    return bool(row) and any('FY-' in str(cell) or 'FY' == str(cell) for cell in row if cell)
+
+
+def stream_statement_rows(
+    file_path: str, header_predicate=is_fy_header_row
+) -> Tuple[Optional[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """
+    Stream the active sheet of a statement workbook in read-only mode
+
+    The workbook is opened with read_only=True and data_only=True, so no cell object
+    model is built. Rows before the header row are only buffered until the header is
+    found and are then discarded.
+
+    Args:
+        file_path: Path to Excel file
+        header_predicate: Callable identifying the header row
+
+    Returns:
+        Tuple of (header row, data rows). If no header row is found the header is None
+        and all rows are returned.
+    """
+    workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+    try:
+        header = None
+        rows = []
+        for row in workbook.active.iter_rows(values_only=True):
+            if header is None and header_predicate(row):
+                header = row
+                rows = []
+                continue
+            rows.append(row)
+    finally:
+        workbook.close()
+
+    return header, rows
+
+
+def build_typed_dataframe(
+    rows: List[Tuple[Any, ...]], columns: Optional[List[Any]] = None
+) -> pd.DataFrame:
+    """
+    Build a DataFrame column by column from streamed worksheet rows
+
+    Columns holding only numbers (or empty cells) become float64 arrays; all other
+    columns are kept as object arrays. This avoids per-cell dtype inference on the
+    row-oriented input.
+
+    Args:
+        rows: Worksheet rows as tuples of cell values
+        columns: Column labels; defaults to positional integers
+
+    Returns:
+        DataFrame with one typed array per column
+    """
+    width = max([len(row) for row in rows] + [len(columns) if columns is not None else 0])
+    if columns is None:
+        columns = list(range(width))
+    else:
+        columns = list(columns) + [None] * (width - len(columns))
+
+    if not rows:
+        return pd.DataFrame(columns=columns)
+
+    arrays = {}
+    for col_idx in range(width):
+        values = [row[col_idx] if col_idx < len(row) else None for row in rows]
+        if all(
+            value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+            for value in values
+        ):
+            arrays[col_idx] = np.array(
+                [np.nan if value is None else value for value in values], dtype=np.float64
+            )
+        else:
+            arrays[col_idx] = np.array(values, dtype=object)
+
+    df = pd.DataFrame(arrays, index=pd.RangeIndex(len(rows)))
+    # Assign labels afterwards: statement headers may contain duplicates or None
+    df.columns = columns
+    return df
+
+
 class UnifiedExcelProcessor:
     """
     Centralized Excel processing to eliminate duplicate Excel operations
@@ -11,6 +11,7 @@ Features:
 - Support for nested data structures
 - Comprehensive logging for debugging
 - Data type validation and conversion
+- Compiled alias matcher resolving each payload key once per extraction
 """
 
 import json
@@ -20,6 +21,8 @@ from pathlib import Path
 import pandas as pd
 from datetime import datetime
 
+from utils.alias_matcher import AliasMatcher, normalize_label
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +48,7 @@ class FieldNormalizer:
         self.data_structure_hints = {}
 
         self._load_mappings()
+        self._alias_matcher = AliasMatcher.from_source_mappings(self.mappings)
 
     def _load_mappings(self):
         """Load field mappings from configuration file"""
@@ -90,8 +94,50 @@ class FieldNormalizer:
             },
         }
 
+    def resolve_standard_field(self, field_name: str, api_source: str) -> Optional[str]:
+        """
+        Resolve an API-specific field name to its standard field name.
+
+        Args:
+            field_name: Field name as returned by the API (case-insensitive)
+            api_source: The API source identifier
+
+        Returns:
+            str: The standard field name, or None if the field is not mapped
+        """
+        return self._alias_matcher.match_exact(field_name, source=api_source, any_source=False)
+
+    def _resolve_top_level_fields(self, data: Any, api_source: str) -> Dict[str, List[tuple]]:
+        """
+        Map standard fields to matching (key, value) pairs in one pass over the data's keys.
+
+        Covers dict keys and DataFrame index labels (most recent column); nested
+        structures are left to the per-variant search in extract_field_value.
+        """
+        if isinstance(data, list) and len(data) > 0:
+            data = data[0]
+
+        if isinstance(data, dict):
+            items = data.items()
+        elif isinstance(data, pd.DataFrame) and not data.empty and len(data.columns) > 0:
+            items = data.iloc[:, 0].items()
+        else:
+            return {}
+
+        resolved = {}
+        for key, value in items:
+            standard_field = self.resolve_standard_field(str(key), api_source)
+            if standard_field is not None:
+                resolved.setdefault(standard_field, []).append((key, value))
+        return resolved
+
     def extract_field_value(
-        self, data: Any, standard_field: str, api_source: str, context: str = "unknown"
+        self,
+        data: Any,
+        standard_field: str,
+        api_source: str,
+        context: str = "unknown",
+        resolved_fields: Optional[Dict[str, List[tuple]]] = None,
     ) -> Optional[float]:
         """
         Extract a field value from data using API-specific field mappings.
@@ -101,6 +147,7 @@ class FieldNormalizer:
             standard_field: The standardized field name to extract
             api_source: The API source identifier (alpha_vantage, fmp, etc.)
             context: Additional context for logging (statement type, ticker, etc.)
+            resolved_fields: Precomputed result of _resolve_top_level_fields for data
 
         Returns:
             float: The extracted and normalized field value, or None if not found
@@ -120,7 +167,26 @@ class FieldNormalizer:
             f"Attempting to extract {standard_field} from {api_source} using variants: {field_variants}"
         )
 
-        # Try each field variant
+        # Top-level keys already resolved through the compiled alias matcher
+        if resolved_fields is None:
+            resolved_fields = self._resolve_top_level_fields(data, api_source)
+
+        # Honour the configured variant order when several keys match
+        variant_rank = {normalize_label(variant): rank for rank, variant in enumerate(field_variants)}
+        candidates = sorted(
+            resolved_fields.get(standard_field, []),
+            key=lambda item: variant_rank.get(normalize_label(item[0]), len(variant_rank)),
+        )
+
+        for key, value in candidates:
+            normalized_value = self._normalize_numeric_value(value)
+            if normalized_value is not None:
+                logger.debug(
+                    f"Successfully extracted {standard_field}={normalized_value} using field '{key}' from {api_source}"
+                )
+                return normalized_value
+
+        # Try each field variant (covers nested structures)
         for field_name in field_variants:
             try:
                 value = self._extract_value_by_type(data, field_name, api_source)
@@ -341,11 +407,14 @@ class FieldNormalizer:
         metrics = {}
         context = f"{ticker} ({api_source})"
 
+        # Resolve the payload's keys once for all standard fields
+        resolved_fields = self._resolve_top_level_fields(data, api_source) if data else {}
+
         # Extract core metrics
         for standard_field in self.standard_fields.keys():
             if standard_field != "free_cash_flow":  # FCF is calculated, not extracted
                 metrics[standard_field] = self.extract_field_value(
-                    data, standard_field, api_source, context
+                    data, standard_field, api_source, context, resolved_fields
                 )
 
         # Calculate Free Cash Flow if we have the required components
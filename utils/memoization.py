@@ -0,0 +1,186 @@
+"""
+Content-Keyed Memoization
+
+Per-instance memoization for calculation methods whose inputs are numeric
+series. Unlike ``functools.lru_cache`` on a method, the cache lives on the
+instance (so it is released with it) and entries are keyed by a hash of the
+input data rather than by object identity or hashability, so lists, NumPy
+arrays and pandas Series can be passed directly.
+
+Usage:
+    class Calculator:
+        @content_memoized(maxsize=256)
+        def calculate_growth_rates(self, values, periods=(1, 3, 5, 10)):
+            ...
+
+    calc = Calculator()
+    calc.calculate_growth_rates([100, 110, 121])
+    calc.calculate_growth_rates.cache_info()
+    # CacheStats(hits=0, misses=1, evictions=0, maxsize=256, currsize=1)
+"""
+
+import functools
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+
+class CacheStats(NamedTuple):
+    """Hit/miss counters for a ContentKeyedCache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _update_digest(digest, value: Any) -> None:
+    """Feed one argument into the digest by content"""
+    if PANDAS_AVAILABLE and isinstance(value, (pd.Series, pd.Index)):
+        value = value.to_numpy()
+
+    if isinstance(value, (list, tuple, np.ndarray)):
+        try:
+            array = np.asarray(value, dtype=np.float64)
+        except (TypeError, ValueError):
+            array = None
+        if array is not None:
+            digest.update(b'a')
+            digest.update(str(array.shape).encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+            return
+
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        payload = repr(value).encode()
+    digest.update(b'p')
+    digest.update(payload)
+
+
+def content_key(args: tuple, kwargs: Dict[str, Any]) -> bytes:
+    """
+    Hash call arguments by content.
+
+    Numeric sequences, arrays and Series hash their float64 values, so equal
+    data gives the same key whatever container it arrives in. Other arguments
+    are hashed by their pickled form, or their repr if they cannot be pickled.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in args:
+        _update_digest(digest, value)
+    for name in sorted(kwargs):
+        digest.update(name.encode())
+        _update_digest(digest, kwargs[name])
+    return digest.digest()
+
+
+class ContentKeyedCache:
+    """
+    Bounded LRU mapping from content keys to results, with hit/miss counters.
+
+    Args:
+        maxsize: Maximum number of entries kept (0 disables caching)
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(self, key: bytes, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for key, computing and storing it on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+
+        result = compute()
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return result
+
+    def cache_info(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, self.maxsize, len(self._entries)
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class content_memoized:
+    """
+    Method decorator memoizing results per instance by argument content.
+
+    The cache is created lazily in the instance's ``__dict__`` and is dropped
+    with the instance. The bound method exposes ``cache_info()`` and
+    ``cache_clear()`` like ``functools.lru_cache``. Results are returned as
+    stored, so callers must not mutate them.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.func: Optional[Callable] = None
+        self.attr_name = ''
+
+    def __call__(self, func: Callable) -> "content_memoized":
+        self.func = func
+        self.attr_name = f"_memo_{func.__name__}"
+        functools.update_wrapper(self, func)
+        return self
+
+    def __set_name__(self, owner, name):
+        self.attr_name = f"_memo_{name}"
+
+    def _get_cache(self, instance) -> ContentKeyedCache:
+        cache = instance.__dict__.get(self.attr_name)
+        if cache is None:
+            cache = instance.__dict__.setdefault(self.attr_name, ContentKeyedCache(self.maxsize))
+        return cache
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        cache = self._get_cache(instance)
+        func = self.func
+
+        @functools.wraps(func)
+        def bound(*args, **kwargs):
+            return cache.get_or_compute(
+                content_key(args, kwargs), lambda: func(instance, *args, **kwargs)
+            )
+
+        bound.cache_info = cache.cache_info
+        bound.cache_clear = cache.cache_clear
+        return bound